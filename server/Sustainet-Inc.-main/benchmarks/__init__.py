@@ -0,0 +1,4 @@
+"""
+效能基準測試腳本。
+於專案根目錄以 `python -m benchmarks.<模組名稱>` 執行。
+"""
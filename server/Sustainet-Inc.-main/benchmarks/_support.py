@@ -0,0 +1,43 @@
+"""
+基準測試共用工具：建立記憶體內 SQLite 資料庫與計時輔助函數。
+"""
+import os
+import tempfile
+import time
+from typing import Callable
+
+# 全域 engine 在匯入時建立，基準測試預設使用暫存的 SQLite 檔案
+os.environ.setdefault(
+    "DATABASE_URL_SYNC",
+    f"sqlite:///{os.path.join(tempfile.gettempdir(), 'sustainet_bench.db')}"
+)
+os.environ.setdefault("LOG_LEVEL", "warning")
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.infrastructure.database.models.base import Base
+from src.infrastructure.database.models import (  # noqa: F401
+    action_record, game_round, game_setup, news, platform_state, session_summary, tools, toolusage
+)
+
+
+def make_session_factory() -> sessionmaker:
+    """建立記憶體內 SQLite 資料庫（不含 PostgreSQL 專用的 agents 表）並返回 Session 工廠"""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    tables = [table for name, table in Base.metadata.tables.items() if name != "agents"]
+    Base.metadata.create_all(engine, tables=tables)
+    return sessionmaker(bind=engine, autocommit=False, autoflush=False, expire_on_commit=False)
+
+
+def timed(func: Callable[[], None], repeat: int = 1) -> float:
+    """執行 func repeat 次並返回平均耗時（毫秒）"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) * 1000 / repeat
@@ -0,0 +1,54 @@
+"""
+遊戲結束判斷基準測試。
+
+比較逐場呼叫 GameConfig.should_game_end 與 format_game_end_summary 的統計，
+與 GameEndLogic.check_game_end_batch 一次處理整批 (games, platforms) 陣列的耗時。
+
+執行方式：
+    python -m benchmarks.bench_game_end_batch
+"""
+import numpy as np
+
+from benchmarks._support import timed
+
+from src.domain.logic.game_end_logic import GameEndLogic
+
+GAME_COUNTS = (1000, 10000, 100000)
+
+
+def main() -> None:
+    logic = GameEndLogic()
+    names = logic.config.platform_names
+    rng = np.random.default_rng(0)
+
+    print(f"{'games':>7} | {'scalar ms':>10} | {'batch ms':>9} | {'speedup':>7}")
+    for games in GAME_COUNTS:
+        rounds = rng.integers(1, logic.config.max_rounds + 1, size=games)
+        player = rng.integers(0, 101, size=(games, len(names)))
+        ai = rng.integers(0, 101, size=(games, len(names)))
+        spread = rng.integers(0, 101, size=(games, len(names)))
+        states = [
+            [
+                {"platform_name": name, "player_trust": p, "ai_trust": a, "spread_rate": s}
+                for name, p, a, s in zip(names, player_row, ai_row, spread_row)
+            ]
+            for player_row, ai_row, spread_row in zip(player.tolist(), ai.tolist(), spread.tolist())
+        ]
+        round_list = rounds.tolist()
+
+        def scalar() -> None:
+            for round_number, platform_states in zip(round_list, states):
+                end_result = logic.config.should_game_end(round_number, platform_states)
+                logic.format_game_end_summary(end_result)
+
+        def batch() -> None:
+            result = logic.check_game_end_batch(rounds, player, ai, spread)
+            result.summary()
+
+        scalar_ms = timed(scalar)
+        batch_ms = timed(batch, repeat=5)
+        print(f"{games:>7} | {scalar_ms:>10.1f} | {batch_ms:>9.2f} | {scalar_ms / batch_ms:>6.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+遊戲列表分頁基準測試。
+
+在 session_summaries 填入大量遊戲後，比較 OFFSET 分頁與 keyset 分頁
+（SessionSummaryRepository.list_recent / list_leaderboard）在第 1 頁到第 10,000 頁的耗時。
+OFFSET 必須先略過前面所有資料列，耗時隨頁數成長；keyset 以索引直接定位，各頁應維持相同。
+
+執行方式：
+    python -m benchmarks.bench_game_listing
+"""
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert, select
+
+from benchmarks._support import make_session_factory, timed
+
+from src.infrastructure.database.models.session_summary import SessionSummary
+from src.infrastructure.database.session import UnitOfWork
+from src.infrastructure.database.session_summary_repo import SessionSummaryRepository
+
+PAGE_SIZE = 20
+PAGES = (1, 100, 1_000, 10_000)
+# 每 20 場：2 場進行中，其餘依序為 9 場玩家勝、7 場 AI 勝、2 場平手；最少的篩選（玩家勝）也有 10,000 頁以上
+WINNERS = (None,) * 2 + ("player",) * 9 + ("ai",) * 7 + ("draw",) * 2
+GAME_COUNT = 450_000
+BATCH_SIZE = 50_000
+
+
+def seed(db) -> None:
+    start = datetime(2026, 1, 1)
+    for offset in range(0, GAME_COUNT, BATCH_SIZE):
+        db.execute(insert(SessionSummary), [_summary_row(start, i) for i in range(offset, offset + BATCH_SIZE)])
+
+
+def _summary_row(start: datetime, i: int) -> dict:
+    winner = WINNERS[i % len(WINNERS)]
+    return {
+        "session_id": f"game_{i:07d}",
+        # 每三場共用同一個建立時間，分頁須以 session_id 區分
+        "created_at": start + timedelta(seconds=i // 3),
+        "updated_at": start,
+        "latest_round": 2,
+        "action_count": 4,
+        "player_action_count": 2,
+        "ai_action_count": 2,
+        "player_reach_total": 0,
+        "ai_reach_total": 0,
+        "player_trust_change_total": 0,
+        "ai_trust_change_total": 0,
+        "player_total_trust": (i * 7919) % 300,
+        "ai_total_trust": 150,
+        "leader": "draw",
+        "is_ended": winner is not None,
+        "winner": winner,
+        "end_reason": "max_rounds_reached" if winner else None,
+    }
+
+
+def offset_page(db, page: int, **filters) -> list:
+    query = select(SessionSummary).filter_by(**filters)
+    query = query.order_by(SessionSummary.created_at.desc(), SessionSummary.session_id.desc())
+    return list(db.execute(query.offset((page - 1) * PAGE_SIZE).limit(PAGE_SIZE)).scalars())
+
+
+def main() -> None:
+    session_factory = make_session_factory()
+    with UnitOfWork(session_factory) as uow:
+        seed(uow.session)
+
+    print(f"{GAME_COUNT} games, {PAGE_SIZE} per page")
+    print(f"{'listing':>14} | {'page':>6} | {'offset ms':>9} | {'keyset ms':>9}")
+    with UnitOfWork(session_factory) as uow:
+        db = uow.session
+        repo = SessionSummaryRepository(db=db)
+        for label, filters in (("all", {}), ("ended", {"is_ended": True}), ("winner=player", {"winner": "player"})):
+            for page in PAGES:
+                # 上一頁的最後一筆作為游標（只在計時外取得一次）
+                previous = offset_page(db, page - 1, **filters)[-1] if page > 1 else None
+                after = (previous.created_at, previous.session_id) if previous else None
+                assert [s.session_id for s in repo.list_recent(PAGE_SIZE, after=after, **filters)] == [
+                    s.session_id for s in offset_page(db, page, **filters)
+                ]
+                offset_ms = timed(lambda: offset_page(db, page, **filters), repeat=5)
+                keyset_ms = timed(lambda: repo.list_recent(PAGE_SIZE, after=after, **filters), repeat=5)
+                print(f"{label:>14} | {page:>6} | {offset_ms:>9.2f} | {keyset_ms:>9.2f}")
+
+        leaders = repo.list_leaderboard(PAGE_SIZE * max(PAGES))
+        for page in PAGES:
+            last = leaders[(page - 1) * PAGE_SIZE - 1] if page > 1 else None
+            after = (last.player_total_trust, last.session_id) if last else None
+            keyset_ms = timed(lambda: repo.list_leaderboard(PAGE_SIZE, after=after), repeat=5)
+            print(f"{'leaderboard':>14} | {page:>6} | {'-':>9} | {keyset_ms:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
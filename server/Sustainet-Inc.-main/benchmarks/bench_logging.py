@@ -0,0 +1,62 @@
+"""
+日誌呼叫成本基準測試。
+
+比較舊版先以 f-string 與 json.dumps 組好訊息再交給 logging 的寫法，
+與延遲格式化的 Logger 在 DEBUG 被過濾（正式環境）及啟用時的單次呼叫耗時。
+
+執行方式：
+    python -m benchmarks.bench_logging
+"""
+import io
+import json
+import logging
+
+from benchmarks._support import timed
+
+from src.utils.logger import JSONFormatter, Logger, TextFormatter
+
+REPEAT = 50000
+
+
+def _extra() -> dict:
+    return {
+        "session_id": "game_1a2b3c4d",
+        "round": 3,
+        "tools": ["情緒刺激", "事實查核", "專家背書"],
+        "platform_status": [{"platform_name": name, "player_trust": 55, "ai_trust": 45} for name in ("Facebook", "Instagram", "Thread")],
+    }
+
+
+def _eager_debug(app_logger: Logger, message: str, extra: dict) -> None:
+    # 舊版 Logger._format_log：不論級別都先序列化
+    app_logger.logger.debug(f"{message} | {json.dumps(extra, ensure_ascii=False)}")
+
+
+def main() -> None:
+    app_logger = Logger("Sustainet-Inc.bench")
+    app_logger.stop()
+    app_logger.logger.handlers.clear()
+    app_logger.logger.propagate = False
+    handler = logging.StreamHandler(io.StringIO())
+    app_logger.logger.addHandler(handler)
+    extra = _extra()
+    tools = extra["tools"]
+
+    print(f"{'level':>9} | {'formatter':>9} | {'eager µs':>9} | {'lazy µs':>8} | {'speedup':>7}")
+    for level, formatter_name, formatter in (
+        (logging.INFO, "-", TextFormatter("%(message)s")),
+        (logging.DEBUG, "text", TextFormatter("%(message)s")),
+        (logging.DEBUG, "json", JSONFormatter()),
+    ):
+        app_logger.logger.setLevel(level)
+        handler.setFormatter(formatter)
+        eager_ms = timed(lambda: _eager_debug(app_logger, f"第 3 回合 player 可用工具: {tools}", extra), repeat=REPEAT)
+        lazy_ms = timed(lambda: app_logger.debug("第 %s 回合 %s 可用工具: %s", 3, "player", tools, extra=extra), repeat=REPEAT)
+        print(
+            f"{logging.getLevelName(level):>9} | {formatter_name:>9} | {eager_ms * 1000:>9.2f} | "
+            f"{lazy_ms * 1000:>8.2f} | {eager_ms / lazy_ms:>6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+平台狀態寫入的資料庫往返次數基準測試。
+
+比較逐平台寫入（create_platform_state / update_platform_state）與批次寫入
+（create_all_platforms_states / update_all_platforms_states）在不同平台數量下
+每回合所需的 SQL 語句數，批次路徑應維持常數。
+
+執行方式：
+    python -m benchmarks.bench_platform_state_writes
+"""
+from benchmarks._support import make_session_factory, timed
+
+from src.infrastructure.database.game_setup_repo import GameSetupRepository
+from src.infrastructure.database.platform_state_repo import PlatformStateRepository
+from src.infrastructure.database.session import UnitOfWork
+from src.infrastructure.database.session_stats import track_session_stats
+
+PLATFORM_COUNTS = [3, 10, 30, 100]
+
+
+def _statuses(platforms, trust):
+    return [
+        {"platform_name": p["name"], "player_trust": trust, "ai_trust": 100 - trust, "spread_rate": 60}
+        for p in platforms
+    ]
+
+
+def run_per_platform(repo: PlatformStateRepository, session_id: str, platforms, round_number: int) -> None:
+    for p in platforms:
+        repo.create_platform_state(session_id, round_number, p["name"])
+    for status in _statuses(platforms, 55):
+        repo.update_platform_state(session_id, round_number, **status)
+
+
+def run_bulk(repo: PlatformStateRepository, session_id: str, platforms, round_number: int) -> None:
+    repo.create_all_platforms_states(session_id, round_number, platforms)
+    repo.update_all_platforms_states(session_id, round_number, _statuses(platforms, 55))
+
+
+def main() -> None:
+    print(f"{'platforms':>9} | {'per-platform stmts':>18} | {'bulk stmts':>10} | {'per-platform ms':>15} | {'bulk ms':>8}")
+    for count in PLATFORM_COUNTS:
+        platforms = [{"name": f"Platform{i}", "audience": "學生"} for i in range(count)]
+        results = {}
+        for label, runner in (("per_platform", run_per_platform), ("bulk", run_bulk)):
+            session_factory = make_session_factory()
+            with UnitOfWork(session_factory) as uow:
+                session_id = f"game_{label}"
+                GameSetupRepository(db=uow.session).create_game_setup(session_id=session_id, platforms=platforms)
+                repo = PlatformStateRepository(db=uow.session)
+                repo.create_all_platforms_states(session_id, 1, platforms)
+
+                with track_session_stats() as stats:
+                    runner(repo, session_id, platforms, 2)
+                rounds = iter(range(3, 10_000))
+                elapsed = timed(lambda: runner(repo, session_id, platforms, next(rounds)), repeat=20)
+            results[label] = (stats.statements, elapsed)
+
+        print(
+            f"{count:>9} | {results['per_platform'][0]:>18} | {results['bulk'][0]:>10} | "
+            f"{results['per_platform'][1]:>15.2f} | {results['bulk'][1]:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
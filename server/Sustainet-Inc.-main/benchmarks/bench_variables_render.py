@@ -0,0 +1,57 @@
+"""
+VariablesRenderer 渲染效能基準測試。
+
+比較原始的兩次正規表達式替換與預先解析的 CompiledTemplate 在長提示詞上的
+單次渲染耗時。
+
+執行方式：
+    python -m benchmarks.bench_variables_render
+"""
+from benchmarks._support import timed
+
+from src.utils.variables_render import VariablesRenderer, _render_with_regex
+
+REPEAT = 2000
+
+
+def _prompt(sections: int) -> str:
+    section = (
+        "## 平台 {platform_name}\n"
+        "受眾：{{platform_audience}}，目前信任度 {player_trust} / {ai_trust}。\n"
+        "參考新聞一：{{news_1_title}}\n{news_1_content}\n"
+        "參考新聞二：{{news_2_title}}\n{news_2_content}\n"
+        "請遵守以下規則，輸出 JSON，不要加入多餘說明。\n"
+    )
+    return section * sections
+
+
+def _variables() -> dict:
+    return {
+        "platform_name": "Facebook",
+        "platform_audience": "長輩",
+        "player_trust": 55,
+        "ai_trust": 45,
+        "news_1_title": "太陽能板污染？",
+        "news_1_content": "部分研究指出太陽能板製程有污染。" * 10,
+        "news_2_title": "風電噪音",
+        "news_2_content": "居民抱怨風機噪音影響睡眠。" * 10,
+        "available_tools": [{"tool_name": "情緒刺激", "description": "提高訊息的情緒張力"}],
+    }
+
+
+def main() -> None:
+    variables = _variables()
+    print(f"{'sections':>8} | {'chars':>6} | {'regex µs':>9} | {'compiled µs':>11} | {'speedup':>7}")
+    for sections in (1, 5, 20):
+        text = _prompt(sections)
+        assert VariablesRenderer.render_variables(text, variables) == _render_with_regex(text, variables)
+        regex_ms = timed(lambda: _render_with_regex(text, variables), repeat=REPEAT)
+        compiled_ms = timed(lambda: VariablesRenderer.render_variables(text, variables), repeat=REPEAT)
+        print(
+            f"{sections:>8} | {len(text):>6} | {regex_ms * 1000:>9.1f} | "
+            f"{compiled_ms * 1000:>11.1f} | {regex_ms / compiled_ms:>6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,19 @@
 # src/main.py
 import uvicorn
 
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from src.api.middleware.cors import setup_cors
+from src.api.middleware.db_stats import setup_db_stats
 from contextlib import asynccontextmanager
-from sqlalchemy.orm import Session
-from sqlalchemy import text
 
-from src.api.routes import games_router, agents_router, news_router
+from src.api.routes import games_router, agents_router, news_router, game_socket_router
 from src.api.middleware.error_handler import setup_exception_handlers
 from src.config import settings
 from src.utils.logger import logger
-from src.infrastructure.database.session import get_db
+from src.infrastructure.database.health import database_probe
+from src.infrastructure.database.pool_metrics import pool_metrics_snapshot
+from src.utils.metrics import CONTENT_TYPE, metrics
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -35,33 +37,38 @@ app = FastAPI(
 # 設定 CORS
 setup_cors(app)
 
+# 設定資料庫使用統計（每個請求的連線與 commit 次數）
+setup_db_stats(app)
+
 # 設定全局異常處理
 setup_exception_handlers(app)
 
 # 加載 API 路由
 app.include_router(games_router, prefix="/api/games")
+app.include_router(game_socket_router, prefix="/api/games")
 app.include_router(agents_router, prefix="/api/agents")
 app.include_router(news_router, prefix="/api/news")
 
 # 健康檢查端點
 @app.get("/api/health")
-def health_check(db: Session = Depends(get_db)):
-    try:
-        # 測試資料庫連線
-        db.execute(text("SELECT 1"))
-        db_status = "connected"
-    except Exception as e:
-        logger.error(f"資料庫連線檢查失敗: {str(e)}")
-        db_status = "disconnected"
-    
+def health_check():
+    # 直接以 engine 探測（不建立 Session），結果在 DB_HEALTH_CACHE_TTL 秒內重用
     return {
         "status": "ok",
         "environment": settings.app_env,
         "version": app.version,
-        "database": {
-            "status": db_status
-        }
+        "database": database_probe.check()
     }
 
+# 內部連線池統計端點（不列入 OpenAPI 文件）
+@app.get("/api/internal/db-pool-stats", include_in_schema=False)
+def db_pool_stats():
+    return pool_metrics_snapshot()
+
+# 效能指標端點（Prometheus 文字格式，不列入 OpenAPI 文件）
+@app.get("/api/metrics", include_in_schema=False)
+def metrics_endpoint():
+    return PlainTextResponse(metrics.render(), media_type=CONTENT_TYPE)
+
 if __name__ == "__main__":
     uvicorn.run("main:app", host="0.0.0.0", port=settings.app_port, reload=True)
\ No newline at end of file
@@ -2,5 +2,6 @@
 
 from .cors import setup_cors
 from .error_handler import setup_exception_handlers
+from .db_stats import setup_db_stats
 
-__all__ = ["setup_cors", "setup_exception_handlers"]
+__all__ = ["setup_cors", "setup_exception_handlers", "setup_db_stats"]
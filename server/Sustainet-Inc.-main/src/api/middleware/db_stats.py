@@ -0,0 +1,43 @@
+"""
+資料庫使用統計中間件。
+統計每個請求的連線取用與 commit 次數，並透過回應標頭回報。
+"""
+from fastapi import FastAPI, Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from src.infrastructure.database.session_stats import track_session_stats
+from src.utils.logger import logger
+
+# 回應標頭名稱
+DB_CONNECTIONS_HEADER = "X-DB-Connections"
+DB_COMMITS_HEADER = "X-DB-Commits"
+
+
+def setup_db_stats(app: FastAPI) -> None:
+    """
+    設定資料庫使用統計中間件。
+
+    每個回應都會帶上 X-DB-Connections 與 X-DB-Commits 標頭，
+    可用來確認一個回合只花費一條連線與一次交易。
+
+    Args:
+        app: FastAPI 應用實例
+    """
+    app.add_middleware(BaseHTTPMiddleware, dispatch=_db_stats_dispatch)
+
+
+# === 私有函數 ===
+
+async def _db_stats_dispatch(request: Request, call_next):
+    with track_session_stats() as stats:
+        response = await call_next(request)
+
+    response.headers[DB_CONNECTIONS_HEADER] = str(stats.connections)
+    response.headers[DB_COMMITS_HEADER] = str(stats.commits)
+
+    if stats.connections:
+        logger.debug("Request database usage", extra={
+            "path": request.url.path,
+            **stats.to_dict()
+        })
+    return response
@@ -22,6 +22,7 @@ from src.utils.exceptions import (
     BusinessLogicError
 )
 from src.utils.logger import logger
+from src.utils.metrics import errors_total
 from src.config import settings
 
 
@@ -128,6 +129,11 @@ _DEFAULT_EXCEPTION_MAPPING = {
 }
 
 
+def _count_error(exc: Exception, status_code: int) -> None:
+    """累計錯誤次數（/api/metrics）"""
+    errors_total.labels(type(exc).__name__, status_code).inc()
+
+
 def _format_error_response(error: APIError) -> Dict[str, Any]:
     """格式化錯誤響應"""
     response = {
@@ -146,6 +152,7 @@ def _format_error_response(error: APIError) -> Dict[str, Any]:
 
 async def api_exception_handler(request: Request, exc: APIError) -> JSONResponse:
     """處理 API 錯誤"""
+    _count_error(exc, exc.status_code)
     logger.error(f"API 錯誤: {exc.message}", extra={
         "status_code": exc.status_code,
         "error_code": exc.error_code,
@@ -171,6 +178,7 @@ async def app_exception_handler(request: Request, exc: AppError) -> JSONResponse
         details=exc.details
     )
     
+    _count_error(exc, api_error.status_code)
     logger.error(f"應用程序錯誤: {exc.message}", extra={
         "error_code": exc.error_code,
         "path": request.url.path,
@@ -191,6 +199,7 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
         error_code=f"HTTP_{exc.status_code}"
     )
     
+    _count_error(exc, exc.status_code)
     logger.error(f"HTTP 錯誤: {error.message}", extra={
         "status_code": error.status_code,
         "path": request.url.path
@@ -219,6 +228,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         details=details
     )
     
+    _count_error(exc, error.status_code)
     logger.error(f"驗證錯誤: {error.message}", extra={
         "path": request.url.path,
         "details": details
@@ -244,6 +254,7 @@ async def generic_exception_handler(request: Request, exc: Exception) -> JSONRes
     else:
         error = error_class(message=str(exc))
     
+    _count_error(exc, error.status_code)
     logger.error(f"未處理的異常: {exc}", extra={
         "exception_type": type(exc).__name__,
         "path": request.url.path
@@ -1,6 +1,7 @@
 from .games import router as games_router
 from .agents import router as agents_router
 from .news import router as news_router
+from .game_socket import router as game_socket_router
 
-__all__ = ["games_router", "agents_router", "news_router"]
+__all__ = ["games_router", "agents_router", "news_router", "game_socket_router"]
 
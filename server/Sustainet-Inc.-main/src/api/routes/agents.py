@@ -18,7 +18,7 @@ from src.utils.exceptions import ResourceNotFoundError, BusinessLogicError
 from src.application.services.agent_service import AgentService
 from src.domain.logic.agent_factory import AgentFactory
 from src.infrastructure.database.agent_repo import AgentRepository
-from src.infrastructure.database.db import get_db
+from src.infrastructure.database.session import get_db
 
 router = APIRouter(prefix="/agents", 
                    tags=["agents"])
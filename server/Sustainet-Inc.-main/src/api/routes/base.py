@@ -11,9 +11,10 @@ from functools import lru_cache
 
 from fastapi import Depends
 from fastapi.routing import APIRouter
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, sessionmaker
 
-from src.infrastructure.database.session import get_db
+from src.infrastructure.database.session import get_async_db, get_db, SessionLocal
 
 # 用於定義服務類型
 ServiceType = TypeVar('ServiceType')
@@ -116,7 +117,7 @@ def inject_service(service_class: Type[ServiceType]) -> Callable[[Session], Serv
 # 導入服務類別型別
 from src.application.services.agent_service import AgentService
 from src.application.services.news_service import NewsService
-from src.application.services.game_service import GameService
+from src.application.services.game_service import GameService, create_game_service
 from src.domain.logic.agent_factory import AgentFactory
 from src.infrastructure.database.agent_repo import AgentRepository
 from src.infrastructure.database.game_setup_repo import GameSetupRepository
@@ -136,12 +137,33 @@ def get_news_service(db: Session = Depends(get_db)) -> NewsService:
     """獲取 News 服務實例"""
     return NewsService(db=db)
 
+async def get_async_news_service(db: AsyncSession = Depends(get_async_db)) -> NewsService:
+    """獲取使用非同步 Session 的 News 服務實例（供 async 路由使用）"""
+    return NewsService(async_db=db)
+
 def get_agent_factory(db: Session = Depends(get_db)) -> AgentFactory:
     """獲取 AgentFactory 實例"""
     return AgentFactory(AgentRepository(db=db))
 
 def get_game_service(db: Session = Depends(get_db)) -> GameService:
-    """獲取 GameService 實例"""
+    """
+    獲取 GameService 實例。
+
+    所有 Repository 綁定同一個請求範圍的 Session（工作單元），
+    整個回合的寫入只使用一條連線，並在請求結束時 commit 一次；
+    非同步回合在等待 Agent 前會先提交，連線不隨模型呼叫一起等待。
+    新聞與工具等參考資料另以獨立 Session 讀取，以便在 AI 回合中並行；
+    Agent 設定在等待並行名額前讀取，同樣使用獨立的短 Session。
+    回合路由仍使用同步 Repository（資料庫階段在執行緒中執行）；唯讀路由改用 get_async_game_service。
+    組裝方式見 create_game_service（持久化模擬也使用同一套）。
+    """
+    return create_game_service(db, read_session_factory=SessionLocal)
+
+async def get_async_game_service(db: AsyncSession = Depends(get_async_db)) -> GameService:
+    """
+    獲取以非同步 Session 讀取的 GameService（遊戲列表、排行榜、面板等唯讀路由使用）。
+    同步 Repository 不綁定 Session，只有 a 開頭的唯讀協程方法可以使用，請求不佔用執行緒池。
+    """
     return GameService(
         setup_repo=GameSetupRepository(),
         state_repo=PlatformStateRepository(),
@@ -149,5 +171,17 @@ def get_game_service(db: Session = Depends(get_db)) -> GameService:
         action_repo=ActionRecordRepository(),
         round_repo=GameRoundRepository(),
         tool_repo=ToolRepository(),
-        tool_usage_repo=ToolUsageRepository()
+        tool_usage_repo=ToolUsageRepository(),
+        async_db=db
     )
+
+def get_session_factory() -> sessionmaker:
+    """
+    獲取 Session 工廠。
+    串流回應在依賴結束（Session 關閉）後才開始產生內容，需在串流中自行開啟 Session。
+    """
+    return SessionLocal
+
+def get_game_service_builder() -> Callable[[Session], GameService]:
+    """獲取以指定 Session 建立 GameService 的函數（供串流路由在自行開啟的 Session 上使用）"""
+    return get_game_service
@@ -0,0 +1,338 @@
+"""
+遊戲 WebSocket 頻道。
+
+每場遊戲一條連線（/api/games/ws/{session_id}），取代逐一呼叫
+/ai-turn、/player-turn、/next-round 並輪詢結果的做法：
+- 每個行動使用自己的短 Session，遊戲狀態持續保留在熱資料存放中，連線閒置時不佔用資料庫連線
+- 客戶端以訊息送出玩家行動，伺服器推送回合進度、AI 回合結果與平台狀態的變化
+- 傳送佇列有上限，客戶端太慢時先丟棄 token 片段，其他訊息等待佇列空出
+- 伺服器定期送出 ping，超過 WS_HEARTBEAT_TIMEOUT 秒未收到任何訊息即關閉連線
+
+客戶端訊息：
+    {"type": "player_turn", "article": {...}, "tool_used": [...]}   round_number 可省略（預設為目前回合）
+    {"type": "ai_turn"}                                             重新執行目前回合的 AI 行動
+    {"type": "next_round"}                                          進入下一回合並執行 AI 行動
+    {"type": "ping"} / {"type": "pong"}
+
+伺服器訊息：
+    connected    連線成功，附目前回合與平台狀態
+    started / stage / token   回合進度，內容同 SSE 串流的事件
+    result       {"action": ..., "data": 回合回應}，回合已寫入資料庫
+    dashboard    與上次推送相比有變化的平台欄位，以及遊戲結束資訊
+    error        {"action": ..., "status_code": ..., "detail": ...}
+    ping / pong
+"""
+import asyncio
+import time
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+import orjson
+from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect, status
+from pydantic import ValidationError as PydanticValidationError
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.api.routes.base import get_game_service_builder, get_session_factory
+from src.api.routes.games import turn_error_status
+from src.application.dto.game_dto import AiTurnRequest, PlayerTurnRequest, StartNextRoundRequest
+from src.application.services.game_service import GameService
+from src.application.services.turn_events import EVENT_RESULT, EVENT_TOKEN
+from src.config import settings
+from src.infrastructure.database.game_state_store import GameStateStore
+from src.infrastructure.database.session import UnitOfWork
+from src.utils.exceptions import ResourceNotFoundError, ValidationError
+from src.utils.logger import logger
+from src.utils.metrics import errors_total, metrics
+
+# 關閉代碼（4000-4999 為應用程式自訂）
+WS_CLOSE_SESSION_NOT_FOUND = 4404
+WS_CLOSE_HEARTBEAT_TIMEOUT = 4408
+
+# 傳送佇列已滿時可以丟棄的訊息類型
+DROPPABLE_MESSAGES = frozenset({EVENT_TOKEN, "ping"})
+
+ws_messages_dropped_total = metrics.counter(
+    "sustainet_ws_messages_dropped_total", "WebSocket 傳送佇列已滿而丟棄的訊息數", ["type"]
+)
+
+router = APIRouter(tags=["games"])
+
+
+class Outbox:
+    """
+    有界的傳送佇列，由單一傳送任務寫入 WebSocket。
+
+    佇列已滿時，token 片段與 ping 直接丟棄並計入 dropped；
+    其他訊息（階段、結果、錯誤）等待佇列空出，使回合處理隨客戶端速度放慢。
+    """
+
+    def __init__(self, maxsize: int):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.dropped = 0
+
+    async def put(self, message: Dict[str, Any]) -> bool:
+        """放入訊息，返回是否成功（丟棄時為 False）"""
+        if message["type"] in DROPPABLE_MESSAGES:
+            try:
+                self.queue.put_nowait(message)
+            except asyncio.QueueFull:
+                self.dropped += 1
+                ws_messages_dropped_total.labels(message["type"]).inc()
+                return False
+            return True
+        await self.queue.put(message)
+        return True
+
+    async def drain(self, websocket: WebSocket) -> None:
+        """持續將佇列中的訊息送出"""
+        while True:
+            message = await self.queue.get()
+            await websocket.send_text(orjson.dumps(message).decode())
+
+
+class GameChannel:
+    """
+    一條 WebSocket 連線上的遊戲狀態。
+
+    連線本身不持有 Session：載入目前回合與每個行動各自開啟短 Session，
+    行動中的 GameService 在等待 Agent 前即提交，行動結束時 commit 並關閉 Session，
+    連線閒置或等待模型時都不佔用資料庫連線。
+    並記住上次推送的平台狀態，回合結束後只推送有變化的欄位。
+
+    用法示例:
+    ```python
+    channel = GameChannel("game_xxx", SessionLocal, get_game_service)
+    connected = await channel.open()
+    async for message in channel.handle({"type": "player_turn", "article": {...}}):
+        await websocket.send_json(message)
+    ```
+    """
+
+    def __init__(
+        self,
+        session_id: str,
+        session_factory: sessionmaker,
+        build_service: Callable[[Session], GameService]
+    ):
+        self.session_id = session_id
+        self.session_factory = session_factory
+        self.build_service = build_service
+        self.state_store: Optional[GameStateStore] = None
+        self.round_number: Optional[int] = None
+        self.platforms: Dict[str, Dict[str, int]] = {}
+
+    async def open(self) -> Dict[str, Any]:
+        """
+        載入目前回合並放入熱資料存放，返回 connected 訊息。
+        載入在自己的工作單元中完成，返回前交易已結束。
+
+        Raises:
+            ResourceNotFoundError: 遊戲不存在
+        """
+        await asyncio.to_thread(self._load_current_round)
+        return {
+            "type": "connected",
+            "session_id": self.session_id,
+            "round_number": self.round_number,
+            "platform_status": [{"platform_name": name, **state} for name, state in self.platforms.items()],
+            "heartbeat_interval": settings.ws_heartbeat_interval,
+        }
+
+    async def handle(self, message: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        處理一則客戶端行動，依序產生要推送的訊息；失敗時 rollback 並產生 error 訊息。
+        每個行動使用自己的 Session，commit、rollback 與 close 都放到執行緒中執行。
+        """
+        action = message.get("type")
+        result = None
+        session = self.session_factory()
+        try:
+            try:
+                async with aclosing(self._start(self.build_service(session), action, message)) as events:
+                    async for event in events:
+                        if event.event == EVENT_RESULT:
+                            result = event.data
+                        else:
+                            yield {"type": event.event, **event.data}
+                await asyncio.to_thread(session.commit)
+            except Exception as e:
+                await asyncio.to_thread(session.rollback)
+                status_code = (
+                    status.HTTP_400_BAD_REQUEST
+                    if isinstance(e, (ValidationError, PydanticValidationError))
+                    else turn_error_status(e)
+                )
+                errors_total.labels(type(e).__name__, status_code).inc()
+                if status_code >= status.HTTP_500_INTERNAL_SERVER_ERROR:
+                    logger.error("WebSocket 行動失敗: %s", e, extra={"session_id": self.session_id, "action": action})
+                yield {"type": "error", "action": action, "status_code": status_code, "detail": str(e)}
+                return
+        finally:
+            await asyncio.to_thread(session.close)
+
+        self.round_number = result["round_number"]
+        yield {"type": "result", "action": action, "data": result}
+        dashboard = self._dashboard_delta(result)
+        if dashboard is not None:
+            yield dashboard
+
+    def keep_alive(self) -> None:
+        """延長遊戲在熱資料存放中的保留時間"""
+        self.state_store.touch(self.session_id)
+
+    # === 私有方法 ===
+
+    def _start(self, service: GameService, action: Optional[str], message: Dict[str, Any]):
+        payload = {key: value for key, value in message.items() if key != "type"}
+        payload["session_id"] = self.session_id
+        payload.setdefault("round_number", self.round_number)
+        if action == "player_turn":
+            return service.astream_player_turn(PlayerTurnRequest(**payload))
+        if action == "ai_turn":
+            return service.astream_ai_turn(AiTurnRequest(**payload))
+        if action == "next_round":
+            return service.astream_next_round(StartNextRoundRequest(session_id=self.session_id))
+        raise ValidationError(f"未知的訊息類型: {action}")
+
+    def _load_current_round(self) -> None:
+        with UnitOfWork(self.session_factory) as uow:
+            service = self.build_service(uow.session)
+            latest = service.round_repo.get_latest_round_by_session(self.session_id)
+            game = service.game_state_manager.rebuild_game_state(self.session_id, latest.round_number)
+        self.state_store = service.state_store
+        self.round_number = latest.round_number
+        self.platforms = {
+            platform.name: {
+                "player_trust": platform.player_trust.value,
+                "ai_trust": platform.ai_trust.value,
+                "spread_rate": platform.spread_rate.value,
+            }
+            for platform in game.platforms
+        }
+
+    def _dashboard_delta(self, result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        changes: Dict[str, Dict[str, int]] = {}
+        for state in result.get("platform_status") or []:
+            name = state.get("platform_name")
+            previous = self.platforms.setdefault(name, {})
+            changed = {
+                field: state[field]
+                for field in ("player_trust", "ai_trust", "spread_rate")
+                if state.get(field) is not None and previous.get(field) != state[field]
+            }
+            if changed:
+                previous.update(changed)
+                changes[name] = changed
+        if not changes and not result.get("game_end_info"):
+            return None
+        return {
+            "type": "dashboard",
+            "round_number": result["round_number"],
+            "changes": changes,
+            "game_end_info": result.get("game_end_info"),
+        }
+
+
+class GameConnection:
+    """
+    一條 WebSocket 連線的收發：接收、行動處理、傳送與心跳各為一個任務，
+    任一任務結束（客戶端斷線、心跳逾時）時取消其餘任務。
+    """
+
+    def __init__(self, websocket: WebSocket, channel: GameChannel):
+        self.websocket = websocket
+        self.channel = channel
+        self.outbox = Outbox(settings.ws_send_queue_size)
+        self.actions: asyncio.Queue = asyncio.Queue(maxsize=settings.ws_max_pending_actions)
+        self.last_seen = time.monotonic()
+
+    async def serve(self, connected: Dict[str, Any]) -> None:
+        await self.outbox.put(connected)
+        heartbeat = asyncio.create_task(self._heartbeat())
+        tasks = [
+            asyncio.create_task(self.outbox.drain(self.websocket)),
+            asyncio.create_task(self._receive()),
+            asyncio.create_task(self._process_actions()),
+            heartbeat,
+        ]
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            # 連線本身被取消時也要停止其餘任務，避免斷線後仍在處理行動
+            for task in tasks:
+                task.cancel()
+        # 等其餘任務確實結束（進行中行動的 Session 已關閉）後才返回
+        await asyncio.wait(tasks)
+
+        for task in done:
+            error = task.exception()
+            if error is not None and not isinstance(error, WebSocketDisconnect):
+                logger.error("WebSocket 連線異常結束: %s", error, extra={"session_id": self.channel.session_id})
+        if heartbeat in done and heartbeat.exception() is None:
+            await self.websocket.close(code=WS_CLOSE_HEARTBEAT_TIMEOUT, reason="heartbeat timeout")
+
+    async def _receive(self) -> None:
+        while True:
+            text = await self.websocket.receive_text()
+            self.last_seen = time.monotonic()
+            try:
+                message = orjson.loads(text)
+            except orjson.JSONDecodeError:
+                await self.outbox.put({"type": "error", "action": None, "status_code": 400, "detail": "訊息必須是 JSON"})
+                continue
+            if not isinstance(message, dict):
+                await self.outbox.put({"type": "error", "action": None, "status_code": 400, "detail": "訊息必須是 JSON 物件"})
+                continue
+
+            if message.get("type") == "ping":
+                await self.outbox.put({"type": "pong"})
+            elif message.get("type") == "pong":
+                continue
+            else:
+                try:
+                    self.actions.put_nowait(message)
+                except asyncio.QueueFull:
+                    await self.outbox.put({
+                        "type": "error", "action": message.get("type"),
+                        "status_code": status.HTTP_429_TOO_MANY_REQUESTS, "detail": "待處理的行動過多，請等待目前回合完成"
+                    })
+
+    async def _process_actions(self) -> None:
+        # 行動依序處理，同一場遊戲同一時間只有一個回合進行
+        while True:
+            message = await self.actions.get()
+            async with aclosing(self.channel.handle(message)) as replies:
+                async for reply in replies:
+                    await self.outbox.put(reply)
+
+    async def _heartbeat(self) -> None:
+        """定期送出 ping 並延長遊戲保留時間；客戶端逾時未回應時返回"""
+        while True:
+            await asyncio.sleep(settings.ws_heartbeat_interval)
+            if time.monotonic() - self.last_seen > settings.ws_heartbeat_timeout:
+                logger.info("WebSocket 心跳逾時", extra={"session_id": self.channel.session_id})
+                return
+            self.channel.keep_alive()
+            await self.outbox.put({"type": "ping"})
+
+
+@router.websocket("/ws/{session_id}")
+async def game_socket(
+    websocket: WebSocket,
+    session_id: str,
+    session_factory: sessionmaker = Depends(get_session_factory),
+    build_service: Callable[[Session], GameService] = Depends(get_game_service_builder)
+):
+    """
+    ## 遊戲 WebSocket 頻道
+    先以 POST /start 建立遊戲，再以 session_id 連線；訊息格式見模組說明。
+    遊戲不存在時以關閉代碼 4404 關閉，心跳逾時以 4408 關閉。
+    """
+    await websocket.accept()
+    channel = GameChannel(session_id, session_factory, build_service)
+    try:
+        connected = await channel.open()
+    except ResourceNotFoundError as e:
+        await websocket.close(code=WS_CLOSE_SESSION_NOT_FOUND, reason=str(e)[:120])
+        return
+    await GameConnection(websocket, channel).serve(connected)
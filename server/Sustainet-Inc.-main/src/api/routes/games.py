@@ -3,25 +3,102 @@ Game 相關的 API 路由。
 提供遊戲初始化與回合管理的 HTTP 端點。
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import asyncio
+from typing import AsyncIterator, Callable, Dict, Literal, Optional
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session, sessionmaker
 from src.application.services.game_service import GameService
+from src.application.services.turn_events import EVENT_ERROR, EVENT_RESULT, TurnEvent
 from src.application.dto.game_dto import ( 
     NewsPolishRequest, NewsPolishResponse,
     GameStartRequest, GameStartResponse,
     AiTurnRequest, AiTurnResponse,
     PlayerTurnRequest, PlayerTurnResponse,
     StartNextRoundRequest, StartNextRoundResponse,
-    GameDashboardRequest, GameDashboardResponse
+    GameDashboardRequest, GameDashboardResponse,
+    GameListResponse
     )
-from src.utils.exceptions import ResourceNotFoundError, BusinessLogicError
-from src.api.routes.base import get_game_service
+from src.utils.exceptions import ResourceNotFoundError, BusinessLogicError, ExternalServiceError, ValidationError
+from src.api.routes.base import (
+    get_async_game_service, get_game_service, get_game_service_builder, get_session_factory
+)
+from src.infrastructure.database.response_cache import polish_cache
+from src.utils.logger import logger
+from src.utils.metrics import errors_total
 
 # 建立路由器
 router = APIRouter(tags=["games"])
 
+# 遊戲列表 / 排行榜每頁筆數
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+# SSE 回應標頭：停用快取與反向代理緩衝，事件才會即時送達
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def _agent_error_status(e: ExternalServiceError) -> int:
+    """Agent 呼叫逾時回 504，排隊名額不足或提供商錯誤回 503"""
+    if e.error_code == "AGENT_TIMEOUT":
+        return status.HTTP_504_GATEWAY_TIMEOUT
+    return status.HTTP_503_SERVICE_UNAVAILABLE
+
+
+def turn_error_status(e: Exception) -> int:
+    """回合錯誤對應的 HTTP 狀態碼（與非串流路由相同）"""
+    if isinstance(e, ResourceNotFoundError):
+        return status.HTTP_404_NOT_FOUND
+    if isinstance(e, BusinessLogicError):
+        return status.HTTP_400_BAD_REQUEST
+    if isinstance(e, ExternalServiceError):
+        return _agent_error_status(e)
+    return status.HTTP_500_INTERNAL_SERVER_ERROR
+
+
+def _sse(event: TurnEvent) -> bytes:
+    """將回合事件編碼為一則 SSE 訊息"""
+    return b"event: " + event.event.encode() + b"\ndata: " + orjson.dumps(event.data) + b"\n\n"
+
+
+async def _stream_turn(
+    session_factory: sessionmaker,
+    build_service: Callable[[Session], GameService],
+    start_stream: Callable[[GameService], AsyncIterator[TurnEvent]]
+) -> AsyncIterator[bytes]:
+    """
+    以自行開啟的 Session 串流執行回合。
+    最終結果在 commit 之後才送出，客戶端收到 result 時回合已寫入資料庫；
+    回合失敗時 rollback，並以 error 事件取代 result。
+    commit、rollback 與 close 都會等待資料庫，一律放到執行緒中執行，不阻塞事件迴圈。
+    """
+    session = session_factory()
+    try:
+        result = None
+        try:
+            async for event in start_stream(build_service(session)):
+                if event.event == EVENT_RESULT:
+                    result = event
+                else:
+                    yield _sse(event)
+            await asyncio.to_thread(session.commit)
+        except Exception as e:
+            await asyncio.to_thread(session.rollback)
+            status_code = turn_error_status(e)
+            errors_total.labels(type(e).__name__, status_code).inc()
+            if status_code >= status.HTTP_500_INTERNAL_SERVER_ERROR:
+                logger.error("串流回合失敗: %s", e, extra={"exception_type": type(e).__name__})
+            yield _sse(TurnEvent(EVENT_ERROR, {"status_code": status_code, "detail": str(e)}))
+            return
+        yield _sse(result)
+    finally:
+        await asyncio.to_thread(session.close)
+
 
 @router.post("/start", response_model=GameStartResponse, status_code=status.HTTP_201_CREATED)
-def start_game(service: GameService = Depends(get_game_service)):
+async def start_game(service: GameService = Depends(get_game_service)):
     """
     ## 開始新遊戲
     建立一場新的遊戲並初始化三個平台與受眾，預設 AI 先攻。
@@ -41,12 +118,17 @@ def start_game(service: GameService = Depends(get_game_service)):
     不需傳入任何 body，直接送 POST 請求即可。
     """
     try:
-        return service.start_game()
+        return await service.astart_game()
     except ResourceNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e)
         )
+    except ExternalServiceError as e:
+        raise HTTPException(
+            status_code=_agent_error_status(e),
+            detail=str(e)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -55,7 +137,7 @@ def start_game(service: GameService = Depends(get_game_service)):
 
 
 @router.post("/polish-news", response_model=NewsPolishResponse)
-def polish_news(
+async def polish_news(
     request: NewsPolishRequest,
     service: GameService = Depends(get_game_service)
 ):
@@ -70,10 +152,13 @@ def polish_news(
     - **platform_user**: (可選) 平台用戶名稱/特徵
     - **current_situation**: (可選) 當前狀況描述
     - **additional_context**: (可選) 其他上下文資訊
+    - **bypass_cache**: (可選) 略過潤稿快取，強制重新呼叫 Agent
+
+    相同的提示詞、Agent 版本與模型會直接返回快取的潤稿結果。
     """
     try:
         # 使用服務層進行潤稿
-        return service.polish_news(request)
+        return await service.apolish_news(request)
     except ResourceNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -84,14 +169,27 @@ def polish_news(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
+    except ExternalServiceError as e:
+        raise HTTPException(
+            status_code=_agent_error_status(e),
+            detail=str(e)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"潤稿過程發生錯誤: {str(e)}"
         )
         
+@router.get("/polish-news/cache-stats")
+async def polish_cache_stats():
+    """
+    ## 潤稿快取統計
+    回傳潤稿回應快取的後端、命中 / 未命中 / 略過次數、命中率與目前項目數。
+    """
+    return await asyncio.to_thread(polish_cache.stats)
+
 @router.post("/ai-turn", response_model=AiTurnResponse)
-def ai_turn(
+async def ai_turn(
     request: AiTurnRequest,
     service: GameService = Depends(get_game_service)
 ):
@@ -118,7 +216,7 @@ def ai_turn(
     * 請確保 session_id 與 round_number 有對應的遊戲狀態，否則會回 404。
     """
     try:
-        return service.ai_turn(request)
+        return await service.aai_turn(request)
     except ResourceNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -129,14 +227,43 @@ def ai_turn(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
+    except ExternalServiceError as e:
+        raise HTTPException(
+            status_code=_agent_error_status(e),
+            detail=str(e)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"AI 回合過程發生錯誤: {str(e)}"
         )
 
+@router.post("/ai-turn/stream")
+async def ai_turn_stream(
+    request: AiTurnRequest,
+    session_factory: sessionmaker = Depends(get_session_factory),
+    build_service: Callable[[Session], GameService] = Depends(get_game_service_builder)
+):
+    """
+    ## AI 回合請求（SSE 串流）
+    與 /ai-turn 相同的請求，回應改為 text/event-stream，回合進行中即時推送進度。
+
+    ### 事件
+    * started: 回合開始（session_id、round_number、actor）
+    * stage: 階段完成，data.stage 依序為
+      state_loaded、article_drafted（附 article）、gm_evaluating、tool_effects_applied、state_persisted
+    * token: Agent 輸出片段（data.agent、data.delta），模型支援串流時才會出現
+    * result: 最後一個事件，內容同 /ai-turn 的回應（AiTurnResponse），此時回合已寫入資料庫
+    * error: 回合失敗（data.status_code 與 /ai-turn 的錯誤狀態碼相同、data.detail），取代 result
+    """
+    return StreamingResponse(
+        _stream_turn(session_factory, build_service, lambda service: service.astream_ai_turn(request)),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS
+    )
+
 @router.post("/player-turn", response_model=PlayerTurnResponse)
-def player_turn(
+async def player_turn(
     request: PlayerTurnRequest,
     service: GameService = Depends(get_game_service)
 ):
@@ -179,7 +306,7 @@ def player_turn(
     欄位如未使用可設為 null 或留空，後端會自動處理。
     """
     try:
-        return service.player_turn(request)
+        return await service.aplayer_turn(request)
     except ResourceNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -190,14 +317,36 @@ def player_turn(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
+    except ExternalServiceError as e:
+        raise HTTPException(
+            status_code=_agent_error_status(e),
+            detail=str(e)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"玩家回合過程發生錯誤: {str(e)}"
         )
 
+@router.post("/player-turn/stream")
+async def player_turn_stream(
+    request: PlayerTurnRequest,
+    session_factory: sessionmaker = Depends(get_session_factory),
+    build_service: Callable[[Session], GameService] = Depends(get_game_service_builder)
+):
+    """
+    ## 玩家回合請求（SSE 串流）
+    與 /player-turn 相同的請求，回應改為 text/event-stream。
+    事件同 /ai-turn/stream，最後的 result 內容同 /player-turn 的回應（PlayerTurnResponse）。
+    """
+    return StreamingResponse(
+        _stream_turn(session_factory, build_service, lambda service: service.astream_player_turn(request)),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS
+    )
+
 @router.post("/next-round", response_model=StartNextRoundResponse)
-def start_next_round(
+async def start_next_round(
     request: StartNextRoundRequest,
     service: GameService = Depends(get_game_service)
 ):
@@ -225,7 +374,7 @@ def start_next_round(
     """
 
     try:
-        return service.start_next_round(request)
+        return await service.astart_next_round(request)
     except ResourceNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -236,57 +385,135 @@ def start_next_round(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
+    except ExternalServiceError as e:
+        raise HTTPException(
+            status_code=_agent_error_status(e),
+            detail=str(e)
+        )
     except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"切換回合過程發生錯誤: {str(e)}"
             )
 
-# @router.get("/dashboard/{session_id}", response_model=GameDashboardResponse)
-# def get_game_dashboard(
-#     session_id: str,
-#     service: GameService = Depends(get_game_service)
-# ):
-#     """
-#     ## 遊戲面板（Dashboard）
-#     取得指定遊戲的完整歷史記錄和當前狀態，包含所有回合的詳細資訊。
-
-#     ### Path Parameters
-#     * session_id: 遊戲識別碼（string，由 URL 传入）
-
-#     ### Response
-#     * session_id: 遊戲識別碼
-#     * game_summary: 遊戲摘要訊息（回合數、開始時間、是否結束等）
-#     * round_records: 所有回合的詳細記錄（AI和玩家行動、平台狀態等）
-#     * current_status: 當前遊戲狀態統計（總信任值、領先者等）
-#     * game_end_info: 遊戲結束資訊（如果遊戲已結束）
-
-#     ### 使用場景
-#     適合用於前端建立遊戲面板，展示：
-#     - 遊戲進度與結束狀態
-#     - 每回合的AI和玩家行動記錄
-#     - 平台信任值變化趨勢
-#     - 社群模擬留言
-#     - 工具使用情況
-
-#     ~~~注意~~~
-#     此 API 會返回大量數據，建議前端做好緩存和分頁處理。
-#     """
-#     try:
-#         request = GameDashboardRequest(session_id=session_id)
-#         return service.get_game_dashboard(request)
-#     except ResourceNotFoundError as e:
-#         raise HTTPException(
-#             status_code=status.HTTP_404_NOT_FOUND,
-#             detail=str(e)
-#         )
-#     except BusinessLogicError as e:
-#         raise HTTPException(
-#             status_code=status.HTTP_400_BAD_REQUEST,
-#             detail=str(e)
-#         )
-#     except Exception as e:
-#         raise HTTPException(
-#             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-#             detail=f"取得遊戲面板時發生錯誤: {str(e)}"
-#         )
\ No newline at end of file
+@router.get("", response_model=GameListResponse)
+async def list_games(
+    status_filter: Optional[Literal["active", "ended"]] = Query(None, alias="status", description="遊戲狀態"),
+    winner: Optional[Literal["player", "ai", "draw"]] = Query(None, description="勝方"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="每頁筆數"),
+    cursor: Optional[str] = Query(None, description="上一頁回應的 next_cursor"),
+    service: GameService = Depends(get_async_game_service)
+):
+    """
+    ## 遊戲列表
+    依建立時間由新到舊列出遊戲，可依狀態與勝方篩選。
+
+    ### Query Parameters
+    * status: "active"（進行中）或 "ended"（已結束），選填
+    * winner: "player" / "ai" / "draw"，選填
+    * limit: 每頁筆數（1-100，預設 20）
+    * cursor: 下一頁時帶入上一頁回應的 next_cursor
+
+    ### Response
+    * items: 每場摘要（回合數、行動數、信任值總和、領先者、結束狀態）
+    * next_cursor: 下一頁的游標，沒有下一頁時為 null
+
+    ~~~注意~~~
+    以游標（keyset）分頁，不提供頁碼；任何一頁的查詢成本都相同。
+    """
+    try:
+        return await service.alist_games(limit, cursor=cursor, status=status_filter, winner=winner)
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"取得遊戲列表時發生錯誤: {str(e)}"
+        )
+
+@router.get("/leaderboard", response_model=GameListResponse)
+async def get_leaderboard(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="每頁筆數"),
+    cursor: Optional[str] = Query(None, description="上一頁回應的 next_cursor"),
+    service: GameService = Depends(get_async_game_service)
+):
+    """
+    ## 排行榜
+    已結束的遊戲依玩家各平台信任值總和由高到低排列，分頁方式同遊戲列表。
+    """
+    try:
+        return await service.aget_leaderboard(limit, cursor=cursor)
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"取得排行榜時發生錯誤: {str(e)}"
+        )
+
+@router.get("/dashboard/{session_id}", response_model=GameDashboardResponse)
+async def get_game_dashboard(
+    session_id: str,
+    request: Request,
+    response: Response,
+    service: GameService = Depends(get_async_game_service)
+):
+    """
+    ## 遊戲面板（Dashboard）
+    取得指定遊戲當前回合的資訊與平台狀態。
+
+    ### Path Parameters
+    * session_id: 遊戲識別碼（string，由 URL 传入）
+
+    ### Response
+    * session_id: 遊戲識別碼
+    * current_round: 當前回合資訊（AI 新聞、玩家回應、社群反應、效果評估）
+    * platform_status: 各平台信任值、傳播率與信任度趨勢（與上一回合比較）
+    * game_progress: 遊戲進度（目前回合、最大回合數、是否結束）
+    * game_end_info: 遊戲結束資訊（如果遊戲已結束）
+
+    ### 快取
+    回應帶有 ETag。輪詢時以 If-None-Match 送回上次的 ETag，
+    面板未變動時回 304 且沒有內容，只需一次索引查詢。
+    """
+    try:
+        etag = f'"{await service.aget_dashboard_version(session_id)}"'
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=_dashboard_headers(etag))
+        dashboard = await service.aget_game_dashboard(GameDashboardRequest(session_id=session_id))
+        response.headers.update(_dashboard_headers(etag))
+        return dashboard
+    except ResourceNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except BusinessLogicError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"取得遊戲面板時發生錯誤: {str(e)}"
+        )
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 是否包含目前的 ETag（弱比對，忽略 W/ 前綴；"*" 符合任何版本）"""
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in tags or "*" in tags
+
+
+def _dashboard_headers(etag: str) -> Dict[str, str]:
+    # no-cache：瀏覽器與代理可保存回應，但每次使用前都須以 ETag 向伺服器確認
+    return {"ETag": etag, "Cache-Control": "no-cache"}
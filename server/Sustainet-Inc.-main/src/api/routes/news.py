@@ -14,7 +14,7 @@ from src.application.dto.news_dto import (
     NewsBatchCreate,
     NewsBatchResponse
 )
-from src.api.routes.base import get_news_service
+from src.api.routes.base import get_async_news_service, get_news_service
 from src.application.services.news_service import NewsService
 from src.utils.exceptions import ResourceNotFoundError, ValidationError
 
@@ -72,6 +72,8 @@ def list_news(
     skip: int = Query(0, ge=0, description="跳過筆數"),
     limit: int = Query(100, ge=1, le=1000, description="取得筆數"),
     active_only: bool = Query(False, description="是否只取啟用中的新聞"),
+    cursor: Optional[str] = Query(None, description="上一頁回傳的 next_cursor（提供時忽略 skip）"),
+    estimate_total: bool = Query(False, description="是否使用估計的總筆數"),
     service: NewsService = Depends(get_news_service)
 ):
     """
@@ -80,18 +82,33 @@ def list_news(
     - **skip**: 跳過筆數
     - **limit**: 取得筆數
     - **active_only**: 是否只取啟用中的新聞
+    - **cursor**: 上一頁回傳的 next_cursor，使用 keyset 分頁
+    - **estimate_total**: 是否使用估計的總筆數（大量資料時較快）
     """
-    return service.list_news(skip=skip, limit=limit, active_only=active_only)
+    try:
+        return service.list_news(
+            skip=skip,
+            limit=limit,
+            active_only=active_only,
+            cursor=cursor,
+            estimate_total=estimate_total
+        )
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
 
 @router.get("/random", response_model=NewsResponse)
-def get_random_news(
+async def get_random_news(
     active_only: bool = Query(True, description="是否只取啟用中的新聞"),
     veracity: Optional[str] = Query(None, description="指定真實性標籤（不指定則不限）"),
     category: Optional[str] = Query(None, description="指定分類（不指定則不限）"),
-    service: NewsService = Depends(get_news_service)
+    service: NewsService = Depends(get_async_news_service)
 ):
     """
     隨機取得一則新聞。
+    使用非同步資料層，查詢在事件迴圈上等待，不佔用執行緒池。
     
     - **active_only**: 是否只取啟用中的新聞
     - **veracity**: 指定真實性標籤（不指定則不限）
@@ -103,7 +120,7 @@ def get_random_news(
             veracity=veracity,
             category=category
         )
-        return service.get_random_news(request)
+        return await service.aget_random_news(request)
     except (ResourceNotFoundError, ValidationError) as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND if isinstance(e, ResourceNotFoundError) else status.HTTP_400_BAD_REQUEST,
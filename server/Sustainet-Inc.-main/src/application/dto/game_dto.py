@@ -3,6 +3,7 @@ Game 相關的 DTO (Data Transfer Objects)。
 用於遊戲初始化與回合管理的資料結構定義。
 """
 
+from datetime import datetime
 from typing import List, Dict, Any, Optional
 from pydantic import BaseModel, Field
 
@@ -391,6 +392,30 @@ class StartNextRoundResponse(BaseRoundResponse):
     """
     pass
 
+# ========== 遊戲列表 / 排行榜 ==========
+
+class GameListItem(BaseModel):
+    """
+    遊戲列表的單場摘要
+    """
+    session_id: str = Field(..., description="遊戲識別碼")
+    created_at: datetime = Field(..., description="遊戲建立時間")
+    latest_round: int = Field(..., description="最新回合數")
+    action_count: int = Field(..., description="累計行動數")
+    player_total_trust: int = Field(..., description="玩家各平台信任值總和")
+    ai_total_trust: int = Field(..., description="AI 各平台信任值總和")
+    leader: str = Field(..., description="目前領先者（player / ai / draw）")
+    is_ended: bool = Field(..., description="遊戲是否已結束")
+    winner: Optional[str] = Field(None, description="勝方（遊戲結束時）")
+    end_reason: Optional[str] = Field(None, description="結束原因（遊戲結束時）")
+
+class GameListResponse(BaseModel):
+    """
+    遊戲列表 / 排行榜回應 DTO（keyset 分頁）
+    """
+    items: List[GameListItem] = Field(..., description="本頁的遊戲")
+    next_cursor: Optional[str] = Field(None, description="下一頁的游標，沒有下一頁時為 null")
+
 # ========== News 潤稿 ==========
 class NewsPolishRequest(BaseModel):
     """
@@ -404,6 +429,7 @@ class NewsPolishRequest(BaseModel):
     platform_user: Optional[str] = Field(None, description="平台用戶名稱/特徵")
     current_situation: Optional[str] = Field(None, description="當前狀況描述")
     additional_context: Optional[Dict[str, Any]] = Field(None, description="其他上下文資訊")
+    bypass_cache: bool = Field(False, description="略過潤稿快取，強制重新呼叫 Agent")
 
 class NewsPolishResponse(BaseModel):
     """
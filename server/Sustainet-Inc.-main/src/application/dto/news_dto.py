@@ -42,7 +42,8 @@ class NewsResponse(NewsBase):
 class NewsListResponse(BaseModel):
     """新聞列表回覆的資料結構。"""
     items: List[NewsResponse] = Field(..., description="新聞列表")
-    total: int = Field(..., description="總筆數")
+    total: int = Field(..., description="總筆數（estimate_total 時為估計值）")
+    next_cursor: Optional[str] = Field(None, description="下一頁游標，None 表示已無下一頁")
 
 
 class RandomNewsRequest(BaseModel):
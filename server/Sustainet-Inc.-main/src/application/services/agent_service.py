@@ -88,7 +88,7 @@ class AgentService:
         Raises:
             ResourceNotFoundError: 如果找不到 Agent
         """
-        agent = self.repo.get_by_id(agent_id, db=self.db)
+        agent = self.repo.get_by_pk(agent_id, db=self.db)
         
         return AgentResponse(
             id=agent.id,
@@ -188,7 +188,7 @@ class AgentService:
             return self.get_agent(agent_id)
                 
         # 更新 Agent
-        agent: Agent = self.repo.update(agent_id, update_data, db=self.db)
+        agent: Agent = self.repo.update_by_pk(agent_id, update_data, db=self.db)
         
         # 明確的類型標註
         created_at: datetime = agent.created_at
@@ -208,4 +208,4 @@ class AgentService:
         )
     
     def delete_agent(self, agent_id: int) -> None:
-        self.repo.delete(agent_id, db=self.db)
+        self.repo.delete_by_pk(agent_id, db=self.db)
@@ -1,6 +1,10 @@
+import asyncio
 import json
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, Callable, List, Optional, Dict, Any, Tuple
 from datetime import datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, sessionmaker
 from src.application.dto.game_dto import (
     NewsPolishRequest, NewsPolishResponse,
     GameStartRequest, GameStartResponse,
@@ -8,21 +12,37 @@ from src.application.dto.game_dto import (
     PlayerTurnRequest, PlayerTurnResponse,
     StartNextRoundRequest, StartNextRoundResponse,
     GameDashboardRequest, GameDashboardResponse, CurrentRoundInfo, PlatformDashboardStatus,
+    GameListItem, GameListResponse,
     ArticleMeta
 )
+from src.infrastructure.database.agent_repo import AgentRepository
 from src.infrastructure.database.game_setup_repo import GameSetupRepository
 from src.infrastructure.database.platform_state_repo import PlatformStateRepository
 from src.infrastructure.database.news_repo import NewsRepository
 from src.infrastructure.database.action_record_repo import ActionRecordRepository
 from src.infrastructure.database.game_round_repo import GameRoundRepository
+from src.infrastructure.database.dashboard_repo import (
+    AsyncDashboardRepository, DashboardRepository, DashboardSnapshot, PlatformTrendRow
+)
+from src.infrastructure.database.session_summary_repo import AsyncSessionSummaryRepository, SessionSummaryRepository
+from src.infrastructure.database.session import UnitOfWork
+from src.infrastructure.database.response_cache import ResponseCache, polish_cache as default_polish_cache
+from src.infrastructure.database.game_state_store import GameStateStore, game_state_store as default_state_store
+from src.application.services.turn_events import (
+    EVENT_RESULT, EVENT_STARTED, NO_TURN_EVENTS,
+    STAGE_ARTICLE_DRAFTED, STAGE_GM_EVALUATING, STAGE_STATE_LOADED, STAGE_STATE_PERSISTED,
+    STAGE_TOOL_EFFECTS_APPLIED, TurnEvent, TurnEventChannel, TurnEventSink
+)
 from src.domain.logic.agent_factory import AgentFactory
 from src.domain.logic.game_initialization import GameInitializationLogic
 from src.domain.logic.ai_turn import AiTurnLogic
 from src.domain.logic.game_master import GameMasterLogic
 from src.domain.logic.game_state import GameStateLogic
 from src.domain.logic.player_action import PlayerActionLogic
-from src.utils.exceptions import BusinessLogicError, ResourceNotFoundError
+from src.utils.exceptions import BusinessLogicError, ResourceNotFoundError, ExternalServiceError, ValidationError
 from src.utils.logger import logger
+from src.utils.metrics import turn_stage_seconds
+from src.utils.pagination import decode_cursor, encode_cursor
 
 # Tool related imports
 from src.infrastructure.database.tool_repo import ToolRepository
@@ -33,10 +53,14 @@ from src.application.dto.game_dto import ToolUsed as PlayerToolUsedDTO
 # New imports for refactored architecture
 from src.domain.logic.turn_execution import TurnExecutionLogic
 from src.domain.logic.game_state_manager import GameStateManager
+from src.domain.logic.turn_pipeline import TurnPipeline
 from src.domain.logic.response_converter import ResponseConverter
 from src.domain.logic.tool_availability_logic import ToolAvailabilityLogic
 from src.domain.logic.game_end_logic import GameEndLogic
 from src.config.game_config import game_config
+
+# 遊戲列表的狀態篩選 → session_summaries.is_ended
+GAME_STATUS_FILTERS = {"active": False, "ended": True}
         
 class GameService:
     def __init__(
@@ -49,6 +73,12 @@ class GameService:
         tool_repo: ToolRepository,
         tool_usage_repo: ToolUsageRepository,
         agent_factory: Optional[AgentFactory] = None,
+        read_session_factory: Optional[sessionmaker] = None,
+        polish_cache: Optional[ResponseCache] = None,
+        state_store: Optional[GameStateStore] = None,
+        dashboard_repo: Optional[DashboardRepository] = None,
+        summary_repo: Optional[SessionSummaryRepository] = None,
+        async_db: Optional[AsyncSession] = None,
     ):
         self.setup_repo = setup_repo
         self.state_repo = state_repo
@@ -58,6 +88,19 @@ class GameService:
         self.agent_factory = agent_factory
         self.tool_repo = tool_repo
         self.tool_usage_repo = tool_usage_repo
+        # 參考資料（新聞、工具）的獨立唯讀 Session，讓這些讀取與遊戲狀態讀取並行
+        self.read_session_factory = read_session_factory
+        # 潤稿回應快取，預設為行程共用的 polish_cache
+        self.polish_cache = polish_cache or default_polish_cache
+        # 進行中遊戲的熱資料存放，預設為行程共用的 game_state_store
+        self.state_store = state_store or default_state_store
+        # 面板讀取模型，預設與其他 Repository 共用同一個 Session
+        self.dashboard_repo = dashboard_repo or DashboardRepository(db=state_repo.db)
+        # 每場摘要，隨回合結果增量更新
+        self.summary_repo = summary_repo or SessionSummaryRepository(db=state_repo.db)
+        # 非同步讀取（遊戲列表、排行榜、面板），供 a 開頭的唯讀協程方法使用
+        self.async_summary_repo = AsyncSessionSummaryRepository(db=async_db)
+        self.async_dashboard_repo = AsyncDashboardRepository(db=async_db)
         
         # Domain logic instances
         self.game_init_logic = GameInitializationLogic()
@@ -73,13 +116,35 @@ class GameService:
         )
         self.game_state_manager = GameStateManager(
             setup_repo, state_repo, action_repo, tool_usage_repo,
-            self.game_state_logic, self.gm_logic, self.tool_effect_logic, self.agent_factory
+            self.game_state_logic, self.gm_logic, self.tool_effect_logic, self.agent_factory,
+            state_store=self.state_store,
+            summary_repo=self.summary_repo
         )
         self.tool_availability_logic = ToolAvailabilityLogic(tool_repo)
-        self.response_converter = ResponseConverter(setup_repo, self.tool_availability_logic)
+        self.response_converter = ResponseConverter(setup_repo, self.tool_availability_logic, self.state_store)
         self.game_end_logic = GameEndLogic()
 
     def start_game(self, request: Optional[GameStartRequest] = None) -> GameStartResponse:
+        ai_request = self._create_game()
+        ai_response = self.ai_turn(ai_request)
+        return GameStartResponse(**ai_response.model_dump())
+
+    async def astart_game(self, request: Optional[GameStartRequest] = None) -> GameStartResponse:
+        """
+        start_game 的協程版本，資料庫操作在執行緒中進行，Agent 呼叫以協程等待。
+        新遊戲在 AI 行動前提交，等待 Agent 時不佔用連線；
+        首回合 AI 行動失敗時刪除該遊戲，呼叫端未取得 session_id，無法接續。
+        """
+        ai_request = await asyncio.to_thread(self._run_db_phase, self._create_game)
+        try:
+            ai_response = await self.aai_turn(ai_request)
+        except Exception:
+            await asyncio.to_thread(self._discard_game, ai_request.session_id)
+            raise
+        return GameStartResponse(**ai_response.model_dump())
+
+    def _create_game(self) -> AiTurnRequest:
+        """建立新遊戲的設定、平台狀態與第一回合，返回首回合 AI 行動請求"""
         # Create new game using domain logic
         game = self.game_init_logic.create_new_game()
         
@@ -107,11 +172,33 @@ class GameService:
             round_number=game.current_round,
             is_completed=False
         )
-              
-        # Execute AI turn
-        ai_request = AiTurnRequest(session_id=game.session_id.value, round_number=game.current_round)
-        ai_response = self.ai_turn(ai_request)
-        return GameStartResponse(**ai_response.model_dump())
+        initial_states = [
+            {
+                "platform_name": platform["name"],
+                "player_trust": game_config.initial_player_trust,
+                "ai_trust": game_config.initial_ai_trust,
+                "spread_rate": game_config.initial_spread_rate
+            }
+            for platform in platforms_data
+        ]
+        self.summary_repo.create_summary(
+            session_id=game.session_id.value,
+            round_number=game.current_round,
+            standing=self.game_end_logic.evaluate_standing(game.current_round, initial_states, check_end=False)
+        )
+        self.state_store.put(game, platforms_data, db=self.state_repo.db)
+        
+        return AiTurnRequest(session_id=game.session_id.value, round_number=game.current_round)
+
+    def _discard_game(self, session_id: str) -> None:
+        """捨棄失敗回合未提交的變更，刪除已提交的新遊戲並提交"""
+        db = self.state_repo.db
+        if db is not None:
+            db.rollback()
+        self.setup_repo.delete_game(session_id, db=db)
+        self.state_store.invalidate(session_id)
+        self._release_connection()
+        logger.warning(f"首回合 AI 行動失敗，已刪除新建的遊戲: {session_id}")
 
     def ai_turn(self, request: AiTurnRequest) -> AiTurnResponse:
         return self._execute_turn(
@@ -133,7 +220,73 @@ class GameService:
             tool_list=request.tool_list
         )
 
+    async def aai_turn(self, request: AiTurnRequest) -> AiTurnResponse:
+        return await self._aexecute_turn(
+            actor="ai",
+            session_id=request.session_id,
+            round_number=request.round_number,
+            article=None,
+            tool_used=[],
+            tool_list=None
+        )
+
+    async def aplayer_turn(self, request: PlayerTurnRequest) -> PlayerTurnResponse:
+        return await self._aexecute_turn(
+            actor="player",
+            session_id=request.session_id,
+            round_number=request.round_number,
+            article=request.article,
+            tool_used=request.tool_used or [],
+            tool_list=request.tool_list
+        )
+
+    def astream_ai_turn(self, request: AiTurnRequest) -> AsyncIterator[TurnEvent]:
+        """
+        串流執行 AI 回合：依序產生 started、各階段的 stage、Agent 輸出片段的 token，
+        最後一個事件為 result（AiTurnResponse）。回合失敗時拋出與 aai_turn 相同的例外。
+        """
+        return self._astream_turn(
+            actor="ai",
+            session_id=request.session_id,
+            round_number=request.round_number,
+            article=None,
+            tool_used=[],
+            tool_list=None
+        )
+
+    def astream_player_turn(self, request: PlayerTurnRequest) -> AsyncIterator[TurnEvent]:
+        """串流執行玩家回合，事件同 astream_ai_turn，result 為 PlayerTurnResponse"""
+        return self._astream_turn(
+            actor="player",
+            session_id=request.session_id,
+            round_number=request.round_number,
+            article=request.article,
+            tool_used=request.tool_used or [],
+            tool_list=request.tool_list
+        )
+
     def start_next_round(self, request: StartNextRoundRequest) -> StartNextRoundResponse:
+        ai_request = self._create_next_round(request)
+        ai_response = self.ai_turn(ai_request)
+        return StartNextRoundResponse(**ai_response.model_dump())
+
+    async def astart_next_round(self, request: StartNextRoundRequest) -> StartNextRoundResponse:
+        """
+        start_next_round 的協程版本。新回合在 AI 行動前提交，等待 Agent 時不佔用連線；
+        AI 行動失敗時回合已存在，可再以 ai-turn 重試該回合。
+        """
+        ai_request = await asyncio.to_thread(self._run_db_phase, self._create_next_round, request)
+        ai_response = await self.aai_turn(ai_request)
+        return StartNextRoundResponse(**ai_response.model_dump())
+
+    async def astream_next_round(self, request: StartNextRoundRequest) -> AsyncIterator[TurnEvent]:
+        """串流版本的 astart_next_round：新回合提交後，產生與 astream_ai_turn 相同的事件"""
+        ai_request = await asyncio.to_thread(self._run_db_phase, self._create_next_round, request)
+        async for event in self.astream_ai_turn(ai_request):
+            yield event
+
+    def _create_next_round(self, request: StartNextRoundRequest) -> AiTurnRequest:
+        """建立下一回合的平台狀態與回合紀錄，返回該回合 AI 行動請求"""
         session_id = request.session_id
         
         last_round = self.round_repo.get_latest_round_by_session(session_id)
@@ -144,36 +297,19 @@ class GameService:
         
         # 檢查是否已達最大回合數
         if next_round_number > game_config.max_rounds:
-            # 取得最終遊戲狀態
-            final_platform_states = self.state_repo.get_by_session_and_round(
-                session_id, last_round.round_number
-            )
-            
-            platform_states_for_check = [
-                {
-                    "platform_name": state.platform_name,
-                    "player_trust": state.player_trust,
-                    "ai_trust": state.ai_trust,
-                    "spread_rate": state.spread_rate
-                }
-                for state in final_platform_states
-            ]
-            
-            game_end_result = self.game_end_logic.check_game_end_condition(
-                session_id, last_round.round_number, platform_states_for_check
-            )
-            
-            # 返回遊戲結束信息而不是開始新回合
-            raise BusinessLogicError(
-                f"遊戲已結束！{self.game_end_logic.format_game_end_summary(game_end_result)['winner_message']} "
-                f"原因：{self.game_end_logic.format_game_end_summary(game_end_result)['reason_message']}"
-            )
+            raise BusinessLogicError(self._game_ended_message(session_id, last_round.round_number))
 
-        platforms = self.setup_repo.get_by_session_id(session_id).platforms
+        # 熱資料存放命中時，平台設定與上一回合狀態都不需查詢
+        platforms = self.state_store.get_setup_platforms(session_id, db=self.state_repo.db)
+        if platforms is None:
+            platforms = self.setup_repo.get_by_session_id(session_id).platforms
         self.state_repo.create_all_platforms_states(
             session_id=session_id,
             round_number=next_round_number,
-            platforms=platforms
+            platforms=platforms,
+            previous_states=self.state_store.get_platform_states(
+                session_id, last_round.round_number, db=self.state_repo.db
+            )
         )
         
         self.round_repo.create_game_round(
@@ -181,10 +317,30 @@ class GameService:
             round_number=next_round_number,
             is_completed=False
         )
+        self.summary_repo.advance_round(session_id, next_round_number)
+        self.state_store.advance_round(session_id, next_round_number, db=self.state_repo.db)
         
-        ai_request = AiTurnRequest(session_id=session_id, round_number=next_round_number)
-        ai_response = self.ai_turn(ai_request)
-        return StartNextRoundResponse(**ai_response.model_dump())
+        return AiTurnRequest(session_id=session_id, round_number=next_round_number)
+
+    def _game_ended_message(self, session_id: str, last_round_number: int) -> str:
+        """遊戲已結束時的訊息；勝方與原因優先讀取每場摘要，摘要不存在時才以最終平台狀態計算"""
+        summary = self.summary_repo.get_by_session_id(session_id)
+        if summary is not None and summary.is_ended:
+            end = self.game_end_logic.describe_end(summary.winner, summary.end_reason)
+        else:
+            final_platform_states = [
+                {
+                    "platform_name": state.platform_name,
+                    "player_trust": state.player_trust,
+                    "ai_trust": state.ai_trust,
+                    "spread_rate": state.spread_rate
+                }
+                for state in self.state_repo.get_by_session_and_round(session_id, last_round_number)
+            ]
+            end = self.game_end_logic.format_game_end_summary(
+                self.game_end_logic.check_game_end_condition(session_id, last_round_number, final_platform_states)
+            )
+        return f"遊戲已結束！{end['winner_message']} 原因：{end['reason_message']}"
 
     def _execute_turn(
         self,
@@ -201,142 +357,311 @@ class GameService:
             "round_number": round_number
         })
         
-        # 1. 獲取當前遊戲狀態
-        current_states = self.state_repo.get_by_session_and_round(session_id, round_number)
-        if not current_states:
-            raise ResourceNotFoundError(f"找不到回合 {round_number} 的遊戲狀態")
-            
-        # 2. 獲取可用工具
-        available_tools = self.tool_availability_logic.get_available_tools(session_id, round_number)
+        if actor == "player" and not article:
+            raise BusinessLogicError("玩家回合必須提供文章內容")
+        
+        # 1. 重建當前遊戲狀態
+        with turn_stage_seconds.labels(actor, "state_load").time():
+            game = self.game_state_manager.rebuild_game_state(session_id, round_number)
+        
+        # 2. 執行回合（AI 生成新聞 / 玩家提交文章）
+        with turn_stage_seconds.labels(actor, "agent_run").time():
+            turn_result = self.turn_execution_logic.execute_actor_turn(
+                game, actor, session_id, round_number,
+                article=article,
+                player_tools=tool_used
+            )
+        
+        # 3. GM 評估並應用工具效果
+        with turn_stage_seconds.labels(actor, "gm_evaluation").time():
+            game_turn_result = self.game_state_manager.evaluate_and_apply_effects(
+                turn_result, game, self.tool_repo
+            )
+        
+        return self._complete_turn(actor, session_id, round_number, tool_list, game_turn_result)
+
+    async def _aexecute_turn(
+        self,
+        actor: str,
+        session_id: str,
+        round_number: int,
+        article: Optional[ArticleMeta],
+        tool_used: Optional[List[PlayerToolUsedDTO]],
+        tool_list: Optional[List[Dict[str, Any]]],
+        events: TurnEventSink = NO_TURN_EVENTS
+    ):
+        """
+        _execute_turn 的協程版本：資料庫階段在執行緒中進行，等待模型時不佔用執行緒。
+        各階段完成與 Agent 輸出片段會通知 events（串流回合使用）。
+        """
+        logger.info(f"Executing turn for actor: {actor}", extra={
+            "session_id": session_id, 
+            "round_number": round_number
+        })
+        
+        if actor == "player" and not article:
+            raise BusinessLogicError("玩家回合必須提供文章內容")
         
-        # 3. 執行回合
         if actor == "ai":
-            # AI 回合 - 使用模擬的 AI 行為
-            result = {
-                "content": "這是一條模擬的 AI 新聞",
-                "platform": "Facebook",
-                "reach_count": 1000,
-                "trust_change": -5,
-                "spread_change": 10,
-                "effectiveness": "medium",
-                "simulated_comments": [
-                    "這看起來不太對勁...",
-                    "需要更多證據支持",
-                    "這個說法有待商榷"
-                ]
-            }
-        else:
-            # 玩家回合
-            if not article:
-                raise BusinessLogicError("玩家回合必須提供文章內容")
-                
-            result = {
-                "content": article.content,
-                "platform": article.platform,
-                "reach_count": 500,
-                "trust_change": 5,
-                "spread_change": -5,
-                "effectiveness": "high",
-                "tools_used": [tool.tool_name for tool in tool_used] if tool_used else []
-            }
-            
-        # 4. 更新遊戲狀態
-        self.game_state_manager.update_game_state(
-            session_id=session_id,
-            round_number=round_number,
-            turn_result=result
-        )
+            game_turn_result = await self._run_ai_pipeline(session_id, round_number, events)
+            return await asyncio.to_thread(
+                self._complete_turn, actor, session_id, round_number, tool_list, game_turn_result, events
+            )
         
-        # 5. 轉換響應格式
-        response = self.response_converter.convert_turn_response(
-            session_id=session_id,
-            round_number=round_number,
-            actor=actor,
-            turn_result=result
+        with turn_stage_seconds.labels(actor, "state_load").time():
+            game = await asyncio.to_thread(
+                self._run_db_phase, self.game_state_manager.rebuild_game_state, session_id, round_number
+            )
+        events.stage(STAGE_STATE_LOADED)
+        with turn_stage_seconds.labels(actor, "agent_run").time():
+            turn_result = await self.turn_execution_logic.aexecute_actor_turn(
+                game, actor, session_id, round_number,
+                article=article,
+                player_tools=tool_used,
+                on_token=events.token_sink("fake_news_agent")
+            )
+        events.stage(STAGE_ARTICLE_DRAFTED, article=turn_result.article.model_dump(mode="json"))
+        events.stage(STAGE_GM_EVALUATING)
+        with turn_stage_seconds.labels(actor, "gm_evaluation").time():
+            game_turn_result = await self.game_state_manager.aevaluate_and_apply_effects(
+                turn_result, game, self.tool_repo,
+                on_token=events.token_sink("game_master_agent")
+            )
+        events.stage(STAGE_TOOL_EFFECTS_APPLIED, tool_effects=len(game_turn_result.tool_effects))
+        return await asyncio.to_thread(
+            self._complete_turn, actor, session_id, round_number, tool_list, game_turn_result, events
+        )
+
+    async def _astream_turn(
+        self,
+        actor: str,
+        session_id: str,
+        round_number: int,
+        article: Optional[ArticleMeta],
+        tool_used: Optional[List[PlayerToolUsedDTO]],
+        tool_list: Optional[List[Dict[str, Any]]]
+    ) -> AsyncIterator[TurnEvent]:
+        """在背景任務中執行回合，同時逐一產生回合事件；串流提前結束時取消回合"""
+        channel = TurnEventChannel()
+        channel.emit(EVENT_STARTED, actor=actor, session_id=session_id, round_number=round_number)
+        task = asyncio.create_task(
+            self._aexecute_turn(actor, session_id, round_number, article, tool_used, tool_list, events=channel),
+            name=f"{actor}_turn_stream:{session_id}:{round_number}"
+        )
+        task.add_done_callback(lambda _: channel.close())
+        try:
+            async for event in channel:
+                yield event
+            response = await task
+            yield TurnEvent(EVENT_RESULT, response.model_dump(mode="json"))
+        finally:
+            if not task.done():
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+
+    async def _run_ai_pipeline(self, session_id: str, round_number: int, events: TurnEventSink = NO_TURN_EVENTS):
+        """
+        以階段管線執行 AI 回合：遊戲狀態、來源新聞與工具目錄三個讀取並行，
+        平台摘要與假新聞 Agent 呼叫並行，回合延遲約為兩次 Agent 呼叫的總和。
+        """
+        # 讀取階段完成後即釋放請求 Session 的連線，等待並行名額與 Agent 時不佔用連線
+        pipeline = TurnPipeline(name=f"ai_turn:{session_id}:{round_number}", release_session=self._release_connection)
+        pipeline.stage(
+            "game", lambda: self.game_state_manager.rebuild_game_state(session_id, round_number),
+            shared_session=True
+        )
+        pipeline.stage(
+            "news", lambda: self._read_reference(self.turn_execution_logic.fetch_source_news),
+            shared_session=self.read_session_factory is None
+        )
+        pipeline.stage(
+            "tools", lambda: self._read_reference(self.tool_repo.get_catalog),
+            shared_session=self.read_session_factory is None
+        )
+        self.turn_execution_logic.add_ai_stages(
+            pipeline, session_id, round_number, on_token=events.token_sink("fake_news_agent")
+        )
+        self.game_state_manager.add_gm_stages(
+            pipeline, self.tool_repo, on_token=events.token_sink("game_master_agent")
         )
         
-        return response
+        result = await pipeline.run(on_stage=lambda name, value: _report_pipeline_stage(events, name, value))
+        return result["game_turn_result"]
+
+    def _run_db_phase(self, func: Callable[..., Any], *args) -> Any:
+        """在共用 Session 上執行一個資料庫階段，完成後結束交易（見 _release_connection）"""
+        result = func(*args)
+        self._release_connection()
+        return result
+
+    def _release_connection(self) -> None:
+        """
+        提交共用 Session 目前的交易，連線隨即還給連線池。
+        等待並行名額或 Agent 之前呼叫：否則每個等待模型的回合都佔住一條連線，
+        同時進行的回合數會被限制在連線池大小。之後的查詢會自動開始新的交易。
+        """
+        if self.state_repo.db is not None:
+            self.state_repo.db.commit()
+
+    def _read_reference(self, read):
+        """以獨立唯讀 Session 讀取參考資料；未設定時使用請求範圍的 Session"""
+        if self.read_session_factory is None:
+            return read()
+        with UnitOfWork(self.read_session_factory) as uow:
+            return read(db=uow.session)
+
+    def _complete_turn(
+        self,
+        actor: str,
+        session_id: str,
+        round_number: int,
+        tool_list: Optional[List[Dict[str, Any]]],
+        game_turn_result,
+        events: TurnEventSink = NO_TURN_EVENTS
+    ):
+        """持久化回合結果、檢查遊戲結束並轉換回應格式"""
+        # 4. 持久化回合結果
+        with turn_stage_seconds.labels(actor, "persist").time():
+            self.game_state_manager.persist_turn_result(game_turn_result)
+            if actor == "player":
+                self.round_repo.update_game_round(session_id, round_number, is_completed=True)
+        events.stage(STAGE_STATE_PERSISTED)
+        
+        # 5. 玩家回合結束後檢查遊戲結束條件
+        game_end_info = None
+        if actor == "player":
+            platform_states_for_check = [
+                {
+                    "platform_name": state.platform_name,
+                    "player_trust": state.player_trust,
+                    "ai_trust": state.ai_trust,
+                    "spread_rate": state.spread_rate
+                }
+                for state in game_turn_result.gm_evaluation.platform_status
+            ]
+            game_end_result = self.game_end_logic.check_game_end_condition(
+                session_id, round_number, platform_states_for_check
+            )
+            if game_end_result["is_ended"]:
+                game_end_info = self.game_end_logic.format_game_end_summary(game_end_result)
+        
+        # 6. 取得下一步可用工具（未由請求提供時）
+        if tool_list is None:
+            with turn_stage_seconds.labels(actor, "tool_availability").time():
+                tool_list = self.tool_availability_logic.get_available_tools_for_round(
+                    round_number=round_number,
+                    actor="player"  # 預設為玩家工具，因為主要是給前端顯示用
+                )
+        
+        # 7. 轉換響應格式
+        with turn_stage_seconds.labels(actor, "response_conversion").time():
+            dashboard_info = self._build_dashboard_info_for_turn(session_id, round_number, game_turn_result)
+            return self.response_converter.to_turn_response(
+                game_turn_result,
+                tool_list=tool_list,
+                game_end_result=game_end_info,
+                dashboard_info=dashboard_info
+            )
 
-    # def get_game_dashboard(self, request: GameDashboardRequest) -> GameDashboardResponse:
-    #     """
-    #     取得當前遊戲狀態的即時面板，顯示當前回合資訊和平台狀態
+    def get_dashboard_version(self, session_id: str) -> str:
+        """
+        取得面板版本（作為 ETag），只讀取索引，面板未變動時不必重建。
+
+        Raises:
+            ResourceNotFoundError: 遊戲不存在
+        """
+        return _require_dashboard(session_id, self.dashboard_repo.get_version(session_id))
+
+    async def aget_dashboard_version(self, session_id: str) -> str:
+        """get_dashboard_version 的協程版本，使用非同步 Repository"""
+        return _require_dashboard(session_id, await self.async_dashboard_repo.get_version(session_id))
+
+    def get_game_dashboard(self, request: GameDashboardRequest) -> GameDashboardResponse:
+        """
+        取得當前遊戲狀態的即時面板，顯示當前回合資訊和平台狀態
         
-    #     Args:
-    #         request: Dashboard請求
-            
-    #     Returns:
-    #         當前遊戲狀態的即時面板數據
-    #     """
-    #     session_id = request.session_id
-        
-    #     try:
-    #         # 1. 取得最新回合
-    #         latest_round = self.round_repo.get_latest_round_by_session(session_id)
-    #         current_round_number = latest_round.round_number
-            
-    #         # 2. 取得當前回合的行動記錄
-    #         current_actions = self.action_repo.get_actions_by_session_and_round(
-    #             session_id, current_round_number
-    #         )
+        Args:
+            request: Dashboard請求
             
-    #         # 3. 取得當前回合的平台狀態
-    #         current_platform_states = self.state_repo.get_by_session_and_round(
-    #             session_id, current_round_number
-    #         )
+        Returns:
+            當前遊戲狀態的即時面板數據
+        """
+        # 讀取模型：平台狀態與趨勢、當前回合行動、工具使用、每場摘要（固定四個查詢）
+        snapshot = self.dashboard_repo.get_snapshot(request.session_id)
+        return self._build_game_dashboard(request.session_id, _require_dashboard(request.session_id, snapshot))
+
+    async def aget_game_dashboard(self, request: GameDashboardRequest) -> GameDashboardResponse:
+        """get_game_dashboard 的協程版本，讀取模型使用非同步 Repository，不佔用執行緒池"""
+        snapshot = await self.async_dashboard_repo.get_snapshot(request.session_id)
+        return self._build_game_dashboard(request.session_id, _require_dashboard(request.session_id, snapshot))
+
+    def _build_game_dashboard(self, session_id: str, snapshot: DashboardSnapshot) -> GameDashboardResponse:
+        """由讀取模型組成面板回應"""
+        try:
+            current_round_number = snapshot.round_number
             
-    #         # 4. 建立當前回合資訊
-    #         current_round_info = self._build_current_round_info(
-    #             current_round_number, current_actions
-    #         )
+            # 1. 建立當前回合資訊
+            current_round_info = self._build_current_round_info(
+                current_round_number, snapshot.actions, snapshot.tools_by_action
+            )
             
-    #         # 5. 建立平台狀態（包含趨勢）
-    #         platform_dashboard_status = self._build_platform_dashboard_status(
-    #             session_id, current_round_number, current_platform_states
-    #         )
+            # 2. 建立平台狀態（趨勢已由查詢算出）
+            platform_dashboard_status = self._build_platform_dashboard_status(snapshot.platforms)
             
-    #         # 6. 建立遊戲進度
-    #         game_progress = {
-    #             "current_round": current_round_number,
-    #             "max_rounds": game_config.max_rounds,
-    #             "is_ended": current_round_number >= game_config.max_rounds  # 修正：正確設定結束狀態
-    #         }
+            # 3. 建立遊戲進度（累計值與領先者來自每場摘要）
+            game_progress = {
+                "current_round": current_round_number,
+                "max_rounds": game_config.max_rounds,
+                "is_ended": current_round_number >= game_config.max_rounds
+            }
+            summary = snapshot.summary
+            if summary is not None:
+                game_progress.update({
+                    "leader": summary.leader,
+                    "player_total_trust": summary.player_total_trust,
+                    "ai_total_trust": summary.ai_total_trust,
+                    "action_count": summary.action_count
+                })
             
-    #         # 7. 檢查遊戲結束狀態
-    #         game_end_info = None
-    #         platform_states_for_check = [
-    #             {
-    #                 "platform_name": state.platform_name,
-    #                 "player_trust": state.player_trust,
-    #                 "ai_trust": state.ai_trust,
-    #                 "spread_rate": state.spread_rate
-    #             }
-    #             for state in current_platform_states
-    #         ]
+            # 4. 檢查遊戲結束狀態
+            game_end_info = None
+            platform_states_for_check = [
+                {
+                    "platform_name": state.platform_name,
+                    "player_trust": state.player_trust,
+                    "ai_trust": state.ai_trust,
+                    "spread_rate": state.spread_rate
+                }
+                for state in snapshot.platforms
+            ]
             
-    #         game_end_result = self.game_end_logic.check_game_end_condition(
-    #             session_id, current_round_number, platform_states_for_check
-    #         )
+            game_end_result = self.game_end_logic.check_game_end_condition(
+                session_id, current_round_number, platform_states_for_check
+            )
             
-    #         if game_end_result["is_ended"]:
-    #             game_end_info = self.game_end_logic.format_game_end_summary(game_end_result)
-    #             game_progress["is_ended"] = True
+            if game_end_result["is_ended"]:
+                game_end_info = self.game_end_logic.format_game_end_summary(game_end_result)
+                game_progress["is_ended"] = True
             
-    #         return GameDashboardResponse(
-    #             session_id=session_id,
-    #             current_round=current_round_info,
-    #             platform_status=platform_dashboard_status,
-    #             game_progress=game_progress,
-    #             game_end_info=game_end_info
-    #         )
+            return GameDashboardResponse(
+                session_id=session_id,
+                current_round=current_round_info,
+                platform_status=platform_dashboard_status,
+                game_progress=game_progress,
+                game_end_info=game_end_info
+            )
             
-    #     except ResourceNotFoundError:
-    #         raise
-    #     except Exception as e:
-    #         logger.error(f"Dashboard error for session {session_id}: {str(e)}")
-    #         raise BusinessLogicError(f"取得遊戲面板時發生錯誤: {str(e)}")
+        except Exception as e:
+            logger.error("Dashboard error for session %s: %s", session_id, e)
+            raise BusinessLogicError(f"取得遊戲面板時發生錯誤: {str(e)}")
     
-    def _build_current_round_info(self, round_number: int, actions: List) -> CurrentRoundInfo:
-        """建立當前回合資訊"""
+    def _build_current_round_info(
+        self,
+        round_number: int,
+        actions: List,
+        tools_by_action: Dict[int, List[str]]
+    ) -> CurrentRoundInfo:
+        """建立當前回合資訊，工具使用由讀取模型預先載入"""
         ai_action = None
         player_action = None
         
@@ -360,9 +685,7 @@ class GameService:
         # 格式化玩家回應
         player_response = None
         if player_action:
-            # 取得玩家使用的工具
-            player_tools = self.tool_usage_repo.get_by_action_id(player_action.id)
-            tools_used = [tool.tool_name for tool in player_tools]
+            tools_used = tools_by_action.get(player_action.id, [])
             
             player_response = {
                 "content": player_action.content,
@@ -415,47 +738,19 @@ class GameService:
     
     def _build_platform_dashboard_status(
         self, 
-        session_id: str, 
-        current_round: int, 
-        current_states: List
+        platforms: List[PlatformTrendRow]
     ) -> List[PlatformDashboardStatus]:
-        """建立平台面板狀態（包含趨勢）"""
-        dashboard_statuses = []
-        
-        for state in current_states:
-            # 計算趨勢（與上一回合比較）
-            trust_trend = "→"  # 默認沒有變化
-            
-            if current_round > 1:
-                try:
-                    prev_states = self.state_repo.get_by_session_and_round(
-                        session_id, current_round - 1
-                    )
-                    prev_state = next(
-                        (s for s in prev_states if s.platform_name == state.platform_name), 
-                        None
-                    )
-                    
-                    if prev_state:
-                        player_diff = state.player_trust - prev_state.player_trust
-                        if player_diff > 0:
-                            trust_trend = "↗"  # 上升
-                        elif player_diff < 0:
-                            trust_trend = "↘"  # 下降
-                except:
-                    pass  # 如果無法取得上一回合數據，保持默認值
-            
-            dashboard_status = PlatformDashboardStatus(
-                platform_name=state.platform_name,
-                player_trust=state.player_trust,
-                ai_trust=state.ai_trust,
-                spread_rate=state.spread_rate,
-                trust_trend=trust_trend
+        """建立平台面板狀態（趨勢已由讀取模型與上一回合比較算出）"""
+        return [
+            PlatformDashboardStatus(
+                platform_name=platform.platform_name,
+                player_trust=platform.player_trust,
+                ai_trust=platform.ai_trust,
+                spread_rate=platform.spread_rate,
+                trust_trend=platform.trust_trend
             )
-            
-            dashboard_statuses.append(dashboard_status)
-        
-        return dashboard_statuses
+            for platform in platforms
+        ]
     
     def _translate_effectiveness(self, effectiveness: str) -> str:
         """翻譯效果評級"""
@@ -571,28 +866,30 @@ class GameService:
         """從平台狀態建立面板狀態（簡化版）"""
         dashboard_statuses = []
         
+        # 上一回合狀態只取一次，優先使用熱資料存放
+        prev_states: Dict[str, Dict[str, int]] = {}
+        if current_round > 1:
+            try:
+                prev_states = self.state_store.get_platform_states(session_id, current_round - 1, db=self.state_repo.db)
+                if prev_states is None:
+                    prev_states = {
+                        s.platform_name: {"player_trust": s.player_trust}
+                        for s in self.state_repo.get_by_session_and_round(session_id, current_round - 1)
+                    }
+            except:
+                prev_states = {}
+        
         for state in platform_states:
             # 計算趨勢
             trust_trend = "→"  # 默認
             
-            if current_round > 1:
-                try:
-                    prev_states = self.state_repo.get_by_session_and_round(
-                        session_id, current_round - 1
-                    )
-                    prev_state = next(
-                        (s for s in prev_states if s.platform_name == state["platform_name"]), 
-                        None
-                    )
-                    
-                    if prev_state:
-                        player_diff = state["player_trust"] - prev_state.player_trust
-                        if player_diff > 0:
-                            trust_trend = "↗"
-                        elif player_diff < 0:
-                            trust_trend = "↘"
-                except:
-                    pass
+            prev_state = prev_states.get(state["platform_name"])
+            if prev_state:
+                player_diff = state["player_trust"] - prev_state["player_trust"]
+                if player_diff > 0:
+                    trust_trend = "↗"
+                elif player_diff < 0:
+                    trust_trend = "↘"
             
             dashboard_status = {
                 "platform_name": state["platform_name"],
@@ -606,10 +903,155 @@ class GameService:
         
         return dashboard_statuses
     
+    def list_games(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        status: Optional[str] = None,
+        winner: Optional[str] = None
+    ) -> GameListResponse:
+        """
+        依建立時間由新到舊列出遊戲，資料來自每場摘要（keyset 分頁）。
+
+        Args:
+            limit: 每頁筆數
+            cursor: 上一頁回應的 next_cursor，第一頁為 None
+            status: "active"（進行中）或 "ended"（已結束）
+            winner: 勝方（"player" / "ai" / "draw"）
+
+        Raises:
+            ValidationError: 狀態篩選或游標無效
+        """
+        if status is not None and status not in GAME_STATUS_FILTERS:
+            raise ValidationError(f"未知的遊戲狀態: {status}")
+        summaries = self.summary_repo.list_recent(
+            limit + 1,
+            after=_decode_game_cursor(cursor, datetime.fromisoformat),
+            is_ended=GAME_STATUS_FILTERS.get(status),
+            winner=winner
+        )
+        return _game_list_page(summaries, limit, lambda summary: summary.created_at.isoformat())
+
+    def get_leaderboard(self, limit: int, cursor: Optional[str] = None) -> GameListResponse:
+        """
+        排行榜：已結束的遊戲依玩家信任值總和由高到低排列（keyset 分頁）。
+
+        Raises:
+            ValidationError: 游標無效
+        """
+        summaries = self.summary_repo.list_leaderboard(limit + 1, after=_decode_game_cursor(cursor, int))
+        return _game_list_page(summaries, limit, lambda summary: summary.player_total_trust)
+
+    async def alist_games(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        status: Optional[str] = None,
+        winner: Optional[str] = None
+    ) -> GameListResponse:
+        """list_games 的協程版本，使用非同步 Repository，不佔用執行緒池"""
+        if status is not None and status not in GAME_STATUS_FILTERS:
+            raise ValidationError(f"未知的遊戲狀態: {status}")
+        summaries = await self.async_summary_repo.list_recent(
+            limit + 1,
+            after=_decode_game_cursor(cursor, datetime.fromisoformat),
+            is_ended=GAME_STATUS_FILTERS.get(status),
+            winner=winner
+        )
+        return _game_list_page(summaries, limit, lambda summary: summary.created_at.isoformat())
+
+    async def aget_leaderboard(self, limit: int, cursor: Optional[str] = None) -> GameListResponse:
+        """get_leaderboard 的協程版本"""
+        summaries = await self.async_summary_repo.list_leaderboard(limit + 1, after=_decode_game_cursor(cursor, int))
+        return _game_list_page(summaries, limit, lambda summary: summary.player_total_trust)
+
     def polish_news(self, request: NewsPolishRequest) -> NewsPolishResponse:
         if not self.agent_factory:
             raise BusinessLogicError("系統未設定 Agent Factory")
         
+        try:
+            variables = self._polish_variables(request)
+            cache_key, cached = self._lookup_polish_response(request, variables)
+            if cached:
+                return cached
+            
+            result = self.agent_factory.run_agent_by_name(
+                session_id=request.session_id,
+                agent_name="news_polish_agent", 
+                variables=variables,
+                input_text="input_text"
+            )
+            return self._store_polish_response(cache_key, self._to_polish_response(request, result))
+        except ResourceNotFoundError:
+            raise ResourceNotFoundError(
+                message="找不到潤稿專用 Agent",
+                resource_type="agent",
+                resource_id="news_polish_agent"
+            )
+        except Exception as e:
+            raise BusinessLogicError(f"潤稿過程發生錯誤: {str(e)}")
+
+    async def apolish_news(self, request: NewsPolishRequest) -> NewsPolishResponse:
+        """polish_news 的協程版本"""
+        if not self.agent_factory:
+            raise BusinessLogicError("系統未設定 Agent Factory")
+        
+        try:
+            variables = self._polish_variables(request)
+            # SQLite 快取後端以同步 sqlite3 讀寫並持有鎖，查詢與寫入都在執行緒中進行，不阻塞事件迴圈
+            cache_key, cached = await asyncio.to_thread(self._lookup_polish_response, request, variables)
+            if cached:
+                return cached
+            
+            result = await self.agent_factory.arun_agent_by_name(
+                session_id=request.session_id,
+                agent_name="news_polish_agent", 
+                variables=variables,
+                input_text="input_text"
+            )
+            return await asyncio.to_thread(
+                self._store_polish_response, cache_key, self._to_polish_response(request, result)
+            )
+        except ResourceNotFoundError:
+            raise ResourceNotFoundError(
+                message="找不到潤稿專用 Agent",
+                resource_type="agent",
+                resource_id="news_polish_agent"
+            )
+        except ExternalServiceError:
+            raise
+        except Exception as e:
+            raise BusinessLogicError(f"潤稿過程發生錯誤: {str(e)}")
+
+    def _polish_cache_key(self, request: NewsPolishRequest, variables: Dict[str, Any]) -> Optional[str]:
+        """計算潤稿回應的快取鍵；請求要求略過或快取停用時返回 None"""
+        if request.bypass_cache:
+            self.polish_cache.record_bypass()
+            return None
+        if not self.polish_cache.enabled:
+            return None
+        return self.agent_factory.prompt_fingerprint("news_polish_agent", variables, "input_text")
+
+    def _lookup_polish_response(
+        self,
+        request: NewsPolishRequest,
+        variables: Dict[str, Any]
+    ) -> Tuple[Optional[str], Optional[NewsPolishResponse]]:
+        """計算快取鍵並取得快取的潤稿回應，返回 (快取鍵, 快取的回應)"""
+        cache_key = self._polish_cache_key(request, variables)
+        if cache_key is None:
+            return None, None
+        cached = self.polish_cache.get(cache_key)
+        return cache_key, NewsPolishResponse(**cached) if cached else None
+
+    def _store_polish_response(self, cache_key: Optional[str], response: NewsPolishResponse) -> NewsPolishResponse:
+        """將潤稿回應寫入快取"""
+        if cache_key is not None:
+            self.polish_cache.set(cache_key, response.model_dump())
+        return response
+
+    def _polish_variables(self, request: NewsPolishRequest) -> Dict[str, Any]:
+        """建立潤稿 Agent 的模板變數"""
         variables = {"content": request.content, "requirements": request.requirements or "將文章潤色使其更吸引人、更有說服力"}
         
         if request.sources:
@@ -622,47 +1064,130 @@ class GameService:
             variables["current_situation"] = request.current_situation
         if request.additional_context:
             variables.update(request.additional_context)
-        
-        try:
-            result = self.agent_factory.run_agent_by_name(
-                session_id=request.session_id,
-                agent_name="news_polish_agent", 
-                variables=variables,
-                input_text="input_text"
+        return variables
+
+    def _to_polish_response(self, request: NewsPolishRequest, result: Any) -> NewsPolishResponse:
+        """將潤稿 Agent 的輸出轉為回應"""
+        if isinstance(result, dict):
+            return NewsPolishResponse(
+                original_content=request.content,
+                polished_content=result.get("polished_content", ""),
+                suggestions=result.get("suggestions"),
+                reasoning=result.get("reasoning")
             )
-            
-            if isinstance(result, dict):
+        elif isinstance(result, str):
+            try:
+                result_data = json.loads(result)
                 return NewsPolishResponse(
                     original_content=request.content,
-                    polished_content=result.get("polished_content", ""),
-                    suggestions=result.get("suggestions"),
-                    reasoning=result.get("reasoning")
+                    polished_content=result_data.get("polished_content", ""),
+                    suggestions=result_data.get("suggestions"),  
+                    reasoning=result_data.get("reasoning")
                 )
-            elif isinstance(result, str):
-                try:
-                    result_data = json.loads(result)
-                    return NewsPolishResponse(
-                        original_content=request.content,
-                        polished_content=result_data.get("polished_content", ""),
-                        suggestions=result_data.get("suggestions"),  
-                        reasoning=result_data.get("reasoning")
-                    )
-                except json.JSONDecodeError:
-                    return NewsPolishResponse(
-                        original_content=request.content,
-                        polished_content=result
-                    )
-            else:
+            except json.JSONDecodeError:
                 return NewsPolishResponse(
                     original_content=request.content,
-                    polished_content=str(result)
+                    polished_content=result
                 )
-                
-        except ResourceNotFoundError:
-            raise ResourceNotFoundError(
-                message="找不到潤稿專用 Agent",
-                resource_type="agent",
-                resource_id="news_polish_agent"
+        else:
+            return NewsPolishResponse(
+                original_content=request.content,
+                polished_content=str(result)
             )
-        except Exception as e:
-            raise BusinessLogicError(f"潤稿過程發生錯誤: {str(e)}")
+
+
+def create_game_service(
+    db: Session,
+    agent_factory: Optional[AgentFactory] = None,
+    read_session_factory: Optional[sessionmaker] = None
+) -> GameService:
+    """
+    以請求範圍的 Session 組裝 GameService，API 路由與持久化模擬共用同一套組裝。
+
+    所有遊戲 Repository 綁定同一個 Session（工作單元）；Agent 設定由 AgentRepository
+    以獨立的短 Session 讀取，不佔用回合的 Session。
+
+    Args:
+        db: 工作單元的 Session
+        agent_factory: Agent 執行器，未指定時以 AgentRepository 建立 AgentFactory
+        read_session_factory: 參考資料（新聞、工具）的獨立唯讀 Session 工廠，None 表示使用 db
+
+    Returns:
+        GameService 實例
+    """
+    return GameService(
+        setup_repo=GameSetupRepository(db=db),
+        state_repo=PlatformStateRepository(db=db),
+        news_repo=NewsRepository(db=db),
+        action_repo=ActionRecordRepository(db=db),
+        round_repo=GameRoundRepository(db=db),
+        tool_repo=ToolRepository(db=db),
+        tool_usage_repo=ToolUsageRepository(db=db),
+        agent_factory=agent_factory or AgentFactory(AgentRepository()),
+        read_session_factory=read_session_factory
+    )
+
+
+# === 私有函數 ===
+
+def _game_list_page(summaries: List[Any], limit: int, sort_key: Callable[[Any], Any]) -> GameListResponse:
+    """將多查一筆的結果切成一頁；有第 limit + 1 筆表示還有下一頁，游標為本頁最後一筆的排序鍵"""
+    page = summaries[:limit]
+    next_cursor = None
+    if len(summaries) > limit:
+        last = page[-1]
+        next_cursor = encode_cursor({"key": sort_key(last), "session_id": last.session_id})
+    return GameListResponse(
+        items=[
+            GameListItem(
+                session_id=summary.session_id,
+                created_at=summary.created_at,
+                latest_round=summary.latest_round,
+                action_count=summary.action_count,
+                player_total_trust=summary.player_total_trust,
+                ai_total_trust=summary.ai_total_trust,
+                leader=summary.leader,
+                is_ended=summary.is_ended,
+                winner=summary.winner,
+                end_reason=summary.end_reason
+            )
+            for summary in page
+        ],
+        next_cursor=next_cursor
+    )
+
+
+def _require_dashboard(session_id: str, found: Any) -> Any:
+    """面板版本或讀取模型不存在（遊戲不存在）時拋出 ResourceNotFoundError"""
+    if found is None:
+        raise ResourceNotFoundError(
+            message=f"找不到 session_id='{session_id}' 的遊戲面板",
+            resource_type="game_dashboard",
+            resource_id=session_id
+        )
+    return found
+
+
+def _decode_game_cursor(cursor: Optional[str], parse_key: Callable[[Any], Any]) -> Optional[Tuple[Any, str]]:
+    """解碼遊戲列表的分頁游標（{"key": 排序鍵, "session_id": ...}），返回 (排序鍵, session_id)"""
+    if not cursor:
+        return None
+    values = decode_cursor(cursor)
+    try:
+        session_id = values["session_id"]
+        if not isinstance(session_id, str):
+            raise TypeError(session_id)
+        return parse_key(values["key"]), session_id
+    except (KeyError, ValueError, TypeError) as e:
+        raise ValidationError(message="Invalid pagination cursor.", error_code="INVALID_CURSOR") from e
+
+
+def _report_pipeline_stage(events: TurnEventSink, name: str, value: Any) -> None:
+    """將 AI 回合管線的階段完成轉為回合事件"""
+    if name == "game":
+        events.stage(STAGE_STATE_LOADED)
+    elif name == "turn_result":
+        events.stage(STAGE_ARTICLE_DRAFTED, article=value.article.model_dump(mode="json"))
+        events.stage(STAGE_GM_EVALUATING)
+    elif name == "game_turn_result":
+        events.stage(STAGE_TOOL_EFFECTS_APPLIED, tool_effects=len(value.tool_effects))
@@ -5,6 +5,7 @@
 
 from typing import List, Optional, Dict, Any
 from datetime import datetime
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from src.application.dto.news_dto import (
@@ -16,8 +17,9 @@ from src.application.dto.news_dto import (
     NewsBatchCreate,
     NewsBatchResponse
 )
-from src.infrastructure.database.news_repo import NewsRepository
+from src.infrastructure.database.news_repo import AsyncNewsRepository, NewsRepository
 from src.utils.exceptions import ResourceNotFoundError, ValidationError
+from src.utils.pagination import decode_cursor, encode_cursor
 
 
 class NewsService:
@@ -33,15 +35,17 @@ class NewsService:
     ```
     """
     
-    def __init__(self, db: Optional[Session] = None):
+    def __init__(self, db: Optional[Session] = None, async_db: Optional[AsyncSession] = None):
         """
         初始化服務。
         
         Args:
             db: 數據庫會話
+            async_db: 非同步數據庫會話，供 a 開頭的協程方法使用
         """
         self.db = db
         self.repo = NewsRepository()
+        self.async_repo = AsyncNewsRepository(db=async_db)
     
     def get_news(self, news_id: int) -> NewsResponse:
         """
@@ -56,37 +60,58 @@ class NewsService:
         Raises:
             ResourceNotFoundError: 若查無此新聞
         """
-        news = self.repo.get_by_id(news_id, db=self.db)
+        news = self.repo.get_by_pk(news_id, db=self.db)
         
         # 將資料庫模型轉為 DTO
         return self._convert_to_response(news)
     
-    def list_news(self, skip: int = 0, limit: int = 100, active_only: bool = False) -> NewsListResponse:
+    def list_news(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        active_only: bool = False,
+        cursor: Optional[str] = None,
+        estimate_total: bool = False
+    ) -> NewsListResponse:
         """
-        獲取新聞列表。
+        獲取新聞列表。分頁與計數皆在資料庫端完成。
         
         Args:
-            skip: 跳過筆數
+            skip: 跳過筆數（提供 cursor 時忽略）
             limit: 取得筆數
             active_only: 是否只取啟用中的新聞
+            cursor: 上一頁回傳的 next_cursor，使用 keyset 分頁
+            estimate_total: 是否使用估計的總筆數
             
         Returns:
             新聞列表
+            
+        Raises:
+            ValidationError: 若游標格式錯誤
         """
-        # 根據是否只取啟用中新聞決定查詢條件
-        if active_only:
-            result = self.repo.get_by(is_active=True, db=self.db)
+        filters = {"is_active": True} if active_only else {}
+        
+        # 多取一筆以判斷是否還有下一頁
+        if cursor is not None:
+            after_id = decode_cursor(cursor).get("news_id")
+            if not isinstance(after_id, int):
+                raise ValidationError(message="Invalid pagination cursor.", error_code="INVALID_CURSOR")
+            items = self.repo.list_after(cursor=after_id, limit=limit + 1, db=self.db, **filters)
         else:
-            result = self.repo.get_all(db=self.db)
+            items = self.repo.list_page(offset=skip, limit=limit + 1, db=self.db, **filters)
         
-        # 處理分頁
-        total = len(result)
-        items = result[skip:skip + limit]
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            next_cursor = encode_cursor({"news_id": items[-1].news_id})
+        
+        total = self.repo.count(estimated=estimate_total, db=self.db, **filters)
         
         # 轉換為回應格式
         return NewsListResponse(
             items=[self._convert_to_response(item) for item in items],
-            total=total
+            total=total,
+            next_cursor=next_cursor
         )
     
     def create_news(self, request: NewsCreate) -> NewsResponse:
@@ -148,7 +173,7 @@ class NewsService:
             return self.get_news(news_id)
         
         # 更新新聞
-        updated_news = self.repo.update(news_id, update_data, db=self.db)
+        updated_news = self.repo.update_by_pk(news_id, update_data, db=self.db)
         
         # 轉換為回應格式
         return self._convert_to_response(updated_news)
@@ -163,7 +188,7 @@ class NewsService:
         Raises:
             ResourceNotFoundError: 若查無此新聞
         """
-        self.repo.delete(news_id, db=self.db)
+        self.repo.delete_by_pk(news_id, db=self.db)
         
     def batch_create_news(self, request: NewsBatchCreate) -> NewsBatchResponse:
         """
@@ -224,38 +249,37 @@ class NewsService:
         if request.category:
             self._validate_news_category(request.category)
         
-        # 若有指定條件，則用條件查詢
-        if request.veracity or request.category or not request.active_only:
-            # 構建查詢條件
-            conditions = {}
-            if request.active_only:
-                conditions["is_active"] = True
-            
-            if request.veracity:
-                conditions["veracity"] = request.veracity
-            
-            if request.category:
-                conditions["category"] = request.category
-            
-            # 取得符合條件的所有新聞
-            news_list = self.repo.get_by(**conditions, db=self.db)
-            
-            if not news_list:
-                raise ResourceNotFoundError(
-                    message="No news match the criteria.",
-                    resource_type="news",
-                    resource_id="random"
-                )
-            
-            # 隨機取一則
-            import random
-            news = random.choice(news_list)
+        if request.active_only:
+            # 啟用中新聞由抽樣索引抽取，只需一次主鍵查詢
+            news = self.repo.get_random_active_news_batch(
+                1, veracity=request.veracity, category=request.category, db=self.db
+            )[0]
         else:
-            # 若無特定條件且只要啟用中的新聞，則使用專用方法
-            news = self.repo.get_random_active_news(db=self.db)
+            news = self.repo.get_random_news(
+                veracity=request.veracity, category=request.category, db=self.db
+            )
         
         # 轉換為回應格式
         return self._convert_to_response(news)
+
+    async def aget_random_news(self, request: RandomNewsRequest) -> NewsResponse:
+        """get_random_news 的協程版本，使用非同步 Repository，不佔用執行緒池"""
+        if request.veracity:
+            self._validate_news_veracity(request.veracity)
+        
+        if request.category:
+            self._validate_news_category(request.category)
+        
+        if request.active_only:
+            news = (await self.async_repo.get_random_active_news_batch(
+                1, veracity=request.veracity, category=request.category
+            ))[0]
+        else:
+            news = await self.async_repo.get_random_news(
+                veracity=request.veracity, category=request.category
+            )
+        
+        return self._convert_to_response(news)
     
     def _convert_to_response(self, news: Any) -> NewsResponse:
         """
@@ -0,0 +1,336 @@
+"""
+對局模擬服務層，以多個行程平行跑大量確定性的模擬對局。
+
+- 記憶體模式：SimulationEngine 在行程內跑完整場遊戲，用於調校 GameConfig
+- 持久化模式：透過 GameService 與真實資料庫跑完整流程，用於壓測資料庫寫入
+每場結果以 JSON Lines 邊跑邊寫入檔案，並彙總勝率、結束原因與平均回合數。
+
+執行方式：
+    python -m src.application.services.simulation_service --games 5000 --workers 8 \\
+        --output simulation.jsonl --set max_rounds=6 --set win_trust_threshold=80
+"""
+import argparse
+import dataclasses
+import logging
+import multiprocessing
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+import orjson
+from sqlalchemy.orm import sessionmaker
+
+from src.application.dto.game_dto import PlayerTurnRequest, StartNextRoundRequest
+from src.application.services.game_service import GameService, create_game_service
+from src.config.game_config import GameConfig, game_config
+from src.domain.logic.simulation import (
+    AiPolicy, GameMasterModel, GameSimulationResult, GreedyPlayerPolicy, PlayerPolicy,
+    RandomPlayerPolicy, ScriptedAiPolicy, SimulatedAgentFactory, SimulationEngine, StubGameMaster
+)
+from src.infrastructure.database.game_state_store import game_state_store
+from src.infrastructure.database.session import SessionLocal, UnitOfWork
+from src.utils.logger import logger
+
+# CLI 可選的策略
+PLAYER_POLICIES = {"greedy": GreedyPlayerPolicy, "random": RandomPlayerPolicy}
+AI_POLICIES = {"scripted": ScriptedAiPolicy}
+
+
+@dataclasses.dataclass
+class SimulationSummary:
+    """一批模擬的彙總結果"""
+    games: int = 0
+    winners: Counter = dataclasses.field(default_factory=Counter)
+    reasons: Counter = dataclasses.field(default_factory=Counter)
+    total_rounds: int = 0
+    elapsed_s: float = 0.0
+
+    def add(self, result: Dict[str, Any]) -> None:
+        self.games += 1
+        self.winners[result["winner"]] += 1
+        self.reasons[result["reason"]] += 1
+        self.total_rounds += result["rounds"]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "games": self.games,
+            "win_rate": {winner: round(count / self.games, 4) for winner, count in self.winners.items()} if self.games else {},
+            "reasons": dict(self.reasons),
+            "avg_rounds": round(self.total_rounds / self.games, 3) if self.games else 0.0,
+            "elapsed_s": round(self.elapsed_s, 3),
+            "games_per_s": round(self.games / self.elapsed_s, 1) if self.elapsed_s else 0.0,
+        }
+
+
+@dataclasses.dataclass
+class _ChunkTask:
+    """交給工作行程的一批對局（需可 pickle）"""
+    seeds: List[int]
+    player_policy: PlayerPolicy
+    ai_policy: AiPolicy
+    gm_model: Optional[GameMasterModel]
+    config: Optional[GameConfig]
+    persist: bool
+
+
+class SimulationService:
+    """
+    以 ProcessPoolExecutor 平行執行模擬對局的服務。
+
+    策略物件會被 pickle 到工作行程，自訂策略需定義在模組層級。
+    同一批 seed 不論工作行程數多少，每場結果都相同。
+
+    用法示例:
+    ```python
+    service = SimulationService(player_policy=RandomPlayerPolicy(tool_rate=0.3))
+    summary = service.run(
+        games=10000,
+        output_path="simulation.jsonl",
+        workers=8,
+        config=GameConfig(max_rounds=6, win_trust_threshold=80)
+    )
+    summary.to_dict()  # {"games": 10000, "win_rate": {"ai": 0.61, ...}, ...}
+    ```
+    """
+
+    def __init__(
+        self,
+        player_policy: Optional[PlayerPolicy] = None,
+        ai_policy: Optional[AiPolicy] = None,
+        gm_model: Optional[GameMasterModel] = None
+    ):
+        self.player_policy = player_policy or GreedyPlayerPolicy()
+        self.ai_policy = ai_policy or ScriptedAiPolicy()
+        self.gm_model = gm_model
+
+    def run(
+        self,
+        games: int,
+        output_path: str,
+        seed: int = 0,
+        workers: Optional[int] = None,
+        chunk_size: int = 50,
+        config: Optional[GameConfig] = None,
+        persist: bool = False,
+        session_factory: Optional[sessionmaker] = None
+    ) -> SimulationSummary:
+        """
+        執行 seed ~ seed + games - 1 共 games 場模擬，結果逐場寫入 output_path（JSON Lines）。
+
+        Args:
+            games: 對局數
+            output_path: 結果檔路徑
+            seed: 起始 seed
+            workers: 工作行程數，預設為 CPU 數；1 以下表示在目前行程執行
+            chunk_size: 每個工作行程任務包含的對局數
+            config: 遊戲參數，預設為全局 game_config
+            persist: 是否經由 GameService 寫入資料庫（壓測用）
+            session_factory: 持久化模式的 Session 工廠，僅在目前行程執行時使用；
+                工作行程一律使用 DATABASE_URL_SYNC
+
+        Returns:
+            SimulationSummary
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        seeds = list(range(seed, seed + games))
+        tasks = [
+            _ChunkTask(seeds[i:i + chunk_size], self.player_policy, self.ai_policy, self.gm_model, config, persist)
+            for i in range(0, len(seeds), chunk_size)
+        ]
+        summary = SimulationSummary()
+        start = time.perf_counter()
+
+        with open(output_path, "wb") as output:
+            for results in self._iter_results(tasks, workers, session_factory):
+                for result in results:
+                    output.write(orjson.dumps(result) + b"\n")
+                    summary.add(result)
+                output.flush()
+
+        summary.elapsed_s = time.perf_counter() - start
+        logger.info("模擬完成", extra={"output_path": output_path, **summary.to_dict()})
+        return summary
+
+    def _iter_results(
+        self,
+        tasks: List[_ChunkTask],
+        workers: int,
+        session_factory: Optional[sessionmaker]
+    ) -> Iterator[List[Dict[str, Any]]]:
+        if workers <= 1:
+            for task in tasks:
+                yield _run_chunk(task, session_factory)
+            return
+
+        # spawn：工作行程重新匯入模組，不繼承父行程的資料庫連線與日誌背景執行緒
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_worker) as executor:
+            futures = [executor.submit(_run_chunk, task) for task in tasks]
+            for future in as_completed(futures):
+                yield future.result()
+
+
+# === 私有函數 ===
+
+def _init_worker() -> None:
+    # 每回合的 INFO 日誌在大量對局下只會拖慢模擬
+    logger.logger.setLevel(logging.WARNING)
+
+
+def _run_chunk(task: _ChunkTask, session_factory: Optional[sessionmaker] = None) -> List[Dict[str, Any]]:
+    if not task.persist:
+        engine = SimulationEngine(
+            player_policy=task.player_policy,
+            ai_policy=task.ai_policy,
+            gm_model=task.gm_model,
+            config=task.config
+        )
+        # 整批場次同步進行，每回合以一次向量化判定檢查所有場次是否結束
+        return [result.to_dict() for result in engine.run_games(task.seeds)]
+
+    with _use_game_config(task.config):
+        return [
+            _run_persisted_game(seed, task, session_factory).to_dict()
+            for seed in task.seeds
+        ]
+
+
+def _run_persisted_game(seed: int, task: _ChunkTask, session_factory: Optional[sessionmaker]) -> GameSimulationResult:
+    """以 GameService 跑完一場遊戲，每個回合各自一個工作單元（與 HTTP 請求相同）"""
+    # NewsRepository 的新聞抽樣使用模組層級的 random：這場遊戲以 seed 設定，結束後還原呼叫端的狀態
+    caller_state = random.getstate()
+    random.seed(seed)
+    try:
+        return _play_persisted_game(seed, task, session_factory)
+    finally:
+        random.setstate(caller_state)
+
+
+def _play_persisted_game(seed: int, task: _ChunkTask, session_factory: Optional[sessionmaker]) -> GameSimulationResult:
+    start = time.perf_counter()
+    rng = random.Random(seed)
+    logic_rng = random.Random(seed)
+    # game_lookup 由 _game_service 綁定到各工作單元
+    agent_factory = SimulatedAgentFactory(
+        task.ai_policy, task.gm_model or StubGameMaster(), game_lookup=game_state_store.get_game, rng=rng
+    )
+    session_factory = session_factory or SessionLocal
+    tools_used = {"player": 0, "ai": 0}
+
+    with UnitOfWork(session_factory) as uow:
+        response = _game_service(uow.session, agent_factory, logic_rng, session_factory).start_game()
+    session_id = response.session_id
+
+    while True:
+        tools_used["ai"] += len(response.tool_used or [])
+        round_number = response.round_number
+        with UnitOfWork(session_factory) as uow:
+            service = _game_service(uow.session, agent_factory, logic_rng, session_factory)
+            game = service.game_state_manager.rebuild_game_state(session_id, round_number)
+            unlocked = service.tool_repo.list_tools_for_round("player", round_number)
+            article, tools = task.player_policy.choose(game, round_number, unlocked, rng)
+            player_response = service.player_turn(PlayerTurnRequest(
+                session_id=session_id, round_number=round_number, article=article, tool_used=tools
+            ))
+        tools_used["player"] += len(tools)
+        if player_response.game_end_info:
+            break
+        with UnitOfWork(session_factory) as uow:
+            response = _game_service(uow.session, agent_factory, logic_rng, session_factory).start_next_round(
+                StartNextRoundRequest(session_id=session_id)
+            )
+
+    states = [status.model_dump(include={"platform_name", "player_trust", "ai_trust", "spread_rate"})
+              for status in player_response.platform_status]
+    return GameSimulationResult(
+        seed=seed,
+        session_id=session_id,
+        winner=player_response.game_end_info["winner"],
+        reason=player_response.game_end_info["reason"],
+        rounds=round_number,
+        player_total_trust=sum(state["player_trust"] for state in states),
+        ai_total_trust=sum(state["ai_trust"] for state in states),
+        platforms=states,
+        tools_used=tools_used,
+        duration_ms=round((time.perf_counter() - start) * 1000, 3)
+    )
+
+
+def _game_service(
+    db,
+    agent_factory: SimulatedAgentFactory,
+    logic_rng: random.Random,
+    session_factory: sessionmaker
+) -> GameService:
+    """以與 API 路由相同的組裝（create_game_service）建立 GameService，再接上模擬用的 Agent 與亂數來源"""
+    service = create_game_service(db, agent_factory=agent_factory, read_session_factory=session_factory)
+    # 熱資料存放的寫入提交後才生效，模擬 GM 需經由本工作單元讀取遊戲狀態
+    agent_factory.game_lookup = service.game_state_manager.rebuild_game_state
+    # 平台洗牌與 AI 選平台使用這場遊戲的亂數來源
+    service.game_init_logic.rng = logic_rng
+    service.ai_turn_logic.rng = logic_rng
+    return service
+
+
+@contextmanager
+def _use_game_config(config: Optional[GameConfig]) -> Iterator[None]:
+    # GameService 的各個邏輯讀取全局 game_config，持久化模式暫時套用指定參數
+    if config is None:
+        yield
+        return
+    original = dataclasses.asdict(game_config)
+    for name, value in dataclasses.asdict(config).items():
+        setattr(game_config, name, value)
+    try:
+        yield
+    finally:
+        for name, value in original.items():
+            setattr(game_config, name, value)
+
+
+def _parse_overrides(items: List[str]) -> GameConfig:
+    config = dataclasses.replace(game_config)
+    for item in items:
+        name, _, value = item.partition("=")
+        current = getattr(config, name.strip())
+        setattr(config, name.strip(), value.split(",") if isinstance(current, list) else type(current)(value))
+    return config
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Sustainet 無頭對局模擬")
+    parser.add_argument("--games", type=int, default=1000, help="對局數")
+    parser.add_argument("--seed", type=int, default=0, help="起始 seed")
+    parser.add_argument("--workers", type=int, default=None, help="工作行程數（預設 CPU 數）")
+    parser.add_argument("--chunk-size", type=int, default=50, help="每個任務的對局數")
+    parser.add_argument("--output", default="simulation.jsonl", help="結果檔（JSON Lines）")
+    parser.add_argument("--player-policy", choices=sorted(PLAYER_POLICIES), default="greedy")
+    parser.add_argument("--ai-policy", choices=sorted(AI_POLICIES), default="scripted")
+    parser.add_argument("--set", action="append", default=[], metavar="NAME=VALUE", help="覆寫 GameConfig 參數")
+    parser.add_argument("--persist", action="store_true", help="經由 GameService 寫入資料庫（壓測用）")
+    args = parser.parse_args()
+
+    _init_worker()
+    service = SimulationService(
+        player_policy=PLAYER_POLICIES[args.player_policy](),
+        ai_policy=AI_POLICIES[args.ai_policy]()
+    )
+    summary = service.run(
+        games=args.games,
+        output_path=args.output,
+        seed=args.seed,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        config=_parse_overrides(args.set),
+        persist=args.persist
+    )
+    print(orjson.dumps(summary.to_dict(), option=orjson.OPT_INDENT_2).decode())
+
+
+if __name__ == "__main__":
+    main()
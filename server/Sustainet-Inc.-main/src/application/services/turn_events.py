@@ -0,0 +1,98 @@
+"""
+回合進度事件 - 串流回合（SSE）時，回合執行過程中各階段完成與 Agent 輸出片段的通知。
+"""
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+# 事件類型
+EVENT_STARTED = "started"
+EVENT_STAGE = "stage"
+EVENT_TOKEN = "token"
+EVENT_RESULT = "result"
+EVENT_ERROR = "error"
+
+# 回合階段
+STAGE_STATE_LOADED = "state_loaded"
+STAGE_ARTICLE_DRAFTED = "article_drafted"
+STAGE_GM_EVALUATING = "gm_evaluating"
+STAGE_TOOL_EFFECTS_APPLIED = "tool_effects_applied"
+STAGE_STATE_PERSISTED = "state_persisted"
+
+
+@dataclass
+class TurnEvent:
+    """單一回合事件，data 需可 JSON 序列化"""
+    event: str
+    data: Dict[str, Any] = field(default_factory=dict)
+
+
+class TurnEventSink:
+    """
+    回合事件的接收端介面。
+    預設實作不做任何事，非串流的回合使用它，流程中不需判斷是否有人接收事件。
+    """
+
+    def stage(self, name: str, **data: Any) -> None:
+        """通知某個回合階段已完成（或開始）"""
+
+    def token_sink(self, agent_name: str) -> Optional[Callable[[str], None]]:
+        """
+        返回接收指定 Agent 輸出片段的回呼。
+        返回 None 表示不需要串流輸出，Agent 以一般方式執行。
+        """
+        return None
+
+
+class TurnEventChannel(TurnEventSink):
+    """
+    將回合事件排入佇列，供 SSE / WebSocket 串流逐一取出。
+
+    需在事件迴圈中建立；事件可由事件迴圈或 asyncio.to_thread 的執行緒送出，
+    一律經由 call_soon_threadsafe 排入，順序與送出順序相同。
+
+    用法示例:
+    ```python
+    channel = TurnEventChannel()
+    task = asyncio.create_task(run_turn(events=channel))
+    task.add_done_callback(lambda _: channel.close())
+
+    async for event in channel:
+        print(event.event, event.data)  # stage {"stage": "state_loaded", "elapsed_ms": 3.1}
+    ```
+    """
+
+    def __init__(self):
+        self._loop = asyncio.get_running_loop()
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._started = time.perf_counter()
+
+    def emit(self, event: str, **data: Any) -> None:
+        """送出事件"""
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, TurnEvent(event, data))
+
+    def stage(self, name: str, **data: Any) -> None:
+        self.emit(EVENT_STAGE, stage=name, elapsed_ms=self.elapsed_ms(), **data)
+
+    def token_sink(self, agent_name: str) -> Optional[Callable[[str], None]]:
+        return lambda delta: self.emit(EVENT_TOKEN, agent=agent_name, delta=delta)
+
+    def elapsed_ms(self) -> float:
+        """自頻道建立以來經過的毫秒數"""
+        return round((time.perf_counter() - self._started) * 1000, 1)
+
+    def close(self) -> None:
+        """不再有事件；已排入的事件仍會先被取出"""
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, None)
+
+    async def __aiter__(self) -> AsyncIterator[TurnEvent]:
+        while True:
+            event = await self._queue.get()
+            if event is None:
+                return
+            yield event
+
+
+# 非串流回合共用的空接收端
+NO_TURN_EVENTS = TurnEventSink()
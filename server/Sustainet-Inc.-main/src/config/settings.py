@@ -46,6 +46,16 @@ class Settings:
     app_log_level: str = field(default_factory=lambda: os.getenv("LOG_LEVEL", "debug"))
     app_log_to_file: bool = field(default_factory=lambda: os.getenv("LOG_TO_FILE", "false").lower() == "true")
     app_log_file_path: str = field(default_factory=lambda: os.getenv("LOG_FILE_PATH", "logs/app.log"))
+    # 日誌格式：text（可讀文字）或 json（每行一筆 JSON，供正式環境收集）
+    app_log_format: str = field(default_factory=lambda: os.getenv("LOG_FORMAT", "text"))
+    # 日誌佇列：請求執行緒只放入佇列，由背景執行緒寫入（0 表示同步寫入）
+    app_log_queue_size: int = field(default_factory=lambda: int(os.getenv("LOG_QUEUE_SIZE", "10000")))
+    # 佇列已滿時：drop（丟棄 WARNING 以下）或 block（短暫等待）
+    app_log_queue_policy: str = field(default_factory=lambda: os.getenv("LOG_QUEUE_POLICY", "drop"))
+    # 日誌檔輪替：超過大小（位元組，0 表示不限）或經過秒數（0 表示不限）
+    app_log_file_max_bytes: int = field(default_factory=lambda: int(os.getenv("LOG_FILE_MAX_BYTES", "10485760")))
+    app_log_file_rotate_seconds: int = field(default_factory=lambda: int(os.getenv("LOG_FILE_ROTATE_SECONDS", "86400")))
+    app_log_file_backup_count: int = field(default_factory=lambda: int(os.getenv("LOG_FILE_BACKUP_COUNT", "5")))
     
     # API 密鑰
     openai_api_key: str = field(default_factory=lambda: os.getenv("OPENAI_API_KEY", ""))
@@ -56,6 +66,40 @@ class Settings:
     database_url_sync: str = field(default_factory=lambda: os.getenv("DATABASE_URL_SYNC", ""))
     database_url_async: str = field(default_factory=lambda: os.getenv("DATABASE_URL_ASYNC", ""))
     
+    # 資料庫連線池設定（同步與非同步 engine 各自一個連線池）
+    db_pool_size: int = field(default_factory=lambda: int(os.getenv("DB_POOL_SIZE", "10")))
+    db_max_overflow: int = field(default_factory=lambda: int(os.getenv("DB_MAX_OVERFLOW", "20")))
+    db_pool_timeout: float = field(default_factory=lambda: float(os.getenv("DB_POOL_TIMEOUT", "30")))  # 等待可用連線的秒數
+    db_pool_recycle: int = field(default_factory=lambda: int(os.getenv("DB_POOL_RECYCLE", "1800")))  # 連線存活秒數，-1 表示不回收
+    db_pool_pre_ping: bool = field(default_factory=lambda: os.getenv("DB_POOL_PRE_PING", "false").lower() == "true")
+    db_connect_timeout: int = field(default_factory=lambda: int(os.getenv("DB_CONNECT_TIMEOUT", "10")))
+    db_health_cache_ttl: float = field(default_factory=lambda: float(os.getenv("DB_HEALTH_CACHE_TTL", "5")))
+    
+    # LLM 呼叫設定
+    llm_max_concurrency: int = field(default_factory=lambda: int(os.getenv("LLM_MAX_CONCURRENCY", "64")))
+    llm_provider_concurrency: str = field(default_factory=lambda: os.getenv("LLM_PROVIDER_CONCURRENCY", ""))  # 例如 "openai=32,google=16"
+    llm_default_provider_concurrency: int = field(default_factory=lambda: int(os.getenv("LLM_DEFAULT_PROVIDER_CONCURRENCY", "32")))
+    llm_timeout: float = field(default_factory=lambda: float(os.getenv("LLM_TIMEOUT", "60")))
+    llm_queue_timeout: float = field(default_factory=lambda: float(os.getenv("LLM_QUEUE_TIMEOUT", "30")))
+    fake_llm_latency: float = field(default_factory=lambda: float(os.getenv("FAKE_LLM_LATENCY", "0")))
+    
+    # 潤稿回應快取設定
+    polish_cache_backend: str = field(default_factory=lambda: os.getenv("POLISH_CACHE_BACKEND", "memory"))  # memory / sqlite / none
+    polish_cache_path: str = field(default_factory=lambda: os.getenv("POLISH_CACHE_PATH", "cache/polish_cache.sqlite3"))
+    polish_cache_max_entries: int = field(default_factory=lambda: int(os.getenv("POLISH_CACHE_MAX_ENTRIES", "1024")))
+    polish_cache_ttl: float = field(default_factory=lambda: float(os.getenv("POLISH_CACHE_TTL", "86400")))
+    
+    # 遊戲狀態熱資料存放設定（0 表示停用）
+    game_state_store_max_sessions: int = field(default_factory=lambda: int(os.getenv("GAME_STATE_STORE_MAX_SESSIONS", "10000")))
+    game_state_store_idle_ttl: float = field(default_factory=lambda: float(os.getenv("GAME_STATE_STORE_IDLE_TTL", "1800")))
+    game_state_store_max_bytes: int = field(default_factory=lambda: int(os.getenv("GAME_STATE_STORE_MAX_BYTES", "268435456")))  # 估計值，0 表示不限制
+    
+    # WebSocket 遊戲頻道設定
+    ws_heartbeat_interval: float = field(default_factory=lambda: float(os.getenv("WS_HEARTBEAT_INTERVAL", "20")))
+    ws_heartbeat_timeout: float = field(default_factory=lambda: float(os.getenv("WS_HEARTBEAT_TIMEOUT", "60")))
+    ws_send_queue_size: int = field(default_factory=lambda: int(os.getenv("WS_SEND_QUEUE_SIZE", "256")))
+    ws_max_pending_actions: int = field(default_factory=lambda: int(os.getenv("WS_MAX_PENDING_ACTIONS", "4")))
+    
     @property
     def is_development(self) -> bool:
         """檢查是否為開發環境"""
@@ -78,6 +122,16 @@ class Settings:
         }
         return levels.get(self.app_log_level.lower(), logging.INFO)
     
+    @property
+    def llm_provider_limits(self) -> Dict[str, int]:
+        """解析各 LLM 提供商的並行上限，例如 {"openai": 32, "google": 16}"""
+        limits = {}
+        for item in self.llm_provider_concurrency.split(","):
+            name, _, value = item.partition("=")
+            if name.strip() and value.strip():
+                limits[name.strip().lower()] = int(value)
+        return limits
+    
     def to_dict(self) -> Dict[str, Any]:
         """將設定轉換為字典"""
         return {
@@ -87,6 +141,9 @@ class Settings:
                 "log_level": self.app_log_level,
                 "log_to_file": self.app_log_to_file,
                 "log_file_path": self.app_log_file_path,
+                "log_format": self.app_log_format,
+                "log_queue_size": self.app_log_queue_size,
+                "log_queue_policy": self.app_log_queue_policy,
                 "is_development": self.is_development,
                 "is_production": self.is_production,
             },
@@ -98,6 +155,29 @@ class Settings:
             "database": {
                 "url_sync": bool(self.database_url_sync),  # 只顯示是否設定，不顯示實際 URL
                 "url_async": bool(self.database_url_async),  # 只顯示是否設定，不顯示實際 URL
+            },
+            "llm": {
+                "max_concurrency": self.llm_max_concurrency,
+                "provider_limits": self.llm_provider_limits,
+                "default_provider_concurrency": self.llm_default_provider_concurrency,
+                "timeout": self.llm_timeout,
+                "queue_timeout": self.llm_queue_timeout,
+            },
+            "polish_cache": {
+                "backend": self.polish_cache_backend,
+                "max_entries": self.polish_cache_max_entries,
+                "ttl": self.polish_cache_ttl,
+            },
+            "game_state_store": {
+                "max_sessions": self.game_state_store_max_sessions,
+                "idle_ttl": self.game_state_store_idle_ttl,
+                "max_bytes": self.game_state_store_max_bytes,
+            },
+            "websocket": {
+                "heartbeat_interval": self.ws_heartbeat_interval,
+                "heartbeat_timeout": self.ws_heartbeat_timeout,
+                "send_queue_size": self.ws_send_queue_size,
+                "max_pending_actions": self.ws_max_pending_actions,
             }
         }
 
@@ -0,0 +1,112 @@
+"""
+Agent 呼叫的並行限制。
+以全域與各提供商的 semaphore 限制同時進行的 LLM 呼叫數量，
+大量遊戲同時等待模型回應時只佔用協程，不佔用執行緒。
+"""
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+
+from src.config.settings import settings
+from src.utils.exceptions import ExternalServiceError
+from src.utils.logger import logger
+
+
+class AgentConcurrencyLimiter:
+    """
+    全域 + 各提供商兩層的並行限制器。
+
+    用法示例:
+    ```python
+    limiter = AgentConcurrencyLimiter(max_concurrency=64, provider_limits={"openai": 32})
+
+    async with limiter.slot("openai"):
+        result = await agent.arun(input_text)
+    ```
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        provider_limits: Optional[Dict[str, int]] = None,
+        default_provider_limit: Optional[int] = None,
+        queue_timeout: Optional[float] = None
+    ):
+        """
+        Args:
+            max_concurrency: 全域同時呼叫上限
+            provider_limits: 各提供商的同時呼叫上限
+            default_provider_limit: 未列出的提供商使用的上限，None 表示與全域相同
+            queue_timeout: 等待呼叫名額的逾時（秒），None 表示不限
+        """
+        self.max_concurrency = max_concurrency
+        self.provider_limits = {k.lower(): v for k, v in (provider_limits or {}).items()}
+        self.default_provider_limit = default_provider_limit or max_concurrency
+        self.queue_timeout = queue_timeout
+        self.in_flight = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._global: Optional[asyncio.Semaphore] = None
+        self._providers: Dict[str, asyncio.Semaphore] = {}
+
+    @asynccontextmanager
+    async def slot(self, provider: str) -> AsyncIterator[None]:
+        """
+        取得一個呼叫名額，離開區塊時釋放。
+
+        Args:
+            provider: LLM 提供商名稱
+
+        Raises:
+            ExternalServiceError: 等待名額逾時
+        """
+        provider = (provider or "default").lower()
+        global_semaphore, provider_semaphore = self._semaphores(provider)
+
+        await self._acquire(global_semaphore, provider)
+        try:
+            await self._acquire(provider_semaphore, provider)
+        except BaseException:
+            global_semaphore.release()
+            raise
+
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            provider_semaphore.release()
+            global_semaphore.release()
+
+    # === 私有方法 ===
+
+    def _semaphores(self, provider: str):
+        # semaphore 綁定事件迴圈，迴圈改變時（例如測試中多次 asyncio.run）重新建立
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._global = asyncio.Semaphore(self.max_concurrency)
+            self._providers = {}
+        if provider not in self._providers:
+            limit = self.provider_limits.get(provider, self.default_provider_limit)
+            self._providers[provider] = asyncio.Semaphore(limit)
+        return self._global, self._providers[provider]
+
+    async def _acquire(self, semaphore: asyncio.Semaphore, provider: str) -> None:
+        try:
+            await asyncio.wait_for(semaphore.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"等待 {provider} 呼叫名額逾時（{self.queue_timeout} 秒）")
+            raise ExternalServiceError(
+                message=f"Timed out waiting for an available {provider} agent slot",
+                error_code="AGENT_QUEUE_TIMEOUT",
+                service_name=provider
+            )
+
+
+# 全局 Agent 並行限制器
+agent_limiter = AgentConcurrencyLimiter(
+    max_concurrency=settings.llm_max_concurrency,
+    provider_limits=settings.llm_provider_limits,
+    default_provider_limit=settings.llm_default_provider_concurrency,
+    queue_timeout=settings.llm_queue_timeout
+)
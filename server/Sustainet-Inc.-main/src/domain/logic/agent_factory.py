@@ -1,18 +1,28 @@
+import asyncio
 import json
+import time
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import AsyncIterator, Callable, Dict, Any, List, Optional, Union
 
 from agno.agent import Agent as AgnoAgent
 from agno.models.openai import OpenAIChat
 from agno.models.google import Gemini
 from agno.models.anthropic import Claude
+from agno.run.response import RunResponse
 
 from src.utils.variables_render import VariablesRenderer
-from src.utils.exceptions import ResourceNotFoundError, BusinessLogicError
+from src.utils.exceptions import ResourceNotFoundError, BusinessLogicError, ExternalServiceError
 from src.utils.logger import logger
+from src.utils.metrics import agent_run_seconds
 from src.config.settings import settings
 from src.infrastructure.database.agent_repo import AgentRepository
+from src.infrastructure.database.response_cache import make_cache_key
 from src.infrastructure.database.models.agent import Agent
+from src.domain.models.agent import AgentDefinition
+from src.domain.logic.agent_concurrency import AgentConcurrencyLimiter, agent_limiter
+
+# 模擬 Agent 串流輸出時每個片段的字元數
+MOCK_STREAM_CHUNK_SIZE = 16
 
 # 工具類註冊表
 TOOL_CLASSES: Dict[str, type] = {}
@@ -23,20 +33,20 @@ if extra_tools_dir.is_dir():
     logger.info(f"添加額外工具目錄: {extra_tools_dir}")
 else:
     logger.warning(f"額外工具目錄不存在: {extra_tools_dir}")
-    
-    # 載入預設工具
-    try:
+
+# 載入預設工具
+try:
     from src.domain.logic.tools.calculator import CalculatorTools
     TOOL_CLASSES["calculator"] = CalculatorTools
-        logger.debug("添加默認 CalculatorTools")
+    logger.debug("添加默認 CalculatorTools")
 except ImportError as e:
     logger.warning(f"無法載入默認 CalculatorTools: {e}")
 
-    try:
-        from src.domain.logic.tools.placeholder import Placeholder
+try:
+    from src.domain.logic.tools.placeholder import Placeholder
     TOOL_CLASSES["placeholder"] = Placeholder
-        logger.debug("添加默認 Placeholder")
-        except ImportError as e:
+    logger.debug("添加默認 Placeholder")
+except ImportError as e:
     logger.warning(f"無法載入默認 Placeholder: {e}")
 
 logger.info(f"系統中可用的工具類列表: {', '.join(TOOL_CLASSES.keys())}")
@@ -55,25 +65,70 @@ class MockAgent:
     
     def run(self, input_text: Optional[str] = None) -> Any:
         """模擬 Agent 的運行"""
-        logger.debug(f"模擬 Agent {self.name} 運行，輸入: {input_text}")
+        logger.debug("模擬 Agent %s 運行，輸入: %s", self.name, input_text)
         return {
             "content": f"這是來自 {self.name} 的模擬回應。輸入文本: {input_text}",
             "tools_used": [tool.name for tool in self.tools]
         }
 
+    async def arun(self, input_text: Optional[str] = None, stream: bool = False) -> Any:
+        """
+        模擬 Agent 的非同步運行。
+        stream=True 時與 agno 相同，返回 RunResponse 片段的非同步迭代器，
+        完整結果在串流結束後放在 run_response。
+        """
+        if stream:
+            return self._astream(input_text)
+        return self.run(input_text)
+
+    async def _astream(self, input_text: Optional[str]) -> AsyncIterator[RunResponse]:
+        self.run_response = self.run(input_text)
+        for delta in _stream_chunks(self.run_response):
+            yield RunResponse(content=delta)
+
+class FakeProviderAgent(MockAgent):
+    """
+    本地假提供商（provider="fake"），以固定延遲模擬模型 I/O，用於測試並行限制與逾時。
+    延遲預設取自 settings.fake_llm_latency（FAKE_LLM_LATENCY，秒）。
+    """
+
+    def __init__(self, *args, latency: Optional[float] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.latency = settings.fake_llm_latency if latency is None else latency
+
+    def run(self, input_text: Optional[str] = None) -> Any:
+        time.sleep(self.latency)
+        return super().run(input_text)
+
+    async def arun(self, input_text: Optional[str] = None, stream: bool = False) -> Any:
+        if stream:
+            return self._astream(input_text)
+        await asyncio.sleep(self.latency)
+        return super().run(input_text)
+
+    async def _astream(self, input_text: Optional[str]) -> AsyncIterator[RunResponse]:
+        # 延遲平均分散在各片段之間，模擬模型逐步產生輸出
+        self.run_response = super().run(input_text)
+        chunks = _stream_chunks(self.run_response)
+        for delta in chunks:
+            await asyncio.sleep(self.latency / len(chunks))
+            yield RunResponse(content=delta)
+
 class AgentFactory:
     """
     Agent Factory 服務，負責創建和管理 Agent
     """
     
-    def __init__(self, agent_repo: AgentRepository):
+    def __init__(self, agent_repo: AgentRepository, limiter: Optional[AgentConcurrencyLimiter] = None):
         """
         初始化 Agent Factory 服務。
         
         Args:
             agent_repo: Agent Repository 實例
+            limiter: 非同步呼叫使用的並行限制器，預設為全局 agent_limiter
         """
         self.agent_repo = agent_repo
+        self.limiter = limiter or agent_limiter
 
     def run_agent_by_name(self,
                          session_id: str,
@@ -99,40 +154,134 @@ class AgentFactory:
             ResourceNotFoundError: 如果找不到代理配置
             BusinessLogicError: 如果代理配置無效或執行失敗
         """
+        start = time.perf_counter()
         try:
-            # 1. 獲取 Agent 資料
-            agent = self.agent_repo.get_by_name(agent_name)
-            if not agent:
+            # 1. 獲取 Agent 設定（版本快取，唯讀）
+            definition = self.agent_repo.get_definition(agent_name)
+            if not definition:
                 raise ResourceNotFoundError(f"找不到名稱為 {agent_name} 的 Agent")
 
-            # 2. 處理變數替換
-            if variables:
-                if agent.description:
-                    agent.description = VariablesRenderer.render_variables(agent.description, variables)
-                if agent.instruction:
-                    agent.instruction = VariablesRenderer.render_variables(agent.instruction, variables)
-
-            # 3. 創建 Agent 實例
-            agent_instance = self._create_agent_from_data(session_id, agent, variables, response_model)
+            # 2. 創建 Agent 實例（變數替換在此完成，產生新字串）
+            agent_instance = self._create_agent_from_data(session_id, definition, variables, response_model)
             if not agent_instance:
                 raise BusinessLogicError("無法創建 Agent 實例")
 
-            # 4. 執行 Agent
+            # 3. 執行 Agent
             result = agent_instance.run(input_text)
             
-            # 5. 處理結果
-            if hasattr(result, 'content'):
-                content = result.content
-            else:
-                content = str(result)
-            
-            return content.strip() if isinstance(content, str) else content
+            # 4. 處理結果
+            return self._extract_content(result)
 
         except ResourceNotFoundError:
             raise
         except Exception as e:
             logger.error(f"執行代理 {agent_name} (session: {session_id}) 時發生錯誤: {str(e)}")
             raise BusinessLogicError(f"執行代理失敗: {str(e)}")
+        finally:
+            agent_run_seconds.labels(agent_name, "sync").observe(time.perf_counter() - start)
+
+    async def arun_agent_by_name(self,
+                                 session_id: str,
+                                 agent_name: str,
+                                 variables: Dict[str, Any],
+                                 input_text: Optional[str] = None,
+                                 response_model: Optional[type] = None,
+                                 timeout: Optional[float] = None,
+                                 on_token: Optional[Callable[[str], None]] = None,
+                                 **kwargs) -> Any:
+        """run_agent_by_name 的協程版本。
+
+        模型呼叫受全域與提供商並行上限限制，等待期間不佔用執行緒；
+        超過 timeout 秒未完成則取消呼叫。
+        提供 on_token 時以串流方式執行，每個輸出片段到達時立即回呼，
+        返回值與非串流時相同。
+
+        Args:
+            session_id: 會話 ID
+            agent_name: 要運行的代理名稱
+            variables: 傳遞給代理模板的變數
+            input_text: 傳遞給 agent.arun 的輸入文本
+            response_model: 可選的響應模型類別
+            timeout: 呼叫逾時（秒），預設為 settings.llm_timeout
+            on_token: 接收輸出片段的回呼（在事件迴圈中呼叫，不可阻塞）
+            **kwargs: 額外參數
+
+        Returns:
+            代理執行結果內容
+
+        Raises:
+            ResourceNotFoundError: 如果找不到代理配置
+            ExternalServiceError: 如果等待名額或模型呼叫逾時
+            BusinessLogicError: 如果代理配置無效或執行失敗
+        """
+        timeout = settings.llm_timeout if timeout is None else timeout
+        start = time.perf_counter()
+        try:
+            # 快取需重新驗證時會查詢資料庫，放到執行緒中避免阻塞事件迴圈
+            definition = await asyncio.to_thread(self.agent_repo.get_definition, agent_name)
+            if not definition:
+                raise ResourceNotFoundError(f"找不到名稱為 {agent_name} 的 Agent")
+
+            agent_instance = self._create_agent_from_data(session_id, definition, variables, response_model)
+            if not agent_instance:
+                raise BusinessLogicError("無法創建 Agent 實例")
+
+            async with self.limiter.slot(definition.provider):
+                try:
+                    run = (
+                        self._astream_instance(agent_instance, input_text, on_token)
+                        if on_token is not None
+                        else self._arun_instance(agent_instance, input_text)
+                    )
+                    result = await asyncio.wait_for(run, timeout=timeout)
+                except asyncio.TimeoutError:
+                    raise ExternalServiceError(
+                        message=f"Agent {agent_name} timed out after {timeout} seconds",
+                        error_code="AGENT_TIMEOUT",
+                        service_name=definition.provider
+                    )
+
+            return self._extract_content(result)
+
+        except (ResourceNotFoundError, ExternalServiceError):
+            raise
+        except Exception as e:
+            logger.error(f"執行代理 {agent_name} (session: {session_id}) 時發生錯誤: {str(e)}")
+            raise BusinessLogicError(f"執行代理失敗: {str(e)}")
+        finally:
+            agent_run_seconds.labels(agent_name, "async").observe(time.perf_counter() - start)
+
+    def prompt_fingerprint(self,
+                           agent_name: str,
+                           variables: Dict[str, Any],
+                           input_text: Optional[str] = None) -> Optional[str]:
+        """計算 Agent 呼叫的內容定址鍵。
+
+        鍵由渲染後的描述與指令、輸入文本、Agent 版本（updated_at）與模型設定組成，
+        任何一項改變都會得到不同的鍵。
+
+        Args:
+            agent_name: 代理名稱
+            variables: 傳遞給代理模板的變數
+            input_text: 傳遞給 agent.run 的輸入文本
+
+        Returns:
+            快取鍵，如果找不到代理配置則返回 None
+        """
+        definition = self.agent_repo.get_definition(agent_name)
+        if not definition:
+            return None
+
+        return make_cache_key(
+            definition.agent_name,
+            definition.updated_at,
+            definition.provider,
+            definition.model_name,
+            definition.temperature,
+            VariablesRenderer.render_variables(definition.description or "", variables),
+            VariablesRenderer.render_variables(definition.instruction or "", variables),
+            input_text
+        )
 
     def create_agent(self, agent_id: int, session_id: str = None, variables: Dict[str, Any] = None) -> Any:
         """
@@ -150,7 +299,7 @@ class AgentFactory:
             ResourceNotFoundError: 如果找不到 Agent
             BusinessLogicError: 如果創建失敗
         """
-        agent = self.agent_repo.get_by_id(agent_id)
+        agent = self.agent_repo.get_by_pk(agent_id)
         if not agent:
             raise ResourceNotFoundError(f"找不到 ID 為 {agent_id} 的 Agent")
         
@@ -172,18 +321,18 @@ class AgentFactory:
             ResourceNotFoundError: 如果找不到 Agent
             BusinessLogicError: 如果創建失敗
         """
-        agent = self.agent_repo.get_by_name(agent_name)
-        if not agent:
+        definition = self.agent_repo.get_definition(agent_name)
+        if not definition:
             raise ResourceNotFoundError(f"找不到名稱為 {agent_name} 的 Agent")
         
-        return self._create_agent_from_data(session_id, agent, variables, None)
+        return self._create_agent_from_data(session_id, definition, variables, None)
 
-    def _create_agent_from_data(self, session_id: str, agent: Agent, variables: Dict[str, Any] = None, response_model: Optional[type] = None) -> MockAgent:
+    def _create_agent_from_data(self, session_id: str, agent: Union[Agent, AgentDefinition], variables: Dict[str, Any] = None, response_model: Optional[type] = None) -> MockAgent:
         """從 Agent 資料創建 Agent 實例。
 
         Args:
             session_id: 會話 ID
-            agent: Agent 實體
+            agent: Agent 實體或 AgentDefinition（只讀取，不會被修改）
             variables: 變數字典
             response_model: 可選的響應模型類別
 
@@ -205,7 +354,7 @@ class AgentFactory:
                 "debug": True
             }
 
-            logger.debug(f"Agent 配置: {config}")
+            logger.debug("Agent 配置: %s", config)
             
             # 2. 處理變數替換
             if variables:
@@ -214,28 +363,66 @@ class AgentFactory:
                 if config["instruction"]:
                     config["instruction"] = VariablesRenderer.render_variables(config["instruction"], variables)
             
-            # 3. 創建模擬 Agent 實例
+            # 3. 創建模擬 Agent 實例（provider="fake" 時使用有延遲的假提供商）
+            agent_class = FakeProviderAgent if getattr(agent, "provider", None) == "fake" else MockAgent
             try:
-                agent_instance = MockAgent(
-                session_id=session_id,
-                name=config["name"],
-                instructions=config["instruction"],
-                description=config["description"],
-                tools=config["tools"],
-                num_history_responses=config["num_history_responses"],
-                markdown=config["markdown"],
+                agent_instance = agent_class(
+                    session_id=session_id,
+                    name=config["name"],
+                    instructions=config["instruction"],
+                    description=config["description"],
+                    tools=config["tools"],
+                    num_history_responses=config["num_history_responses"],
+                    markdown=config["markdown"],
                     debug_mode=config["debug"]
-            )
-                logger.debug(f"成功創建 Agent 實例: {config['name']}")
-            return agent_instance
+                )
+                logger.debug("成功創建 Agent 實例: %s", config['name'])
+                return agent_instance
             except Exception as e:
                 logger.error(f"創建 Agent 實例失敗: {e}")
                 raise BusinessLogicError(f"創建 Agent 實例失敗: {str(e)}")
-            
+
         except Exception as e:
             logger.error(f"創建 Agent 失敗: {e}")
             raise BusinessLogicError(f"創建 Agent 失敗: {str(e)}")
 
+    async def _arun_instance(self, agent_instance: Any, input_text: Optional[str]) -> Any:
+        """以協程執行 Agent 實例，不支援 arun 的實例改在執行緒中執行"""
+        if hasattr(agent_instance, "arun"):
+            return await agent_instance.arun(input_text)
+        return await asyncio.to_thread(agent_instance.run, input_text)
+
+    async def _astream_instance(
+        self,
+        agent_instance: Any,
+        input_text: Optional[str],
+        on_token: Callable[[str], None]
+    ) -> Any:
+        """
+        以串流執行 Agent 實例並轉發輸出片段。
+        agno 的 arun(stream=True) 返回 RunResponse 片段的非同步迭代器，完整結果在串流結束後放在 run_response；
+        設定 response_model 時 agno 不串流，直接返回完整結果，此時不產生片段。
+        """
+        if not hasattr(agent_instance, "arun"):
+            return await self._arun_instance(agent_instance, input_text)
+        response = await agent_instance.arun(input_text, stream=True)
+        if not hasattr(response, "__aiter__"):
+            return response
+        async for chunk in response:
+            delta = getattr(chunk, "content", None)
+            if isinstance(delta, str) and delta:
+                on_token(delta)
+        return agent_instance.run_response
+
+    def _extract_content(self, result: Any) -> Any:
+        """從 Agent 執行結果取出內容"""
+        if hasattr(result, 'content'):
+            content = result.content
+        else:
+            content = str(result)
+        
+        return content.strip() if isinstance(content, str) else content
+
     def _get_tools(self, agent_data: Dict[str, Any]) -> List[Any]:
         """
         從 Agent 配置獲取工具實例列表。
@@ -270,7 +457,7 @@ class AgentFactory:
                     try:
                         instance = cls()
                         instances.append(instance)
-                        logger.debug(f"成功創建工具實例: {entry}")
+                        logger.debug("成功創建工具實例: %s", entry)
                     except Exception as e:
                         logger.error(f"創建工具實例失敗 '{entry}': {e}")
                 else:
@@ -286,9 +473,17 @@ class AgentFactory:
                     try:
                         instance = cls(**params)
                         instances.append(instance)
-                        logger.debug(f"成功創建工具實例: {name}")
+                        logger.debug("成功創建工具實例: %s", name)
                     except Exception as e:
                         logger.error(f"創建工具實例失敗 '{name}': {e}")
                 else:
                     logger.warning(f"未知工具 '{name}'，跳過")
         return instances
+
+
+# === 私有函數 ===
+
+def _stream_chunks(result: Any) -> List[str]:
+    """將模擬結果切成串流片段（dict 結果以 JSON 文字輸出）"""
+    text = result if isinstance(result, str) else json.dumps(result, ensure_ascii=False, default=str)
+    return [text[i:i + MOCK_STREAM_CHUNK_SIZE] for i in range(0, len(text), MOCK_STREAM_CHUNK_SIZE)] or [""]
@@ -1,11 +1,16 @@
 import random
+from typing import Optional
 from src.domain.models.game import Article
 from src.application.dto.game_dto import ArticleMeta, FakeNewsAgentResponse
 from datetime import datetime
 
 class AiTurnLogic:
+    def __init__(self, rng: Optional[random.Random] = None):
+        # 亂數來源；模擬引擎傳入每場遊戲各自的 Random，不使用行程共用的 random 模組狀態
+        self.rng = rng or random.Random()
+
     def select_platform(self, platforms):
-        return random.choice(platforms)
+        return self.rng.choice(platforms)
     
     def prepare_fake_news_variables(self, platform, news_1, news_2):
         return {
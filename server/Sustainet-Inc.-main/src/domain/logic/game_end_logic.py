@@ -1,16 +1,34 @@
 """
 遊戲結束邏輯 - 負責判斷遊戲是否結束及處理結束狀態
 """
-from typing import Dict, Any, List
-from src.config.game_config import game_config
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Sequence, Union
+
+import numpy as np
+
+from src.config.game_config import GameConfig, game_config
 from src.utils.logger import logger
 
+# 批次結果以整數代碼表示勝方與結束原因，NOT_ENDED 表示遊戲繼續
+WINNERS = ("player", "ai", "draw")
+REASONS = ("max_rounds_reached", "player_dominance", "ai_dominance")
+NOT_ENDED = -1
+
+WINNER_MESSAGES = {
+    "player": "🎉 玩家勝利！",
+    "ai": "🤖 AI 勝利！",
+    "draw": "🤝 平局！"
+}
+
+_PLAYER, _AI, _DRAW = range(len(WINNERS))
+_MAX_ROUNDS, _PLAYER_DOMINANCE, _AI_DOMINANCE = range(len(REASONS))
+
 
 class GameEndLogic:
     """遊戲結束判斷邏輯 - Domain Layer"""
     
-    def __init__(self):
-        self.config = game_config
+    def __init__(self, config: Optional[GameConfig] = None):
+        self.config = config or game_config
     
     def check_game_end_condition(
         self,
@@ -53,6 +71,94 @@ class GameEndLogic:
         
         return end_result
     
+    def check_game_end_batch(
+        self,
+        round_numbers: Union[int, Sequence[int], np.ndarray],
+        player_trust: np.ndarray,
+        ai_trust: np.ndarray,
+        spread_rates: Optional[np.ndarray] = None,
+        platform_names: Optional[Sequence[str]] = None
+    ) -> "BatchGameEndResult":
+        """
+        一次判斷多場遊戲是否結束（排行榜、分析與模擬器使用）
+
+        結果與逐場呼叫 check_game_end_condition、format_game_end_summary 完全相同，
+        但整批只做一次向量化運算，不寫入日誌。
+
+        Args:
+            round_numbers: 各場當前回合數，形狀 (games,)，或所有場次共用的單一回合數
+            player_trust: 玩家信任值，形狀 (games, platforms)
+            ai_trust: AI 信任值，形狀 (games, platforms)
+            spread_rates: 傳播率，形狀 (games, platforms)，只用於統計資訊
+            platform_names: 平台名稱，預設使用配置中的平台
+
+        Returns:
+            BatchGameEndResult
+
+        用法示例:
+        ```python
+        result = game_end_logic.check_game_end_batch(
+            round_numbers=np.array([2, 1]),
+            player_trust=np.array([[60, 55, 50], [100, 100, 100]]),
+            ai_trust=np.array([[40, 45, 50], [20, 30, 40]])
+        )
+        result.winners  # ["player", "player"]
+        result.reasons  # ["max_rounds_reached", "player_dominance"]
+        result.summary()  # {"games": 2, "ended": 2, "winners": {"player": 2}, ...}
+        ```
+        """
+        player = np.asarray(player_trust)
+        ai = np.asarray(ai_trust)
+        spread = np.zeros_like(player) if spread_rates is None else np.asarray(spread_rates)
+        if player.ndim != 2 or ai.shape != player.shape or spread.shape != player.shape:
+            raise ValueError(
+                f"信任值與傳播率必須是相同形狀的 (games, platforms) 陣列: "
+                f"player={player.shape}, ai={ai.shape}, spread={spread.shape}"
+            )
+        games, platform_count = player.shape
+        names = list(platform_names) if platform_names is not None else list(self.config.platform_names)
+        if len(names) != platform_count:
+            raise ValueError(f"平台名稱數量 ({len(names)}) 與陣列平台數 ({platform_count}) 不符")
+        rounds = np.broadcast_to(np.asarray(round_numbers), (games,))
+
+        player_total = _row_sum(player)
+        ai_total = _row_sum(ai)
+        player_winning = np.count_nonzero(player >= self.config.win_trust_threshold, axis=1)
+        ai_winning = np.count_nonzero(ai >= self.config.win_trust_threshold, axis=1)
+
+        # 判斷順序與 GameConfig.should_game_end 相同：回合上限 > 玩家主導 > AI 主導
+        max_rounds_reached = rounds >= self.config.max_rounds
+        player_dominance = ~max_rounds_reached & (player_winning >= self.config.win_platform_count)
+        ai_dominance = ~max_rounds_reached & ~player_dominance & (ai_winning >= self.config.win_platform_count)
+
+        reason_codes = np.full(games, NOT_ENDED, dtype=np.int8)
+        reason_codes[max_rounds_reached] = _MAX_ROUNDS
+        reason_codes[player_dominance] = _PLAYER_DOMINANCE
+        reason_codes[ai_dominance] = _AI_DOMINANCE
+
+        final_winner = np.where(
+            player_total > ai_total, _PLAYER, np.where(ai_total > player_total, _AI, _DRAW)
+        )
+        winner_codes = np.full(games, NOT_ENDED, dtype=np.int8)
+        winner_codes[max_rounds_reached] = final_winner[max_rounds_reached]
+        winner_codes[player_dominance] = _PLAYER
+        winner_codes[ai_dominance] = _AI
+
+        return BatchGameEndResult(
+            config=self.config,
+            platform_names=names,
+            round_numbers=rounds,
+            player_trust=player,
+            ai_trust=ai,
+            spread_rates=spread,
+            winner_codes=winner_codes,
+            reason_codes=reason_codes,
+            player_total_trust=player_total,
+            ai_total_trust=ai_total,
+            player_winning_platforms=player_winning,
+            ai_winning_platforms=ai_winning
+        )
+
     def format_game_end_summary(self, end_result: Dict[str, Any]) -> Dict[str, Any]:
         """
         格式化遊戲結束摘要資訊
@@ -66,17 +172,7 @@ class GameEndLogic:
         if not end_result["is_ended"]:
             return {"summary": "遊戲進行中", "is_ended": False}
         
-        reason_messages = {
-            "max_rounds_reached": f"已達最大回合數 ({self.config.max_rounds} 回合)",
-            "player_dominance": f"玩家在 {self.config.win_platform_count} 個平台達到 {self.config.win_trust_threshold} 信任值",
-            "ai_dominance": f"AI 在 {self.config.win_platform_count} 個平台達到 {self.config.win_trust_threshold} 信任值"
-        }
-        
-        winner_messages = {
-            "player": "🎉 玩家勝利！",
-            "ai": "🤖 AI 勝利！",
-            "draw": "🤝 平局！"
-        }
+        reason_messages = _reason_messages(self.config)
         
         reason = end_result["reason"]
         winner = end_result["winner"]
@@ -85,14 +181,54 @@ class GameEndLogic:
         summary = {
             "is_ended": True,
             "winner": winner,
-            "winner_message": winner_messages.get(winner, "遊戲結束"),
+            "winner_message": WINNER_MESSAGES.get(winner, "遊戲結束"),
             "reason": reason,
             "reason_message": reason_messages.get(reason, "遊戲結束"),
             "game_statistics": self._calculate_game_statistics(details),
         }
         
         return summary
-    
+
+    def evaluate_standing(
+        self,
+        round_number: int,
+        platform_states: List[Dict[str, Any]],
+        check_end: bool = True
+    ) -> Dict[str, Any]:
+        """
+        計算目前戰況，供每場摘要（session_summaries）增量更新；與 check_game_end_condition 判定相同但不寫入日誌
+
+        Args:
+            round_number: 當前回合數
+            platform_states: 平台狀態列表
+            check_end: 是否判定遊戲結束（遊戲結束只在玩家回合後判定，AI 回合傳入 False）
+
+        Returns:
+            player_total_trust、ai_total_trust、leader；check_end 時另含 is_ended、winner、end_reason
+        """
+        player_total = sum(p.get("player_trust", 0) for p in platform_states)
+        ai_total = sum(p.get("ai_trust", 0) for p in platform_states)
+        standing = {
+            "player_total_trust": player_total,
+            "ai_total_trust": ai_total,
+            "leader": "player" if player_total > ai_total else "ai" if ai_total > player_total else "draw",
+        }
+        if check_end:
+            end_result = self.config.should_game_end(round_number, platform_states)
+            standing.update({
+                "is_ended": end_result["is_ended"],
+                "winner": end_result["winner"],
+                "end_reason": end_result["reason"],
+            })
+        return standing
+
+    def describe_end(self, winner: str, reason: str) -> Dict[str, str]:
+        """返回勝方與結束原因的顯示訊息（同 format_game_end_summary 的 winner_message、reason_message）"""
+        return {
+            "winner_message": WINNER_MESSAGES.get(winner, "遊戲結束"),
+            "reason_message": _reason_messages(self.config).get(reason, "遊戲結束"),
+        }
+
     def _calculate_game_statistics(self, details: Dict[str, Any]) -> Dict[str, Any]:
         """計算遊戲統計資訊"""
         stats = {
@@ -123,3 +259,188 @@ class GameEndLogic:
             stats["winning_threshold"] = details.get("threshold", self.config.win_platform_count)
         
         return stats
+
+
+@dataclass(frozen=True)
+class BatchGameEndResult:
+    """
+    GameEndLogic.check_game_end_batch 的結果。
+    陣列的第一維為場次；勝方與原因以 WINNERS、REASONS 的索引表示，NOT_ENDED 表示遊戲繼續。
+
+    用法示例:
+    ```python
+    result.is_ended               # array([True, False])
+    result.end_result(0)          # 與 GameConfig.should_game_end 相同的字典
+    result.game_summary(0)        # 與 format_game_end_summary 相同的字典
+    result.summary()              # 整批的勝率與平均信任值
+    ```
+    """
+    config: GameConfig
+    platform_names: List[str]
+    round_numbers: np.ndarray
+    player_trust: np.ndarray
+    ai_trust: np.ndarray
+    spread_rates: np.ndarray
+    winner_codes: np.ndarray
+    reason_codes: np.ndarray
+    player_total_trust: np.ndarray
+    ai_total_trust: np.ndarray
+    player_winning_platforms: np.ndarray
+    ai_winning_platforms: np.ndarray
+
+    @property
+    def games(self) -> int:
+        return len(self.reason_codes)
+
+    @property
+    def is_ended(self) -> np.ndarray:
+        return self.reason_codes != NOT_ENDED
+
+    @property
+    def winners(self) -> List[Optional[str]]:
+        return [WINNERS[code] if code != NOT_ENDED else None for code in self.winner_codes.tolist()]
+
+    @property
+    def reasons(self) -> List[Optional[str]]:
+        return [REASONS[code] if code != NOT_ENDED else None for code in self.reason_codes.tolist()]
+
+    @property
+    def total_rounds(self) -> np.ndarray:
+        """
+        統計資訊中的 total_rounds。
+        與逐場結果一致：回合上限結束時 details 不含 round_number，因此為 0。
+        """
+        return np.where(self.reason_codes == _MAX_ROUNDS, 0, self.round_numbers)
+
+    @property
+    def winning_platforms(self) -> np.ndarray:
+        """主導勝利時勝方達標的平台數，其他情況為 0"""
+        return np.select(
+            [self.reason_codes == _PLAYER_DOMINANCE, self.reason_codes == _AI_DOMINANCE],
+            [self.player_winning_platforms, self.ai_winning_platforms],
+            default=0
+        )
+
+    def end_result(self, index: int) -> Dict[str, Any]:
+        """第 index 場的結果，格式同 GameConfig.should_game_end"""
+        reason_code = int(self.reason_codes[index])
+        round_number = self.round_numbers[index].item()
+        if reason_code == _MAX_ROUNDS:
+            details = {
+                "player_total_trust": self.player_total_trust[index].item(),
+                "ai_total_trust": self.ai_total_trust[index].item(),
+                "platform_details": self._platform_states(index),
+                "max_rounds": self.config.max_rounds
+            }
+        elif reason_code in (_PLAYER_DOMINANCE, _AI_DOMINANCE):
+            details = {
+                "winning_platforms": int(self.winning_platforms[index]),
+                "threshold": self.config.win_platform_count,
+                "round_number": round_number
+            }
+        else:
+            return {
+                "is_ended": False,
+                "reason": None,
+                "winner": None,
+                "details": {
+                    "round_number": round_number,
+                    "player_winning_platforms": int(self.player_winning_platforms[index]),
+                    "ai_winning_platforms": int(self.ai_winning_platforms[index])
+                }
+            }
+        return {
+            "is_ended": True,
+            "reason": REASONS[reason_code],
+            "winner": WINNERS[int(self.winner_codes[index])],
+            "details": details
+        }
+
+    def game_summary(self, index: int) -> Dict[str, Any]:
+        """第 index 場的摘要，格式同 GameEndLogic.format_game_end_summary"""
+        reason_code = int(self.reason_codes[index])
+        if reason_code == NOT_ENDED:
+            return {"summary": "遊戲進行中", "is_ended": False}
+
+        winner = WINNERS[int(self.winner_codes[index])]
+        reason = REASONS[reason_code]
+        statistics = {
+            "total_rounds": self.total_rounds[index].item(),
+            "max_possible_rounds": self.config.max_rounds
+        }
+        if reason_code == _MAX_ROUNDS:
+            statistics.update({
+                "final_player_total_trust": self.player_total_trust[index].item(),
+                "final_ai_total_trust": self.ai_total_trust[index].item(),
+                "platform_breakdown": [
+                    {
+                        "platform": state["platform_name"],
+                        "player_trust": state["player_trust"],
+                        "ai_trust": state["ai_trust"],
+                        "spread_rate": state["spread_rate"]
+                    }
+                    for state in self._platform_states(index)
+                ]
+            })
+        else:
+            statistics["winning_platforms"] = int(self.winning_platforms[index])
+            statistics["winning_threshold"] = self.config.win_platform_count
+
+        return {
+            "is_ended": True,
+            "winner": winner,
+            "winner_message": WINNER_MESSAGES[winner],
+            "reason": reason,
+            "reason_message": _reason_messages(self.config)[reason],
+            "game_statistics": statistics,
+        }
+
+    def summary(self) -> Dict[str, Any]:
+        """整批統計：結束場數、勝方與原因分布、平均總信任值與平均回合數"""
+        ended = self.is_ended
+        ended_count = int(np.count_nonzero(ended))
+        winner_counts = np.bincount(self.winner_codes[ended], minlength=len(WINNERS))
+        reason_counts = np.bincount(self.reason_codes[ended], minlength=len(REASONS))
+        return {
+            "games": self.games,
+            "ended": ended_count,
+            "winners": {WINNERS[i]: int(count) for i, count in enumerate(winner_counts) if count},
+            "reasons": {REASONS[i]: int(count) for i, count in enumerate(reason_counts) if count},
+            "avg_player_total_trust": float(self.player_total_trust.mean()) if self.games else 0.0,
+            "avg_ai_total_trust": float(self.ai_total_trust.mean()) if self.games else 0.0,
+            "avg_round_number": float(self.round_numbers.mean()) if self.games else 0.0,
+        }
+
+    def _platform_states(self, index: int) -> List[Dict[str, Any]]:
+        player = self.player_trust[index].tolist()
+        ai = self.ai_trust[index].tolist()
+        spread = self.spread_rates[index].tolist()
+        return [
+            {
+                "platform_name": name,
+                "player_trust": player[i],
+                "ai_trust": ai[i],
+                "spread_rate": spread[i]
+            }
+            for i, name in enumerate(self.platform_names)
+        ]
+
+
+# === 私有函數 ===
+
+def _reason_messages(config: GameConfig) -> Dict[str, str]:
+    return {
+        "max_rounds_reached": f"已達最大回合數 ({config.max_rounds} 回合)",
+        "player_dominance": f"玩家在 {config.win_platform_count} 個平台達到 {config.win_trust_threshold} 信任值",
+        "ai_dominance": f"AI 在 {config.win_platform_count} 個平台達到 {config.win_trust_threshold} 信任值"
+    }
+
+
+def _row_sum(values: np.ndarray) -> np.ndarray:
+    # 依平台順序逐欄累加（每欄仍對所有場次向量化），
+    # 浮點數的加總順序與 Python sum() 相同，結果逐位元一致；
+    # np.sum 的成對加總在平台數多時可能有捨入差異
+    total = np.zeros(values.shape[0], dtype=np.result_type(values.dtype, np.int64))
+    for column in values.T:
+        total = total + column
+    return total
@@ -1,13 +1,15 @@
 import random
 import uuid
-from typing import List
+from typing import List, Optional
 from src.domain.models.game import Game, Platform, SessionId, TrustScore, SpreadRate
 from src.config.game_config import game_config
 
 class GameInitializationLogic:
     
-    def __init__(self):
+    def __init__(self, rng: Optional[random.Random] = None):
         self.config = game_config
+        # 平台受眾的洗牌亂數來源；模擬引擎傳入每場遊戲各自的 Random
+        self.rng = rng or random.Random()
     
     def create_new_game(self) -> Game:
         session_id = SessionId(f"game_{uuid.uuid4().hex}")
@@ -21,7 +23,7 @@ class GameInitializationLogic:
     
     def _create_initial_platforms(self) -> List[Platform]:
         audiences = self.config.audience_types.copy()
-        random.shuffle(audiences)
+        self.rng.shuffle(audiences)
         
         return [
             Platform(
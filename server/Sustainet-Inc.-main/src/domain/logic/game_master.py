@@ -1,4 +1,4 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from src.domain.models.game import Platform
 from src.application.dto.game_dto import ArticleMeta
 
@@ -8,12 +8,11 @@ class GameMasterLogic:
         article: ArticleMeta, 
         platform: Platform,
         all_platforms: List[Platform],
-        round_number: int
+        round_number: int,
+        platform_summary: Optional[str] = None
     ) -> Dict[str, Any]:
-        platform_summary = "\n".join([
-            f"{p.name}（受眾：{p.audience}） | 玩家信任: {p.player_trust.value} | AI信任: {p.ai_trust.value} | 傳播率: {p.spread_rate.value}%"
-            for p in all_platforms
-        ])
+        if platform_summary is None:
+            platform_summary = self.summarize_platforms(all_platforms)
         
         content = article.polished_content or article.content
         
@@ -31,6 +30,13 @@ class GameMasterLogic:
             "round_number": round_number
         }
     
+    def summarize_platforms(self, all_platforms: List[Platform]) -> str:
+        """產生各平台狀態摘要（與文章無關，可在文章產生前先準備）"""
+        return "\n".join([
+            f"{p.name}（受眾：{p.audience}） | 玩家信任: {p.player_trust.value} | AI信任: {p.ai_trust.value} | 傳播率: {p.spread_rate.value}%"
+            for p in all_platforms
+        ])
+    
     def parse_gm_result(self, gm_result: Dict[str, Any]) -> Dict[str, Any]:
         return {
             "trust_change": gm_result.get("trust_change", 0),
@@ -1,8 +1,10 @@
 """
 遊戲狀態管理邏輯 - 負責遊戲狀態的重建、持久化等操作
 """
-from typing import Dict, Any, List
+import logging
+from typing import Callable, Dict, Any, List, Optional
 from src.application.dto.game_dto import GameMasterAgentResponse
+from src.domain.logic.game_end_logic import GameEndLogic
 from src.domain.logic.turn_execution import TurnExecutionResult
 from src.domain.models.tool import AppliedToolEffectDetail, DomainTool
 from src.utils.logger import logger
@@ -33,7 +35,9 @@ class GameStateManager:
         game_state_logic,
         gm_logic,
         tool_effect_logic,
-        agent_factory
+        agent_factory,
+        state_store=None,
+        summary_repo=None
     ):
         self.setup_repo = setup_repo
         self.state_repo = state_repo
@@ -43,12 +47,25 @@ class GameStateManager:
         self.gm_logic = gm_logic
         self.tool_effect_logic = tool_effect_logic
         self.agent_factory = agent_factory
+        # 進行中遊戲的熱資料存放，None 表示不使用
+        self.state_store = state_store
+        # 每場摘要（session_summaries），None 表示不維護
+        self.summary_repo = summary_repo
+        self.game_end_logic = GameEndLogic()
     
     def rebuild_game_state(self, session_id: str, round_number: int):
-        """重建遊戲狀態"""
+        """重建遊戲狀態，熱資料存放命中時不查詢資料庫"""
+        if self.state_store is not None:
+            game = self.state_store.get_game(session_id, round_number, db=self.state_repo.db)
+            if game is not None:
+                return game
+        
         setup_data = self.setup_repo.get_by_session_id(session_id)
         platform_states = self.state_repo.get_by_session_and_round(session_id, round_number)
-        return self.game_state_logic.rebuild_game_from_db(session_id, round_number, setup_data, platform_states)
+        game = self.game_state_logic.rebuild_game_from_db(session_id, round_number, setup_data, platform_states)
+        if self.state_store is not None:
+            self.state_store.put(game, setup_data.platforms, db=self.state_repo.db)
+        return game
     
     def evaluate_and_apply_effects(
         self, 
@@ -66,13 +83,80 @@ class GameStateManager:
             turn_result.round_number
         )
         
-        logger.debug(f"Original GM evaluation for {turn_result.actor}", extra={
-            "session_id": turn_result.session_id, 
-            "round": turn_result.round_number, 
-            "gm_result": original_gm_result.model_dump()
-        })
-        
         # 2. 應用工具效果
+        return self._apply_tool_effects(turn_result, original_gm_result, tool_repo)
+    
+    async def aevaluate_and_apply_effects(
+        self, 
+        turn_result: TurnExecutionResult,
+        game,
+        tool_repo,
+        on_token: Optional[Callable[[str], None]] = None
+    ) -> GameTurnResult:
+        """evaluate_and_apply_effects 的協程版本，提供 on_token 時轉交 GM Agent 的輸出片段"""
+        variables = self._prepare_gm_variables(
+            game, turn_result.article, turn_result.target_platform, turn_result.round_number
+        )
+        original_gm_result: GameMasterAgentResponse = await self.agent_factory.arun_agent_by_name(
+            session_id=game.session_id.value,
+            agent_name="game_master_agent",
+            variables=variables,
+            input_text="input_text",
+            response_model=GameMasterAgentResponse,
+            on_token=on_token
+        )
+        return self._apply_tool_effects(turn_result, original_gm_result, tool_repo)
+    
+    def add_gm_stages(self, pipeline, tool_repo, on_token: Optional[Callable[[str], None]] = None) -> None:
+        """
+        在回合管線中宣告 GM 評估的各階段。
+        平台摘要只依賴遊戲狀態，與假新聞 Agent 呼叫同時準備；
+        需要管線先宣告 "game"、"tools" 與 "turn_result" 階段，結果放在 "game_turn_result" 階段。
+        提供 on_token 時轉交 GM Agent 的輸出片段。
+        """
+        async def run_game_master_agent(game, turn_result, gm_context):
+            variables = self.gm_logic.prepare_evaluation_variables(
+                turn_result.article,
+                game.get_platform(turn_result.target_platform),
+                game.platforms,
+                turn_result.round_number,
+                platform_summary=gm_context
+            )
+            return await self.agent_factory.arun_agent_by_name(
+                session_id=game.session_id.value,
+                agent_name="game_master_agent",
+                variables=variables,
+                input_text="input_text",
+                response_model=GameMasterAgentResponse,
+                on_token=on_token
+            )
+        
+        pipeline.stage(
+            "gm_context", lambda game: self.gm_logic.summarize_platforms(game.platforms),
+            depends_on=("game",), blocking=False
+        )
+        pipeline.stage("gm", run_game_master_agent, depends_on=("game", "turn_result", "gm_context"))
+        pipeline.stage(
+            "game_turn_result",
+            # 依賴 "tools" 確保工具目錄已載入，套用效果時不需再查詢資料庫
+            lambda turn_result, gm, tools: self._apply_tool_effects(turn_result, gm, tool_repo),
+            depends_on=("turn_result", "gm", "tools"), blocking=False
+        )
+    
+    def _apply_tool_effects(
+        self,
+        turn_result: TurnExecutionResult,
+        original_gm_result: GameMasterAgentResponse,
+        tool_repo
+    ) -> GameTurnResult:
+        """將行動者使用的工具效果套用到 GM 評估"""
+        if logger.is_enabled_for(logging.DEBUG):
+            logger.debug("Original GM evaluation for %s", turn_result.actor, extra={
+                "session_id": turn_result.session_id,
+                "round": turn_result.round_number,
+                "gm_result": original_gm_result.model_dump()
+            })
+        
         final_gm_result = original_gm_result
         tool_effects = []
         
@@ -89,7 +173,7 @@ class GameStateManager:
                 final_gm_result, tool_effects = self.tool_effect_logic.apply_effects(
                     original_gm_result, domain_tools
                 )
-                logger.info(f"Applied {len(domain_tools)} tools for {turn_result.actor}", extra={
+                logger.info("Applied %s tools for %s", len(domain_tools), turn_result.actor, extra={
                     "session_id": turn_result.session_id,
                     "round": turn_result.round_number,
                     "tools": [t.tool_name for t in domain_tools]
@@ -102,54 +186,72 @@ class GameStateManager:
         turn_result = game_turn_result.turn_result
         gm_result = game_turn_result.gm_evaluation
         
-        # 1. 記錄行動
+        # 1. 記錄行動（效果欄位一併寫入，單一 INSERT ... RETURNING）
         action_record = self.action_repo.create_action_record(
             session_id=turn_result.session_id,
             round_number=turn_result.round_number,
             actor=turn_result.actor,
             platform=turn_result.target_platform,
-            content=turn_result.article.content
-        )
-        
-        # 2. 更新行動效果
-        self.action_repo.update_effectiveness(
-            action_id=action_record.id,
+            content=turn_result.article.content,
+            reach_count=gm_result.reach_count,
             trust_change=gm_result.trust_change,
             spread_change=gm_result.spread_change,
-            reach_count=gm_result.reach_count,
             effectiveness=gm_result.effectiveness,
             simulated_comments=gm_result.simulated_comments
         )
         
-        # 3. 更新平台狀態
-        for state in gm_result.platform_status:
-            self.state_repo.update_platform_state(
+        # 2. 批次更新平台狀態（單一 UPDATE），並同步寫入熱資料存放
+        platform_status_list = [
+            {
+                "platform_name": state.platform_name,
+                "player_trust": state.player_trust,
+                "ai_trust": state.ai_trust,
+                "spread_rate": state.spread_rate
+            }
+            for state in gm_result.platform_status
+        ]
+        self.state_repo.update_all_platforms_states(
+            session_id=turn_result.session_id,
+            round_number=turn_result.round_number,
+            platform_status_list=platform_status_list
+        )
+        if self.state_store is not None:
+            self.state_store.apply_platform_states(
+                turn_result.session_id, turn_result.round_number, platform_status_list, db=self.state_repo.db
+            )
+        
+        # 3. 增量更新每場摘要（單一 UPDATE，不重新掃描歷史資料）
+        #    與回合回應相同，遊戲結束只在玩家回合後判定
+        if self.summary_repo is not None:
+            self.summary_repo.apply_turn(
                 session_id=turn_result.session_id,
                 round_number=turn_result.round_number,
-                platform_name=state.platform_name,
-                player_trust=state.player_trust,
-                ai_trust=state.ai_trust,
-                spread_rate=state.spread_rate
+                actor=turn_result.actor,
+                reach_count=gm_result.reach_count,
+                trust_change=gm_result.trust_change,
+                standing=self.game_end_logic.evaluate_standing(
+                    turn_result.round_number, platform_status_list, check_end=turn_result.actor == "player"
+                )
             )
         
-        # 4. 記錄工具使用
-        for tool_effect in game_turn_result.tool_effects:
-            if tool_effect.is_effective:
-                self.tool_usage_repo.create_tool_usage_record(
-                    action_id=action_record.id,
-                    usage_detail=tool_effect
-                )
-                logger.debug(f"Recorded tool usage: {tool_effect.tool_name}", extra={
-                    "session_id": turn_result.session_id,
-                    "action_id": action_record.id
-                })
+        # 4. 記錄有效的工具使用（單一多列 INSERT）
+        effective_tools = [t for t in game_turn_result.tool_effects if t.is_effective]
+        self.tool_usage_repo.create_tool_usage_records(
+            action_id=action_record.id,
+            usage_details=effective_tools
+        )
+        if effective_tools and logger.is_enabled_for(logging.DEBUG):
+            logger.debug("Recorded tool usage: %s", [t.tool_name for t in effective_tools], extra={
+                "session_id": turn_result.session_id,
+                "action_id": action_record.id
+            })
         
         # 5. 標記玩家回合完成
         if turn_result.actor == "player":
             # 這個邏輯應該由上層的 round_repo 處理，但為了保持一致性暫時放在這裡
             pass
         
-        logger.info(f"Persisted {turn_result.actor} turn result", extra={
+        logger.info("Persisted %s turn result", turn_result.actor, extra={
             "session_id": turn_result.session_id,
             "round": turn_result.round_number,
             "action_id": action_record.id
@@ -159,10 +261,7 @@ class GameStateManager:
     
     def _get_gm_evaluation(self, game, article, target_platform, round_number) -> GameMasterAgentResponse:
         """獲取 GM 評估"""
-        target_platform_obj = game.get_platform(target_platform)
-        variables = self.gm_logic.prepare_evaluation_variables(
-            article, target_platform_obj, game.platforms, round_number
-        )
+        variables = self._prepare_gm_variables(game, article, target_platform, round_number)
         
         gm_response: GameMasterAgentResponse = self.agent_factory.run_agent_by_name(
             session_id=game.session_id.value,
@@ -190,7 +289,7 @@ class GameStateManager:
             
             if domain_tool and (domain_tool.applicable_to == actor or domain_tool.applicable_to == "both"):
                 domain_tools.append(domain_tool)
-                logger.debug(f"Tool '{tool_dto.tool_name}' applicable for {actor}", extra={
+                logger.debug("Tool '%s' applicable for %s", tool_dto.tool_name, actor, extra={
                     "session_id": session_id,
                     "round": round_number
                 })
@@ -201,3 +300,10 @@ class GameStateManager:
                 })
         
         return domain_tools
+    
+    def _prepare_gm_variables(self, game, article, target_platform, round_number) -> Dict[str, Any]:
+        """準備 GM 評估所需的變數"""
+        target_platform_obj = game.get_platform(target_platform)
+        return self.gm_logic.prepare_evaluation_variables(
+            article, target_platform_obj, game.platforms, round_number
+        )
@@ -12,9 +12,10 @@ from src.domain.logic.tool_availability_logic import ToolAvailabilityLogic
 class ResponseConverter:
     """回應轉換器 - Application Layer"""
     
-    def __init__(self, setup_repo, tool_availability_logic: ToolAvailabilityLogic):
+    def __init__(self, setup_repo, tool_availability_logic: ToolAvailabilityLogic, state_store=None):
         self.setup_repo = setup_repo
         self.tool_availability_logic = tool_availability_logic
+        self.state_store = state_store
     
     def to_turn_response(
         self, 
@@ -27,8 +28,12 @@ class ResponseConverter:
         turn_result = game_turn_result.turn_result
         gm_result = game_turn_result.gm_evaluation
         
-        # 獲取平台設置信息
-        platforms_info = self.setup_repo.get_by_session_id(turn_result.session_id).platforms
+        # 獲取平台設置信息（優先使用熱資料存放）
+        platforms_info = None
+        if self.state_store is not None:
+            platforms_info = self.state_store.get_setup_platforms(turn_result.session_id, db=self.setup_repo.db)
+        if platforms_info is None:
+            platforms_info = self.setup_repo.get_by_session_id(turn_result.session_id).platforms
         
         # 清理文章數據（移除敏感信息）
         article_safe = self._create_safe_article(turn_result.article, turn_result.actor)
@@ -0,0 +1,478 @@
+"""
+無頭對局模擬邏輯 - 不經過 HTTP 與 LLM，以確定性的策略跑完整場遊戲
+
+沿用正式流程的 GameInitializationLogic、TurnExecutionLogic、ToolEffectLogic
+與 GameEndLogic 的結束判定；Agent 呼叫改由可替換的 AI 策略與 GM 模型回答，
+用於調校 GameConfig 參數與壓測資料庫寫入（見 SimulationService）。
+"""
+import random
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.application.dto.game_dto import (
+    ArticleMeta, FakeNewsAgentResponse, GameMasterAgentPlatformStatus, GameMasterAgentResponse, ToolUsed
+)
+from src.config.game_config import GameConfig, game_config
+from src.domain.logic.ai_turn import AiTurnLogic
+from src.domain.logic.game_end_logic import GameEndLogic
+from src.domain.logic.game_initialization import GameInitializationLogic
+from src.domain.logic.game_master import GameMasterLogic
+from src.domain.logic.tool_effect_logic import ToolEffectLogic
+from src.domain.logic.turn_execution import TurnExecutionLogic
+from src.domain.models.game import Game, SessionId, SpreadRate, TrustScore
+from src.domain.models.tool import DomainTool, ToolEffect
+
+
+@dataclass
+class SimulatedNews:
+    """模擬用的來源新聞，欄位與 News 模型相同"""
+    news_id: int
+    title: str
+    content: str
+    veracity: str
+    category: str
+    source: str
+    is_active: bool = True
+
+
+# 未指定時使用的工具與新聞（與 README 的範例資料一致）
+DEFAULT_SIMULATION_TOOLS: List[DomainTool] = [
+    DomainTool(tool_name="情緒刺激", description="提高訊息的情緒張力", applicable_to="ai",
+               effects=ToolEffect(trust_multiplier=1.0, spread_multiplier=1.5)),
+    DomainTool(tool_name="斷章取義", description="擷取片段誤導讀者", applicable_to="ai",
+               effects=ToolEffect(trust_multiplier=1.2, spread_multiplier=1.1), available_from_round=2),
+    DomainTool(tool_name="AI文案優化", description="讓澄清文字更易讀", applicable_to="player",
+               effects=ToolEffect(trust_multiplier=1.2, spread_multiplier=1.0)),
+    DomainTool(tool_name="數據視覺化", description="以圖表呈現數據", applicable_to="player",
+               effects=ToolEffect(trust_multiplier=1.3, spread_multiplier=1.1), available_from_round=2),
+]
+
+DEFAULT_SIMULATION_NEWS: List[SimulatedNews] = [
+    SimulatedNews(1, "太陽能板污染？", "部分研究指出太陽能板製程有污染", "partial", "energy", "綠色論壇"),
+    SimulatedNews(2, "風電噪音", "居民抱怨風機噪音影響睡眠", "true", "energy", "地方新聞"),
+    SimulatedNews(3, "電動車更耗能", "網傳電動車整體碳排高於油車", "false", "environment", "匿名部落格"),
+]
+
+
+# === 策略與 GM 模型 ===
+
+class PlayerPolicy:
+    """玩家策略：決定澄清文章的目標平台與使用的工具"""
+
+    def choose(
+        self,
+        game: Game,
+        round_number: int,
+        available_tools: List[DomainTool],
+        rng: random.Random
+    ) -> Tuple[ArticleMeta, List[ToolUsed]]:
+        raise NotImplementedError
+
+
+class AiPolicy:
+    """AI 策略：取代假新聞 Agent，依 Agent 變數產生假新聞"""
+
+    def compose(self, variables: Dict[str, Any], rng: random.Random) -> FakeNewsAgentResponse:
+        raise NotImplementedError
+
+
+class GameMasterModel:
+    """GM 模型：取代 GM Agent，評估行動效果並回傳各平台最新狀態"""
+
+    def evaluate(self, game: Game, variables: Dict[str, Any], rng: random.Random) -> GameMasterAgentResponse:
+        raise NotImplementedError
+
+
+class GreedyPlayerPolicy(PlayerPolicy):
+    """鎖定 AI 領先最多的平台，並使用所有已解鎖的工具"""
+
+    def choose(self, game, round_number, available_tools, rng):
+        target = max(game.platforms, key=lambda p: (p.ai_trust.value - p.player_trust.value, p.spread_rate.value))
+        return _player_article(target.name), [ToolUsed(tool_name=tool.tool_name) for tool in available_tools]
+
+
+class RandomPlayerPolicy(PlayerPolicy):
+    """隨機選擇平台，每個已解鎖的工具以 tool_rate 的機率使用"""
+
+    def __init__(self, tool_rate: float = 0.5):
+        self.tool_rate = tool_rate
+
+    def choose(self, game, round_number, available_tools, rng):
+        target = rng.choice(game.platforms)
+        tools = [ToolUsed(tool_name=tool.tool_name) for tool in available_tools if rng.random() < self.tool_rate]
+        return _player_article(target.name), tools
+
+
+class ScriptedAiPolicy(AiPolicy):
+    """依權重決定假新聞真實性，每個 AI 工具以 tool_rate 的機率使用"""
+
+    def __init__(self, veracity_weights: Optional[Dict[str, float]] = None, tool_rate: float = 0.5):
+        self.veracity_weights = veracity_weights or {"false": 0.6, "partial": 0.3, "true": 0.1}
+        self.tool_rate = tool_rate
+
+    def compose(self, variables, rng):
+        veracity = rng.choices(list(self.veracity_weights), weights=list(self.veracity_weights.values()))[0]
+        tools = [
+            ToolUsed(tool_name=tool["tool_name"])
+            for tool in variables.get("available_tools", [])
+            if rng.random() < self.tool_rate
+        ]
+        return FakeNewsAgentResponse(
+            title=f"{variables['target_platform']} 熱議",
+            content=f"{variables['news_1']}，而且{variables['news_2']}",
+            source="模擬來源",
+            veracity=veracity,
+            tool_used=tools
+        )
+
+
+@dataclass
+class StubGameMaster(GameMasterModel):
+    """
+    以簡單公式取代 GM Agent 的評估模型。
+
+    行動者在目標平台的信任值增加 base_trust_gain（AI 依假新聞真實性加成）加上
+    [-noise, noise] 的隨機值，對手在該平台的信任值減少增加量的 rival_penalty 倍；
+    AI 行動提高傳播率，玩家行動降低傳播率。
+    """
+    base_trust_gain: int = 6
+    ai_veracity_bonus: Dict[str, int] = field(default_factory=lambda: {"false": 3, "partial": 1, "true": -1})
+    rival_penalty: float = 0.5
+    spread_step: int = 5
+    noise: int = 3
+    config: GameConfig = field(default_factory=lambda: game_config)
+
+    def evaluate(self, game, variables, rng):
+        actor = "ai" if variables["author"] == "ai" else "player"
+        gain = self.base_trust_gain + rng.randint(-self.noise, self.noise)
+        if actor == "ai":
+            gain += self.ai_veracity_bonus.get(variables.get("veracity") or "", 0)
+        spread_change = self.spread_step if actor == "ai" else -self.spread_step
+        rival_loss = int(gain * self.rival_penalty)
+
+        platform_status = []
+        for platform in game.platforms:
+            player_trust, ai_trust, spread = platform.player_trust.value, platform.ai_trust.value, platform.spread_rate.value
+            if platform.name == variables["target_platform"]:
+                if actor == "ai":
+                    ai_trust, player_trust = ai_trust + gain, player_trust - rival_loss
+                else:
+                    player_trust, ai_trust = player_trust + gain, ai_trust - rival_loss
+                spread += spread_change
+            platform_status.append(GameMasterAgentPlatformStatus(
+                platform_name=platform.name,
+                player_trust=self.config.validate_trust_value(player_trust),
+                ai_trust=self.config.validate_trust_value(ai_trust),
+                spread_rate=self.config.validate_spread_rate(spread)
+            ))
+
+        return GameMasterAgentResponse(
+            trust_change=gain,
+            spread_change=spread_change,
+            reach_count=max(0, gain) * 50,
+            platform_status=platform_status,
+            effectiveness="high" if gain >= 8 else "medium" if gain >= 4 else "low",
+            simulated_comments=[]
+        )
+
+
+# === 取代 Repository 與 AgentFactory 的記憶體實作 ===
+
+class InMemoryToolProvider:
+    """提供 TurnExecutionLogic 所需的工具查詢介面（與 ToolRepository 相同的方法）"""
+
+    def __init__(self, tools: List[DomainTool]):
+        self._tools = list(tools)
+        self._by_name = {tool.tool_name.lower(): tool for tool in self._tools}
+
+    def get_tool_by_name(self, name: str, db=None) -> Optional[DomainTool]:
+        return self._by_name.get(name.lower())
+
+    def list_tools_for_actor(self, actor: str = "player", db=None) -> List[DomainTool]:
+        return [tool for tool in self._tools if tool.applicable_to in (actor, "both")]
+
+    def list_tools_for_round(self, actor: str, round_number: int, db=None) -> List[DomainTool]:
+        return [tool for tool in self.list_tools_for_actor(actor) if tool.available_from_round <= round_number]
+
+
+class InMemoryNewsProvider:
+    """提供 TurnExecutionLogic 所需的來源新聞抽樣介面（與 NewsRepository 相同的方法）"""
+
+    def __init__(self, news: List[SimulatedNews], rng: Optional[random.Random] = None):
+        self._news = [item for item in news if item.is_active]
+        self.rng = rng or random.Random()
+
+    def get_random_active_news_batch(self, k: int, veracity=None, category=None, db=None) -> List[SimulatedNews]:
+        return self.rng.sample(self._news, min(k, len(self._news)))
+
+
+class SimulatedAgentFactory:
+    """
+    取代 AgentFactory：假新聞 Agent 交給 AiPolicy，GM Agent 交給 GameMasterModel。
+    GM 需要平台的數值狀態，以 game_lookup(session_id, round_number) 取得當前遊戲。
+
+    用法示例:
+    ```python
+    factory = SimulatedAgentFactory(ScriptedAiPolicy(), StubGameMaster(), game_lookup=game_state_store.get_game)
+    factory.rng = random.Random(seed)
+    service = GameService(..., agent_factory=factory)
+    ```
+    """
+
+    def __init__(
+        self,
+        ai_policy: AiPolicy,
+        gm_model: GameMasterModel,
+        game_lookup: Callable[[str, int], Optional[Game]],
+        rng: Optional[random.Random] = None
+    ):
+        self.ai_policy = ai_policy
+        self.gm_model = gm_model
+        self.game_lookup = game_lookup
+        self.rng = rng or random.Random()
+
+    def run_agent_by_name(self, session_id, agent_name, variables, input_text=None, response_model=None, **kwargs):
+        if agent_name == "fake_news_agent":
+            return self.ai_policy.compose(variables, self.rng)
+        if agent_name == "game_master_agent":
+            game = self.game_lookup(session_id, variables["round_number"])
+            if game is None:
+                raise ValueError(f"模擬 GM 找不到遊戲狀態: {session_id} 第 {variables['round_number']} 回合")
+            return self.gm_model.evaluate(game, variables, self.rng)
+        raise ValueError(f"模擬器不支援的 Agent: {agent_name}")
+
+    async def arun_agent_by_name(self, session_id, agent_name, variables, input_text=None, response_model=None, **kwargs):
+        return self.run_agent_by_name(session_id, agent_name, variables, input_text, response_model, **kwargs)
+
+
+# === 模擬引擎 ===
+
+@dataclass
+class GameSimulationResult:
+    """單場模擬的結果"""
+    seed: int
+    session_id: str
+    winner: str
+    reason: str
+    rounds: int
+    player_total_trust: int
+    ai_total_trust: int
+    platforms: List[Dict[str, Any]]
+    tools_used: Dict[str, int]
+    duration_ms: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "seed": self.seed,
+            "session_id": self.session_id,
+            "winner": self.winner,
+            "reason": self.reason,
+            "rounds": self.rounds,
+            "player_total_trust": self.player_total_trust,
+            "ai_total_trust": self.ai_total_trust,
+            "platforms": self.platforms,
+            "tools_used": self.tools_used,
+            "duration_ms": self.duration_ms,
+        }
+
+
+class SimulationEngine:
+    """
+    在記憶體中跑完整場遊戲的模擬引擎，同一個 seed 一定得到相同結果。
+
+    回合流程與 GameService 相同：每回合先 AI 後玩家，各自經過
+    TurnExecutionLogic → GM 評估 → ToolEffectLogic，玩家回合後判斷是否結束。
+    run_games 讓多場遊戲以相同步調進行，每回合以 GameEndLogic.check_game_end_batch
+    一次判斷所有進行中的場次；每場結果與單獨執行 run_game 相同。平台狀態與正式遊戲
+    （GameStateManager.persist_turn_result）一樣直接採用 GM 回傳的
+    platform_status；工具倍率只影響該次行動的 trust_change / spread_change。
+
+    用法示例:
+    ```python
+    engine = SimulationEngine(player_policy=RandomPlayerPolicy(), config=GameConfig(max_rounds=5))
+    result = engine.run_game(seed=42)
+    result.winner, result.reason, result.rounds
+    results = engine.run_games(range(1000))
+    ```
+    """
+
+    def __init__(
+        self,
+        player_policy: Optional[PlayerPolicy] = None,
+        ai_policy: Optional[AiPolicy] = None,
+        gm_model: Optional[GameMasterModel] = None,
+        tools: Optional[List[DomainTool]] = None,
+        news: Optional[List[SimulatedNews]] = None,
+        config: Optional[GameConfig] = None
+    ):
+        self.config = config or game_config
+        self.player_policy = player_policy or GreedyPlayerPolicy()
+        self.tool_provider = InMemoryToolProvider(DEFAULT_SIMULATION_TOOLS if tools is None else tools)
+        self.agent_factory = SimulatedAgentFactory(
+            ai_policy or ScriptedAiPolicy(),
+            gm_model or StubGameMaster(config=self.config),
+            game_lookup=lambda session_id, round_number: self._game
+        )
+        self.init_logic = GameInitializationLogic()
+        self.init_logic.config = self.config
+        self.ai_turn_logic = AiTurnLogic()
+        self.news_provider = InMemoryNewsProvider(DEFAULT_SIMULATION_NEWS if news is None else news)
+        self.turn_logic = TurnExecutionLogic(
+            self.ai_turn_logic, self.tool_provider, self.agent_factory, self.news_provider
+        )
+        self.gm_logic = GameMasterLogic()
+        self.tool_effect_logic = ToolEffectLogic()
+        self.end_logic = GameEndLogic(config=self.config)
+        self._game: Optional[Game] = None
+
+    def run_game(self, seed: int) -> GameSimulationResult:
+        """以 seed 跑完一場遊戲"""
+        return self.run_games([seed])[0]
+
+    def run_games(self, seeds: Sequence[int]) -> List[GameSimulationResult]:
+        """
+        同時跑完多場遊戲，結果依 seeds 的順序返回。
+
+        所有進行中的場次每回合各自執行 AI 與玩家回合後，
+        以一次 check_game_end_batch 判斷哪些場次結束，不再逐場呼叫 should_game_end。
+        """
+        runs = [self._start_run(seed) for seed in seeds]
+        results: Dict[int, GameSimulationResult] = {}
+        active = list(range(len(runs)))
+        while active:
+            for index in active:
+                self._play_round(runs[index])
+            batch = self._check_end([runs[index] for index in active])
+            still_active = []
+            for position, index in enumerate(active):
+                run = runs[index]
+                if batch.is_ended[position]:
+                    results[index] = self._finish_run(run, batch.end_result(position))
+                else:
+                    run.round_number = run.game.increment_round()
+                    still_active.append(index)
+            active = still_active
+        return [results[index] for index in range(len(runs))]
+
+    def _play_turn(self, game: Game, actor: str, round_number: int, rng: random.Random) -> int:
+        """執行一個行動者的回合並更新平台狀態，返回生效的工具數"""
+        session_id = game.session_id.value
+        article, player_tools = None, None
+        if actor == "player":
+            unlocked = self.tool_provider.list_tools_for_round("player", round_number)
+            article, player_tools = self.player_policy.choose(game, round_number, unlocked, rng)
+
+        turn_result = self.turn_logic.execute_actor_turn(
+            game, actor, session_id, round_number, article=article, player_tools=player_tools
+        )
+        variables = self.gm_logic.prepare_evaluation_variables(
+            turn_result.article, game.get_platform(turn_result.target_platform), game.platforms, round_number
+        )
+        gm_result = self.agent_factory.run_agent_by_name(session_id, "game_master_agent", variables)
+
+        domain_tools = [
+            tool for tool in (self.tool_provider.get_tool_by_name(used.tool_name) for used in turn_result.tools_used)
+            if tool is not None and tool.applicable_to in (actor, "both")
+        ]
+        final_result, _ = self.tool_effect_logic.apply_effects(gm_result, domain_tools)
+
+        # 與 GameStateManager.persist_turn_result 相同：平台狀態直接採用 GM 評估的 platform_status，
+        # 工具只調整 trust_change / spread_change，不再疊加到平台信任值上
+        for status in final_result.platform_status:
+            platform = game.get_platform(status.platform_name)
+            platform.player_trust = TrustScore(status.player_trust)
+            platform.ai_trust = TrustScore(status.ai_trust)
+            platform.spread_rate = SpreadRate(status.spread_rate)
+        return len(domain_tools)
+
+    def _start_run(self, seed: int) -> "_GameRun":
+        start = time.perf_counter()
+        # 策略與 GM 使用 rng；平台洗牌、AI 選平台與新聞抽樣使用 logic_rng。
+        # 兩者都是這場遊戲自己的 Random，不改動呼叫端行程的 random 模組狀態
+        rng = random.Random(seed)
+        logic_rng = random.Random(seed)
+        self.init_logic.rng = logic_rng
+        game = self.init_logic.create_new_game()
+        game.session_id = SessionId(f"game_sim_{uuid.UUID(int=rng.getrandbits(128)).hex}")
+        return _GameRun(seed=seed, game=game, rng=rng, logic_rng=logic_rng, elapsed=time.perf_counter() - start)
+
+    def _play_round(self, run: "_GameRun") -> None:
+        """執行一場遊戲目前回合的 AI 與玩家回合"""
+        start = time.perf_counter()
+        self.agent_factory.rng = run.rng
+        self.ai_turn_logic.rng = run.logic_rng
+        self.news_provider.rng = run.logic_rng
+        self._game = run.game
+        try:
+            for actor in ("ai", "player"):
+                run.tools_used[actor] += self._play_turn(run.game, actor, run.round_number, run.rng)
+        finally:
+            self._game = None
+            run.elapsed += time.perf_counter() - start
+
+    def _check_end(self, runs: List["_GameRun"]):
+        names = [platform.name for platform in runs[0].game.platforms]
+        platforms = [[run.game.get_platform(name) for name in names] for run in runs]
+        return self.end_logic.check_game_end_batch(
+            round_numbers=np.array([run.round_number for run in runs]),
+            player_trust=np.array([[platform.player_trust.value for platform in row] for row in platforms]),
+            ai_trust=np.array([[platform.ai_trust.value for platform in row] for row in platforms]),
+            spread_rates=np.array([[platform.spread_rate.value for platform in row] for row in platforms]),
+            platform_names=names
+        )
+
+    def _finish_run(self, run: "_GameRun", end_result: Dict[str, Any]) -> GameSimulationResult:
+        states = _platform_states(run.game)
+        return GameSimulationResult(
+            seed=run.seed,
+            session_id=run.game.session_id.value,
+            winner=end_result["winner"],
+            reason=end_result["reason"],
+            rounds=run.round_number,
+            player_total_trust=sum(state["player_trust"] for state in states),
+            ai_total_trust=sum(state["ai_trust"] for state in states),
+            platforms=states,
+            tools_used=run.tools_used,
+            duration_ms=round(run.elapsed * 1000, 3)
+        )
+
+
+@dataclass
+class _GameRun:
+    """run_games 中一場遊戲的進行狀態"""
+    seed: int
+    game: Game
+    rng: random.Random
+    logic_rng: random.Random  # 平台洗牌、AI 選平台與新聞抽樣，輪到這場時交給對應的邏輯
+    round_number: int = 1
+    tools_used: Dict[str, int] = field(default_factory=lambda: {"player": 0, "ai": 0})
+    elapsed: float = 0.0
+
+
+# === 私有函數 ===
+
+def _player_article(target_platform: str) -> ArticleMeta:
+    return ArticleMeta(
+        title="澄清",
+        content="根據公開資料，這則訊息缺乏可靠來源",
+        author="player",
+        published_date=datetime.now().isoformat(),
+        target_platform=target_platform
+    )
+
+
+def _platform_states(game: Game) -> List[Dict[str, Any]]:
+    return [
+        {
+            "platform_name": platform.name,
+            "player_trust": platform.player_trust.value,
+            "ai_trust": platform.ai_trust.value,
+            "spread_rate": platform.spread_rate.value
+        }
+        for platform in game.platforms
+    ]
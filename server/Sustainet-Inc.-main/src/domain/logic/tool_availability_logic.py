@@ -6,6 +6,7 @@ from typing import List, Dict, Any, Optional, Tuple
 from src.infrastructure.database.tool_repo import ToolRepository
 from src.domain.models.game import Game
 from src.utils.logger import logger
+import logging
 import time
 
 
@@ -42,11 +43,11 @@ class ToolAvailabilityLogic:
         if actor in self._tool_cache:
             cached_tools, cache_time = self._tool_cache[actor]
             if current_time - cache_time < self.cache_ttl:
-                logger.debug(f"使用快取中的 {actor} 工具資料")
+                logger.debug("使用快取中的 %s 工具資料", actor)
                 return cached_tools
         
         # 快取不存在或已過期，從資料庫重新讀取
-        logger.debug(f"從資料庫讀取 {actor} 工具資料")
+        logger.debug("從資料庫讀取 %s 工具資料", actor)
         tools = self.tool_repo.list_tools_for_actor(actor)
         
         # 更新快取
@@ -63,7 +64,7 @@ class ToolAvailabilityLogic:
         """
         if actor:
             self._tool_cache.pop(actor, None)
-            logger.debug(f"已清除 {actor} 的工具快取")
+            logger.debug("已清除 %s 的工具快取", actor)
         else:
             self._tool_cache.clear()
             logger.debug("已清除所有工具快取")
@@ -87,7 +88,7 @@ class ToolAvailabilityLogic:
         Returns:
             適合前端使用的工具字典列表
         """
-        logger.debug(f"獲取 {actor} 在第 {round_number} 回合的可用工具")
+        logger.debug("獲取 %s 在第 %s 回合的可用工具", actor, round_number)
         
         # 1. 獲取該角色的所有工具（使用快取）
         if use_cache:
@@ -114,7 +115,8 @@ class ToolAvailabilityLogic:
             }
             tool_list.append(tool_dict)
         
-        logger.debug(f"第 {round_number} 回合 {actor} 可用工具: {[t['tool_name'] for t in tool_list]}")
+        if logger.is_enabled_for(logging.DEBUG):
+            logger.debug("第 %s 回合 %s 可用工具: %s", round_number, actor, [t['tool_name'] for t in tool_list])
         return tool_list
     
     def get_all_available_tools_info(self, actor: str = "player", use_cache: bool = True) -> Dict[str, Any]:
@@ -166,5 +168,5 @@ class ToolAvailabilityLogic:
             }
         }
         
-        logger.debug(f"工具解鎖統計 - 總數: {total_tools}, 分佈: {round_stats}")
+        logger.debug("工具解鎖統計 - 總數: %s, 分佈: %s", total_tools, round_stats)
         return result
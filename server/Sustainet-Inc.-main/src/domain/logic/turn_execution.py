@@ -1,7 +1,8 @@
 """
 回合執行邏輯 - 負責處理 AI 和玩家的行動執行
 """
-from typing import Dict, Any, Optional, List
+import asyncio
+from typing import Callable, Dict, Any, Optional, List, Tuple
 from src.application.dto.game_dto import ArticleMeta, ToolUsed, FakeNewsAgentResponse
 from src.domain.models.game import Game
 from src.utils.logger import logger
@@ -63,6 +64,83 @@ class TurnExecutionLogic:
         else:
             raise ValueError(f"Unknown actor: {actor}")
     
+    async def aexecute_actor_turn(
+        self, 
+        game: Game, 
+        actor: str, 
+        session_id: str, 
+        round_number: int,
+        article: Optional[ArticleMeta] = None,
+        player_tools: Optional[List[ToolUsed]] = None,
+        on_token: Optional[Callable[[str], None]] = None
+    ) -> TurnExecutionResult:
+        """
+        execute_actor_turn 的協程版本：資料庫讀取在執行緒中進行，Agent 呼叫以協程等待。
+        提供 on_token 時，假新聞 Agent 的輸出片段會在產生時轉交。
+        """
+        logger.info(f"Executing {actor} turn", extra={
+            "session_id": session_id, 
+            "round_number": round_number
+        })
+        
+        if actor == "ai":
+            selected_platform, source, variables = await asyncio.to_thread(self._prepare_ai_action, game)
+            agent_output: FakeNewsAgentResponse = await self.agent_factory.arun_agent_by_name(
+                session_id=session_id,
+                agent_name="fake_news_agent",
+                variables=variables,
+                input_text="input_text",
+                response_model=FakeNewsAgentResponse,
+                on_token=on_token
+            )
+            return self._finish_ai_action(session_id, round_number, selected_platform, source, agent_output)
+        elif actor == "player":
+            return self._execute_player_action(
+                game, session_id, round_number, article, player_tools or []
+            )
+        else:
+            raise ValueError(f"Unknown actor: {actor}")
+    
+    def add_ai_stages(
+        self,
+        pipeline,
+        session_id: str,
+        round_number: int,
+        on_token: Optional[Callable[[str], None]] = None
+    ) -> None:
+        """
+        在回合管線中宣告 AI 行動的各階段。
+        需要管線先宣告 "game"（遊戲狀態）、"news"（來源新聞）與 "tools"（工具目錄）階段，
+        結果放在 "turn_result" 階段。提供 on_token 時轉交假新聞 Agent 的輸出片段。
+        """
+        async def run_fake_news_agent(fake_news_variables):
+            return await self.agent_factory.arun_agent_by_name(
+                session_id=session_id,
+                agent_name="fake_news_agent",
+                variables=fake_news_variables,
+                input_text="input_text",
+                response_model=FakeNewsAgentResponse,
+                on_token=on_token
+            )
+        
+        pipeline.stage(
+            "platform", lambda game: self.ai_turn_logic.select_platform(game.platforms),
+            depends_on=("game",), blocking=False
+        )
+        pipeline.stage(
+            "fake_news_variables",
+            lambda platform, news, tools: self.build_ai_variables(platform, news, tools.for_actor("ai")),
+            depends_on=("platform", "news", "tools"), blocking=False
+        )
+        pipeline.stage("fake_news", run_fake_news_agent, depends_on=("fake_news_variables",))
+        pipeline.stage(
+            "turn_result",
+            lambda platform, news, fake_news: self._finish_ai_action(
+                session_id, round_number, platform, news[0].source, fake_news
+            ),
+            depends_on=("platform", "news", "fake_news"), blocking=False
+        )
+    
     def _execute_ai_action(
         self, 
         game: Game, 
@@ -70,12 +148,43 @@ class TurnExecutionLogic:
         round_number: int
     ) -> TurnExecutionResult:
         """執行 AI 行動"""
+        selected_platform, source, variables = self._prepare_ai_action(game)
+        
+        # 調用 AI Agent
+        agent_output: FakeNewsAgentResponse = self.agent_factory.run_agent_by_name(
+            session_id=session_id,
+            agent_name="fake_news_agent",
+            variables=variables,
+            input_text="input_text",
+            response_model=FakeNewsAgentResponse
+        )
+        
+        return self._finish_ai_action(session_id, round_number, selected_platform, source, agent_output)
+    
+    def _prepare_ai_action(self, game: Game) -> Tuple[Any, str, Dict[str, Any]]:
+        """準備 AI 行動：選擇平台、取得新聞來源與可用工具，返回 (平台, 來源, Agent 變數)"""
         # 選擇平台
         selected_platform = self.ai_turn_logic.select_platform(game.platforms)
         
-        # 獲取新聞來源
-        news_1 = self.news_repo.get_random_active_news()
-        news_2 = self.news_repo.get_random_active_news()
+        # 獲取新聞來源與可用工具
+        news_items = self.fetch_source_news()
+        available_tools = self.tool_repo.list_tools_for_actor(actor="ai")
+        
+        variables = self.build_ai_variables(selected_platform, news_items, available_tools)
+        return selected_platform, news_items[0].source, variables
+    
+    def fetch_source_news(self, db=None) -> List[Any]:
+        """
+        取得 AI 假新聞的兩則來源新聞（兩則不重複；僅有一則啟用中新聞時重複使用）
+        
+        Args:
+            db: 可選的獨立 Session，未提供時使用 Repository 綁定的 Session
+        """
+        return self.news_repo.get_random_active_news_batch(2, db=db)
+    
+    def build_ai_variables(self, selected_platform, news_items: List[Any], available_tools: List[Any]) -> Dict[str, Any]:
+        """由選定平台、來源新聞與 AI 可用工具組成假新聞 Agent 的變數"""
+        news_1, news_2 = news_items[0], news_items[-1]
         
         # 準備變數
         variables = self.ai_turn_logic.prepare_fake_news_variables(
@@ -85,7 +194,6 @@ class TurnExecutionLogic:
         )
         
         # 添加可用工具
-        available_tools = self.tool_repo.list_tools_for_actor(actor="ai")
         variables["available_tools"] = [
             {
                 "tool_name": tool.tool_name,
@@ -95,20 +203,22 @@ class TurnExecutionLogic:
             for tool in available_tools
         ]
         
-        # 調用 AI Agent
-        agent_output: FakeNewsAgentResponse = self.agent_factory.run_agent_by_name(
-            session_id=session_id,
-            agent_name="fake_news_agent",
-            variables=variables,
-            input_text="input_text",
-            response_model=FakeNewsAgentResponse
-        )
-        
+        return variables
+    
+    def _finish_ai_action(
+        self,
+        session_id: str,
+        round_number: int,
+        selected_platform,
+        source: str,
+        agent_output: FakeNewsAgentResponse
+    ) -> TurnExecutionResult:
+        """由 Agent 輸出建立 AI 行動結果"""
         # 創建文章
         article = self.ai_turn_logic.create_ai_article(
             result_data=agent_output,
             platform=selected_platform,
-            source=news_1.source
+            source=source
         )
         
         # 解析 AI 使用的工具
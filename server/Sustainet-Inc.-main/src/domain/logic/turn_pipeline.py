@@ -0,0 +1,179 @@
+"""
+回合階段管線 - 以明確的相依關係描述回合中的各個步驟，
+互不相依的階段（例如兩個資料庫讀取、GM 變數準備與假新聞 Agent 呼叫）同時進行。
+"""
+import asyncio
+import inspect
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from src.utils.logger import logger
+from src.utils.metrics import turn_pipeline_stage_seconds
+
+
+@dataclass
+class PipelineStage:
+    """管線中的單一階段"""
+    name: str
+    func: Callable[..., Any]
+    depends_on: Tuple[str, ...] = ()
+    blocking: bool = True       # 同步函數是否可能阻塞（I/O），是則放到執行緒中執行
+    shared_session: bool = False  # 是否使用請求範圍的 Session（同一時間只能有一個階段使用，完成後釋放連線）
+
+
+@dataclass
+class PipelineResult:
+    """管線執行結果"""
+    values: Dict[str, Any] = field(default_factory=dict)
+    timings: Dict[str, Tuple[float, float]] = field(default_factory=dict)  # 階段名稱 -> (開始, 結束)，相對管線開始的秒數
+
+    def __getitem__(self, name: str) -> Any:
+        return self.values[name]
+
+
+async def _run_in_thread(func: Callable[..., Any], kwargs: Dict[str, Any]) -> Any:
+    """在執行緒中執行同步函數；被取消時等執行緒結束後才傳遞取消"""
+    future = asyncio.ensure_future(asyncio.to_thread(func, **kwargs))
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        await asyncio.wait({future})
+        if not future.cancelled():
+            # 執行緒在取消後才失敗時，取出例外避免 "Task exception was never retrieved"
+            future.exception()
+        raise
+
+
+class TurnPipeline:
+    """
+    依相依關係並行執行的回合管線。
+
+    每個階段的函數以關鍵字參數接收其相依階段的結果；協程函數直接等待，
+    同步函數預設放到執行緒中執行。使用請求範圍 Session 的階段以鎖序列化，
+    因為同一個 Session 不能被多個執行緒同時使用；提供 release_session 時，
+    每個這類階段完成後都會呼叫它結束交易，之後等待 Agent 的階段不會佔用連線。
+    階段只能依賴先前宣告的階段，因此不會形成循環。
+
+    用法示例:
+    ```python
+    pipeline = TurnPipeline(release_session=session.commit)
+    pipeline.stage("game", lambda: manager.rebuild_game_state(session_id, 1), shared_session=True)
+    pipeline.stage("news", lambda: news_repo.get_random_active_news_batch(2))
+    pipeline.stage("variables", build_variables, depends_on=("game", "news"), blocking=False)
+    pipeline.stage("agent", run_agent, depends_on=("variables",))
+
+    result = await pipeline.run()
+    result["agent"]
+    ```
+    """
+
+    def __init__(self, name: str = "turn", release_session: Optional[Callable[[], None]] = None):
+        """
+        Args:
+            name: 管線名稱，用於日誌與指標
+            release_session: 結束請求範圍 Session 交易（把連線還給連線池）的函數
+        """
+        self.name = name
+        self.release_session = release_session
+        # 指標標籤只取名稱的第一段（例如 "ai_turn:<session>:<round>" -> "ai_turn"），避免標籤爆量
+        self.metric_label = name.split(":", 1)[0]
+        self._stages: Dict[str, PipelineStage] = {}
+
+    def stage(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        depends_on: Tuple[str, ...] = (),
+        blocking: bool = True,
+        shared_session: bool = False
+    ) -> "TurnPipeline":
+        """
+        宣告一個階段。
+
+        Args:
+            name: 階段名稱，亦為其結果在相依階段中的參數名稱
+            func: 階段函數（同步或協程）
+            depends_on: 相依階段名稱，必須已宣告
+            blocking: 同步函數是否需要放到執行緒中執行
+            shared_session: 是否使用請求範圍的 Session
+
+        Returns:
+            管線本身，便於連續宣告
+
+        Raises:
+            ValueError: 階段名稱重複或相依階段未宣告
+        """
+        if name in self._stages:
+            raise ValueError(f"Duplicate pipeline stage: {name}")
+        missing = [dep for dep in depends_on if dep not in self._stages]
+        if missing:
+            raise ValueError(f"Stage {name} depends on undeclared stages: {', '.join(missing)}")
+
+        self._stages[name] = PipelineStage(name, func, tuple(depends_on), blocking, shared_session)
+        return self
+
+    async def run(self, on_stage: Optional[Callable[[str, Any], None]] = None) -> PipelineResult:
+        """
+        執行所有階段，任一階段失敗時取消其餘階段並拋出該例外。
+
+        Args:
+            on_stage: 每個階段完成時以 (階段名稱, 結果) 呼叫，用於串流回合進度
+
+        Returns:
+            PipelineResult，包含各階段結果與起訖時間
+        """
+        result = PipelineResult()
+        session_lock = asyncio.Lock()
+        started = time.perf_counter()
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def run_stage(stage: PipelineStage) -> Any:
+            kwargs = {dep: await tasks[dep] for dep in stage.depends_on}
+            begin = time.perf_counter() - started
+            if inspect.iscoroutinefunction(stage.func):
+                value = await stage.func(**kwargs)
+            elif stage.shared_session:
+                async with session_lock:
+                    value = await _run_in_thread(self._release_after(stage.func), kwargs)
+            elif stage.blocking:
+                value = await _run_in_thread(stage.func, kwargs)
+            else:
+                value = stage.func(**kwargs)
+            end = time.perf_counter() - started
+            result.timings[stage.name] = (begin, end)
+            turn_pipeline_stage_seconds.labels(self.metric_label, stage.name).observe(end - begin)
+            result.values[stage.name] = value
+            if on_stage is not None:
+                on_stage(stage.name, value)
+            return value
+
+        for stage in self._stages.values():
+            tasks[stage.name] = asyncio.create_task(run_stage(stage), name=f"{self.name}:{stage.name}")
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            # 等待被取消的階段結束，避免執行緒仍在背景使用 Session
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+
+        logger.debug(f"Pipeline {self.name} finished", extra={
+            "timings": {name: round(end - begin, 4) for name, (begin, end) in result.timings.items()}
+        })
+        return result
+
+    # === 私有方法 ===
+
+    def _release_after(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        """階段成功後在同一個執行緒中釋放連線；失敗時保留交易，由請求結束時回滾"""
+        if self.release_session is None:
+            return func
+
+        def run_and_release(**kwargs):
+            value = func(**kwargs)
+            self.release_session()
+            return value
+        return run_and_release
@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class AgentDefinition:
+    """
+    Agent 設定的唯讀快照，由 AgentRepository 從資料庫載入後快取共用。
+    description / instruction 保留原始模板，渲染時產生新字串，不修改此物件。
+    """
+    agent_name: str
+    provider: str
+    model_name: str
+    description: Optional[str]
+    instruction: Optional[str]
+    tools: Optional[Dict[str, Any]]
+    num_history_responses: Optional[int]
+    markdown: Optional[bool]
+    debug: Optional[bool]
+    temperature: Optional[float]
+    updated_at: Optional[datetime]
+
+    @classmethod
+    def from_entity(cls, agent: Any) -> 'AgentDefinition':
+        """從 Agent ORM 實體建立快照"""
+        return cls(
+            agent_name=agent.agent_name,
+            provider=agent.provider,
+            model_name=agent.model_name,
+            description=agent.description,
+            instruction=agent.instruction,
+            tools=agent.tools,
+            num_history_responses=agent.num_history_responses,
+            markdown=agent.markdown,
+            debug=agent.debug,
+            temperature=agent.temperature,
+            updated_at=agent.updated_at
+        )
@@ -1,10 +1,12 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Literal, List, Dict, Any, Optional
 
 class ToolEffect(BaseModel):
     """
     定義工具的核心效果，作為乘數。
     """
+    model_config = ConfigDict(frozen=True)
+
     trust_multiplier: float = 1.0  # 例如 1.1 表示原始信任變化效果增加10%
     spread_multiplier: float = 1.0 # 例如 1.2 表示原始傳播變化效果增加20%
     # 如果未來需要固定的加/減值效果，可以在此擴展
@@ -13,6 +15,8 @@ class DomainTool(BaseModel):
     """
     工具的領域模型表示。
     """
+    model_config = ConfigDict(frozen=True)  # 由行程共用的工具目錄持有，不可修改
+
     tool_name: str
     description: str
     applicable_to: Literal["player", "ai", "both"] # 工具適用對象
@@ -0,0 +1,58 @@
+"""add hot path indexes
+
+Revision ID: a7c4e2d91b3f
+Revises: 3e3973af9d66
+Create Date: 2026-10-17 10:15:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c4e2d91b3f'
+down_revision: Union[str, None] = '3e3973af9d66'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 建立唯一約束前移除重複的平台狀態，保留 id 最大（最後寫入）的一筆
+    op.execute(
+        "DELETE FROM platform_states WHERE id NOT IN ("
+        " SELECT MAX(id) FROM platform_states"
+        " GROUP BY session_id, round_number, platform_name)"
+    )
+    op.create_unique_constraint(
+        'uq_platform_states_session_round_platform',
+        'platform_states',
+        ['session_id', 'round_number', 'platform_name']
+    )
+
+    # 行動記錄：依場次與回合查詢，依建立時間排序
+    op.create_index(
+        'ix_action_records_session_round_created',
+        'action_records',
+        ['session_id', 'round_number', 'created_at']
+    )
+
+    # 工具使用記錄：依行動 ID 查詢（外鍵欄位 PostgreSQL 不會自動建立索引）
+    op.create_index('ix_tool_usages_action_id', 'tool_usages', ['action_id'])
+
+    # 新聞抽樣索引載入：涵蓋 is_active 篩選與讀取的欄位
+    op.create_index(
+        'ix_news_active_sampler',
+        'news',
+        ['is_active', 'news_id', 'veracity', 'category']
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_news_active_sampler', table_name='news')
+    op.drop_index('ix_tool_usages_action_id', table_name='tool_usages')
+    op.drop_index('ix_action_records_session_round_created', table_name='action_records')
+    op.drop_constraint('uq_platform_states_session_round_platform', 'platform_states', type_='unique')
@@ -0,0 +1,146 @@
+"""add session summaries
+
+Revision ID: 5d2f8b6c0e71
+Revises: a7c4e2d91b3f
+Create Date: 2026-10-17 14:30:00.000000
+
+"""
+import os
+from typing import Any, Dict, List, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2f8b6c0e71'
+down_revision: Union[str, None] = 'a7c4e2d91b3f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 撰寫本遷移時的遊戲結束規則（同 GameConfig 的環境變數與預設值）；
+# 遷移不匯入應用程式程式碼，日後規則變更不會改變這次回填的結果
+MAX_ROUNDS = int(os.getenv("GAME_MAX_ROUNDS", "2"))
+WIN_TRUST_THRESHOLD = int(os.getenv("GAME_WIN_TRUST_THRESHOLD", "100"))
+WIN_PLATFORM_COUNT = int(os.getenv("GAME_WIN_PLATFORM_COUNT", "3"))
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    summaries = op.create_table(
+        'session_summaries',
+        sa.Column('session_id', sa.String(length=64), nullable=False, comment='遊戲 session ID，主鍵'),
+        sa.Column('latest_round', sa.Integer(), nullable=False, comment='最新回合數'),
+        sa.Column('action_count', sa.Integer(), nullable=False, comment='累計行動數'),
+        sa.Column('player_action_count', sa.Integer(), nullable=False, comment='玩家累計行動數'),
+        sa.Column('ai_action_count', sa.Integer(), nullable=False, comment='AI 累計行動數'),
+        sa.Column('player_reach_total', sa.Integer(), nullable=False, comment='玩家累計觸及人數'),
+        sa.Column('ai_reach_total', sa.Integer(), nullable=False, comment='AI 累計觸及人數'),
+        sa.Column('player_trust_change_total', sa.Integer(), nullable=False, comment='玩家行動累計信任值變化'),
+        sa.Column('ai_trust_change_total', sa.Integer(), nullable=False, comment='AI 行動累計信任值變化'),
+        sa.Column('player_total_trust', sa.Integer(), nullable=False, comment='目前玩家各平台信任值總和'),
+        sa.Column('ai_total_trust', sa.Integer(), nullable=False, comment='目前 AI 各平台信任值總和'),
+        sa.Column('leader', sa.String(length=16), nullable=False, comment='目前領先者（player / ai / draw）'),
+        sa.Column('is_ended', sa.Boolean(), nullable=False, comment='遊戲是否已結束'),
+        sa.Column('winner', sa.String(length=16), nullable=True, comment='勝方（遊戲結束時）'),
+        sa.Column('end_reason', sa.String(length=32), nullable=True, comment='結束原因（遊戲結束時）'),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['session_id'], ['game_setups.session_id']),
+        sa.PrimaryKeyConstraint('session_id')
+    )
+    op.create_index('ix_session_summaries_ended_winner', 'session_summaries', ['is_ended', 'winner'])
+
+    _backfill(summaries)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_session_summaries_ended_winner', table_name='session_summaries')
+    op.drop_table('session_summaries')
+
+
+def _backfill(summaries: sa.Table) -> None:
+    """由既有的行動記錄與最新回合平台狀態建立每場摘要（只執行一次，之後由應用程式增量維護）"""
+    bind = op.get_bind()
+    totals = {
+        row.session_id: row
+        for row in bind.execute(sa.text(
+            "SELECT session_id,"
+            " COUNT(*) AS action_count,"
+            " SUM(CASE WHEN actor = 'player' THEN 1 ELSE 0 END) AS player_action_count,"
+            " SUM(CASE WHEN actor = 'player' THEN 0 ELSE 1 END) AS ai_action_count,"
+            " SUM(CASE WHEN actor = 'player' THEN COALESCE(reach_count, 0) ELSE 0 END) AS player_reach_total,"
+            " SUM(CASE WHEN actor = 'player' THEN 0 ELSE COALESCE(reach_count, 0) END) AS ai_reach_total,"
+            " SUM(CASE WHEN actor = 'player' THEN COALESCE(trust_change, 0) ELSE 0 END) AS player_trust_change_total,"
+            " SUM(CASE WHEN actor = 'player' THEN 0 ELSE COALESCE(trust_change, 0) END) AS ai_trust_change_total"
+            " FROM action_records GROUP BY session_id"
+        ))
+    }
+
+    # 最新回合的平台狀態；該回合已完成（玩家已行動）時才判定遊戲結束，與應用程式相同
+    states = {}
+    for row in bind.execute(sa.text(
+        "SELECT ps.session_id, ps.round_number, ps.platform_name, ps.player_trust, ps.ai_trust, ps.spread_rate,"
+        " COALESCE(gr.is_completed, false) AS is_completed"
+        " FROM platform_states ps"
+        " JOIN (SELECT session_id, MAX(round_number) AS round_number FROM platform_states GROUP BY session_id) latest"
+        " ON latest.session_id = ps.session_id AND latest.round_number = ps.round_number"
+        " LEFT JOIN game_rounds gr ON gr.session_id = ps.session_id AND gr.round_number = ps.round_number"
+    )):
+        round_number, is_completed, platforms = states.setdefault(
+            row.session_id, (row.round_number, bool(row.is_completed), [])
+        )
+        platforms.append({
+            "platform_name": row.platform_name,
+            "player_trust": row.player_trust,
+            "ai_trust": row.ai_trust,
+            "spread_rate": row.spread_rate
+        })
+
+    counters = (
+        "action_count", "player_action_count", "ai_action_count", "player_reach_total",
+        "ai_reach_total", "player_trust_change_total", "ai_trust_change_total"
+    )
+    rows = []
+    for session_id, (round_number, is_completed, platforms) in states.items():
+        total = totals.get(session_id)
+        rows.append({
+            "session_id": session_id,
+            "latest_round": round_number,
+            **{name: int(getattr(total, name)) if total is not None else 0 for name in counters},
+            "is_ended": False,
+            "winner": None,
+            "end_reason": None,
+            **_standing(round_number, platforms, check_end=is_completed)
+        })
+    if rows:
+        op.bulk_insert(summaries, rows)
+        # 摘要的建立時間即遊戲建立時間，遊戲列表依此排序
+        bind.execute(sa.text(
+            "UPDATE session_summaries SET created_at = ("
+            " SELECT gs.created_at FROM game_setups gs WHERE gs.session_id = session_summaries.session_id)"
+        ))
+
+
+def _standing(round_number: int, platforms: List[Dict[str, Any]], check_end: bool) -> Dict[str, Any]:
+    """戰況：信任值總和與領先者；check_end 時依結束規則判定是否結束（回合上限 > 玩家主導 > AI 主導）"""
+    player_total = sum(p["player_trust"] or 0 for p in platforms)
+    ai_total = sum(p["ai_trust"] or 0 for p in platforms)
+    leader = "player" if player_total > ai_total else "ai" if ai_total > player_total else "draw"
+    standing = {"player_total_trust": player_total, "ai_total_trust": ai_total, "leader": leader}
+    if not check_end:
+        return standing
+
+    player_winning = sum(1 for p in platforms if (p["player_trust"] or 0) >= WIN_TRUST_THRESHOLD)
+    ai_winning = sum(1 for p in platforms if (p["ai_trust"] or 0) >= WIN_TRUST_THRESHOLD)
+    if round_number >= MAX_ROUNDS:
+        winner, reason = leader, "max_rounds_reached"
+    elif player_winning >= WIN_PLATFORM_COUNT:
+        winner, reason = "player", "player_dominance"
+    elif ai_winning >= WIN_PLATFORM_COUNT:
+        winner, reason = "ai", "ai_dominance"
+    else:
+        winner, reason = None, None
+    standing.update({"is_ended": reason is not None, "winner": winner, "end_reason": reason})
+    return standing
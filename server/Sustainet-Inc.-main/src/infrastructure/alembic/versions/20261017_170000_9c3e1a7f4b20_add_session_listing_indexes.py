@@ -0,0 +1,49 @@
+"""add session listing indexes
+
+Revision ID: 9c3e1a7f4b20
+Revises: 5d2f8b6c0e71
+Create Date: 2026-10-17 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c3e1a7f4b20'
+down_revision: Union[str, None] = '5d2f8b6c0e71'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 遊戲列表與排行榜的 keyset 分頁：篩選欄位在前、排序鍵在後，取代只能篩選的 (is_ended, winner)
+    op.drop_index('ix_session_summaries_ended_winner', table_name='session_summaries')
+    op.create_index('ix_session_summaries_created', 'session_summaries', ['created_at', 'session_id'])
+    op.create_index(
+        'ix_session_summaries_ended_created',
+        'session_summaries',
+        ['is_ended', 'created_at', 'session_id']
+    )
+    op.create_index(
+        'ix_session_summaries_winner_created',
+        'session_summaries',
+        ['winner', 'created_at', 'session_id']
+    )
+    op.create_index(
+        'ix_session_summaries_ended_score',
+        'session_summaries',
+        ['is_ended', 'player_total_trust', 'session_id']
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_session_summaries_ended_score', table_name='session_summaries')
+    op.drop_index('ix_session_summaries_winner_created', table_name='session_summaries')
+    op.drop_index('ix_session_summaries_ended_created', table_name='session_summaries')
+    op.drop_index('ix_session_summaries_created', table_name='session_summaries')
+    op.create_index('ix_session_summaries_ended_winner', 'session_summaries', ['is_ended', 'winner'])
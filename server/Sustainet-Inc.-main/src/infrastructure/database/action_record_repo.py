@@ -4,6 +4,7 @@ Provides synchronous CRUD operations for ActionRecord entities.
 """
 
 from typing import Optional, List
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from src.infrastructure.database.base_repo import BaseRepository
@@ -134,22 +135,28 @@ class ActionRecordRepository(BaseRepository[ActionRecord]):
 
         Returns:
             新創建的 ActionRecord 實體
+
+        Note:
+            以單一 INSERT ... RETURNING 寫入並取回主鍵與伺服器預設值，
+            效果欄位應在此一併提供，不需再呼叫 update_effectiveness。
         """
-        return self.create(
-            {
-                "session_id": session_id,
-                "round_number": round_number,
-                "actor": actor,
-                "platform": platform,
-                "content": content,
-                "reach_count": reach_count,
-                "trust_change": trust_change,
-                "spread_change": spread_change,
-                "effectiveness": effectiveness,
-                "simulated_comments": simulated_comments,
-            },
-            db=db
+        statement = (
+            insert(ActionRecord)
+            .values(
+                session_id=session_id,
+                round_number=round_number,
+                actor=actor,
+                platform=platform,
+                content=content,
+                reach_count=reach_count,
+                trust_change=trust_change,
+                spread_change=spread_change,
+                effectiveness=effectiveness,
+                simulated_comments=simulated_comments,
+            )
+            .returning(ActionRecord)
         )
+        return db.scalars(statement).one()
 
     @with_session
     def update_effectiveness(
@@ -193,4 +200,4 @@ class ActionRecordRepository(BaseRepository[ActionRecord]):
         if simulated_comments is not None:
             action.simulated_comments = simulated_comments
 
-        db.commit()
+        db.flush()
@@ -0,0 +1,101 @@
+"""
+Agent 設定快取模組。
+以 agent_name 為鍵、updated_at 為版本快取 AgentDefinition，
+每次執行 Agent 時不必重新載入整列資料。
+"""
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, Optional, Tuple
+
+from src.domain.models.agent import AgentDefinition
+from src.utils.logger import logger
+
+
+class AgentDefinitionCache:
+    """
+    有版本的 Agent 設定快取。
+
+    - 命中且距上次驗證未超過 revalidate_interval 秒：直接返回，不查詢資料庫
+    - 超過間隔：只查詢 updated_at，版本相同則沿用快取，不同才重新載入
+    - 本行程更新或刪除 Agent 時由 AgentRepository 明確失效
+
+    用法示例:
+    ```python
+    from src.infrastructure.database.agent_definition_cache import agent_definition_cache
+
+    definition = agent_definition_cache.get(
+        "fake_news_agent",
+        load_version=lambda: repo.get_version("fake_news_agent"),
+        load_definition=lambda: load("fake_news_agent")
+    )
+    agent_definition_cache.invalidate("fake_news_agent")
+    ```
+    """
+
+    def __init__(self, revalidate_interval: float = 30.0):
+        """
+        Args:
+            revalidate_interval: 重新驗證版本的間隔（秒）
+        """
+        self.revalidate_interval = revalidate_interval
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[AgentDefinition, float]] = {}
+
+    def get(
+        self,
+        agent_name: str,
+        load_version: Callable[[], Optional[datetime]],
+        load_definition: Callable[[], Optional[AgentDefinition]]
+    ) -> Optional[AgentDefinition]:
+        """
+        取得 Agent 設定。
+
+        Args:
+            agent_name: Agent 名稱
+            load_version: 查詢資料庫中目前 updated_at 的函數，找不到時返回 None
+            load_definition: 載入完整設定的函數，找不到時返回 None
+
+        Returns:
+            AgentDefinition，若 Agent 不存在則返回 None
+        """
+        now = time.monotonic()
+        entry = self._entries.get(agent_name)
+        if entry is not None and now - entry[1] < self.revalidate_interval:
+            return entry[0]
+
+        if entry is not None:
+            version = load_version()
+            if version is None:
+                self.invalidate(agent_name)
+                return None
+            if version == entry[0].updated_at:
+                with self._lock:
+                    self._entries[agent_name] = (entry[0], now)
+                return entry[0]
+
+        definition = load_definition()
+        with self._lock:
+            if definition is None:
+                self._entries.pop(agent_name, None)
+            else:
+                self._entries[agent_name] = (definition, now)
+        logger.debug(f"已載入 Agent 設定: {agent_name}")
+        return definition
+
+    def invalidate(self, agent_name: Optional[str] = None) -> None:
+        """
+        使快取失效。
+
+        Args:
+            agent_name: 指定失效的 Agent，None 表示全部
+        """
+        with self._lock:
+            if agent_name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(agent_name, None)
+
+
+# 全局 Agent 設定快取實例
+agent_definition_cache = AgentDefinitionCache()
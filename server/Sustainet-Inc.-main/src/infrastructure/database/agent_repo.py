@@ -4,9 +4,12 @@ Provides synchronous CRUD operations for Agent entities.
 """
 from typing import Optional, Dict, Any, List, Union
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from src.infrastructure.database.utils import with_session
 
+from src.domain.models.agent import AgentDefinition
+from src.infrastructure.database.agent_definition_cache import agent_definition_cache
 from src.infrastructure.database.base_repo import BaseRepository
 from src.infrastructure.database.models.agent import Agent
 from src.utils.exceptions import ResourceNotFoundError
@@ -22,8 +25,11 @@ class AgentRepository(BaseRepository[Agent]):
     
     # 同步操作
     all_agents = agent_repo.get_all()
-    agent = agent_repo.get_by_id(1)
+    agent = agent_repo.get_by_pk(1)
     agent = agent_repo.get_by_name("FakeNewsAgent")
+
+    # 取得快取的唯讀設定（執行 Agent 時使用）
+    definition = agent_repo.get_definition("FakeNewsAgent")
     
     # 同步創建 Agent
     new_agent = agent_repo.create_agent(
@@ -52,6 +58,69 @@ class AgentRepository(BaseRepository[Agent]):
         """
         results = self.get_by(db=db, agent_name=agent_name)
         return results[0] if results else None
+
+    @with_session
+    def get_definition(self, agent_name: str, db: Optional[Session] = None) -> Optional[AgentDefinition]:
+        """
+        取得 Agent 的唯讀設定，經由行程共用的版本快取。
+        快取需要驗證時只查詢 updated_at，版本變更才重新載入整列。
+
+        Args:
+            agent_name: Agent 名稱
+            db: 可選的數據庫 Session，如果未提供則自動創建
+
+        Returns:
+            AgentDefinition，如果未找到則返回 None
+        """
+        def load_definition() -> Optional[AgentDefinition]:
+            agent = self.get_by_name(agent_name, db=db)
+            return AgentDefinition.from_entity(agent) if agent else None
+
+        return agent_definition_cache.get(
+            agent_name,
+            load_version=lambda: db.execute(
+                select(Agent.updated_at).where(Agent.agent_name == agent_name)
+            ).scalar_one_or_none(),
+            load_definition=load_definition
+        )
+
+    @with_session
+    def update_by_pk(self, pk_value: Any, data: Dict[str, Any], db: Optional[Session] = None) -> Agent:
+        """
+        根據主鍵更新 Agent，並使其設定快取失效。
+
+        Args:
+            pk_value: Agent ID
+            data: 要更新的數據
+            db: 可選的數據庫 Session，如果未提供則自動創建
+
+        Returns:
+            更新後的 Agent 實體
+
+        Raises:
+            ResourceNotFoundError: 如果找不到 Agent
+        """
+        old_name = self.get_by_pk(pk_value, db=db).agent_name
+        agent = super().update_by_pk(pk_value, data, db=db)
+        agent_definition_cache.invalidate(old_name)
+        agent_definition_cache.invalidate(agent.agent_name)
+        return agent
+
+    @with_session
+    def delete_by_pk(self, pk_value: Any, db: Optional[Session] = None) -> None:
+        """
+        根據主鍵刪除 Agent，並使其設定快取失效。
+
+        Args:
+            pk_value: Agent ID
+            db: 可選的數據庫 Session，如果未提供則自動創建
+
+        Raises:
+            ResourceNotFoundError: 如果找不到 Agent
+        """
+        agent_name = self.get_by_pk(pk_value, db=db).agent_name
+        super().delete_by_pk(pk_value, db=db)
+        agent_definition_cache.invalidate(agent_name)
     
     @with_session
     def create_agent(self, 
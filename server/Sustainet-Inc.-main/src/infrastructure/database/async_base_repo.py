@@ -0,0 +1,151 @@
+"""
+Async base repository class for database operations.
+Provides common asynchronous CRUD operations mirroring BaseRepository.
+"""
+from typing import TypeVar, Generic, Type, List, Optional, Any, Dict, Union, Tuple
+
+from sqlalchemy import select, func, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.utils.exceptions import ResourceNotFoundError
+from src.infrastructure.database.base_repo import BaseRepository
+from src.infrastructure.database.utils import with_async_session
+
+# Type variable for the entity model
+T = TypeVar('T')
+
+
+class AsyncBaseRepository(Generic[T]):
+    """
+    基礎資料庫 Repository 的非同步版本，方法與 BaseRepository 一一對應。
+    查詢在事件迴圈上等待，不佔用執行緒池。
+
+    用法示例:
+    ```python
+    class AsyncNewsRepository(AsyncBaseRepository[News]):
+        model = News
+
+    async with AsyncUnitOfWork() as uow:
+        repo = AsyncNewsRepository(db=uow.session)
+        news = await repo.get_by_pk(1)
+        page = await repo.list_after(cursor=news.news_id, limit=20)
+    ```
+    """
+    # 子類需要覆寫此屬性
+    model: Type[Any] = None
+
+    def __init__(self, db: Optional[AsyncSession] = None):
+        """
+        初始化 repository。
+
+        Args:
+            db: 可選的綁定 AsyncSession。綁定後所有方法預設使用此 Session，
+                且不會自行 commit，由外部的 AsyncUnitOfWork 負責提交
+        """
+        if self.__class__.model is None:
+            raise NotImplementedError("Repository class must define 'model' attribute")
+        self.db = db
+
+    @with_async_session
+    async def get_by_pk(self, pk_value: Union[Any, Tuple[Any, ...]], db: AsyncSession = None) -> T:
+        """
+        根據主鍵取得實體。
+
+        Raises:
+            ResourceNotFoundError: 如果找不到實體
+        """
+        entity = await db.get(self.model, pk_value)
+        if not entity:
+            raise ResourceNotFoundError(
+                message=f"{self.model.__name__} with primary key {pk_value} not found",
+                resource_type=self.model.__name__.lower(),
+                resource_id=str(pk_value)
+            )
+        return entity
+
+    @with_async_session
+    async def get_all(self, db: AsyncSession = None) -> List[T]:
+        """取得所有實體列表"""
+        return list((await db.execute(select(self.model))).scalars().all())
+
+    @with_async_session
+    async def get_by(self, db: AsyncSession = None, **kwargs) -> List[T]:
+        """根據等值條件查詢實體"""
+        stmt = self._apply_filters(select(self.model), kwargs)
+        return list((await db.execute(stmt)).scalars().all())
+
+    @with_async_session
+    async def list_page(self, offset: int = 0, limit: int = 100, db: AsyncSession = None, **kwargs) -> List[T]:
+        """以 LIMIT/OFFSET 分頁查詢，依主鍵排序"""
+        stmt = self._apply_filters(select(self.model), kwargs)
+        stmt = stmt.order_by(self._pk_column()).offset(offset).limit(limit)
+        return list((await db.execute(stmt)).scalars().all())
+
+    @with_async_session
+    async def list_after(self, cursor: Optional[Any] = None, limit: int = 100, db: AsyncSession = None, **kwargs) -> List[T]:
+        """以 keyset 方式分頁查詢（WHERE pk > cursor ORDER BY pk LIMIT n），僅支援單一欄位主鍵"""
+        pk = self._pk_column()
+        stmt = self._apply_filters(select(self.model), kwargs)
+        if cursor is not None:
+            stmt = stmt.where(pk > cursor)
+        stmt = stmt.order_by(pk).limit(limit)
+        return list((await db.execute(stmt)).scalars().all())
+
+    @with_async_session
+    async def count(self, estimated: bool = False, db: AsyncSession = None, **kwargs) -> int:
+        """
+        計算符合條件的實體數量。
+        estimated 的行為與 BaseRepository.count 相同（僅 PostgreSQL 且無條件時使用估計值）。
+        """
+        if estimated and not kwargs and db.get_bind().dialect.name == "postgresql":
+            estimate = (await db.execute(
+                text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)"),
+                {"table": self.model.__tablename__}
+            )).scalar()
+            if estimate is not None and estimate >= 0:
+                return int(estimate)
+
+        stmt = self._apply_filters(select(func.count()).select_from(self.model), kwargs)
+        return (await db.execute(stmt)).scalar_one()
+
+    @with_async_session
+    async def create(self, data: Union[Dict[str, Any], T], db: AsyncSession = None) -> T:
+        """創建新實體"""
+        entity = self.model(**data) if isinstance(data, dict) else data
+        db.add(entity)
+        await db.flush()
+        await db.refresh(entity)
+        return entity
+
+    @with_async_session
+    async def update_by_pk(self, pk_value: Union[Any, Tuple[Any, ...]], data: Dict[str, Any], db: AsyncSession = None) -> T:
+        """
+        根據主鍵更新實體。
+
+        Raises:
+            ResourceNotFoundError: 如果找不到實體
+        """
+        entity = await self.get_by_pk(pk_value, db=db)
+        for key, value in data.items():
+            if hasattr(entity, key):
+                setattr(entity, key, value)
+        await db.flush()
+        await db.refresh(entity)
+        return entity
+
+    @with_async_session
+    async def delete_by_pk(self, pk_value: Union[Any, Tuple[Any, ...]], db: AsyncSession = None) -> None:
+        """
+        根據主鍵刪除實體。
+
+        Raises:
+            ResourceNotFoundError: 如果找不到實體
+        """
+        entity = await self.get_by_pk(pk_value, db=db)
+        await db.delete(entity)
+
+    # === 私有方法 ===
+
+    # 條件組裝與主鍵查找只依賴 self.model，直接沿用同步版本
+    _apply_filters = BaseRepository._apply_filters
+    _pk_column = BaseRepository._pk_column
@@ -4,7 +4,7 @@ Provides common synchronous CRUD operations for all entity repositories.
 """
 from typing import TypeVar, Generic, Type, List, Optional, Any, Dict, Union, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import select, func, inspect, text
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -27,16 +27,31 @@ class BaseRepository(Generic[T]):
     
     agent_repo = AgentRepository()
     agents = agent_repo.get_all()
-    agent = agent_repo.get_by_id(1)
+    agent = agent_repo.get_by_pk(1)
+
+    # 資料庫端分頁與計數
+    page = agent_repo.list_page(offset=0, limit=20)
+    page = agent_repo.list_after(cursor=page[-1].id, limit=20)
+    total = agent_repo.count()
+
+    # 綁定請求範圍的 session（工作單元模式），所有操作共用同一交易
+    agent_repo = AgentRepository(db=db)
     ```
     """
     # 子類需要覆寫此屬性
     model: Type[Any] = None
     
-    def __init__(self):
-        """初始化 repository。"""
+    def __init__(self, db: Optional[Session] = None):
+        """
+        初始化 repository。
+
+        Args:
+            db: 可選的綁定 Session。綁定後所有方法預設使用此 Session，
+                且不會自行 commit，由外部的工作單元負責提交
+        """
         if self.__class__.model is None:
             raise NotImplementedError("Repository class must define 'model' attribute")
+        self.db = db
     
     @with_session
     def get_by_pk(self, pk_value: Union[Any, Tuple[Any, ...]], db: Session = None) -> T:
@@ -89,15 +104,74 @@ class BaseRepository(Generic[T]):
         Returns:
             符合條件的實體列表
         """
-        stmt = select(self.model)
-        
-        # 添加所有查詢條件
-        for key, value in kwargs.items():
-            if hasattr(self.model, key):
-                stmt = stmt.where(getattr(self.model, key) == value)
-        
+        stmt = self._apply_filters(select(self.model), kwargs)
         result = db.execute(stmt)
         return list(result.scalars().all())
+
+    @with_session
+    def list_page(self, offset: int = 0, limit: int = 100, db: Session = None, **kwargs) -> List[T]:
+        """
+        以 LIMIT/OFFSET 分頁查詢，依主鍵排序。
+
+        Args:
+            offset: 跳過筆數
+            limit: 取得筆數
+            db: 可選的數據庫 Session，如果未提供則自動創建
+            **kwargs: 查詢條件
+
+        Returns:
+            該頁的實體列表
+        """
+        stmt = self._apply_filters(select(self.model), kwargs)
+        stmt = stmt.order_by(self._pk_column()).offset(offset).limit(limit)
+        return list(db.execute(stmt).scalars().all())
+
+    @with_session
+    def list_after(self, cursor: Optional[Any] = None, limit: int = 100, db: Session = None, **kwargs) -> List[T]:
+        """
+        以 keyset 方式分頁查詢（WHERE pk > cursor ORDER BY pk LIMIT n），
+        深層分頁時不需掃過前面的資料。僅支援單一欄位主鍵。
+
+        Args:
+            cursor: 上一頁最後一筆的主鍵值，None 表示第一頁
+            limit: 取得筆數
+            db: 可選的數據庫 Session，如果未提供則自動創建
+            **kwargs: 查詢條件
+
+        Returns:
+            該頁的實體列表
+        """
+        pk = self._pk_column()
+        stmt = self._apply_filters(select(self.model), kwargs)
+        if cursor is not None:
+            stmt = stmt.where(pk > cursor)
+        stmt = stmt.order_by(pk).limit(limit)
+        return list(db.execute(stmt).scalars().all())
+
+    @with_session
+    def count(self, estimated: bool = False, db: Session = None, **kwargs) -> int:
+        """
+        計算符合條件的實體數量。
+
+        Args:
+            estimated: 是否使用估計值。僅在 PostgreSQL 且無查詢條件時讀取
+                pg_class.reltuples，其餘情況（或統計資料尚未建立）改用 COUNT(*)
+            db: 可選的數據庫 Session，如果未提供則自動創建
+            **kwargs: 查詢條件
+
+        Returns:
+            實體數量
+        """
+        if estimated and not kwargs and db.get_bind().dialect.name == "postgresql":
+            estimate = db.execute(
+                text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)"),
+                {"table": self.model.__tablename__}
+            ).scalar()
+            if estimate is not None and estimate >= 0:
+                return int(estimate)
+
+        stmt = self._apply_filters(select(func.count()).select_from(self.model), kwargs)
+        return db.execute(stmt).scalar_one()
     
     @with_session
     def create(self, data: Union[Dict[str, Any], T], db: Session = None) -> T:
@@ -178,3 +252,19 @@ class BaseRepository(Generic[T]):
             )
         
         db.delete(entity)
+
+    # === 私有方法 ===
+
+    def _apply_filters(self, stmt, filters: Dict[str, Any]):
+        """為查詢加上等值條件，忽略模型上不存在的欄位"""
+        for key, value in filters.items():
+            if hasattr(self.model, key):
+                stmt = stmt.where(getattr(self.model, key) == value)
+        return stmt
+
+    def _pk_column(self):
+        """取得單一欄位主鍵"""
+        primary_key = inspect(self.model).primary_key
+        if len(primary_key) != 1:
+            raise NotImplementedError(f"{self.model.__name__} does not have a single-column primary key")
+        return primary_key[0]
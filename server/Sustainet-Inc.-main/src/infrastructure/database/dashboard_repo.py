@@ -0,0 +1,255 @@
+"""
+遊戲面板（Dashboard）讀取模型。
+以固定次數的查詢取得面板所需資料，查詢次數不隨平台數、行動數增加：
+- 平台狀態：單一查詢以視窗函數取得目前回合與上一回合的信任值，並在 SQL 中算出趨勢
+- 行動記錄與工具使用：兩個查詢，工具使用以 IN 一次預先載入
+- 累計值與領先者：以主鍵讀取每場摘要（session_summaries）一筆
+另提供只讀索引的版本查詢，供 ETag 比對，面板未變動時不必重建。
+同步與非同步 Repository 共用相同的查詢。
+"""
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import Select, case, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.infrastructure.database.models.action_record import ActionRecord
+from src.infrastructure.database.models.platform_state import PlatformState
+from src.infrastructure.database.models.session_summary import SessionSummary
+from src.infrastructure.database.models.toolusage import ToolUsage
+from src.infrastructure.database.utils import with_async_session, with_session
+
+# 與上一回合相比的玩家信任度趨勢
+TREND_UP = "↗"
+TREND_DOWN = "↘"
+TREND_FLAT = "→"
+
+
+@dataclass(frozen=True)
+class PlatformTrendRow:
+    """目前回合的單一平台狀態，trust_trend 為與上一回合比較的玩家信任度趨勢"""
+    platform_name: str
+    player_trust: int
+    ai_trust: int
+    spread_rate: int
+    trust_trend: str
+
+
+@dataclass
+class DashboardSnapshot:
+    """
+    組成面板所需的資料。
+
+    - **round_number**: 目前回合（平台狀態的最新回合）
+    - **platforms**: 目前回合各平台狀態與趨勢
+    - **actions**: 目前回合的行動記錄，依建立順序
+    - **tools_by_action**: 行動 ID → 該行動使用的工具名稱
+    - **summary**: 每場摘要（累計值、領先者），摘要表建立前的遊戲為 None
+    """
+    round_number: int
+    platforms: List[PlatformTrendRow]
+    actions: List[ActionRecord] = field(default_factory=list)
+    tools_by_action: Dict[int, List[str]] = field(default_factory=dict)
+    summary: Optional[SessionSummary] = None
+
+
+class DashboardRepository:
+    """
+    面板讀取模型的 Repository。
+
+    用法示例:
+    ```python
+    repo = DashboardRepository(db=session)
+
+    version = repo.get_version("game123")     # "3.42"，遊戲不存在時為 None
+    snapshot = repo.get_snapshot("game123")
+    for platform in snapshot.platforms:
+        print(platform.platform_name, platform.player_trust, platform.trust_trend)
+    ```
+    """
+
+    # db: optional request-scoped session shared with the other repositories
+    def __init__(self, db: Optional[Session] = None):
+        self.db = db
+
+    @with_session
+    def get_version(self, session_id: str, db: Session = None) -> Optional[str]:
+        """
+        取得面板的版本字串，遊戲不存在時返回 None。
+
+        面板內容只在建立新回合（新增平台狀態）或寫入回合結果（新增行動記錄）時改變，
+        兩者分別由最新回合數與最大的行動 ID 反映；兩個值都由索引直接取得。
+        """
+        return _format_version(*db.execute(_version_query(session_id)).one())
+
+    @with_session
+    def get_snapshot(self, session_id: str, db: Session = None) -> Optional[DashboardSnapshot]:
+        """
+        取得目前回合的面板資料，遊戲不存在時返回 None。
+
+        Args:
+            session_id: 遊戲識別碼
+            db: 資料庫 Session（自動注入）
+        """
+        trends = _to_platform_trends(db.execute(_platform_trends_query(session_id)).all())
+        if trends is None:
+            return None
+        round_number, platforms = trends
+
+        actions = list(db.execute(_actions_query(session_id, round_number)).scalars())
+        action_ids = [action.id for action in actions]
+        tool_rows = db.execute(_tools_query(action_ids)).all() if action_ids else []
+        return DashboardSnapshot(
+            round_number=round_number,
+            platforms=platforms,
+            actions=actions,
+            tools_by_action=_group_tools(action_ids, tool_rows),
+            summary=db.get(SessionSummary, session_id)
+        )
+
+
+class AsyncDashboardRepository:
+    """
+    面板讀取模型的非同步版本，查詢與 DashboardRepository 相同，供 async 面板路由使用。
+
+    用法示例:
+    ```python
+    async with AsyncUnitOfWork() as uow:
+        repo = AsyncDashboardRepository(db=uow.session)
+        version = await repo.get_version("game123")
+        snapshot = await repo.get_snapshot("game123")
+    ```
+    """
+
+    def __init__(self, db: Optional[AsyncSession] = None):
+        self.db = db
+
+    @with_async_session
+    async def get_version(self, session_id: str, db: AsyncSession = None) -> Optional[str]:
+        """取得面板的版本字串，遊戲不存在時返回 None（見 DashboardRepository.get_version）"""
+        return _format_version(*(await db.execute(_version_query(session_id))).one())
+
+    @with_async_session
+    async def get_snapshot(self, session_id: str, db: AsyncSession = None) -> Optional[DashboardSnapshot]:
+        """取得目前回合的面板資料，遊戲不存在時返回 None"""
+        trends = _to_platform_trends((await db.execute(_platform_trends_query(session_id))).all())
+        if trends is None:
+            return None
+        round_number, platforms = trends
+
+        actions = list((await db.execute(_actions_query(session_id, round_number))).scalars())
+        action_ids = [action.id for action in actions]
+        tool_rows = (await db.execute(_tools_query(action_ids))).all() if action_ids else []
+        return DashboardSnapshot(
+            round_number=round_number,
+            platforms=platforms,
+            actions=actions,
+            tools_by_action=_group_tools(action_ids, tool_rows),
+            summary=await db.get(SessionSummary, session_id)
+        )
+
+
+# === 私有函數 ===
+
+def _version_query(session_id: str) -> Select:
+    return select(
+        select(func.max(PlatformState.round_number))
+        .where(PlatformState.session_id == session_id)
+        .scalar_subquery(),
+        select(func.max(ActionRecord.id))
+        .where(ActionRecord.session_id == session_id)
+        .scalar_subquery(),
+    )
+
+
+def _format_version(round_number: Optional[int], action_id: Optional[int]) -> Optional[str]:
+    if round_number is None:
+        return None
+    return f"{round_number}.{action_id or 0}"
+
+
+def _platform_trends_query(session_id: str) -> Select:
+    """單一查詢取得最新回合的平台狀態；上一回合的信任值以 LAG 取得，只讀取最後兩個回合"""
+    latest_round = (
+        select(func.max(PlatformState.round_number))
+        .where(PlatformState.session_id == session_id)
+        .scalar_subquery()
+    )
+    states = (
+        select(
+            PlatformState.id,
+            PlatformState.round_number,
+            PlatformState.platform_name,
+            PlatformState.player_trust,
+            PlatformState.ai_trust,
+            PlatformState.spread_rate,
+            func.lag(PlatformState.player_trust).over(
+                partition_by=PlatformState.platform_name,
+                order_by=PlatformState.round_number
+            ).label("previous_player_trust"),
+            func.max(PlatformState.round_number).over().label("current_round"),
+        )
+        .where(
+            PlatformState.session_id == session_id,
+            PlatformState.round_number >= latest_round - 1
+        )
+        .subquery()
+    )
+    trend = case(
+        (states.c.previous_player_trust.is_(None), TREND_FLAT),
+        (states.c.player_trust > states.c.previous_player_trust, TREND_UP),
+        (states.c.player_trust < states.c.previous_player_trust, TREND_DOWN),
+        else_=TREND_FLAT
+    )
+    return (
+        select(
+            states.c.round_number,
+            states.c.platform_name,
+            states.c.player_trust,
+            states.c.ai_trust,
+            states.c.spread_rate,
+            trend.label("trust_trend"),
+        )
+        .where(states.c.round_number == states.c.current_round)
+        .order_by(states.c.id)
+    )
+
+
+def _to_platform_trends(rows) -> Optional[Tuple[int, List[PlatformTrendRow]]]:
+    if not rows:
+        return None
+    return rows[0].round_number, [
+        PlatformTrendRow(
+            platform_name=row.platform_name,
+            player_trust=row.player_trust,
+            ai_trust=row.ai_trust,
+            spread_rate=row.spread_rate,
+            trust_trend=row.trust_trend,
+        )
+        for row in rows
+    ]
+
+
+def _actions_query(session_id: str, round_number: int) -> Select:
+    return (
+        select(ActionRecord)
+        .filter_by(session_id=session_id, round_number=round_number)
+        .order_by(ActionRecord.created_at, ActionRecord.id)
+    )
+
+
+def _tools_query(action_ids: List[int]) -> Select:
+    """一次載入多個行動的工具使用記錄"""
+    return (
+        select(ToolUsage.action_id, ToolUsage.tool_name)
+        .where(ToolUsage.action_id.in_(action_ids))
+        .order_by(ToolUsage.id)
+    )
+
+
+def _group_tools(action_ids: List[int], rows) -> Dict[int, List[str]]:
+    tools_by_action: Dict[int, List[str]] = {action_id: [] for action_id in action_ids}
+    for action_id, tool_name in rows:
+        tools_by_action[action_id].append(tool_name)
+    return tools_by_action
@@ -4,10 +4,16 @@ Provides synchronous CRUD operations for GameSetup entities.
 """
 
 from typing import Optional
+from sqlalchemy import delete, select
 from sqlalchemy.orm import Session
 
 from src.infrastructure.database.base_repo import BaseRepository
+from src.infrastructure.database.models.action_record import ActionRecord
+from src.infrastructure.database.models.game_round import GameRound
 from src.infrastructure.database.models.game_setup import GameSetup
+from src.infrastructure.database.models.platform_state import PlatformState
+from src.infrastructure.database.models.session_summary import SessionSummary
+from src.infrastructure.database.models.toolusage import ToolUsage
 from src.infrastructure.database.utils import with_session
 from src.utils.exceptions import ResourceNotFoundError
 
@@ -31,6 +37,9 @@ class GameSetupRepository(BaseRepository[GameSetup]):
             {"name": "Instagram", "audience": "學生"}
         ]
     )
+
+    # 刪除整場遊戲（含平台狀態、回合、行動與摘要）
+    repo.delete_game("game123")
     ```
     """
 
@@ -95,3 +104,18 @@ class GameSetupRepository(BaseRepository[GameSetup]):
             },
             db=db
         )
+
+    @with_session
+    def delete_game(self, session_id: str, db: Optional[Session] = None) -> None:
+        """
+        刪除整場遊戲：依外鍵順序刪除工具使用、行動紀錄、平台狀態、回合、摘要與遊戲設置。
+        用於建立後未能完成首回合、呼叫端也無從得知 session_id 的遊戲。
+
+        Args:
+            session_id: 遊戲識別碼
+            db: 可選的資料庫 Session
+        """
+        action_ids = select(ActionRecord.id).where(ActionRecord.session_id == session_id)
+        db.execute(delete(ToolUsage).where(ToolUsage.action_id.in_(action_ids)))
+        for model in (ActionRecord, PlatformState, GameRound, SessionSummary, GameSetup):
+            db.execute(delete(model).where(model.session_id == session_id))
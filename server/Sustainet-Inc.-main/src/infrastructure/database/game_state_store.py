@@ -0,0 +1,400 @@
+"""
+遊戲狀態熱資料存放模組。
+為進行中的遊戲保留目前回合的 Game 聚合、平台設定與上一回合狀態，
+回合中不必再查詢 game_setups 與 platform_states，也不必重建 Game 物件。
+
+資料庫仍是唯一的真實來源：傳入 db 的寫入先暫存在該 Session，交易提交後才寫入此存放，
+其他請求看不到未提交的狀態；交易回滾時捨棄暫存的寫入，未命中時由呼叫端從資料庫載入。
+"""
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.config.settings import settings
+from src.domain.models.game import Game, SpreadRate, TrustScore
+from src.utils.logger import logger
+
+# Session.info 中暫存本交易的寫入：(存放, 遊戲識別碼) -> _StagedEntry
+_PENDING_KEY = "game_state_store_sessions"
+
+
+@dataclass
+class SessionState:
+    """單一遊戲的熱資料"""
+    game: Game
+    setup_platforms: List[Dict[str, Any]]
+    previous_states: Optional[Dict[str, Dict[str, int]]] = None
+    last_access: float = 0.0
+    size: int = 0  # 估計的記憶體用量（位元組）
+    version: int = 0  # 每次寫入存放時遞增，用於偵測暫存期間的其他提交
+
+
+@dataclass
+class _StagedEntry:
+    """交易內暫存的遊戲熱資料：開始暫存時存放中的版本，以及套用本交易寫入後的項目"""
+    base_version: Optional[int]
+    entry: Optional[SessionState]
+
+
+class GameStateStore:
+    """
+    進行中遊戲的狀態存放。
+
+    - 以最後存取時間排序（LRU），閒置超過 idle_ttl 秒、超過 max_sessions
+      或估計用量超過 max_bytes 時淘汰最久未使用者
+    - 取出的 Game 為複本，呼叫端修改不影響存放內容
+    - 寫入時傳入 db，變更暫存在該 Session，提交後才生效、回滾時捨棄；
+      讀取時傳入同一個 db 可看到本交易暫存的寫入
+    - 多個 worker 行程各自持有存放；同一場遊戲需由同一個 worker 處理，
+      否則應將 GAME_STATE_STORE_MAX_SESSIONS 設為 0 停用
+
+    用法示例:
+    ```python
+    from src.infrastructure.database.game_state_store import game_state_store
+
+    game = game_state_store.get_game(session_id, round_number, db=session)
+    if game is None:
+        game = rebuild_from_db(session_id, round_number)
+        game_state_store.put(game, setup_platforms, db=session)
+
+    game_state_store.apply_platform_states(session_id, round_number, states, db=session)
+    session.commit()  # 提交後其他請求才看得到更新
+    ```
+    """
+
+    def __init__(self, max_sessions: int = 10000, idle_ttl: float = 1800.0, max_bytes: int = 0):
+        """
+        Args:
+            max_sessions: 最多保留的遊戲數，0 表示停用
+            idle_ttl: 閒置多久（秒）後淘汰
+            max_bytes: 全部項目估計用量的上限（位元組），0 表示不限制；
+                每個項目以 sys.getsizeof 遞迴加總估計，只作為近似值
+        """
+        self.max_sessions = max_sessions
+        self.idle_ttl = idle_ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._bytes = 0
+        self._version = 0
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, SessionState]" = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_sessions > 0
+
+    def get_game(self, session_id: str, round_number: int, db: Optional[Session] = None) -> Optional[Game]:
+        """
+        取得指定回合的 Game 複本。
+
+        Args:
+            session_id: 遊戲識別碼
+            round_number: 回合數
+            db: 目前的 Session，優先讀取本交易暫存的寫入
+
+        Returns:
+            Game 複本，未保留或回合不符時返回 None
+        """
+        entry = self._touch(session_id, db)
+        if entry is None or entry.game.current_round != round_number:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return _copy_game(entry.game)
+
+    def get_setup_platforms(self, session_id: str, db: Optional[Session] = None) -> Optional[List[Dict[str, Any]]]:
+        """取得平台與受眾設定，未保留時返回 None；傳入 db 時優先讀取本交易暫存的寫入"""
+        entry = self._touch(session_id, db)
+        return [dict(p) for p in entry.setup_platforms] if entry else None
+
+    def get_platform_states(
+        self,
+        session_id: str,
+        round_number: int,
+        db: Optional[Session] = None
+    ) -> Optional[Dict[str, Dict[str, int]]]:
+        """
+        取得某回合各平台狀態（平台名稱 -> player_trust / ai_trust / spread_rate）。
+        只保留目前回合與上一回合。
+
+        Args:
+            session_id: 遊戲識別碼
+            round_number: 回合數
+            db: 目前的 Session，優先讀取本交易暫存的寫入
+
+        Returns:
+            平台狀態字典，未保留時返回 None
+        """
+        entry = self._touch(session_id, db)
+        if entry is None:
+            return None
+        if entry.game.current_round == round_number:
+            return _states_of(entry.game)
+        if entry.game.current_round == round_number + 1 and entry.previous_states is not None:
+            return {name: dict(state) for name, state in entry.previous_states.items()}
+        return None
+
+    def put(self, game: Game, setup_platforms: List[Dict[str, Any]], db: Optional[Session] = None) -> None:
+        """
+        保留遊戲目前回合的狀態（建立遊戲或從資料庫載入後呼叫）。
+
+        Args:
+            game: Game 聚合（會複製後保存）
+            setup_platforms: 平台與受眾設定
+            db: 寫入所屬的 Session，提交後生效
+        """
+        if not self.enabled:
+            return
+        game = _copy_game(game)
+        setup_platforms = [dict(p) for p in setup_platforms]
+
+        def write(entry: Optional[SessionState]) -> SessionState:
+            previous_states = None
+            if entry is not None and entry.game.current_round == game.current_round - 1:
+                previous_states = _states_of(entry.game)
+            return SessionState(game=game, setup_platforms=setup_platforms, previous_states=previous_states)
+
+        self._write(game.session_id.value, write, db)
+
+    def apply_platform_states(
+        self,
+        session_id: str,
+        round_number: int,
+        platform_states: List[Dict[str, Any]],
+        db: Optional[Session] = None
+    ) -> None:
+        """
+        寫入某回合平台狀態的更新（對應 update_all_platforms_states）。
+
+        Args:
+            session_id: 遊戲識別碼
+            round_number: 回合數
+            platform_states: 包含 platform_name、player_trust、ai_trust、spread_rate 的字典列表
+            db: 寫入所屬的 Session，提交後生效
+        """
+        platform_states = [dict(state) for state in platform_states]
+
+        def write(entry: Optional[SessionState]) -> Optional[SessionState]:
+            if entry is None or entry.game.current_round != round_number:
+                return None
+            for state in platform_states:
+                platform = entry.game.get_platform(state["platform_name"])
+                if platform is None:
+                    continue
+                platform.player_trust = TrustScore(state["player_trust"])
+                platform.ai_trust = TrustScore(state["ai_trust"])
+                platform.spread_rate = SpreadRate(state["spread_rate"])
+            return entry
+
+        self._write(session_id, write, db)
+
+    def advance_round(self, session_id: str, round_number: int, db: Optional[Session] = None) -> None:
+        """
+        寫入新回合的建立：新回合各平台沿用上一回合的狀態。
+
+        Args:
+            session_id: 遊戲識別碼
+            round_number: 新回合數
+            db: 寫入所屬的 Session，提交後生效
+        """
+        def write(entry: Optional[SessionState]) -> Optional[SessionState]:
+            if entry is None or entry.game.current_round != round_number - 1:
+                return None
+            entry.previous_states = _states_of(entry.game)
+            entry.game = _copy_game(entry.game)
+            entry.game.current_round = round_number
+            return entry
+
+        self._write(session_id, write, db)
+
+    def invalidate(self, session_id: Optional[str] = None) -> None:
+        """
+        使存放失效。
+
+        Args:
+            session_id: 指定失效的遊戲，None 表示全部
+        """
+        with self._lock:
+            if session_id is None:
+                self._entries.clear()
+                self._bytes = 0
+                self.hits = self.misses = 0
+            else:
+                self._remove(session_id)
+
+    def touch(self, session_id: str) -> bool:
+        """延長遊戲的保留時間（WebSocket 連線的心跳使用），返回遊戲是否仍在存放中"""
+        return self._touch(session_id) is not None
+
+    def size(self) -> int:
+        return len(self._entries)
+
+    def memory_usage(self) -> int:
+        """全部項目的估計記憶體用量（位元組）"""
+        return self._bytes
+
+    # === 私有方法 ===
+
+    def _touch(self, session_id: str, db: Optional[Session] = None) -> Optional[SessionState]:
+        if db is not None:
+            staged = db.info.get(_PENDING_KEY, {}).get((self, session_id))
+            if staged is not None:
+                return staged.entry
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None:
+                return None
+            if now - entry.last_access >= self.idle_ttl:
+                self._remove(session_id)
+                return None
+            entry.last_access = now
+            self._entries.move_to_end(session_id)
+            return entry
+
+    def _write(
+        self,
+        session_id: str,
+        write: Callable[[Optional[SessionState]], Optional[SessionState]],
+        db: Optional[Session]
+    ) -> None:
+        """套用一次寫入；write 接收目前項目（可能為 None），返回新項目，None 表示移除"""
+        if db is None:
+            with self._lock:
+                self._replace(session_id, write(self._entries.get(session_id)))
+            return
+        # 確保交易已開始，之後的 commit / rollback 才會觸發事件
+        if not db.in_transaction():
+            db.begin()
+        pending = db.info.setdefault(_PENDING_KEY, {})
+        staged = pending.get((self, session_id))
+        if staged is None:
+            with self._lock:
+                base = self._entries.get(session_id)
+                staged = _StagedEntry(
+                    base_version=base.version if base else None,
+                    entry=_copy_entry(base) if base else None
+                )
+            pending[(self, session_id)] = staged
+        staged.entry = write(staged.entry)
+
+    def _publish(self, session_id: str, staged: _StagedEntry) -> None:
+        """交易提交後寫入暫存的項目"""
+        with self._lock:
+            current = self._entries.get(session_id)
+            if (current.version if current else None) != staged.base_version:
+                # 暫存期間其他交易已提交同一場遊戲，無法判斷先後，改為失效由資料庫重新載入
+                self._remove(session_id)
+                return
+            self._replace(session_id, staged.entry)
+
+    def _replace(self, session_id: str, entry: Optional[SessionState]) -> None:
+        # 呼叫端需持有 self._lock
+        self._remove(session_id)
+        if entry is None:
+            return
+        self._version += 1
+        entry.version = self._version
+        entry.last_access = time.monotonic()
+        self._store(session_id, entry)
+        self._evict()
+
+    def _evict(self) -> None:
+        # 呼叫端需持有 self._lock
+        now = time.monotonic()
+        while self._entries:
+            session_id, entry = next(iter(self._entries.items()))
+            over_bytes = self.max_bytes > 0 and self._bytes > self.max_bytes
+            if len(self._entries) <= self.max_sessions and not over_bytes and now - entry.last_access < self.idle_ttl:
+                break
+            self._remove(session_id)
+            logger.debug(f"遊戲狀態已移出熱資料存放: {session_id}")
+
+    def _store(self, session_id: str, entry: SessionState) -> None:
+        # 呼叫端需持有 self._lock；放到 LRU 尾端並重新估計用量
+        entry.size = _approximate_size(entry)
+        self._entries[session_id] = entry
+        self._entries.move_to_end(session_id)
+        self._bytes += entry.size
+
+    def _remove(self, session_id: str) -> None:
+        # 呼叫端需持有 self._lock
+        entry = self._entries.pop(session_id, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+
+def _copy_game(game: Game) -> Game:
+    # TrustScore / SpreadRate 為值物件，變更時會建立新實例，只需複製 Platform
+    return replace(game, platforms=[replace(platform) for platform in game.platforms])
+
+
+def _copy_entry(entry: SessionState) -> SessionState:
+    return replace(
+        entry,
+        game=_copy_game(entry.game),
+        setup_platforms=[dict(p) for p in entry.setup_platforms],
+        previous_states=(
+            {name: dict(state) for name, state in entry.previous_states.items()}
+            if entry.previous_states is not None else None
+        )
+    )
+
+
+def _approximate_size(obj: Any, seen: Optional[set] = None) -> int:
+    # 以 sys.getsizeof 遞迴加總容器與物件屬性；共用物件只計一次，結果為近似值
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_approximate_size(key, seen) + _approximate_size(value, seen) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(_approximate_size(item, seen) for item in obj)
+    elif hasattr(obj, "__dict__"):
+        size += _approximate_size(vars(obj), seen)
+    return size
+
+
+def _states_of(game: Game) -> Dict[str, Dict[str, int]]:
+    return {
+        platform.name: {
+            "player_trust": platform.player_trust.value,
+            "ai_trust": platform.ai_trust.value,
+            "spread_rate": platform.spread_rate.value
+        }
+        for platform in game.platforms
+    }
+
+
+# 全局遊戲狀態存放實例
+game_state_store = GameStateStore(
+    max_sessions=settings.game_state_store_max_sessions,
+    idle_ttl=settings.game_state_store_idle_ttl,
+    max_bytes=settings.game_state_store_max_bytes
+)
+
+
+# === 私有函數 ===
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending(session: Session) -> None:
+    for (store, session_id), staged in session.info.pop(_PENDING_KEY, {}).items():
+        store._publish(session_id, staged)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_pending(session: Session, previous_transaction) -> None:
+    # 暫存的寫入尚未進入存放（包括注入 GameService / GameStateManager 的非全局存放），
+    # 回滾時直接捨棄；使用 soft rollback：即使交易尚未送出任何 SQL 也會觸發
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,67 @@
+"""
+資料庫健康檢查模組。
+以 engine 直接取用連線執行 SELECT 1，不建立 Session 也不 commit，
+並在 TTL 內重用上次結果，頻繁的健康探測不會佔用連線池。
+"""
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy.engine import Engine
+
+from src.config import settings
+from src.infrastructure.database.session import engine
+from src.utils.logger import logger
+
+
+class DatabaseHealthProbe:
+    """
+    帶快取的資料庫連線探測。
+
+    用法示例:
+    ```python
+    from src.infrastructure.database.health import database_probe
+
+    database_probe.check()  # {"status": "connected", "latency_ms": 0.8, "cached": False}
+    ```
+    """
+
+    def __init__(self, engine: Engine, cache_ttl: float = 5.0):
+        """
+        Args:
+            engine: 要探測的同步 Engine
+            cache_ttl: 結果重用秒數，0 表示每次都探測
+        """
+        self.engine = engine
+        self.cache_ttl = cache_ttl
+        self._lock = threading.Lock()
+        self._result: Optional[Dict[str, Any]] = None
+        self._checked_at = 0.0
+
+    def check(self) -> Dict[str, Any]:
+        """
+        返回資料庫狀態，快取過期時才實際探測。
+
+        Returns:
+            包含 status（connected / disconnected）、latency_ms 與 cached 的字典
+        """
+        with self._lock:
+            if self._result is not None and time.monotonic() - self._checked_at < self.cache_ttl:
+                return {**self._result, "cached": True}
+
+            start = time.perf_counter()
+            try:
+                with self.engine.connect() as conn:
+                    conn.exec_driver_sql("SELECT 1")
+                status = "connected"
+            except Exception as e:
+                logger.error(f"資料庫連線檢查失敗: {str(e)}")
+                status = "disconnected"
+
+            self._result = {"status": status, "latency_ms": round((time.perf_counter() - start) * 1000, 3)}
+            self._checked_at = time.monotonic()
+            return {**self._result, "cached": False}
+
+
+# 全局資料庫健康探測實例
+database_probe = DatabaseHealthProbe(engine, settings.db_health_cache_ttl)
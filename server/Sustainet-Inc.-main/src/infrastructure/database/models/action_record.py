@@ -3,7 +3,7 @@ ActionRecord 模型定義。
 記錄每一回合中，AI 與玩家的實際行動內容與其擴散與信任影響。
 """
 
-from sqlalchemy import Column, Integer, String, Text, JSON, ForeignKey
+from sqlalchemy import Column, Index, Integer, String, Text, JSON, ForeignKey
 from .base import Base, TimeStampMixin
 
 class ActionRecord(Base, TimeStampMixin):
@@ -29,7 +29,15 @@ class ActionRecord(Base, TimeStampMixin):
         "來源在哪？",
         "我也轉發了這篇！"
     ]
+    ```
+
+    索引：
+    - (session_id, round_number, created_at)：依場次與回合查詢並依建立時間排序。
     """
+    __table_args__ = (
+        Index("ix_action_records_session_round_created", "session_id", "round_number", "created_at"),
+    )
+
     id = Column(
         Integer,
         primary_key=True,
@@ -3,7 +3,7 @@ News 模型定義。
 儲存遊戲中可使用的新聞或議題資料。
 """
 
-from sqlalchemy import Column, Integer, String, Text, Boolean
+from sqlalchemy import Column, Index, Integer, String, Text, Boolean
 from .base import Base, TimeStampMixin
 
 class News(Base, TimeStampMixin):
@@ -29,6 +29,10 @@ class News(Base, TimeStampMixin):
     }
     """
     __tablename__ = "news"
+    __table_args__ = (
+        # 涵蓋抽樣索引載入（is_active 篩選，只讀 news_id / veracity / category）
+        Index("ix_news_active_sampler", "is_active", "news_id", "veracity", "category"),
+    )
 
     news_id = Column(
         Integer,
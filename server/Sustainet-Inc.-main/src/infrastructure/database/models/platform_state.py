@@ -3,7 +3,7 @@ PlatformState 模型定義。
 記錄每個回合中，各平台的信任狀態與傳播率。
 """
 
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Integer, String, ForeignKey, UniqueConstraint
 from .base import Base, TimeStampMixin
 
 class PlatformState(Base, TimeStampMixin):
@@ -21,8 +21,18 @@ class PlatformState(Base, TimeStampMixin):
     - **player_trust**: 玩家在此平台的信任值（0~100）。
     - **ai_trust**: AI 在此平台的信任值（0~100）。
     - **spread_rate**: 傳播率，百分比（整數 0~100）。
+
+    索引：
+    - (session_id, round_number, platform_name) 唯一，同時涵蓋依場次、場次+回合的查詢。
     """
 
+    __table_args__ = (
+        UniqueConstraint(
+            "session_id", "round_number", "platform_name",
+            name="uq_platform_states_session_round_platform"
+        ),
+    )
+
     # 主鍵
     id = Column(Integer, primary_key=True, autoincrement=True)
 
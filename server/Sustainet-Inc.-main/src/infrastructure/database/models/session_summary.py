@@ -0,0 +1,70 @@
+"""
+SessionSummary 模型定義。
+每場遊戲一筆的摘要，隨每次寫入回合結果增量更新。
+"""
+
+from sqlalchemy import Boolean, Column, ForeignKey, Index, Integer, String
+from .base import Base, TimeStampMixin
+
+class SessionSummary(Base, TimeStampMixin):
+    """
+    遊戲摘要表（物化的每場統計）。
+
+    面板、遊戲結束檢查與遊戲列表只需讀取這一筆，
+    不必重新掃描 platform_states 與 action_records。
+    由 GameService 建立遊戲、進入下一回合，以及 GameStateManager.persist_turn_result 維護。
+
+    - **session_id**: 主鍵，對應 GameSetup。
+    - **latest_round**: 最新回合數。
+    - **action_count**: 累計行動數；**player_action_count** / **ai_action_count** 為各方行動數。
+    - **player_reach_total** / **ai_reach_total**: 各方累計觸及人數。
+    - **player_trust_change_total** / **ai_trust_change_total**: 各方行動累計造成的信任值變化。
+    - **player_total_trust** / **ai_total_trust**: 目前各平台信任值總和。
+    - **leader**: 目前領先者（"player"、"ai" 或 "draw"），依信任值總和判定。
+    - **is_ended**: 遊戲是否已結束；**winner** / **end_reason** 為結束時的勝方與原因。
+
+    索引（遊戲列表與排行榜的 keyset 分頁，篩選欄位在前、排序鍵在後）：
+    - (created_at, session_id)：依建立時間列出全部遊戲。
+    - (is_ended, created_at, session_id)：依狀態篩選。
+    - (winner, created_at, session_id)：依勝方篩選。
+    - (is_ended, player_total_trust, session_id)：排行榜（已結束的遊戲依玩家信任值總和排序）。
+    """
+    __tablename__ = "session_summaries"
+    __table_args__ = (
+        Index("ix_session_summaries_created", "created_at", "session_id"),
+        Index("ix_session_summaries_ended_created", "is_ended", "created_at", "session_id"),
+        Index("ix_session_summaries_winner_created", "winner", "created_at", "session_id"),
+        Index("ix_session_summaries_ended_score", "is_ended", "player_total_trust", "session_id"),
+    )
+
+    session_id = Column(
+        String(64),
+        ForeignKey("game_setups.session_id"),
+        primary_key=True,
+        comment="遊戲 session ID，主鍵"
+    )
+
+    latest_round = Column(Integer, nullable=False, default=1, comment="最新回合數")
+
+    action_count = Column(Integer, nullable=False, default=0, comment="累計行動數")
+    player_action_count = Column(Integer, nullable=False, default=0, comment="玩家累計行動數")
+    ai_action_count = Column(Integer, nullable=False, default=0, comment="AI 累計行動數")
+
+    player_reach_total = Column(Integer, nullable=False, default=0, comment="玩家累計觸及人數")
+    ai_reach_total = Column(Integer, nullable=False, default=0, comment="AI 累計觸及人數")
+    player_trust_change_total = Column(Integer, nullable=False, default=0, comment="玩家行動累計信任值變化")
+    ai_trust_change_total = Column(Integer, nullable=False, default=0, comment="AI 行動累計信任值變化")
+
+    player_total_trust = Column(Integer, nullable=False, default=0, comment="目前玩家各平台信任值總和")
+    ai_total_trust = Column(Integer, nullable=False, default=0, comment="目前 AI 各平台信任值總和")
+
+    leader = Column(String(16), nullable=False, default="draw", comment="目前領先者（player / ai / draw）")
+    is_ended = Column(Boolean, nullable=False, default=False, comment="遊戲是否已結束")
+    winner = Column(String(16), nullable=True, comment="勝方（遊戲結束時）")
+    end_reason = Column(String(32), nullable=True, comment="結束原因（遊戲結束時）")
+
+    def __repr__(self):
+        return (
+            f"<SessionSummary session_id={self.session_id}, round={self.latest_round}, "
+            f"leader={self.leader}, is_ended={self.is_ended}>"
+        )
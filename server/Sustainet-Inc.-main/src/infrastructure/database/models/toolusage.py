@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, DateTime, Boolean, ForeignKey, text, Float
+from sqlalchemy import Column, String, Integer, DateTime, Boolean, ForeignKey, Index, text, Float
 from .base import Base, TimeStampMixin
 
 class ToolUsage(Base, TimeStampMixin):
@@ -6,6 +6,10 @@ class ToolUsage(Base, TimeStampMixin):
     """
     工具使用記錄表：記錄每次行動中使用的工具及其效果
     """
+    __table_args__ = (
+        Index("ix_tool_usages_action_id", "action_id"),
+    )
+
     id = Column(Integer, primary_key=True, autoincrement=True, comment="工具使用記錄主鍵")
     action_id = Column(Integer, ForeignKey('action_records.id'), nullable=False, comment="關聯的行動記錄 ID")
     tool_name = Column(String(64), ForeignKey('tools.tool_name'), nullable=False, comment="使用的工具名稱")
@@ -1,14 +1,18 @@
 """
 News repository for database operations.
-Provides synchronous CRUD operations for News entities.
+Provides synchronous and asynchronous CRUD operations for News entities.
 """
-
-from typing import Optional, List
+import random
+from typing import Optional, List, Any, Dict
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from src.infrastructure.database.async_base_repo import AsyncBaseRepository
 from src.infrastructure.database.base_repo import BaseRepository
 from src.infrastructure.database.models.news import News
-from src.infrastructure.database.utils import with_session
+from src.infrastructure.database.news_sampler import news_sampler
+from src.infrastructure.database.utils import with_async_session, with_session
 from src.utils.exceptions import ResourceNotFoundError
 
 
@@ -26,6 +30,9 @@ class NewsRepository(BaseRepository[News]):
     # 隨機取一筆啟用中的新聞
     news = repo.get_random_active_news()
 
+    # 隨機取兩筆不重複的啟用中新聞（一次主鍵查詢）
+    news_1, news_2 = repo.get_random_active_news_batch(2)
+
     # 創建新新聞資料
     new_news = repo.create_news(
         title="太陽能發電污染重？",
@@ -56,15 +63,52 @@ class NewsRepository(BaseRepository[News]):
         Raises:
             ResourceNotFoundError: 若查無任何啟用中的新聞
         """
-        from sqlalchemy.sql import func
-        stmt = db.query(News).filter(News.is_active.is_(True)).order_by(func.random()).limit(1)
-        result = stmt.first()
+        return self.get_random_active_news_batch(1, db=db)[0]
+
+    @with_session
+    def get_random_active_news_batch(
+        self,
+        k: int,
+        veracity: Optional[str] = None,
+        category: Optional[str] = None,
+        db: Optional[Session] = None
+    ) -> List[News]:
+        """
+        從抽樣索引隨機取得最多 k 筆不重複的啟用中新聞。
+        抽樣在記憶體中完成，資料庫只執行一次主鍵 IN 查詢。
+
+        Args:
+            k: 抽樣數量
+            veracity: 指定真實性（可選）
+            category: 指定分類（可選）
+            db: 可選資料庫 Session
+
+        Returns:
+            News 實體列表，符合條件的新聞不足 k 筆時返回全部
+
+        Raises:
+            ResourceNotFoundError: 若查無任何符合條件的啟用中新聞
+        """
+        news_sampler.ensure_loaded(lambda: self._load_sampler_rows(db))
+
+        result: List[News] = []
+        # 索引可能落後於其他行程的變更，取回的新聞若已停用則移出索引並補抽
+        for _ in range(3):
+            ids = _next_sample_ids(k, veracity, category, result)
+            if not ids:
+                break
+
+            found = {
+                news.news_id: news
+                for news in db.execute(select(News).where(News.news_id.in_(ids))).scalars()
+            }
+            _accept_sampled(ids, found, veracity, category, result)
+
+            if len(result) >= k:
+                break
+
         if not result:
-            raise ResourceNotFoundError(
-                message="No active news available.",
-                resource_type="news",
-                resource_id="active"
-            )
+            raise _no_active_news()
         return result
 
     @with_session
@@ -93,7 +137,7 @@ class NewsRepository(BaseRepository[News]):
         Returns:
             新創建的 News 實體
         """
-        return self.create(
+        news = self.create(
             {
                 "title": title,
                 "content": content,
@@ -104,28 +148,219 @@ class NewsRepository(BaseRepository[News]):
             },
             db=db
         )
+        news_sampler.sync(news, db=db)
+        return news
+
+    @with_session
+    def update_by_pk(self, pk_value: Any, data: Dict[str, Any], db: Session = None) -> News:
+        """
+        根據主鍵更新新聞，交易提交後同步抽樣索引。
+
+        Args:
+            pk_value: 新聞 ID
+            data: 要更新的數據
+            db: 資料庫 Session
+
+        Returns:
+            更新後的 News 實體
+
+        Raises:
+            ResourceNotFoundError: 若查無此新聞
+        """
+        news = super().update_by_pk(pk_value, data, db=db)
+        news_sampler.sync(news, db=db)
+        return news
+
+    @with_session
+    def delete_by_pk(self, pk_value: Any, db: Session = None) -> None:
+        """
+        根據主鍵刪除新聞，交易提交後移出抽樣索引。
+
+        Args:
+            pk_value: 新聞 ID
+            db: 資料庫 Session
+
+        Raises:
+            ResourceNotFoundError: 若查無此新聞
+        """
+        super().delete_by_pk(pk_value, db=db)
+        news_sampler.discard(pk_value, db=db)
 
     @with_session
     def get_random_news(
         self,
+        veracity: Optional[str] = None,
+        category: Optional[str] = None,
         db: Optional[Session] = None
     ) -> News:
         """
-        隨機取得一則新聞。
+        隨機取得一則新聞（包含未啟用的新聞）。
+        先計算符合條件的筆數再以 OFFSET 取單筆，避免對整張表排序。
 
         Args:
+            veracity: 指定真實性（可選）
+            category: 指定分類（可選）
             db: 資料庫 Session
 
         Returns:
             隨機選取的 News 實體
+
+        Raises:
+            ResourceNotFoundError: 若查無符合條件的新聞
+        """
+        conditions = _news_conditions(veracity, category)
+        total = db.execute(select(func.count()).select_from(News).where(*conditions)).scalar_one()
+        if not total:
+            raise _no_news()
+
+        stmt = select(News).where(*conditions).order_by(News.news_id).offset(random.randrange(total)).limit(1)
+        return db.execute(stmt).scalars().one()
+
+    # === 私有方法 ===
+
+    def _load_sampler_rows(self, db: Session) -> List[Any]:
+        """讀取建立抽樣索引所需的最少欄位"""
+        return [tuple(row) for row in db.execute(_SAMPLER_ROWS)]
+
+
+class AsyncNewsRepository(AsyncBaseRepository[News]):
+    """
+    News Repository 的非同步版本，提供 /api/news/random 等讀取熱路徑使用。
+    與 NewsRepository 共用行程內的新聞抽樣索引。
+
+    用法示例:
+    ```python
+    async with AsyncUnitOfWork() as uow:
+        repo = AsyncNewsRepository(db=uow.session)
+        news = await repo.get_random_active_news()
+        news_1, news_2 = await repo.get_random_active_news_batch(2)
+    ```
+    """
+
+    model = News
+
+    @with_async_session
+    async def get_random_active_news(self, db: Optional[AsyncSession] = None) -> News:
+        """
+        隨機取得一筆啟用中的新聞。
+
+        Raises:
+            ResourceNotFoundError: 若查無任何啟用中的新聞
+        """
+        return (await self.get_random_active_news_batch(1, db=db))[0]
+
+    @with_async_session
+    async def get_random_active_news_batch(
+        self,
+        k: int,
+        veracity: Optional[str] = None,
+        category: Optional[str] = None,
+        db: Optional[AsyncSession] = None
+    ) -> List[News]:
+        """
+        從抽樣索引隨機取得最多 k 筆不重複的啟用中新聞，行為與 NewsRepository 相同。
+
+        Raises:
+            ResourceNotFoundError: 若查無任何符合條件的啟用中新聞
         """
-        from sqlalchemy.sql import func
-        stmt = db.query(News).order_by(func.random()).limit(1)
-        result = stmt.first()
+        if news_sampler.is_stale():
+            news_sampler.load([tuple(row) for row in await db.execute(_SAMPLER_ROWS)])
+
+        result: List[News] = []
+        for _ in range(3):
+            ids = _next_sample_ids(k, veracity, category, result)
+            if not ids:
+                break
+
+            found = {
+                news.news_id: news
+                for news in (await db.execute(select(News).where(News.news_id.in_(ids)))).scalars()
+            }
+            _accept_sampled(ids, found, veracity, category, result)
+
+            if len(result) >= k:
+                break
+
         if not result:
-            raise ResourceNotFoundError(
-                message="No news available.",
-                resource_type="news",
-                resource_id="random"
-            )
+            raise _no_active_news()
         return result
+
+    @with_async_session
+    async def get_random_news(
+        self,
+        veracity: Optional[str] = None,
+        category: Optional[str] = None,
+        db: Optional[AsyncSession] = None
+    ) -> News:
+        """
+        隨機取得一則新聞（包含未啟用的新聞）。
+
+        Raises:
+            ResourceNotFoundError: 若查無符合條件的新聞
+        """
+        conditions = _news_conditions(veracity, category)
+        total = (await db.execute(select(func.count()).select_from(News).where(*conditions))).scalar_one()
+        if not total:
+            raise _no_news()
+
+        stmt = select(News).where(*conditions).order_by(News.news_id).offset(random.randrange(total)).limit(1)
+        return (await db.execute(stmt)).scalars().one()
+
+
+# === 私有函數 ===
+
+# 建立抽樣索引所需的最少欄位
+_SAMPLER_ROWS = select(News.news_id, News.veracity, News.category).where(News.is_active.is_(True))
+
+
+def _news_conditions(veracity: Optional[str], category: Optional[str]) -> List[Any]:
+    conditions = []
+    if veracity is not None:
+        conditions.append(News.veracity == veracity)
+    if category is not None:
+        conditions.append(News.category == category)
+    return conditions
+
+
+def _next_sample_ids(k: int, veracity: Optional[str], category: Optional[str], result: List[News]) -> List[int]:
+    """從抽樣索引補抽尚缺的新聞 ID，排除已取得的新聞"""
+    exclude = {news.news_id for news in result}
+    return [
+        news_id for news_id in news_sampler.sample_ids(k + len(exclude), veracity, category)
+        if news_id not in exclude
+    ][:k - len(result)]
+
+
+def _accept_sampled(
+    ids: List[int],
+    found: Dict[int, News],
+    veracity: Optional[str],
+    category: Optional[str],
+    result: List[News]
+) -> None:
+    """將仍符合條件的新聞加入 result，已停用或已修改的新聞同步回抽樣索引"""
+    for news_id in ids:
+        news = found.get(news_id)
+        if news is None or not news.is_active:
+            news_sampler.discard(news_id)
+        elif (veracity or news.veracity, category or news.category) != (news.veracity, news.category):
+            # 分類或真實性已被其他行程修改
+            news_sampler.sync(news)
+        else:
+            result.append(news)
+
+
+def _no_active_news() -> ResourceNotFoundError:
+    return ResourceNotFoundError(
+        message="No active news available.",
+        resource_type="news",
+        resource_id="active"
+    )
+
+
+def _no_news() -> ResourceNotFoundError:
+    return ResourceNotFoundError(
+        message="No news available.",
+        resource_type="news",
+        resource_id="random"
+    )
@@ -0,0 +1,213 @@
+"""
+新聞抽樣索引模組。
+在行程內維護啟用中新聞 ID 的索引（依真實性與分類分桶），
+抽樣時不需對 news 表排序，只需一次主鍵查詢即可取回新聞內容。
+"""
+import random
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.utils.logger import logger
+
+# (veracity, category)
+Bucket = Tuple[str, str]
+
+# Session.info 中暫存待提交索引更新的鍵：{(sampler, news_id): 分桶或 None（移除）}
+_PENDING_KEY = "news_sampler_pending"
+
+
+class NewsSampler:
+    """
+    啟用中新聞的行程內抽樣索引。
+
+    - 依 (veracity, category) 分桶保存新聞 ID，新增、移除皆為 O(1)
+    - 抽取 k 筆不重複 ID 只與 k 及分桶數有關，與新聞總數無關
+    - 新聞建立、更新、停用時由 NewsRepository 增量更新索引；傳入 db 時暫存到交易提交後才套用
+    - 超過 refresh_interval 秒後的下一次抽樣會重新載入，以同步其他行程的變更
+
+    用法示例:
+    ```python
+    from src.infrastructure.database.news_sampler import news_sampler
+
+    news_sampler.ensure_loaded(loader)
+    ids = news_sampler.sample_ids(2, veracity="partial")
+    ```
+    """
+
+    def __init__(self, refresh_interval: float = 300.0):
+        """
+        Args:
+            refresh_interval: 索引完整重新載入的間隔（秒）
+        """
+        self.refresh_interval = refresh_interval
+        self._lock = threading.Lock()
+        self._buckets: Dict[Bucket, List[int]] = {}
+        self._positions: Dict[int, Tuple[Bucket, int]] = {}
+        self._loaded_at: Optional[float] = None
+
+    @property
+    def size(self) -> int:
+        """索引中的新聞數量"""
+        return len(self._positions)
+
+    def is_stale(self) -> bool:
+        """索引是否尚未載入或已超過重新載入間隔"""
+        return self._loaded_at is None or time.monotonic() - self._loaded_at >= self.refresh_interval
+
+    def ensure_loaded(self, loader: Callable[[], Iterable[Tuple[int, str, str]]]) -> None:
+        """
+        若索引已過期，使用 loader 重新載入。
+
+        Args:
+            loader: 返回 (news_id, veracity, category) 的可迭代物件
+        """
+        if self.is_stale():
+            self.load(loader())
+
+    def load(self, rows: Iterable[Tuple[int, str, str]]) -> None:
+        """以 (news_id, veracity, category) 列表完整重建索引"""
+        buckets: Dict[Bucket, List[int]] = {}
+        positions: Dict[int, Tuple[Bucket, int]] = {}
+        for news_id, veracity, category in rows:
+            bucket = (veracity, category)
+            ids = buckets.setdefault(bucket, [])
+            positions[news_id] = (bucket, len(ids))
+            ids.append(news_id)
+
+        with self._lock:
+            self._buckets = buckets
+            self._positions = positions
+            self._loaded_at = time.monotonic()
+        logger.debug(f"新聞抽樣索引已載入 {len(positions)} 筆")
+
+    def invalidate(self) -> None:
+        """標記索引過期，下一次抽樣時重新載入"""
+        with self._lock:
+            self._loaded_at = None
+
+    def add(self, news_id: int, veracity: str, category: str) -> None:
+        """加入或移動一筆新聞到對應分桶"""
+        with self._lock:
+            self._discard(news_id)
+            bucket = (veracity, category)
+            ids = self._buckets.setdefault(bucket, [])
+            self._positions[news_id] = (bucket, len(ids))
+            ids.append(news_id)
+
+    def discard(self, news_id: int, db: Optional[Session] = None) -> None:
+        """
+        從索引移除一筆新聞（不存在時忽略）。
+
+        Args:
+            news_id: 新聞 ID
+            db: 可選資料庫 Session；指定時延後到該交易提交後才移除，回滾則捨棄
+        """
+        if db is not None:
+            self._stage(db, news_id, None)
+            return
+        with self._lock:
+            self._discard(news_id)
+
+    def sync(self, news, db: Optional[Session] = None) -> None:
+        """
+        依 News 實體的目前狀態更新索引：啟用則加入，停用則移除。
+
+        Args:
+            news: News 實體
+            db: 可選資料庫 Session；指定時延後到該交易提交後才更新，回滾則捨棄
+        """
+        bucket = (news.veracity, news.category) if news.is_active else None
+        if db is not None:
+            self._stage(db, news.news_id, bucket)
+        elif bucket is not None:
+            self.add(news.news_id, *bucket)
+        else:
+            self.discard(news.news_id)
+
+    def sample_ids(
+        self,
+        k: int,
+        veracity: Optional[str] = None,
+        category: Optional[str] = None
+    ) -> List[int]:
+        """
+        抽取最多 k 筆不重複的新聞 ID。
+
+        Args:
+            k: 抽樣數量
+            veracity: 指定真實性（None 表示不限）
+            category: 指定分類（None 表示不限）
+
+        Returns:
+            新聞 ID 列表，符合條件的新聞不足 k 筆時返回全部
+        """
+        with self._lock:
+            if veracity is not None and category is not None:
+                candidates = [self._buckets.get((veracity, category), [])]
+            else:
+                candidates = [
+                    ids for (v, c), ids in self._buckets.items()
+                    if ids and (veracity is None or v == veracity) and (category is None or c == category)
+                ]
+
+            total = sum(len(ids) for ids in candidates)
+            if total == 0 or k <= 0:
+                return []
+
+            picked = []
+            for index in random.sample(range(total), min(k, total)):
+                for ids in candidates:
+                    if index < len(ids):
+                        picked.append(ids[index])
+                        break
+                    index -= len(ids)
+            return picked
+
+    # === 私有方法 ===
+
+    def _stage(self, db: Session, news_id: int, bucket: Optional[Bucket]) -> None:
+        # 先記下分桶而非保留實體：提交後實體會過期，讀取屬性將再次查詢資料庫
+        # 確保交易已開始，之後的 commit / rollback 才會觸發事件
+        if not db.in_transaction():
+            db.begin()
+        db.info.setdefault(_PENDING_KEY, {})[(self, news_id)] = bucket
+
+    def _apply(self, news_id: int, bucket: Optional[Bucket]) -> None:
+        if bucket is None:
+            self.discard(news_id)
+        else:
+            self.add(news_id, *bucket)
+
+    def _discard(self, news_id: int) -> None:
+        # 以最後一個元素填補空位，移除為 O(1)
+        entry = self._positions.pop(news_id, None)
+        if entry is None:
+            return
+        bucket, position = entry
+        ids = self._buckets[bucket]
+        last_id = ids.pop()
+        if last_id != news_id:
+            ids[position] = last_id
+            self._positions[last_id] = (bucket, position)
+
+
+# 全局新聞抽樣索引實例
+news_sampler = NewsSampler()
+
+
+# === 私有函數 ===
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending(session: Session) -> None:
+    for (sampler, news_id), bucket in session.info.pop(_PENDING_KEY, {}).items():
+        sampler._apply(news_id, bucket)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_pending(session: Session, previous_transaction) -> None:
+    # 新聞的寫入已回滾，索引維持原狀
+    session.info.pop(_PENDING_KEY, None)
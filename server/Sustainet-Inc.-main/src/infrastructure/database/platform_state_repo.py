@@ -3,8 +3,9 @@ PlatformState repository for database operations.
 Provides synchronous CRUD operations for PlatformState entities.
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 
+from sqlalchemy import case, insert, update
 from sqlalchemy.orm import Session
 from src.infrastructure.database.utils import with_session
 
@@ -157,46 +158,49 @@ class PlatformStateRepository(BaseRepository[PlatformState]):
         player_trust: int=None,
         ai_trust: int=None,
         spread_rate: int=None,
+        previous_states: Optional[Dict[str, Dict[str, int]]] = None,
         db: Optional[Session] = None
     ):
         """
         一次創建所有平台的狀態紀錄。
+        使用單一多列 INSERT，不論平台數量都只需一次資料庫往返。
+        如果不是第一回合，會以一次查詢取得上一回合所有平台的狀態作為預設值；
+        呼叫端已持有上一回合狀態時可由 previous_states 傳入（平台名稱 -> 狀態字典），省略該查詢。
         """
-        previous_states_dict = {}
-        if round_number > 1:
-            try:
-                previous_states = self.get_by_session_and_round(
-                    session_id=session_id,
-                    round_number=round_number - 1,
-                    db=db
-                )
-                previous_states_dict = {
-                    state.platform_name: state for state in previous_states
+        previous_states_dict = dict(previous_states or {})
+        if previous_states is None and round_number > 1:
+            # 如果不是第一回合卻查不到上一回合，get_by_session_and_round 會 raise
+            rows_before = self.get_by_session_and_round(
+                session_id=session_id,
+                round_number=round_number - 1,
+                db=db
+            )
+            previous_states_dict = {
+                state.platform_name: {
+                    "player_trust": state.player_trust,
+                    "ai_trust": state.ai_trust,
+                    "spread_rate": state.spread_rate
                 }
-            except ResourceNotFoundError:
-                # 如果不是第一回合卻查不到上一回合，才 raise
-                raise
+                for state in rows_before
+            }
 
+        rows = []
         for platform in platforms:
             if "name" not in platform:
                 raise ValueError("Each platform must have a 'name' key.")
 
             previous_state = previous_states_dict.get(platform["name"])
-            platform_player_trust = player_trust if player_trust is not None else (previous_state.player_trust if previous_state else 50)
-            platform_ai_trust = ai_trust if ai_trust is not None else (previous_state.ai_trust if previous_state else 50)
-            platform_spread_rate = spread_rate if spread_rate is not None else (previous_state.spread_rate if previous_state else 50)
-
-            self.create(
-                {
-                    "session_id": session_id,
-                    "round_number": round_number,
-                    "platform_name": platform["name"],
-                    "player_trust": platform_player_trust,
-                    "ai_trust": platform_ai_trust,
-                    "spread_rate": platform_spread_rate,
-                },
-                db=db
-            )
+            rows.append({
+                "session_id": session_id,
+                "round_number": round_number,
+                "platform_name": platform["name"],
+                "player_trust": player_trust if player_trust is not None else (previous_state["player_trust"] if previous_state else 50),
+                "ai_trust": ai_trust if ai_trust is not None else (previous_state["ai_trust"] if previous_state else 50),
+                "spread_rate": spread_rate if spread_rate is not None else (previous_state["spread_rate"] if previous_state else 50),
+            })
+
+        if rows:
+            db.execute(insert(PlatformState).values(rows))
 
     @with_session
     def update_platform_state(
@@ -240,10 +244,10 @@ class PlatformStateRepository(BaseRepository[PlatformState]):
         platform.player_trust = player_trust
         platform.ai_trust = ai_trust
         platform.spread_rate = spread_rate
-        db.commit()
+        db.flush()
 
     
-    @with_session    
+    @with_session
     def update_all_platforms_states(
         self,
         session_id: str,
@@ -253,18 +257,50 @@ class PlatformStateRepository(BaseRepository[PlatformState]):
     ):
         """
         批次更新所有平台狀態。
-        platform_status_list: [
-            {"platform_name": ..., "ai_trust": ..., "spread": ...},
-            ...
-        ]
+        以單一 UPDATE ... SET col = CASE platform_name ... 完成，不論平台數量都只需一次資料庫往返。
+
+        Args:
+            session_id: 遊戲識別碼
+            round_number: 回合數
+            platform_status_list: [
+                {"platform_name": ..., "player_trust": ..., "ai_trust": ..., "spread_rate": ...},
+                ...
+            ]
+            db: 可選的資料庫 Session
+
+        Raises:
+            ResourceNotFoundError: 如果有任何平台找不到對應的 PlatformState
         """
-        for state in platform_status_list:
-            self.update_platform_state(
-                session_id=session_id,
-                round_number=round_number,
-                platform_name=state["platform_name"],
-                ai_trust=state["ai_trust"],
-                spread_rate=state["spread"],
-                db=db
+        if not platform_status_list:
+            return
+
+        by_platform = {state["platform_name"]: state for state in platform_status_list}
+
+        def _case(field: str):
+            return case(
+                {name: state[field] for name, state in by_platform.items()},
+                value=PlatformState.platform_name
+            )
+
+        stmt = (
+            update(PlatformState)
+            .where(
+                PlatformState.session_id == session_id,
+                PlatformState.round_number == round_number,
+                PlatformState.platform_name.in_(list(by_platform))
+            )
+            .values(
+                player_trust=_case("player_trust"),
+                ai_trust=_case("ai_trust"),
+                spread_rate=_case("spread_rate")
+            )
+        )
+        result = db.execute(stmt)
+
+        if result.rowcount != len(by_platform):
+            raise ResourceNotFoundError(
+                message=f"PlatformState not found for some platforms in session={session_id}, round={round_number}",
+                resource_type="platform_state",
+                resource_id=f"{session_id}-{round_number}"
             )
 
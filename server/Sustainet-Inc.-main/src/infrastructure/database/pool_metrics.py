@@ -0,0 +1,188 @@
+"""
+連線池量測模組。
+透過 SQLAlchemy 連線池事件記錄取用次數、溢位使用、連線存活時間，
+並量測等待可用連線的時間，用於依實際負載調整連線池大小。
+"""
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+# 保留最近的等待時間樣本數，用於計算百分位數
+_WAIT_SAMPLES = 1024
+
+
+class PoolMetrics:
+    """
+    單一連線池的量測資料。
+
+    用法示例:
+    ```python
+    from src.infrastructure.database.pool_metrics import instrument_engine, pool_metrics_snapshot
+
+    instrument_engine(engine, "sync")
+    pool_metrics_snapshot()  # {"sync": {"checked_out": 2, "checkout_wait_ms": {...}, ...}}
+    ```
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.pool: Optional[Pool] = None
+        self.connects = 0
+        self.checkouts = 0
+        self.overflow_checkouts = 0
+        self.timeouts = 0
+        self.invalidations = 0
+        self._lock = threading.Lock()
+        self._waits: Deque[float] = deque(maxlen=_WAIT_SAMPLES)
+        self._connected_at: Dict[int, float] = {}
+
+    def record_wait(self, seconds: float) -> None:
+        """記錄一次取得連線所花的等待時間"""
+        with self._lock:
+            self._waits.append(seconds)
+
+    def record_timeout(self) -> None:
+        """記錄一次等待連線逾時"""
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """返回目前的量測資料"""
+        now = time.monotonic()
+        with self._lock:
+            waits = sorted(self._waits)
+            ages = [now - connected_at for connected_at in self._connected_at.values()]
+            counters = {
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "overflow_checkouts": self.overflow_checkouts,
+                "timeouts": self.timeouts,
+                "invalidations": self.invalidations,
+            }
+        return {
+            "pool_class": type(self.pool).__name__ if self.pool is not None else None,
+            **_pool_status(self.pool),
+            **counters,
+            "checkout_wait_ms": {
+                "samples": len(waits),
+                "avg": round(sum(waits) / len(waits) * 1000, 3) if waits else 0.0,
+                "p95": round(waits[min(len(waits) - 1, int(len(waits) * 0.95))] * 1000, 3) if waits else 0.0,
+                "max": round(waits[-1] * 1000, 3) if waits else 0.0,
+            },
+            "connection_age_s": {
+                "open": len(ages),
+                "avg": round(sum(ages) / len(ages), 1) if ages else 0.0,
+                "max": round(max(ages), 1) if ages else 0.0,
+            },
+        }
+
+    # === 連線池事件 ===
+
+    def on_connect(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self.connects += 1
+            self._connected_at[id(connection_record)] = time.monotonic()
+
+    def on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        overflow = _call(self.pool, "overflow")
+        with self._lock:
+            self.checkouts += 1
+            if overflow is not None and overflow > 0:
+                self.overflow_checkouts += 1
+
+    def on_invalidate(self, dbapi_connection, connection_record, exception) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+    def on_close(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self._connected_at.pop(id(connection_record), None)
+
+
+class _MeasuredCheckout:
+    """為佇列式連線池量測取得連線的等待時間（連線池事件沒有「開始等待」的時間點）"""
+
+    metrics: Optional[PoolMetrics] = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except exc.TimeoutError:
+            if self.metrics is not None:
+                self.metrics.record_timeout()
+            raise
+        if self.metrics is not None:
+            self.metrics.record_wait(time.perf_counter() - start)
+        return record
+
+    def recreate(self):
+        # engine.dispose() 會以 recreate() 建立新的連線池，量測需跟著轉移
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        if self.metrics is not None:
+            self.metrics.pool = pool
+        return pool
+
+
+class MeasuredQueuePool(_MeasuredCheckout, QueuePool):
+    """量測等待時間的 QueuePool"""
+
+
+class MeasuredAsyncQueuePool(_MeasuredCheckout, AsyncAdaptedQueuePool):
+    """量測等待時間的 AsyncAdaptedQueuePool"""
+
+
+# 全局連線池量測登錄表（連線池名稱 -> 量測資料）
+pool_metrics: Dict[str, PoolMetrics] = {}
+
+
+def instrument_engine(engine: Engine, name: str) -> PoolMetrics:
+    """
+    為 engine 的連線池註冊量測事件。
+
+    Args:
+        engine: 同步 Engine（非同步 engine 請傳入 async_engine.sync_engine）
+        name: 連線池名稱，用於統計輸出
+
+    Returns:
+        該連線池的 PoolMetrics
+    """
+    metrics = PoolMetrics(name)
+    pool = engine.pool
+    metrics.pool = pool
+    if isinstance(pool, _MeasuredCheckout):
+        pool.metrics = metrics
+    event.listen(pool, "connect", metrics.on_connect)
+    event.listen(pool, "checkout", metrics.on_checkout)
+    event.listen(pool, "invalidate", metrics.on_invalidate)
+    event.listen(pool, "close", metrics.on_close)
+    pool_metrics[name] = metrics
+    return metrics
+
+
+def pool_metrics_snapshot() -> Dict[str, Dict[str, Any]]:
+    """返回所有已量測連線池的統計"""
+    return {name: metrics.snapshot() for name, metrics in list(pool_metrics.items())}
+
+
+# === 私有函數 ===
+
+def _call(pool: Optional[Pool], method: str) -> Optional[int]:
+    # size / checkedout / overflow 只有佇列式連線池提供
+    func = getattr(pool, method, None)
+    return func() if callable(func) else None
+
+
+def _pool_status(pool: Optional[Pool]) -> Dict[str, Optional[int]]:
+    return {
+        "size": _call(pool, "size"),
+        "checked_in": _call(pool, "checkedin"),
+        "checked_out": _call(pool, "checkedout"),
+        "overflow": _call(pool, "overflow"),
+    }
@@ -0,0 +1,117 @@
+"""
+查詢計畫檢查模組。
+記錄程式區塊內送出的查詢，並以 EXPLAIN 取得各查詢的執行計畫，
+用於在測試中確認熱路徑查詢有命中索引，避免索引遺失或查詢改寫後退化為全表掃描。
+"""
+import re
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Iterator, List, Optional, Set
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# 只檢查讀取與以條件定位資料列的語句，INSERT 不需要索引
+_EXPLAINABLE = ("SELECT", "UPDATE", "DELETE")
+
+# SQLite: "SCAN platform_states"；PostgreSQL: "Seq Scan on platform_states"
+_SQLITE_SCAN = re.compile(r"^SCAN (\w+)(?!.*COVERING INDEX)")
+_POSTGRES_SCAN = re.compile(r"Seq Scan on (\w+)")
+
+
+@dataclass
+class QueryPlan:
+    """
+    單一查詢的執行計畫。
+
+    - **statement**: 送出的 SQL
+    - **parameters**: 綁定參數
+    - **plan**: EXPLAIN 輸出的每一行
+    """
+    statement: str
+    parameters: Any
+    plan: List[str] = field(default_factory=list)
+
+    def full_scans(self) -> Set[str]:
+        """返回此查詢以全表掃描讀取的資料表名稱"""
+        tables = set()
+        for line in self.plan:
+            match = _SQLITE_SCAN.search(line.strip()) or _POSTGRES_SCAN.search(line)
+            if match:
+                tables.add(match.group(1))
+        return tables
+
+
+class QueryPlanRecorder:
+    """
+    記錄查詢並產生執行計畫。
+
+    用法示例:
+    ```python
+    from src.infrastructure.database.query_plan import capture_query_plans
+
+    with capture_query_plans(engine) as recorder:
+        repo.get_by_session_and_round("game123", 1)
+
+    assert not recorder.full_scans({"platform_states"})
+    ```
+    """
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self.plans: List[QueryPlan] = []
+
+    def record(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if executemany or not statement.lstrip().upper().startswith(_EXPLAINABLE):
+            return
+        self.plans.append(QueryPlan(statement, parameters))
+
+    def explain(self) -> List[QueryPlan]:
+        """
+        對已記錄的查詢執行 EXPLAIN。
+        需在記錄的交易結束後呼叫，避免與進行中的交易共用連線。
+
+        Returns:
+            已填入執行計畫的查詢列表
+        """
+        prefix = "EXPLAIN QUERY PLAN " if self.engine.dialect.name == "sqlite" else "EXPLAIN "
+        with self.engine.connect() as conn:
+            for query in self.plans:
+                rows = conn.exec_driver_sql(prefix + query.statement, query.parameters).fetchall()
+                # SQLite 的 detail 在最後一欄，PostgreSQL 每列只有一欄
+                query.plan = [str(row[-1]) for row in rows]
+            conn.rollback()
+        return self.plans
+
+    def full_scans(self, tables: Optional[Iterable[str]] = None) -> List[QueryPlan]:
+        """
+        找出含全表掃描的查詢。
+
+        Args:
+            tables: 只檢查這些資料表，None 表示全部
+
+        Returns:
+            對指定資料表做全表掃描的查詢列表
+        """
+        watched = set(tables) if tables is not None else None
+        return [
+            query for query in self.plans
+            if query.full_scans() and (watched is None or query.full_scans() & watched)
+        ]
+
+
+@contextmanager
+def capture_query_plans(engine: Engine) -> Iterator[QueryPlanRecorder]:
+    """
+    上下文管理器：記錄區塊內的查詢，離開區塊時取得執行計畫。
+
+    注意：PostgreSQL 在資料量很小時即使有索引也可能選擇 Seq Scan，
+    在 PostgreSQL 上檢查時應使用接近正式環境的資料量或先執行 ANALYZE。
+    """
+    recorder = QueryPlanRecorder(engine)
+    event.listen(engine, "before_cursor_execute", recorder.record)
+    try:
+        yield recorder
+    finally:
+        event.remove(engine, "before_cursor_execute", recorder.record)
+    recorder.explain()
@@ -0,0 +1,249 @@
+"""
+Agent 回應快取模組。
+以渲染後提示詞、Agent 版本與模型的雜湊為鍵（內容定址），
+相同的請求不必再次呼叫 LLM。提供行程內與 SQLite 檔案兩種後端。
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from src.config.settings import settings
+from src.utils.logger import logger
+
+
+def make_cache_key(*parts: Any) -> str:
+    """
+    由多個部分計算內容定址的快取鍵。
+
+    Args:
+        *parts: 組成鍵的值（需可 JSON 序列化，其他型別以 str 轉換）
+
+    Returns:
+        SHA-256 十六進位字串
+    """
+    payload = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class MemoryCacheBackend:
+    """行程內 LRU 後端，依存取順序淘汰並檢查 TTL"""
+
+    name = "memory"
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, stored_at = entry
+            if time.time() - stored_at >= self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (value, time.time())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def size(self) -> int:
+        return len(self._entries)
+
+
+class SqliteCacheBackend:
+    """
+    SQLite 檔案後端，多個 worker 行程可共用同一個快取檔。
+    值以 JSON 儲存，寫入時淘汰過期與最久未存取的項目。
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: str, max_entries: int, ttl: float):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS response_cache ("
+            " key TEXT PRIMARY KEY, value TEXT NOT NULL,"
+            " stored_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_response_cache_accessed_at ON response_cache (accessed_at)"
+        )
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, stored_at FROM response_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if now - row[1] >= self.ttl:
+                self._conn.execute("DELETE FROM response_cache WHERE key = ?", (key,))
+                return None
+            self._conn.execute("UPDATE response_cache SET accessed_at = ? WHERE key = ?", (now, key))
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO response_cache (key, value, stored_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False), now, now)
+            )
+            self._conn.execute("DELETE FROM response_cache WHERE stored_at <= ?", (now - self.ttl,))
+            self._conn.execute(
+                "DELETE FROM response_cache WHERE key IN ("
+                " SELECT key FROM response_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM response_cache")
+
+    def size(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM response_cache").fetchone()[0]
+
+
+class ResponseCache:
+    """
+    帶命中統計的回應快取。
+
+    用法示例:
+    ```python
+    from src.infrastructure.database.response_cache import polish_cache, make_cache_key
+
+    key = make_cache_key("news_polish_agent", version, model_name, prompt)
+    cached = polish_cache.get(key)
+    if cached is None:
+        cached = run_agent(...)
+        polish_cache.set(key, cached)
+
+    polish_cache.stats()  # {"backend": "memory", "hits": 3, "misses": 1, ...}
+    ```
+    """
+
+    def __init__(self, backend=None):
+        """
+        Args:
+            backend: MemoryCacheBackend 或 SqliteCacheBackend，None 表示停用快取
+        """
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self.bypasses = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        取得快取值並更新命中統計。
+
+        Args:
+            key: 快取鍵
+
+        Returns:
+            快取值，未命中或停用時返回 None
+        """
+        if self.backend is None:
+            return None
+        value = self.backend.get(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """寫入快取值（停用時不做任何事）"""
+        if self.backend is not None:
+            self.backend.set(key, value)
+
+    def record_bypass(self) -> None:
+        """記錄一次因請求要求而略過快取"""
+        with self._lock:
+            self.bypasses += 1
+
+    def clear(self) -> None:
+        """清除所有快取項目與統計"""
+        if self.backend is not None:
+            self.backend.clear()
+        with self._lock:
+            self.hits = self.misses = self.bypasses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """返回快取統計"""
+        lookups = self.hits + self.misses
+        return {
+            "backend": self.backend.name if self.backend else "none",
+            "hits": self.hits,
+            "misses": self.misses,
+            "bypasses": self.bypasses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "size": self.backend.size() if self.backend else 0,
+        }
+
+
+def create_response_cache(backend: str, path: str, max_entries: int, ttl: float) -> ResponseCache:
+    """
+    依設定建立回應快取。
+
+    Args:
+        backend: "memory"、"sqlite" 或 "none"
+        path: SQLite 後端的檔案路徑
+        max_entries: 最大項目數
+        ttl: 存活時間（秒）
+
+    Returns:
+        ResponseCache 實例
+    """
+    backend = backend.lower()
+    if backend == "sqlite":
+        try:
+            return ResponseCache(SqliteCacheBackend(path, max_entries, ttl))
+        except sqlite3.Error as e:
+            logger.warning(f"無法開啟潤稿快取檔 {path}，改用記憶體快取: {e}")
+            return ResponseCache(MemoryCacheBackend(max_entries, ttl))
+    if backend == "memory":
+        return ResponseCache(MemoryCacheBackend(max_entries, ttl))
+    return ResponseCache(None)
+
+
+# 全局潤稿回應快取實例
+polish_cache = create_response_cache(
+    settings.polish_cache_backend,
+    settings.polish_cache_path,
+    settings.polish_cache_max_entries,
+    settings.polish_cache_ttl
+)
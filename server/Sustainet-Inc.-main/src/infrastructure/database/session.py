@@ -1,20 +1,64 @@
 """
 Database connection management module.
-Provides synchronous database session management.
+Provides synchronous and asynchronous database session management.
 """
-from typing import Generator
+from typing import Any, AsyncGenerator, Dict, Generator, Optional
 from sqlalchemy import create_engine
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
 
 from src.config import settings
+# 匯入以註冊連線與交易統計的事件監聽
+from src.infrastructure.database import session_stats  # noqa: F401
+from src.infrastructure.database.pool_metrics import (
+    MeasuredAsyncQueuePool, MeasuredQueuePool, instrument_engine
+)
+
+
+def engine_options(url: URL, is_async: bool = False) -> Dict[str, Any]:
+    """
+    依 Settings 產生 engine 的連線池與連線參數。
+
+    預設不啟用 pre-ping（每次取用連線都多一次 SELECT 1 往返），
+    改以 pool_recycle 在資料庫或中介設備關閉閒置連線前主動回收。
+
+    Args:
+        url: 連線字串
+        is_async: 是否為非同步 engine
+
+    Returns:
+        create_engine / create_async_engine 的關鍵字參數
+    """
+    backend = url.get_backend_name()
+    if backend == "sqlite" and url.database in (None, "", ":memory:"):
+        # 記憶體資料庫只能使用 SQLAlchemy 預設的單一連線池
+        return {}
+
+    options: Dict[str, Any] = {
+        "poolclass": MeasuredAsyncQueuePool if is_async else MeasuredQueuePool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+    if backend == "postgresql":
+        # psycopg2 使用 connect_timeout，asyncpg 使用 timeout
+        key = "timeout" if is_async else "connect_timeout"
+        options["connect_args"] = {key: settings.db_connect_timeout}
+    elif backend == "sqlite":
+        # SQLite 的 timeout 為等待檔案鎖的秒數
+        options["connect_args"] = {"timeout": settings.db_connect_timeout}
+    return options
+
 
 # Create synchronous engine
 engine = create_engine(
-    settings.database_url_sync,  
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    settings.database_url_sync,
+    **engine_options(make_url(settings.database_url_sync))
 )
+instrument_engine(engine, "sync")
 
 # Create synchronous session factory
 SessionLocal = sessionmaker(
@@ -24,20 +68,179 @@ SessionLocal = sessionmaker(
     expire_on_commit=False,
 )
 
+
+class UnitOfWork:
+    """
+    請求範圍的工作單元（Unit of Work）。
+
+    持有單一 Session，將其綁定到所有 Repository 後，
+    Repository 方法不再各自開啟連線與 commit，整個請求只在結束時 commit 一次。
+
+    用法示例:
+    ```python
+    with UnitOfWork() as uow:
+        setup_repo = GameSetupRepository(db=uow.session)
+        state_repo = PlatformStateRepository(db=uow.session)
+        ...
+    # 區塊正常結束時 commit，發生例外時 rollback
+    ```
+    """
+
+    def __init__(self, session_factory: sessionmaker = SessionLocal):
+        """
+        Args:
+            session_factory: Session 工廠，預設為全域 SessionLocal
+        """
+        self.session_factory = session_factory
+        self.session: Optional[Session] = None
+
+    def __enter__(self) -> "UnitOfWork":
+        self.session = self.session_factory()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        try:
+            if exc_type is None:
+                self.commit()
+            else:
+                self.rollback()
+        finally:
+            self.session.close()
+
+    def commit(self) -> None:
+        """提交目前交易"""
+        self.session.commit()
+
+    def rollback(self) -> None:
+        """回滾目前交易"""
+        self.session.rollback()
+
+
 def get_db() -> Generator[Session, None, None]:
     """
     Provide a synchronous database session dependency.
     Use in FastAPI routes with Depends(get_db).
 
+    The session acts as a request-scoped unit of work: it is committed once
+    when the request finishes and rolled back if the request raises.
+
     Yields:
         SQLAlchemy Session
     """
-    db = SessionLocal()
-    try:
-        yield db
-        db.commit()
-    except Exception:
-        db.rollback()
-        raise
-    finally:
-        db.close()
+    with UnitOfWork() as uow:
+        yield uow.session
+
+
+# === 非同步資料層 ===
+
+# 同步驅動對應的非同步驅動，DATABASE_URL_ASYNC 未設定時由同步連線字串推導
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+def resolve_async_database_url(async_url: str, sync_url: str) -> str:
+    """
+    取得非同步連線字串。
+
+    Args:
+        async_url: DATABASE_URL_ASYNC，有設定時直接使用
+        sync_url: DATABASE_URL_SYNC，用於推導非同步連線字串
+
+    Returns:
+        非同步驅動的連線字串
+
+    Raises:
+        ValueError: 無法由同步連線字串推導時
+    """
+    if async_url:
+        return async_url
+    url = make_url(sync_url)
+    driver = _ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None:
+        raise ValueError(f"無法由 {url.drivername} 推導非同步連線字串，請設定 DATABASE_URL_ASYNC")
+    return url.set(drivername=driver).render_as_string(hide_password=False)
+
+
+_async_engine: Optional[AsyncEngine] = None
+
+# 非同步 Session 工廠，第一次呼叫 get_async_engine() 時綁定 engine
+AsyncSessionLocal = async_sessionmaker(
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+
+def get_async_engine() -> AsyncEngine:
+    """
+    取得非同步 engine（第一次呼叫時建立）。
+    延後建立，未使用非同步路由的部署不需要安裝 asyncpg / aiosqlite。
+    """
+    global _async_engine
+    if _async_engine is None:
+        url = resolve_async_database_url(settings.database_url_async, settings.database_url_sync)
+        _async_engine = create_async_engine(url, **engine_options(make_url(url), is_async=True))
+        instrument_engine(_async_engine.sync_engine, "async")
+        AsyncSessionLocal.configure(bind=_async_engine)
+    return _async_engine
+
+
+class AsyncUnitOfWork:
+    """
+    UnitOfWork 的非同步版本，持有單一 AsyncSession。
+
+    用法示例:
+    ```python
+    async with AsyncUnitOfWork() as uow:
+        news_repo = AsyncNewsRepository(db=uow.session)
+        news = await news_repo.get_random_active_news()
+    # 區塊正常結束時 commit，發生例外時 rollback
+    ```
+    """
+
+    def __init__(self, session_factory: Optional[async_sessionmaker] = None):
+        """
+        Args:
+            session_factory: AsyncSession 工廠，預設為全域 AsyncSessionLocal
+        """
+        self.session_factory = session_factory
+        self.session: Optional[AsyncSession] = None
+
+    async def __aenter__(self) -> "AsyncUnitOfWork":
+        if self.session_factory is None:
+            get_async_engine()
+            self.session_factory = AsyncSessionLocal
+        self.session = self.session_factory()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        try:
+            if exc_type is None:
+                await self.commit()
+            else:
+                await self.rollback()
+        finally:
+            await self.session.close()
+
+    async def commit(self) -> None:
+        """提交目前交易"""
+        await self.session.commit()
+
+    async def rollback(self) -> None:
+        """回滾目前交易"""
+        await self.session.rollback()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Provide an asynchronous database session dependency.
+    Use in async FastAPI routes with Depends(get_async_db); the route and its
+    queries run on the event loop without occupying a threadpool worker.
+
+    Yields:
+        SQLAlchemy AsyncSession
+    """
+    async with AsyncUnitOfWork() as uow:
+        yield uow.session
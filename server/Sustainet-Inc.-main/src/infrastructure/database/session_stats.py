@@ -0,0 +1,92 @@
+"""
+資料庫連線統計模組。
+以 ContextVar 追蹤單一請求（或任意程式區塊）內的連線取用與交易次數，
+用於確認一個回合只花費一次資料庫交易。
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, asdict
+from typing import Dict, Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import Pool
+
+
+@dataclass
+class SessionStats:
+    """
+    單一追蹤範圍內的資料庫使用統計。
+
+    - **connections**: 從連線池取出連線的次數
+    - **statements**: 送往資料庫的 SQL 語句次數（即資料庫往返次數）
+    - **commits**: Session commit 次數
+    - **rollbacks**: Session rollback 次數
+    """
+    connections: int = 0
+    statements: int = 0
+    commits: int = 0
+    rollbacks: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        """將統計轉換為字典"""
+        return asdict(self)
+
+
+_current_stats: ContextVar[Optional[SessionStats]] = ContextVar("db_session_stats", default=None)
+
+
+def get_current_stats() -> Optional[SessionStats]:
+    """取得目前追蹤範圍的統計，若未啟用追蹤則返回 None"""
+    return _current_stats.get()
+
+
+@contextmanager
+def track_session_stats() -> Iterator[SessionStats]:
+    """
+    上下文管理器：在區塊內統計連線與交易次數。
+
+    用法：
+    ```python
+    with track_session_stats() as stats:
+        service.player_turn(request)
+    assert stats.commits == 1
+    ```
+    """
+    stats = SessionStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+# === 私有函數 ===
+
+@event.listens_for(Pool, "checkout")
+def _on_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.connections += 1
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _on_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.statements += 1
+
+
+@event.listens_for(Session, "after_commit")
+def _on_commit(session: Session) -> None:
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.commits += 1
+
+
+@event.listens_for(Session, "after_rollback")
+def _on_rollback(session: Session) -> None:
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.rollbacks += 1
@@ -0,0 +1,244 @@
+"""
+SessionSummary repository for database operations.
+每場遊戲摘要的增量維護：寫入回合結果時以單一 UPDATE 累加，不重新掃描歷史資料。
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import Select, insert, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.infrastructure.database.async_base_repo import AsyncBaseRepository
+from src.infrastructure.database.base_repo import BaseRepository
+from src.infrastructure.database.models.session_summary import SessionSummary
+from src.infrastructure.database.utils import with_async_session, with_session
+
+# 戰況欄位（由 GameEndLogic.evaluate_standing 計算）
+STANDING_FIELDS = ("player_total_trust", "ai_total_trust", "leader", "is_ended", "winner", "end_reason")
+
+
+class SessionSummaryRepository(BaseRepository[SessionSummary]):
+    """
+    SessionSummary 資料庫 Repository 類。
+
+    用法示例:
+    ```python
+    repo = SessionSummaryRepository(db=session)
+
+    # 建立遊戲時
+    repo.create_summary("game123", round_number=1, standing=game_end_logic.evaluate_standing(1, platform_states))
+
+    # 每次寫入回合結果
+    repo.apply_turn(
+        session_id="game123", round_number=1, actor="player",
+        reach_count=120, trust_change=5,
+        standing=game_end_logic.evaluate_standing(1, platform_states)
+    )
+
+    # 讀取
+    summary = repo.get_by_session_id("game123")
+    summaries = repo.get_by_session_ids(["game123", "game456"])
+
+    # 遊戲列表（keyset 分頁：以上一頁最後一筆的排序鍵取下一頁）
+    page = repo.list_recent(limit=20, is_ended=True, winner="player")
+    next_page = repo.list_recent(limit=20, after=(page[-1].created_at, page[-1].session_id))
+    ```
+    """
+
+    model = SessionSummary
+
+    @with_session
+    def get_by_session_id(self, session_id: str, db: Optional[Session] = None) -> Optional[SessionSummary]:
+        """以主鍵取得單場摘要，不存在時返回 None"""
+        return db.get(SessionSummary, session_id)
+
+    @with_session
+    def get_by_session_ids(self, session_ids: List[str], db: Optional[Session] = None) -> Dict[str, SessionSummary]:
+        """一次取得多場摘要，返回 session_id → SessionSummary"""
+        if not session_ids:
+            return {}
+        rows = db.execute(select(SessionSummary).where(SessionSummary.session_id.in_(session_ids))).scalars()
+        return {summary.session_id: summary for summary in rows}
+
+    @with_session
+    def create_summary(
+        self,
+        session_id: str,
+        round_number: int,
+        standing: Dict[str, Any],
+        db: Optional[Session] = None
+    ) -> None:
+        """建立新遊戲的摘要（尚無任何行動），standing 為初始平台狀態的戰況"""
+        db.execute(insert(SessionSummary).values(
+            session_id=session_id,
+            latest_round=round_number,
+            **_standing_values(standing)
+        ))
+
+    @with_session
+    def advance_round(self, session_id: str, round_number: int, db: Optional[Session] = None) -> None:
+        """進入下一回合；新回合沿用上一回合的平台狀態，只更新最新回合數"""
+        db.execute(
+            update(SessionSummary)
+            .where(SessionSummary.session_id == session_id)
+            .values(latest_round=round_number)
+        )
+
+    @with_session
+    def apply_turn(
+        self,
+        session_id: str,
+        round_number: int,
+        actor: str,
+        reach_count: Optional[int],
+        trust_change: Optional[int],
+        standing: Dict[str, Any],
+        db: Optional[Session] = None
+    ) -> None:
+        """
+        累加一次行動並更新戰況（單一 UPDATE）。
+        摘要不存在時（摘要表建立前開始的遊戲）以本次行動建立，累計值只從此開始計算。
+
+        Args:
+            session_id: 遊戲識別碼
+            round_number: 回合數
+            actor: 行動者（"player" 或 "ai"）
+            reach_count: 本次觸及人數
+            trust_change: 本次信任值變化
+            standing: GameEndLogic.evaluate_standing 的結果；不含結束欄位時保留原本的結束狀態
+        """
+        prefix = "player" if actor == "player" else "ai"
+        reach_count = reach_count or 0
+        trust_change = trust_change or 0
+        counters = {
+            "action_count": 1,
+            f"{prefix}_action_count": 1,
+            f"{prefix}_reach_total": reach_count,
+            f"{prefix}_trust_change_total": trust_change,
+        }
+        state = {"latest_round": round_number, **_standing_values(standing)}
+
+        result = db.execute(
+            update(SessionSummary)
+            .where(SessionSummary.session_id == session_id)
+            .values(
+                **{name: getattr(SessionSummary, name) + value for name, value in counters.items()},
+                **state
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
+            db.execute(insert(SessionSummary).values(session_id=session_id, **counters, **state))
+
+    @with_session
+    def list_recent(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime, str]] = None,
+        is_ended: Optional[bool] = None,
+        winner: Optional[str] = None,
+        db: Optional[Session] = None
+    ) -> List[SessionSummary]:
+        """
+        依建立時間由新到舊列出遊戲（keyset 分頁）。
+
+        以 (created_at, session_id) 的列比較取代 OFFSET，每頁都只沿索引讀取 limit 筆，
+        不論翻到第幾頁耗時都相同；篩選條件對應索引的前導欄位。
+
+        Args:
+            limit: 本頁筆數
+            after: 上一頁最後一筆的 (created_at, session_id)，第一頁為 None
+            is_ended: 只列出已結束（True）或進行中（False）的遊戲
+            winner: 只列出指定勝方的遊戲
+        """
+        return list(db.execute(_recent_query(limit, after, is_ended, winner)).scalars())
+
+    @with_session
+    def list_leaderboard(
+        self,
+        limit: int,
+        after: Optional[Tuple[int, str]] = None,
+        db: Optional[Session] = None
+    ) -> List[SessionSummary]:
+        """
+        排行榜：已結束的遊戲依玩家信任值總和由高到低排列（keyset 分頁）。
+
+        Args:
+            limit: 本頁筆數
+            after: 上一頁最後一筆的 (player_total_trust, session_id)，第一頁為 None
+        """
+        return list(db.execute(_leaderboard_query(limit, after)).scalars())
+
+
+class AsyncSessionSummaryRepository(AsyncBaseRepository[SessionSummary]):
+    """
+    SessionSummary Repository 的非同步版本，供遊戲列表與排行榜的 async 路由使用。
+    查詢與 SessionSummaryRepository 相同。
+
+    用法示例:
+    ```python
+    async with AsyncUnitOfWork() as uow:
+        repo = AsyncSessionSummaryRepository(db=uow.session)
+        page = await repo.list_recent(limit=20, is_ended=True)
+        ranked = await repo.list_leaderboard(limit=20)
+    ```
+    """
+
+    model = SessionSummary
+
+    @with_async_session
+    async def list_recent(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime, str]] = None,
+        is_ended: Optional[bool] = None,
+        winner: Optional[str] = None,
+        db: Optional[AsyncSession] = None
+    ) -> List[SessionSummary]:
+        """依建立時間由新到舊列出遊戲（keyset 分頁），參數同 SessionSummaryRepository.list_recent"""
+        return list((await db.execute(_recent_query(limit, after, is_ended, winner))).scalars())
+
+    @with_async_session
+    async def list_leaderboard(
+        self,
+        limit: int,
+        after: Optional[Tuple[int, str]] = None,
+        db: Optional[AsyncSession] = None
+    ) -> List[SessionSummary]:
+        """排行榜（keyset 分頁），參數同 SessionSummaryRepository.list_leaderboard"""
+        return list((await db.execute(_leaderboard_query(limit, after))).scalars())
+
+
+# === 私有函數 ===
+
+def _standing_values(standing: Dict[str, Any]) -> Dict[str, Any]:
+    return {field: standing[field] for field in STANDING_FIELDS if field in standing}
+
+
+def _recent_query(
+    limit: int,
+    after: Optional[Tuple[datetime, str]],
+    is_ended: Optional[bool],
+    winner: Optional[str]
+) -> Select:
+    key = tuple_(SessionSummary.created_at, SessionSummary.session_id)
+    query = select(SessionSummary)
+    if is_ended is not None:
+        query = query.where(SessionSummary.is_ended == is_ended)
+    if winner is not None:
+        query = query.where(SessionSummary.winner == winner)
+    if after is not None:
+        query = query.where(key < after)
+    return query.order_by(SessionSummary.created_at.desc(), SessionSummary.session_id.desc()).limit(limit)
+
+
+def _leaderboard_query(limit: int, after: Optional[Tuple[int, str]]) -> Select:
+    key = tuple_(SessionSummary.player_total_trust, SessionSummary.session_id)
+    query = select(SessionSummary).where(SessionSummary.is_ended.is_(True))
+    if after is not None:
+        query = query.where(key < after)
+    return query.order_by(
+        SessionSummary.player_total_trust.desc(), SessionSummary.session_id.desc()
+    ).limit(limit)
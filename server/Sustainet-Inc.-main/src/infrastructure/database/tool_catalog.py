@@ -0,0 +1,134 @@
+"""
+工具目錄快取模組。
+工具定義幾乎不變，整個行程共用一份唯讀目錄，回合中解析工具不需查詢資料庫。
+工具資料表有任何寫入時自動失效，下一次使用時重新載入。
+"""
+import bisect
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+from src.domain.models.tool import DomainTool
+from src.infrastructure.database.models.tools import Tool as DbTool
+from src.utils.logger import logger
+
+
+class ToolCatalog:
+    """
+    唯讀的工具目錄快照。
+
+    - 依小寫名稱索引，供不區分大小寫的查詢
+    - 依 (actor, available_from_round) 排序索引，查詢某回合可用工具只需二分搜尋
+    """
+
+    def __init__(self, tools: Iterable[DomainTool]):
+        self._tools: Tuple[DomainTool, ...] = tuple(tools)
+        self._by_name: Dict[str, DomainTool] = {}
+        for tool in self._tools:
+            self._by_name.setdefault(tool.tool_name.lower(), tool)
+
+        self._by_actor: Dict[str, Tuple[DomainTool, ...]] = {}
+        self._rounds_by_actor: Dict[str, List[int]] = {}
+        for actor in ("player", "ai"):
+            tools = sorted(
+                (tool for tool in self._tools if tool.applicable_to in (actor, "both")),
+                key=lambda tool: tool.available_from_round
+            )
+            self._by_actor[actor] = tuple(tools)
+            self._rounds_by_actor[actor] = [tool.available_from_round for tool in tools]
+
+    def __len__(self) -> int:
+        return len(self._tools)
+
+    def get(self, name: str) -> Optional[DomainTool]:
+        """依名稱取得工具（不區分大小寫）"""
+        return self._by_name.get(name.lower())
+
+    def all(self) -> List[DomainTool]:
+        """所有工具"""
+        return list(self._tools)
+
+    def for_actor(self, actor: str) -> List[DomainTool]:
+        """指定行動者可用的所有工具（含 applicable_to 為 both 的工具）"""
+        return list(self._by_actor.get(actor, ()))
+
+    def for_round(self, actor: str, round_number: int) -> List[DomainTool]:
+        """指定行動者在某回合已解鎖的工具"""
+        rounds = self._rounds_by_actor.get(actor, [])
+        return list(self._by_actor.get(actor, ())[:bisect.bisect_right(rounds, round_number)])
+
+
+class ToolCatalogCache:
+    """
+    行程共用的工具目錄持有者，負責載入與失效。
+
+    用法示例:
+    ```python
+    from src.infrastructure.database.tool_catalog import tool_catalog
+
+    catalog = tool_catalog.get(lambda: load_tools_from_db())
+    tool = catalog.get("事實查核")
+
+    # 工具資料變更後（Tool 資料表寫入時會自動呼叫）
+    tool_catalog.invalidate()
+    ```
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._catalog: Optional[ToolCatalog] = None
+
+    @property
+    def loaded(self) -> bool:
+        """目錄是否已載入"""
+        return self._catalog is not None
+
+    def get(self, loader: Callable[[], Iterable[DomainTool]]) -> ToolCatalog:
+        """
+        取得目錄，尚未載入時以 loader 載入。
+
+        Args:
+            loader: 返回所有 DomainTool 的函數
+
+        Returns:
+            工具目錄快照
+        """
+        catalog = self._catalog
+        if catalog is not None:
+            return catalog
+
+        with self._lock:
+            if self._catalog is None:
+                self._catalog = ToolCatalog(loader())
+                logger.debug(f"工具目錄已載入 {len(self._catalog)} 筆")
+            return self._catalog
+
+    def invalidate(self) -> None:
+        """使目錄失效，下一次使用時重新載入"""
+        with self._lock:
+            self._catalog = None
+
+
+# 全局工具目錄實例
+tool_catalog = ToolCatalogCache()
+
+
+# === 私有函數 ===
+
+@event.listens_for(DbTool, "after_insert")
+@event.listens_for(DbTool, "after_update")
+@event.listens_for(DbTool, "after_delete")
+def _invalidate_on_write(mapper, connection, target) -> None:
+    tool_catalog.invalidate()
+    # 提交前其他請求可能已用舊資料重新載入，提交後再失效一次
+    session = object_session(target)
+    if session is not None:
+        session.info["tool_catalog_dirty"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    if session.info.pop("tool_catalog_dirty", False):
+        tool_catalog.invalidate()
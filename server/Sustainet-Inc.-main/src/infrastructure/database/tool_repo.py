@@ -1,13 +1,18 @@
 from typing import Optional, List
 from sqlalchemy.orm import Session
-from sqlalchemy import func # Import func for SQL functions
 from src.infrastructure.database.models.tools import Tool as DbTool
 from src.domain.models.tool import DomainTool, ToolEffect
+from src.infrastructure.database.tool_catalog import ToolCatalog, tool_catalog
 from src.infrastructure.database.utils import with_session
 
 class ToolRepository:
-    def __init__(self):
-        pass
+    """
+    工具定義的 Repository。
+    讀取操作皆由行程共用的工具目錄（tool_catalog）提供，僅在目錄載入時查詢資料庫。
+    """
+
+    def __init__(self, db: Optional[Session] = None):
+        self.db = db
 
     def _to_domain(self, db_tool: DbTool) -> DomainTool:
         """將資料庫模型 DbTool 轉換為領域模型 DomainTool。"""
@@ -25,25 +30,23 @@ class ToolRepository:
         )
 
     @with_session
+    def get_catalog(self, db: Session = None) -> ToolCatalog:
+        """取得工具目錄，尚未載入時以一次查詢載入。"""
+        return tool_catalog.get(lambda: [self._to_domain(tool) for tool in db.query(DbTool).all()])
+
     def get_tool_by_name(self, name: str, db: Session = None) -> Optional[DomainTool]:
         """根據工具名稱獲取工具定義（不區分大小寫）。"""
-        # Convert both the stored name and the input name to lowercase for comparison
-        db_tool = db.query(DbTool).filter(func.lower(DbTool.tool_name) == func.lower(name)).first()
-        if db_tool:
-            return self._to_domain(db_tool)
-        return None
+        return self.get_catalog(db=db).get(name)
 
-    @with_session
     def list_tools_for_actor(self, actor: str = "player", db: Session = None) -> List[DomainTool]:
         """獲取指定行動者（預設為 player）可用的所有工具。"""
         # TODO: Filter by is_active if such a field is added to DbTool
-        db_tools = db.query(DbTool).filter(
-            (DbTool.applicable_to == actor) | (DbTool.applicable_to == "both")
-        ).all()
-        return [self._to_domain(tool) for tool in db_tools]
+        return self.get_catalog(db=db).for_actor(actor)
+
+    def list_tools_for_round(self, actor: str, round_number: int, db: Session = None) -> List[DomainTool]:
+        """獲取指定行動者在某回合已解鎖的工具。"""
+        return self.get_catalog(db=db).for_round(actor, round_number)
 
-    @with_session
     def list_all_tools(self, db: Session = None) -> List[DomainTool]:
         """獲取資料庫中定義的所有工具。"""
-        db_tools = db.query(DbTool).all()
-        return [self._to_domain(tool) for tool in db_tools] 
\ No newline at end of file
+        return self.get_catalog(db=db).all()
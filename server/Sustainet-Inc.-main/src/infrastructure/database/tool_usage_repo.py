@@ -1,13 +1,14 @@
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from src.infrastructure.database.models.toolusage import ToolUsage as DbToolUsage
 from src.domain.models.tool import AppliedToolEffectDetail # Using the domain model for details
 from src.infrastructure.database.utils import with_session # Import the decorator
 
 class ToolUsageRepository:
-    # __init__ no longer takes db_session
-    def __init__(self):
-        pass
+    # db: optional request-scoped session shared with the other repositories
+    def __init__(self, db: Optional[Session] = None):
+        self.db = db
 
     @with_session # Apply decorator
     def create_tool_usage_record(
@@ -31,6 +32,28 @@ class ToolUsageRepository:
         # db.refresh(db_record) # To get generated values like id
         return db_record
     
+    @with_session
+    def create_tool_usage_records(
+        self,
+        action_id: int,
+        usage_details: List[AppliedToolEffectDetail],
+        db: Session = None
+    ) -> int:
+        """以單一多列 INSERT 寫入同一行動的所有工具使用記錄，返回寫入筆數。"""
+        rows = [
+            {
+                "action_id": action_id,
+                "tool_name": detail.tool_name,
+                "trust_effect": detail.applied_trust_effect_value,
+                "spread_effect": detail.applied_spread_effect_value,
+                "is_effective": detail.is_effective
+            }
+            for detail in usage_details
+        ]
+        if rows:
+            db.execute(insert(DbToolUsage).values(rows))
+        return len(rows)
+    
     @with_session
     def get_by_action_id(self, action_id: int, db: Session = None) -> List[DbToolUsage]:
         """取得指定行動的所有工具使用記錄。"""
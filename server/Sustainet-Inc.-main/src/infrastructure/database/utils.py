@@ -3,10 +3,12 @@
 提供資料庫操作的輔助功能。
 """
 import functools
+import time
 from typing import TypeVar, Callable, Any, Optional
 from sqlalchemy.orm import Session
 
-from src.infrastructure.database.session import get_db
+from src.infrastructure.database.session import AsyncSessionLocal, SessionLocal, get_async_engine
+from src.utils.metrics import repository_call_seconds
 
 T = TypeVar('T')
 
@@ -14,7 +16,8 @@ def with_session(func: Callable[..., T]) -> Callable[..., T]:
     """
     裝飾器：自動處理 session 的創建和關閉。
     
-    當函數的 db 參數為 None 時，自動創建一個新的 session。
+    當函數的 db 參數為 None 時，優先使用 Repository 實例上綁定的 session（self.db），
+    此時由外部的工作單元（UnitOfWork）負責 commit；若未綁定，才自動創建一個新的 session。
     函數執行完畢後自動關閉 session（如果是由裝飾器創建的）。
     
     用法：
@@ -33,13 +36,20 @@ def with_session(func: Callable[..., T]) -> Callable[..., T]:
     """
     @functools.wraps(func)
     def wrapper(*args, **kwargs) -> T:
+        start = time.perf_counter()
         # 檢查是否已提供 db
         db = kwargs.get('db')
         own_session = False
         
-        # 如果沒有提供 db，創建一個新的
+        # 如果沒有提供 db，先使用 Repository 綁定的 session
+        if db is None and args:
+            db = getattr(args[0], 'db', None)
+            if db is not None:
+                kwargs['db'] = db
+
+        # 仍然沒有 session，創建一個新的
         if db is None:
-            db = next(get_db())
+            db = SessionLocal()
             kwargs['db'] = db
             own_session = True
         
@@ -61,9 +71,41 @@ def with_session(func: Callable[..., T]) -> Callable[..., T]:
             # 如果我們創建了自己的 session，則關閉
             if own_session:
                 db.close()
+            _observe_call(args, func, start)
     
     return wrapper
 
+def with_async_session(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    裝飾器：with_session 的非同步版本，用於 async 的 Repository 方法。
+
+    當 db 參數為 None 時，優先使用 Repository 綁定的 AsyncSession（self.db），
+    由外部的 AsyncUnitOfWork 負責 commit；若未綁定，才自動創建、提交並關閉一個新的 AsyncSession。
+
+    用法：
+    ```python
+    @with_async_session
+    async def get_entity(self, id: int, db: AsyncSession = None) -> Entity:
+        return await db.get(Entity, id)
+    ```
+
+    Args:
+        func: 要裝飾的協程函數，必須有一個名為 db 的參數，類型為 AsyncSession，且可為 None
+
+    Returns:
+        裝飾後的協程函數
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return await _call_with_async_session(func, args, kwargs)
+        finally:
+            _observe_call(args, func, start)
+
+    return wrapper
+
+
 def manage_session(db: Optional[Session] = None):
     """
     上下文管理器函數：提供一個可在 with 中使用的 session 管理器。
@@ -89,7 +131,7 @@ def manage_session(db: Optional[Session] = None):
         return
         
     # 創建新的 session
-    session = next(get_db())
+    session = SessionLocal()
     
     try:
         # 提供 session 給調用者
@@ -102,4 +144,38 @@ def manage_session(db: Optional[Session] = None):
         raise
     finally:
         # 總是關閉自己創建的 session
-        session.close()
\ No newline at end of file
+        session.close()
+
+
+# === 私有函數 ===
+
+def _observe_call(args, func: Callable[..., Any], start: float) -> None:
+    """記錄 Repository 方法耗時（以實際的 Repository 類別為標籤）"""
+    repository = type(args[0]).__name__ if args else func.__module__
+    repository_call_seconds.labels(repository, func.__name__).observe(time.perf_counter() - start)
+
+
+async def _call_with_async_session(func: Callable[..., Any], args, kwargs) -> Any:
+    """with_async_session 的實作：決定使用的 AsyncSession 並在自行建立時負責提交與關閉"""
+    db = kwargs.get('db')
+
+    # 如果沒有提供 db，先使用 Repository 綁定的 session
+    if db is None and args:
+        db = getattr(args[0], 'db', None)
+        if db is not None:
+            kwargs['db'] = db
+
+    if db is not None:
+        return await func(*args, **kwargs)
+
+    # 仍然沒有 session，創建一個新的並負責提交與關閉
+    get_async_engine()
+    async with AsyncSessionLocal() as db:
+        kwargs['db'] = db
+        try:
+            result = await func(*args, **kwargs)
+            await db.commit()
+            return result
+        except Exception:
+            await db.rollback()
+            raise
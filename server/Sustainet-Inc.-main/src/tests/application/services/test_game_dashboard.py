@@ -0,0 +1,102 @@
+"""
+遊戲面板（Dashboard）服務與路由的測試
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from src.application.dto.game_dto import ArticleMeta, GameDashboardRequest, PlayerTurnRequest, ToolUsed
+from src.infrastructure.database.models.news import News
+from src.infrastructure.database.models.tools import Tool
+from src.infrastructure.database.session import AsyncUnitOfWork, UnitOfWork, get_async_db
+
+
+def start_game(session_factory, build_game_service) -> str:
+    with UnitOfWork(session_factory) as uow:
+        uow.session.add(News(
+            title="太陽能板污染？", content="部分研究指出太陽能板製程有污染",
+            veracity="partial", category="energy", source="綠色論壇", is_active=True
+        ))
+        uow.session.add(Tool(
+            tool_name="事實查核", description="查核", trust_effect=1.2,
+            spread_effect=0.9, applicable_to="player", available_from_round=1
+        ))
+    with UnitOfWork(session_factory) as uow:
+        return build_game_service(uow.session).start_game().session_id
+
+
+@pytest.fixture
+def session_id(session_factory, build_game_service):
+    return start_game(session_factory, build_game_service)
+
+
+def play_player_turn(session_factory, build_game_service, session_id):
+    with UnitOfWork(session_factory) as uow:
+        build_game_service(uow.session).player_turn(PlayerTurnRequest(
+            session_id=session_id,
+            round_number=1,
+            article=ArticleMeta(
+                title="澄清", content="太陽能板污染極低", author="player",
+                published_date="2025-05-21T14:45:00", target_platform="Facebook"
+            ),
+            tool_used=[ToolUsed(tool_name="事實查核")]
+        ))
+
+
+class TestGameDashboard:
+    """測試面板內容與 ETag / If-None-Match"""
+
+    def test_dashboard_reports_round_actions_and_tools(self, session_factory, build_game_service, session_id):
+        play_player_turn(session_factory, build_game_service, session_id)
+
+        with UnitOfWork(session_factory) as uow:
+            dashboard = build_game_service(uow.session).get_game_dashboard(
+                GameDashboardRequest(session_id=session_id)
+            )
+
+        assert dashboard.current_round.round_number == 1
+        assert dashboard.current_round.ai_news is not None
+        assert dashboard.current_round.player_response["content"] == "太陽能板污染極低"
+        assert len(dashboard.platform_status) == 3
+        assert {status.trust_trend for status in dashboard.platform_status} == {"→"}
+        assert dashboard.game_progress["current_round"] == 1
+
+    @pytest.fixture
+    def client(self, async_session_factory):
+        """面板路由使用非同步 Session；資料以同一個 SQLite 檔案的同步 Session 準備"""
+        from main import app
+
+        async_factory, _ = async_session_factory
+
+        async def override_async_db():
+            async with AsyncUnitOfWork(async_factory) as uow:
+                yield uow.session
+
+        app.dependency_overrides[get_async_db] = override_async_db
+        try:
+            with TestClient(app) as client:
+                yield client
+        finally:
+            app.dependency_overrides.clear()
+
+    def test_if_none_match_returns_304_until_state_changes(self, client, async_session_factory, build_game_service):
+        _, session_factory = async_session_factory
+        session_id = start_game(session_factory, build_game_service)
+        url = f"/api/games/dashboard/{session_id}"
+        first = client.get(url)
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+        assert first.json()["session_id"] == session_id
+
+        cached = client.get(url, headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert cached.headers["etag"] == etag
+
+        play_player_turn(session_factory, build_game_service, session_id)
+        changed = client.get(url, headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+        assert changed.json()["current_round"]["player_response"] is not None
+
+    def test_unknown_session_returns_404(self, client):
+        assert client.get("/api/games/dashboard/game_missing").status_code == 404
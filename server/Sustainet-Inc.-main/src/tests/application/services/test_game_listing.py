@@ -0,0 +1,139 @@
+"""
+遊戲列表與排行榜（keyset 分頁）的服務與路由測試
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.infrastructure.database.models.session_summary import SessionSummary
+from src.infrastructure.database.session import AsyncUnitOfWork, UnitOfWork, get_async_db
+from src.utils.exceptions import ValidationError
+from src.utils.pagination import decode_cursor, encode_cursor
+
+START = datetime(2026, 10, 1, 12, 0, 0)
+WINNERS = [None, "player", "ai"]
+
+
+def seed_summaries(session_factory):
+    """30 場遊戲；每兩場共用同一個建立時間，以 session_id 區分先後"""
+    with UnitOfWork(session_factory) as uow:
+        for i in range(30):
+            winner = WINNERS[i % 3]
+            uow.session.add(SessionSummary(
+                session_id=f"game_{i:02d}",
+                created_at=START + timedelta(minutes=i // 2),
+                latest_round=2 if winner else 1,
+                player_total_trust=100 + i,
+                ai_total_trust=100,
+                leader="player",
+                is_ended=winner is not None,
+                winner=winner,
+                end_reason="max_rounds_reached" if winner else None
+            ))
+
+
+@pytest.fixture
+def seed(session_factory):
+    seed_summaries(session_factory)
+
+
+def all_pages(fetch, limit: int):
+    pages, cursor = [], None
+    while True:
+        page = fetch(limit, cursor)
+        pages.append([item.session_id for item in page.items])
+        cursor = page.next_cursor
+        if cursor is None:
+            return pages
+
+
+@pytest.mark.usefixtures("seed")
+class TestGameListing:
+    """測試分頁順序、篩選與游標"""
+
+    def test_pages_walk_every_game_in_recency_order(self, session_factory, build_game_service):
+        with UnitOfWork(session_factory) as uow:
+            service = build_game_service(uow.session)
+            pages = all_pages(lambda limit, cursor: service.list_games(limit, cursor=cursor), 7)
+
+        assert [len(page) for page in pages] == [7, 7, 7, 7, 2]
+        assert sum(pages, []) == [f"game_{i:02d}" for i in reversed(range(30))]
+
+    def test_filters_are_applied_on_every_page(self, session_factory, build_game_service):
+        with UnitOfWork(session_factory) as uow:
+            service = build_game_service(uow.session)
+            ai_wins = sum(all_pages(
+                lambda limit, cursor: service.list_games(limit, cursor=cursor, winner="ai"), 3
+            ), [])
+            active = sum(all_pages(
+                lambda limit, cursor: service.list_games(limit, cursor=cursor, status="active"), 4
+            ), [])
+
+        assert ai_wins == [f"game_{i:02d}" for i in reversed(range(30)) if i % 3 == 2]
+        assert active == [f"game_{i:02d}" for i in reversed(range(30)) if i % 3 == 0]
+
+    def test_leaderboard_lists_ended_games_by_player_trust(self, session_factory, build_game_service):
+        with UnitOfWork(session_factory) as uow:
+            service = build_game_service(uow.session)
+            ranked = sum(all_pages(lambda limit, cursor: service.get_leaderboard(limit, cursor=cursor), 6), [])
+
+        assert ranked == [f"game_{i:02d}" for i in reversed(range(30)) if i % 3 != 0]
+
+    @pytest.mark.parametrize("cursor", [
+        "not-base64!", "WzEsMl0", "bnVsbA",
+        encode_cursor({"key": "not-a-date", "session_id": "game_01"}),
+        encode_cursor({"key": START.isoformat(), "session_id": 1}),
+    ])
+    def test_invalid_cursor_is_rejected(self, session_factory, cursor, build_game_service):
+        with UnitOfWork(session_factory) as uow:
+            with pytest.raises(ValidationError) as exc_info:
+                build_game_service(uow.session).list_games(10, cursor=cursor)
+        assert exc_info.value.error_code == "INVALID_CURSOR"
+
+    def test_next_cursor_uses_the_shared_format(self, session_factory, build_game_service):
+        with UnitOfWork(session_factory) as uow:
+            page = build_game_service(uow.session).get_leaderboard(3)
+        assert set(decode_cursor(page.next_cursor)) == {"key", "session_id"}
+
+
+class TestGameListingRoutes:
+    """測試 /api/games 與 /api/games/leaderboard（非同步 Session）"""
+
+    @pytest.fixture
+    def client(self, async_session_factory):
+        from main import app
+
+        async_factory, sync_factory = async_session_factory
+        seed_summaries(sync_factory)
+
+        async def override_async_db():
+            async with AsyncUnitOfWork(async_factory) as uow:
+                yield uow.session
+
+        app.dependency_overrides[get_async_db] = override_async_db
+        try:
+            with TestClient(app) as client:
+                yield client
+        finally:
+            app.dependency_overrides.clear()
+
+    def test_list_games_follows_next_cursor(self, client):
+        first = client.get("/api/games", params={"status": "ended", "limit": 5})
+        assert first.status_code == 200
+        body = first.json()
+        assert len(body["items"]) == 5
+        assert all(item["is_ended"] for item in body["items"])
+
+        second = client.get("/api/games", params={"status": "ended", "limit": 5, "cursor": body["next_cursor"]})
+        assert second.status_code == 200
+        assert second.json()["items"][0]["created_at"] <= body["items"][-1]["created_at"]
+
+    def test_leaderboard_route(self, client):
+        body = client.get("/api/games/leaderboard", params={"limit": 3}).json()
+        assert [item["player_total_trust"] for item in body["items"]] == [129, 128, 126]
+
+    def test_invalid_parameters(self, client):
+        assert client.get("/api/games", params={"cursor": "bnVsbA"}).status_code == 400
+        assert client.get("/api/games", params={"status": "paused"}).status_code == 422
+        assert client.get("/api/games", params={"limit": 0}).status_code == 422
@@ -0,0 +1,180 @@
+"""
+遊戲 WebSocket 頻道的測試
+"""
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from src.api.routes import game_socket
+from src.api.routes.base import get_game_service_builder, get_session_factory
+from src.config import settings
+from src.infrastructure.database.models.action_record import ActionRecord
+from src.infrastructure.database.models.news import News
+from src.infrastructure.database.session import UnitOfWork
+
+PLAYER_ARTICLE = {
+    "title": "澄清", "content": "太陽能板污染極低", "author": "player",
+    "published_date": "2025-05-21T14:45:00", "target_platform": "Facebook"
+}
+
+
+def receive_until(websocket, message_type):
+    """接收訊息直到指定類型，返回途中收到的全部訊息"""
+    messages = []
+    while True:
+        message = websocket.receive_json()
+        messages.append(message)
+        if message["type"] == message_type:
+            return messages
+
+
+@pytest.fixture
+def session_id(session_factory, build_game_service):
+    with UnitOfWork(session_factory) as uow:
+        uow.session.add(News(
+            title="太陽能板污染？", content="部分研究指出太陽能板製程有污染",
+            veracity="partial", category="energy", source="綠色論壇", is_active=True
+        ))
+    with UnitOfWork(session_factory) as uow:
+        return build_game_service(uow.session)._create_game().session_id
+
+
+@pytest.fixture
+def client(session_factory, build_game_service):
+    from main import app
+
+    app.dependency_overrides[get_session_factory] = lambda: session_factory
+    app.dependency_overrides[get_game_service_builder] = lambda: build_game_service
+    try:
+        with TestClient(app) as client:
+            yield client
+    finally:
+        app.dependency_overrides.clear()
+
+
+class TestGameSocket:
+    """測試連線、行動訊息、儀表板差異與心跳"""
+
+    def test_player_turn_and_next_round(self, client, session_factory, session_id):
+        with client.websocket_connect(f"/api/games/ws/{session_id}") as websocket:
+            connected = websocket.receive_json()
+            assert connected["type"] == "connected"
+            assert connected["round_number"] == 1
+            assert len(connected["platform_status"]) == 3
+
+            websocket.send_json({"type": "player_turn", "article": PLAYER_ARTICLE})
+            messages = receive_until(websocket, "result")
+            assert messages[0]["type"] == "started"
+            assert messages[-1]["action"] == "player_turn"
+            assert messages[-1]["data"]["actor"] == "player"
+            # 結果送出前已 commit，其他連線可以讀到玩家行動
+            with UnitOfWork(session_factory) as uow:
+                actors = [record.actor for record in uow.session.query(ActionRecord).filter_by(session_id=session_id)]
+            assert actors == ["player"]
+
+            dashboard = websocket.receive_json()
+            assert dashboard["type"] == "dashboard"
+            for changed in dashboard["changes"].values():
+                assert set(changed) <= {"player_trust", "ai_trust", "spread_rate"}
+
+            websocket.send_json({"type": "next_round"})
+            result = receive_until(websocket, "result")[-1]
+            assert result["data"]["round_number"] == 2
+            assert result["data"]["actor"] == "ai"
+
+    def test_ping_and_invalid_messages(self, client, session_id):
+        with client.websocket_connect(f"/api/games/ws/{session_id}") as websocket:
+            websocket.receive_json()
+
+            websocket.send_json({"type": "ping"})
+            assert websocket.receive_json() == {"type": "pong"}
+
+            websocket.send_json({"type": "teleport"})
+            error = websocket.receive_json()
+            assert error["type"] == "error"
+            assert error["status_code"] == 400
+
+            websocket.send_json({"type": "player_turn"})
+            assert websocket.receive_json()["status_code"] == 400
+
+            websocket.send_text("not json")
+            assert websocket.receive_json()["status_code"] == 400
+
+    def test_unknown_session_is_closed(self, client):
+        with client.websocket_connect("/api/games/ws/game_missing") as websocket:
+            with pytest.raises(WebSocketDisconnect) as exc_info:
+                websocket.receive_json()
+        assert exc_info.value.code == game_socket.WS_CLOSE_SESSION_NOT_FOUND
+
+    def test_heartbeat_timeout_closes_connection(self, client, session_id, monkeypatch):
+        monkeypatch.setattr(settings, "ws_heartbeat_interval", 0.05)
+        monkeypatch.setattr(settings, "ws_heartbeat_timeout", 0.12)
+
+        with client.websocket_connect(f"/api/games/ws/{session_id}") as websocket:
+            assert websocket.receive_json()["heartbeat_interval"] == 0.05
+            assert websocket.receive_json() == {"type": "ping"}
+            with pytest.raises(WebSocketDisconnect) as exc_info:
+                while True:
+                    websocket.receive_json()
+        assert exc_info.value.code == game_socket.WS_CLOSE_HEARTBEAT_TIMEOUT
+
+
+class TestGameChannel:
+    """測試連線不持有資料庫交易"""
+
+    def test_no_transaction_is_held_between_or_during_agent_calls(
+        self, session_factory, fake_agent_factory, build_game_service, session_id, monkeypatch
+    ):
+        sessions, calls = [], []
+        run = fake_agent_factory.arun_agent_by_name
+
+        async def arun_agent_by_name(*args, **kwargs):
+            calls.append([session.in_transaction() for session in sessions])
+            return await run(*args, **kwargs)
+        monkeypatch.setattr(fake_agent_factory, "arun_agent_by_name", arun_agent_by_name)
+
+        def build_service(db):
+            sessions.append(db)
+            return build_game_service(db)
+
+        async def play():
+            channel = game_socket.GameChannel(session_id, session_factory, build_service)
+            await channel.open()
+            opened = [session.in_transaction() for session in sessions]
+            replies = [reply async for reply in channel.handle({"type": "player_turn", "article": PLAYER_ARTICLE})]
+            replies += [reply async for reply in channel.handle({"type": "next_round"})]
+            return opened, replies
+
+        opened, replies = asyncio.run(play())
+
+        assert opened == [False]
+        assert [reply["action"] for reply in replies if reply["type"] == "result"] == ["player_turn", "next_round"]
+        assert len(sessions) == 3
+        assert calls and not any(any(in_transaction) for in_transaction in calls)
+
+
+class TestOutbox:
+    """測試傳送佇列已滿時的處理"""
+
+    def test_drops_tokens_but_keeps_other_messages(self):
+        async def fill():
+            outbox = game_socket.Outbox(maxsize=2)
+            assert await outbox.put({"type": "token", "delta": "a"})
+            assert await outbox.put({"type": "stage", "stage": "state_loaded"})
+            assert not await outbox.put({"type": "token", "delta": "b"})
+            assert not await outbox.put({"type": "ping"})
+
+            # 非可丟棄訊息會等待佇列空出
+            blocked = asyncio.create_task(outbox.put({"type": "result"}))
+            await asyncio.sleep(0)
+            assert not blocked.done()
+            outbox.queue.get_nowait()
+            assert await blocked
+            return outbox
+
+        outbox = asyncio.run(fill())
+
+        assert outbox.dropped == 2
+        assert [outbox.queue.get_nowait()["type"] for _ in range(2)] == ["stage", "result"]
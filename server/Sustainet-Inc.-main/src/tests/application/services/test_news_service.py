@@ -0,0 +1,55 @@
+"""
+NewsService 資料庫端分頁的測試
+"""
+import pytest
+
+from src.application.services.news_service import NewsService
+from src.infrastructure.database.models.news import News
+from src.infrastructure.database.session import UnitOfWork
+from src.infrastructure.database.session_stats import track_session_stats
+from src.utils.exceptions import ValidationError
+
+
+class TestNewsListPagination:
+    """測試 list_news 的 OFFSET 與 keyset 分頁"""
+
+    @pytest.fixture
+    def service(self, session_factory):
+        with UnitOfWork(session_factory) as uow:
+            for i in range(25):
+                uow.session.add(News(
+                    title=f"新聞{i}", content="這是一則測試用的新聞內容", veracity="true",
+                    category="energy", source="來源", is_active=i % 5 != 0
+                ))
+            uow.session.flush()
+            yield NewsService(db=uow.session)
+
+    def test_offset_page_reads_only_requested_rows(self, service):
+        with track_session_stats() as stats:
+            page = service.list_news(skip=10, limit=5)
+
+        # 一次分頁查詢 + 一次 COUNT
+        assert stats.statements == 2
+        assert [item.title for item in page.items] == [f"新聞{i}" for i in range(10, 15)]
+        assert page.total == 25
+        assert page.next_cursor is not None
+
+    def test_cursor_walks_all_active_news(self, service):
+        seen, cursor = [], None
+        while True:
+            page = service.list_news(limit=7, active_only=True, cursor=cursor)
+            seen.extend(item.news_id for item in page.items)
+            assert page.total == 20
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert len(seen) == 20
+        assert seen == sorted(seen)
+
+    def test_estimated_total_falls_back_to_count(self, service):
+        assert service.list_news(limit=1, estimate_total=True).total == 25
+
+    def test_invalid_cursor_raises(self, service):
+        with pytest.raises(ValidationError):
+            service.list_news(cursor="not-a-cursor")
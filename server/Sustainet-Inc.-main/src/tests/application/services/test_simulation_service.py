@@ -0,0 +1,63 @@
+"""
+模擬服務（多行程、串流輸出、持久化模式）的測試
+"""
+import dataclasses
+import json
+import random
+
+from src.application.services.simulation_service import SimulationService
+from src.config.game_config import game_config
+from src.domain.logic.simulation import RandomPlayerPolicy
+from src.infrastructure.database.models.action_record import ActionRecord
+from src.infrastructure.database.models.news import News
+from src.infrastructure.database.session import UnitOfWork
+
+
+def read_results(path):
+    results = {}
+    for line in path.read_text().splitlines():
+        result = json.loads(line)
+        result.pop("duration_ms")
+        results[result["seed"]] = result
+    return results
+
+
+class TestSimulationService:
+    """測試結果檔與彙總"""
+
+    def test_process_pool_matches_inline_run(self, tmp_path):
+        service = SimulationService(player_policy=RandomPlayerPolicy())
+        config = dataclasses.replace(game_config, max_rounds=3)
+
+        inline = service.run(games=12, output_path=str(tmp_path / "inline.jsonl"), workers=1, chunk_size=5, config=config)
+        pooled = service.run(games=12, output_path=str(tmp_path / "pooled.jsonl"), workers=2, chunk_size=5, config=config)
+
+        assert inline.games == pooled.games == 12
+        assert read_results(tmp_path / "inline.jsonl") == read_results(tmp_path / "pooled.jsonl")
+        summary = inline.to_dict()
+        assert sum(inline.winners.values()) == 12
+        assert summary["avg_rounds"] == 3.0
+
+    def test_persisted_games_write_through_game_service(self, tmp_path, session_factory):
+        with UnitOfWork(session_factory) as uow:
+            uow.session.add_all([
+                News(title="太陽能板污染？", content="部分研究指出太陽能板製程有污染",
+                     veracity="partial", category="energy", source="綠色論壇", is_active=True),
+                News(title="風電噪音", content="居民抱怨風機噪音影響睡眠",
+                     veracity="true", category="energy", source="地方新聞", is_active=True),
+            ])
+
+        caller_state = random.getstate()
+        summary = SimulationService().run(
+            games=2, output_path=str(tmp_path / "persisted.jsonl"), workers=1,
+            config=dataclasses.replace(game_config, max_rounds=2),
+            persist=True, session_factory=session_factory
+        )
+
+        results = read_results(tmp_path / "persisted.jsonl")
+        assert summary.games == 2
+        assert random.getstate() == caller_state
+        assert {result["rounds"] for result in results.values()} == {2}
+        with UnitOfWork(session_factory) as uow:
+            # 每場 2 回合 × (AI + 玩家)
+            assert uow.session.query(ActionRecord).count() == 8
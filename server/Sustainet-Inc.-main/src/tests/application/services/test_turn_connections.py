@@ -0,0 +1,95 @@
+"""
+非同步回合等待 Agent 時不佔用資料庫連線的測試
+"""
+import asyncio
+
+import pytest
+
+from src.application.dto.game_dto import ArticleMeta, PlayerTurnRequest
+from src.infrastructure.database.game_round_repo import GameRoundRepository
+from src.infrastructure.database.game_state_store import game_state_store
+from src.infrastructure.database.models.action_record import ActionRecord
+from src.infrastructure.database.models.game_round import GameRound
+from src.infrastructure.database.models.game_setup import GameSetup
+from src.infrastructure.database.models.news import News
+from src.infrastructure.database.models.platform_state import PlatformState
+from src.infrastructure.database.models.session_summary import SessionSummary
+from src.infrastructure.database.session import UnitOfWork
+
+
+@pytest.fixture
+def agent_calls(monkeypatch, fake_agent_factory):
+    """記錄每次 Agent 呼叫時，請求範圍的 Session 是否仍在交易中（持有連線）"""
+    calls = []
+    run = fake_agent_factory.arun_agent_by_name
+
+    def watch(session):
+        async def arun_agent_by_name(*args, **kwargs):
+            calls.append((kwargs.get("agent_name"), session.in_transaction()))
+            return await run(*args, **kwargs)
+        monkeypatch.setattr(fake_agent_factory, "arun_agent_by_name", arun_agent_by_name)
+
+    return calls, watch
+
+
+class TestTurnConnections:
+    """測試等待 Agent 前已結束共用 Session 的交易"""
+
+    @pytest.fixture(autouse=True)
+    def seed(self, session_factory):
+        with UnitOfWork(session_factory) as uow:
+            uow.session.add(News(
+                title="太陽能板污染？", content="部分研究指出太陽能板製程有污染",
+                veracity="partial", category="energy", source="綠色論壇", is_active=True
+            ))
+
+    def test_player_turn_waits_for_gm_without_a_connection(self, session_factory, build_game_service, agent_calls):
+        with UnitOfWork(session_factory) as uow:
+            session_id = build_game_service(uow.session)._create_game().session_id
+        # 熱資料存放未命中，回合需從資料庫重建遊戲狀態
+        game_state_store.invalidate()
+        calls, watch = agent_calls
+
+        with UnitOfWork(session_factory) as uow:
+            watch(uow.session)
+            asyncio.run(build_game_service(uow.session).aplayer_turn(PlayerTurnRequest(
+                session_id=session_id,
+                round_number=1,
+                article=ArticleMeta(
+                    title="澄清", content="太陽能板污染極低", author="player",
+                    published_date="2025-05-21T14:45:00", target_platform="Facebook"
+                )
+            )))
+
+        assert calls == [("game_master_agent", False)]
+        with UnitOfWork(session_factory) as uow:
+            assert uow.session.query(ActionRecord).filter_by(session_id=session_id, actor="player").count() == 1
+
+    def test_ai_turn_waits_for_agents_without_a_connection(self, session_factory, build_game_service, agent_calls):
+        calls, watch = agent_calls
+
+        with UnitOfWork(session_factory) as uow:
+            watch(uow.session)
+            response = asyncio.run(build_game_service(uow.session).astart_game())
+
+        assert [name for name, _ in calls] == ["fake_news_agent", "game_master_agent"]
+        assert all(not in_transaction for _, in_transaction in calls)
+        with UnitOfWork(session_factory) as uow:
+            assert GameRoundRepository(db=uow.session).get_by_session_and_round(response.session_id, 1) is not None
+
+    def test_failed_first_ai_turn_deletes_the_new_game(
+        self, session_factory, fake_agent_factory, build_game_service, monkeypatch
+    ):
+        async def arun_agent_by_name(*args, **kwargs):
+            raise TimeoutError("agent timed out")
+        monkeypatch.setattr(fake_agent_factory, "arun_agent_by_name", arun_agent_by_name)
+
+        with pytest.raises(Exception):
+            with UnitOfWork(session_factory) as uow:
+                asyncio.run(build_game_service(uow.session).astart_game())
+
+        # 呼叫端沒有取得 session_id，不應留下無法接續的遊戲
+        with UnitOfWork(session_factory) as uow:
+            for model in (GameSetup, PlatformState, GameRound, SessionSummary, ActionRecord):
+                assert uow.session.query(model).count() == 0
+        assert game_state_store.size() == 0
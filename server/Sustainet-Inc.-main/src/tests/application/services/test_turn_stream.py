@@ -0,0 +1,114 @@
+"""
+串流回合（SSE）的測試
+"""
+import asyncio
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.routes.base import get_game_service_builder, get_session_factory
+from src.application.dto.game_dto import AiTurnRequest
+from src.infrastructure.database.models.action_record import ActionRecord
+from src.infrastructure.database.models.news import News
+from src.infrastructure.database.session import UnitOfWork
+
+
+def parse_sse(body: str):
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+@pytest.fixture
+def streaming_agent_factory(fake_agent_factory):
+    """輸出片段會轉交 on_token 的 AgentFactory 替身"""
+    run = fake_agent_factory.run_agent_by_name
+
+    async def arun_agent_by_name(session_id, agent_name, variables, input_text=None, response_model=None,
+                                 on_token=None, **kwargs):
+        result = run(session_id, agent_name, variables, input_text, response_model)
+        if on_token is not None:
+            for delta in ("片段一", "片段二"):
+                on_token(delta)
+        return result
+
+    fake_agent_factory.arun_agent_by_name = arun_agent_by_name
+    return fake_agent_factory
+
+
+@pytest.fixture
+def session_id(session_factory, streaming_agent_factory, build_game_service):
+    with UnitOfWork(session_factory) as uow:
+        uow.session.add(News(
+            title="太陽能板污染？", content="部分研究指出太陽能板製程有污染",
+            veracity="partial", category="energy", source="綠色論壇", is_active=True
+        ))
+    with UnitOfWork(session_factory) as uow:
+        return build_game_service(uow.session, streaming_agent_factory)._create_game().session_id
+
+
+class TestTurnStream:
+    """測試事件順序、Agent 片段與最終結果"""
+
+    def test_service_streams_stages_tokens_and_result(
+        self, session_factory, streaming_agent_factory, build_game_service, session_id
+    ):
+        async def collect():
+            with UnitOfWork(session_factory) as uow:
+                service = build_game_service(uow.session, streaming_agent_factory)
+                return [event async for event in service.astream_ai_turn(AiTurnRequest(session_id=session_id, round_number=1))]
+
+        events = asyncio.run(collect())
+
+        assert events[0].event == "started"
+        assert events[-1].event == "result"
+        assert events[-1].data["actor"] == "ai"
+        stages = [event.data["stage"] for event in events if event.event == "stage"]
+        assert stages == ["state_loaded", "article_drafted", "gm_evaluating", "tool_effects_applied", "state_persisted"]
+        tokens = [(event.data["agent"], event.data["delta"]) for event in events if event.event == "token"]
+        assert tokens == [
+            ("fake_news_agent", "片段一"), ("fake_news_agent", "片段二"),
+            ("game_master_agent", "片段一"), ("game_master_agent", "片段二"),
+        ]
+        # 假新聞片段在文章完成前送出，GM 片段在 GM 評估開始之後
+        names = [event.data.get("stage") or event.data.get("agent") for event in events]
+        assert names.index("article_drafted") > 2
+        assert names.index("gm_evaluating") < len(names) - names[::-1].index("game_master_agent")
+
+    @pytest.fixture
+    def client(self, session_factory, streaming_agent_factory, build_game_service):
+        from main import app
+
+        app.dependency_overrides[get_session_factory] = lambda: session_factory
+        app.dependency_overrides[get_game_service_builder] = (
+            lambda: lambda db: build_game_service(db, streaming_agent_factory)
+        )
+        try:
+            with TestClient(app) as client:
+                yield client
+        finally:
+            app.dependency_overrides.clear()
+
+    def test_sse_route_commits_before_result(self, client, session_factory, session_id):
+        response = client.post("/api/games/ai-turn/stream", json={"session_id": session_id, "round_number": 1})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = parse_sse(response.text)
+        assert [name for name, _ in events][0] == "started"
+        assert events[-1][0] == "result"
+        assert events[-1][1]["session_id"] == session_id
+        with UnitOfWork(session_factory) as uow:
+            assert uow.session.query(ActionRecord).filter_by(session_id=session_id, actor="ai").count() == 1
+
+    def test_sse_route_reports_errors_as_event(self, client, session_factory):
+        response = client.post("/api/games/ai-turn/stream", json={"session_id": "game_missing", "round_number": 1})
+
+        events = parse_sse(response.text)
+        assert events[-1][0] == "error"
+        assert events[-1][1]["status_code"] == 404
+        with UnitOfWork(session_factory) as uow:
+            assert uow.session.query(ActionRecord).count() == 0
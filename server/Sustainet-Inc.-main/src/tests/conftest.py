@@ -0,0 +1,145 @@
+"""
+測試共用設定與 fixtures
+"""
+import asyncio
+import os
+import tempfile
+
+# 全域 engine 在匯入時建立，測試環境預設使用暫存的 SQLite 檔案
+os.environ.setdefault(
+    "DATABASE_URL_SYNC",
+    f"sqlite:///{os.path.join(tempfile.gettempdir(), 'sustainet_test.db')}"
+)
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool, StaticPool
+
+from src.application.dto.game_dto import (
+    FakeNewsAgentResponse, GameMasterAgentResponse, GameMasterAgentPlatformStatus
+)
+from src.application.services.game_service import GameService, create_game_service
+from src.config.game_config import game_config
+from src.infrastructure.database.models.base import Base
+from src.infrastructure.database.agent_definition_cache import agent_definition_cache
+from src.infrastructure.database.game_state_store import game_state_store
+from src.infrastructure.database.news_sampler import news_sampler
+from src.infrastructure.database.response_cache import make_cache_key, polish_cache
+from src.infrastructure.database.tool_catalog import tool_catalog
+from src.utils.metrics import metrics
+from src.infrastructure.database.models import (  # noqa: F401
+    action_record, game_round, game_setup, news, platform_state, session_summary, tools, toolusage
+)
+
+
+class FakeAgentFactory:
+    """不呼叫 LLM 的 AgentFactory 替身，回傳固定的 Agent 結果"""
+
+    def __init__(self):
+        self.calls = []
+
+    def run_agent_by_name(self, session_id, agent_name, variables, input_text=None, response_model=None, **kwargs):
+        self.calls.append(agent_name)
+        if agent_name == "fake_news_agent":
+            return FakeNewsAgentResponse(
+                title="測試假新聞",
+                content="這是一則測試用的假新聞內容",
+                source="測試來源",
+                veracity="false",
+                tool_used=[]
+            )
+        if agent_name == "game_master_agent":
+            return GameMasterAgentResponse(
+                trust_change=5,
+                spread_change=3,
+                reach_count=100,
+                platform_status=[
+                    GameMasterAgentPlatformStatus(
+                        platform_name=name, player_trust=55, ai_trust=45, spread_rate=52
+                    )
+                    for name in game_config.platform_names
+                ],
+                effectiveness="medium",
+                simulated_comments=["真的假的", "來源在哪？"]
+            )
+        return {"polished_content": f"潤稿: {variables.get('content')}"}
+
+    def prompt_fingerprint(self, agent_name, variables, input_text=None):
+        return make_cache_key(agent_name, variables, input_text)
+
+    async def arun_agent_by_name(self, session_id, agent_name, variables, input_text=None, response_model=None, **kwargs):
+        return self.run_agent_by_name(session_id, agent_name, variables, input_text, response_model, **kwargs)
+
+
+# Agent 表使用 PostgreSQL 專用的 server_default，SQLite 測試不建立
+_SQLITE_TABLES = [table for name, table in Base.metadata.tables.items() if name != "agents"]
+
+
+@pytest.fixture(autouse=True)
+def reset_process_caches():
+    """每個測試使用獨立資料庫，行程共用的索引與目錄需重新載入"""
+    caches = (news_sampler, tool_catalog, agent_definition_cache, game_state_store)
+    for cache in caches:
+        cache.invalidate()
+    polish_cache.clear()
+    metrics.clear()
+    yield
+    for cache in caches:
+        cache.invalidate()
+    polish_cache.clear()
+
+
+@pytest.fixture
+def db_engine():
+    """記憶體內 SQLite engine，已建立遊戲相關資料表"""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine, tables=_SQLITE_TABLES)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(db_engine):
+    """綁定測試 engine 的 Session 工廠"""
+    return sessionmaker(bind=db_engine, autocommit=False, autoflush=False, expire_on_commit=False)
+
+
+@pytest.fixture
+def async_session_factory(tmp_path):
+    """
+    以 aiosqlite 存取暫存 SQLite 檔案的 AsyncSession 工廠。
+    使用 NullPool，每次 asyncio.run 各自開啟連線，不跨事件迴圈共用。
+    同時返回同一檔案的同步 Session 工廠，方便準備資料。
+    """
+    path = tmp_path / "async.db"
+    sync_engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(sync_engine, tables=_SQLITE_TABLES)
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}", poolclass=NullPool)
+    yield (
+        async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False),
+        sessionmaker(bind=sync_engine, autoflush=False, expire_on_commit=False)
+    )
+    asyncio.run(async_engine.dispose())
+    sync_engine.dispose()
+
+
+@pytest.fixture
+def fake_agent_factory():
+    return FakeAgentFactory()
+
+
+@pytest.fixture
+def build_game_service(fake_agent_factory):
+    """
+    以同一個 Session 組裝 GameService 的函數：build_game_service(db, agent_factory=None)。
+    組裝方式同 create_game_service，agent_factory 未指定時使用 fake_agent_factory。
+    """
+    def build(db, agent_factory=None) -> GameService:
+        return create_game_service(db, agent_factory=agent_factory or fake_agent_factory)
+    return build
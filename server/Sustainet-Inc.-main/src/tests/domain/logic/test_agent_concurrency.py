@@ -0,0 +1,121 @@
+"""
+Agent 非同步呼叫路徑與並行限制的測試
+"""
+import asyncio
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from src.domain.logic.agent_concurrency import AgentConcurrencyLimiter
+from src.domain.logic.agent_factory import AgentFactory
+from src.domain.models.agent import AgentDefinition
+from src.utils.exceptions import ExternalServiceError
+
+
+def build_factory(limiter: AgentConcurrencyLimiter, provider: str = "fake") -> AgentFactory:
+    repo = Mock()
+    repo.get_definition.return_value = AgentDefinition(
+        agent_name="fake_news_agent", provider=provider, model_name="fake-1",
+        description="測試", instruction="產生新聞", tools=None,
+        num_history_responses=10, markdown=True, debug=False, temperature=None,
+        updated_at=datetime(2025, 1, 1)
+    )
+    return AgentFactory(repo, limiter=limiter)
+
+
+class TestAgentConcurrencyLimiter:
+    """測試全域與提供商並行上限"""
+
+    def test_provider_limit_caps_in_flight_calls(self):
+        limiter = AgentConcurrencyLimiter(max_concurrency=10, provider_limits={"fake": 3})
+        peak = 0
+
+        async def call():
+            nonlocal peak
+            async with limiter.slot("fake"):
+                peak = max(peak, limiter.in_flight)
+                await asyncio.sleep(0.01)
+
+        async def main():
+            await asyncio.gather(*(call() for _ in range(12)))
+
+        asyncio.run(main())
+        assert peak == 3
+        assert limiter.in_flight == 0
+
+    def test_global_limit_applies_across_providers(self):
+        limiter = AgentConcurrencyLimiter(max_concurrency=2)
+        peak = 0
+
+        async def call(provider):
+            nonlocal peak
+            async with limiter.slot(provider):
+                peak = max(peak, limiter.in_flight)
+                await asyncio.sleep(0.01)
+
+        async def main():
+            await asyncio.gather(*(call(p) for p in ["openai", "google", "anthropic"] * 2))
+
+        asyncio.run(main())
+        assert peak == 2
+
+    def test_queue_timeout_raises_external_service_error(self):
+        limiter = AgentConcurrencyLimiter(max_concurrency=1, queue_timeout=0.01)
+
+        async def hold():
+            async with limiter.slot("fake"):
+                await asyncio.sleep(0.1)
+
+        async def main():
+            holder = asyncio.create_task(hold())
+            await asyncio.sleep(0)
+            with pytest.raises(ExternalServiceError) as exc_info:
+                async with limiter.slot("fake"):
+                    pass
+            await holder
+            return exc_info.value
+
+        error = asyncio.run(main())
+        assert error.error_code == "AGENT_QUEUE_TIMEOUT"
+
+
+class TestArunAgentByName:
+    """測試 AgentFactory 的協程路徑"""
+
+    def test_concurrent_runs_share_provider_limit(self, monkeypatch):
+        monkeypatch.setattr("src.domain.logic.agent_factory.settings.fake_llm_latency", 0.02)
+        limiter = AgentConcurrencyLimiter(max_concurrency=50, provider_limits={"fake": 4})
+        factory = build_factory(limiter)
+        peak = 0
+
+        async def watch():
+            nonlocal peak
+            while True:
+                peak = max(peak, limiter.in_flight)
+                await asyncio.sleep(0.001)
+
+        async def main():
+            watcher = asyncio.create_task(watch())
+            results = await asyncio.gather(*(
+                factory.arun_agent_by_name(f"s{i}", "fake_news_agent", {}, input_text="go")
+                for i in range(16)
+            ))
+            watcher.cancel()
+            return results
+
+        results = asyncio.run(main())
+        assert len(results) == 16
+        assert "fake_news_agent" in results[0]
+        assert peak == 4
+
+    def test_slow_provider_times_out(self, monkeypatch):
+        monkeypatch.setattr("src.domain.logic.agent_factory.settings.fake_llm_latency", 1.0)
+        limiter = AgentConcurrencyLimiter(max_concurrency=4)
+        factory = build_factory(limiter)
+
+        with pytest.raises(ExternalServiceError) as exc_info:
+            asyncio.run(factory.arun_agent_by_name("s1", "fake_news_agent", {}, timeout=0.01))
+
+        assert exc_info.value.error_code == "AGENT_TIMEOUT"
+        assert limiter.in_flight == 0
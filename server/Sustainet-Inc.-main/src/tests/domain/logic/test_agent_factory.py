@@ -0,0 +1,111 @@
+"""
+AgentFactory 使用快取設定的測試
+"""
+import asyncio
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from unittest.mock import Mock
+
+from agno.agent import Agent as AgnoAgent
+from agno.models.base import Model
+from agno.models.response import ModelResponse
+
+from src.domain.logic.agent_factory import AgentFactory
+from src.domain.models.agent import AgentDefinition
+
+STUB_DELTAS = ["太陽能板", "製程污染", "其實極低"]
+
+
+@dataclass
+class StubModel(Model):
+    """不連線的 agno 模型，依序輸出 STUB_DELTAS"""
+    id: str = "stub"
+    name: str = "Stub"
+    provider: str = "Stub"
+
+    def invoke(self, *args, **kwargs):
+        return "".join(STUB_DELTAS)
+
+    async def ainvoke(self, *args, **kwargs):
+        return "".join(STUB_DELTAS)
+
+    def invoke_stream(self, *args, **kwargs):
+        yield from STUB_DELTAS
+
+    async def ainvoke_stream(self, *args, **kwargs):
+        for delta in STUB_DELTAS:
+            yield delta
+
+    def parse_provider_response(self, response):
+        return ModelResponse(role="assistant", content=response)
+
+    def parse_provider_response_delta(self, response):
+        return ModelResponse(role="assistant", content=response)
+
+
+def make_factory(provider: str) -> AgentFactory:
+    repo = Mock()
+    repo.get_definition.return_value = AgentDefinition(
+        agent_name="fake_news_agent", provider=provider, model_name=provider,
+        description="你是{role}", instruction="撰寫新聞", tools=None,
+        num_history_responses=10, markdown=True, debug=False, temperature=None,
+        updated_at=datetime(2025, 1, 1)
+    )
+    return AgentFactory(repo)
+
+
+class TestAgentFactoryRendering:
+    """測試渲染不修改共用的 Agent 設定"""
+
+    def test_render_does_not_mutate_cached_definition(self):
+        definition = AgentDefinition(
+            agent_name="polish_agent", provider="openai", model_name="gpt-4.1",
+            description="你是{role}", instruction="請潤飾 {{content}}", tools=None,
+            num_history_responses=10, markdown=True, debug=False, temperature=None,
+            updated_at=datetime(2025, 1, 1)
+        )
+        repo = Mock()
+        repo.get_definition.return_value = definition
+        factory = AgentFactory(repo)
+
+        first = factory.create_agent_by_name("s1", "polish_agent", {"role": "編輯", "content": "第一篇"})
+        second = factory.create_agent_by_name("s2", "polish_agent", {"role": "記者", "content": "第二篇"})
+
+        assert (first.description, first.instructions) == ("你是編輯", "請潤飾 第一篇")
+        assert (second.description, second.instructions) == ("你是記者", "請潤飾 第二篇")
+        assert definition.instruction == "請潤飾 {{content}}"
+
+
+class TestAgentFactoryStreaming:
+    """測試串流執行轉交輸出片段且結果與一般執行相同"""
+
+    def test_on_token_receives_output_chunks(self):
+        factory = make_factory("fake")
+        deltas = []
+
+        async def run_both():
+            streamed = await factory.arun_agent_by_name("s1", "fake_news_agent", {"role": "記者"}, "輸入", on_token=deltas.append)
+            plain = await factory.arun_agent_by_name("s1", "fake_news_agent", {"role": "記者"}, "輸入")
+            return streamed, plain
+
+        streamed, plain = asyncio.run(run_both())
+
+        assert streamed == plain
+        assert len(deltas) > 1
+        assert json.loads("".join(deltas))["content"] in plain
+
+    def test_agno_agent_streams_tokens(self, monkeypatch):
+        factory = make_factory("openai")
+        monkeypatch.setattr(factory, "_create_agent_from_data", lambda *args: AgnoAgent(model=StubModel()))
+        deltas = []
+
+        async def run_both():
+            streamed = await factory.arun_agent_by_name("s1", "fake_news_agent", {}, "輸入", on_token=deltas.append)
+            plain = await factory.arun_agent_by_name("s1", "fake_news_agent", {}, "輸入")
+            return streamed, plain
+
+        streamed, plain = asyncio.run(run_both())
+
+        assert deltas == STUB_DELTAS
+        assert streamed == plain == "".join(STUB_DELTAS)
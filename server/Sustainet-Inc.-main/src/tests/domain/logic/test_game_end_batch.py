@@ -0,0 +1,79 @@
+"""
+遊戲結束批次判斷測試：必須與逐場判斷的結果完全一致
+"""
+import numpy as np
+import pytest
+
+from src.config.game_config import GameConfig
+from src.domain.logic.game_end_logic import GameEndLogic
+
+PLATFORMS = ["Facebook", "Instagram", "Thread"]
+
+
+@pytest.fixture
+def game_end_logic():
+    logic = GameEndLogic()
+    logic.config = GameConfig(max_rounds=5, win_trust_threshold=80, win_platform_count=2, platform_names=list(PLATFORMS))
+    return logic
+
+
+def platform_states(player_row, ai_row, spread_row):
+    return [
+        {"platform_name": name, "player_trust": p, "ai_trust": a, "spread_rate": s}
+        for name, p, a, s in zip(PLATFORMS, player_row, ai_row, spread_row)
+    ]
+
+
+class TestGameEndBatch:
+    """測試向量化的遊戲結束判斷"""
+
+    @pytest.mark.parametrize("dtype", [np.int64, np.float64])
+    def test_matches_scalar_results(self, game_end_logic, dtype):
+        rng = np.random.default_rng(42)
+        games = 500
+        rounds = rng.integers(1, 7, size=games)
+        player = rng.integers(40, 101, size=(games, 3)).astype(dtype)
+        ai = rng.integers(40, 101, size=(games, 3)).astype(dtype)
+        if dtype is np.float64:
+            player += rng.random((games, 3))
+            ai += rng.random((games, 3))
+        spread = rng.integers(0, 101, size=(games, 3))
+
+        result = game_end_logic.check_game_end_batch(rounds, player, ai, spread)
+
+        for i in range(games):
+            states = platform_states(player[i].tolist(), ai[i].tolist(), spread[i].tolist())
+            expected = game_end_logic.config.should_game_end(int(rounds[i]), states)
+            assert result.end_result(i) == expected
+            assert result.game_summary(i) == game_end_logic.format_game_end_summary(expected)
+            assert result.winners[i] == expected["winner"]
+            assert result.reasons[i] == expected["reason"]
+        assert set(result.reasons) == {None, "max_rounds_reached", "player_dominance", "ai_dominance"}
+
+    def test_priority_and_draw(self, game_end_logic):
+        result = game_end_logic.check_game_end_batch(
+            round_numbers=np.array([5, 2, 2, 5]),
+            player_trust=np.array([[90, 90, 10], [90, 90, 10], [50, 50, 50], [60, 50, 40]]),
+            ai_trust=np.array([[90, 90, 90], [90, 90, 90], [85, 85, 10], [40, 50, 60]])
+        )
+
+        # 回合上限優先於主導勝利；雙方都達標時玩家優先；總信任值相同為平局
+        assert result.reasons == ["max_rounds_reached", "player_dominance", "ai_dominance", "max_rounds_reached"]
+        assert result.winners == ["ai", "player", "ai", "draw"]
+        assert result.total_rounds.tolist() == [0, 2, 2, 0]
+        assert result.summary()["winners"] == {"player": 1, "ai": 2, "draw": 1}
+
+    def test_scalar_round_number_is_broadcast(self, game_end_logic):
+        result = game_end_logic.check_game_end_batch(1, np.full((4, 3), 50), np.full((4, 3), 50))
+
+        assert not result.is_ended.any()
+        assert result.summary() == {
+            "games": 4, "ended": 0, "winners": {}, "reasons": {},
+            "avg_player_total_trust": 150.0, "avg_ai_total_trust": 150.0, "avg_round_number": 1.0
+        }
+
+    def test_rejects_mismatched_shapes(self, game_end_logic):
+        with pytest.raises(ValueError):
+            game_end_logic.check_game_end_batch(1, np.zeros((2, 3)), np.zeros((2, 2)))
+        with pytest.raises(ValueError):
+            game_end_logic.check_game_end_batch(1, np.zeros((2, 2)), np.zeros((2, 2)))
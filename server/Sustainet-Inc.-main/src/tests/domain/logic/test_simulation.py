@@ -0,0 +1,81 @@
+"""
+無頭對局模擬引擎的測試
+"""
+import dataclasses
+import random
+
+from src.config.game_config import game_config
+from src.domain.logic.simulation import (
+    DEFAULT_SIMULATION_TOOLS, GreedyPlayerPolicy, RandomPlayerPolicy, SimulationEngine, StubGameMaster
+)
+
+
+def without_timing(result):
+    data = result.to_dict()
+    data.pop("duration_ms")
+    return data
+
+
+class TestSimulationEngine:
+    """測試確定性、結束條件與工具效果"""
+
+    def test_same_seed_gives_same_game(self):
+        first = [without_timing(SimulationEngine(player_policy=RandomPlayerPolicy()).run_game(seed)) for seed in range(5)]
+        second = [without_timing(SimulationEngine(player_policy=RandomPlayerPolicy()).run_game(seed)) for seed in range(5)]
+
+        assert first == second
+        assert len({result["session_id"] for result in first}) == 5
+
+    def test_batched_games_match_single_games(self):
+        # 部分場次提早以主導勝利結束，其餘打到回合上限
+        config = dataclasses.replace(game_config, max_rounds=12, win_trust_threshold=70, win_platform_count=2)
+
+        def engine():
+            return SimulationEngine(player_policy=RandomPlayerPolicy(), config=config)
+
+        batched = [without_timing(result) for result in engine().run_games(range(20))]
+        single = [without_timing(engine().run_game(seed)) for seed in range(20)]
+
+        assert batched == single
+        assert len({result["rounds"] for result in batched}) > 1
+
+    def test_caller_random_state_is_untouched(self):
+        random.seed(123)
+        expected = [random.random() for _ in range(3)]
+
+        random.seed(123)
+        SimulationEngine(player_policy=RandomPlayerPolicy()).run_games(range(3))
+
+        assert [random.random() for _ in range(3)] == expected
+
+    def test_game_ends_by_game_config(self):
+        config = dataclasses.replace(game_config, max_rounds=4)
+        result = SimulationEngine(config=config).run_game(1)
+
+        assert result.rounds == 4
+        assert result.reason == "max_rounds_reached"
+        assert result.winner in ("player", "ai", "draw")
+        expected = config.should_game_end(result.rounds, result.platforms)
+        assert (expected["winner"], expected["reason"]) == (result.winner, result.reason)
+
+    def test_dominance_ends_game_early(self):
+        config = dataclasses.replace(game_config, max_rounds=50, win_trust_threshold=70, win_platform_count=1)
+        gm_model = StubGameMaster(base_trust_gain=15, noise=0, config=config)
+        result = SimulationEngine(gm_model=gm_model, config=config).run_game(3)
+
+        assert result.reason in ("player_dominance", "ai_dominance")
+        assert result.rounds < 50
+
+    def test_platform_states_follow_gm_like_persisted_games(self):
+        # 正式遊戲寫入 GM 的 platform_status，工具倍率不疊加到平台信任值，模擬結果也不受影響
+        config = dataclasses.replace(game_config, max_rounds=5)
+        boosted = [
+            tool.model_copy(update={"effects": tool.effects.model_copy(update={"trust_multiplier": 3.0})})
+            if tool.applicable_to == "player" else tool
+            for tool in DEFAULT_SIMULATION_TOOLS
+        ]
+        plain = SimulationEngine(player_policy=GreedyPlayerPolicy(), config=config).run_game(7)
+        strong = SimulationEngine(player_policy=GreedyPlayerPolicy(), tools=boosted, config=config).run_game(7)
+
+        assert plain.tools_used["player"] > 0
+        assert without_timing(strong) == without_timing(plain)
@@ -0,0 +1,144 @@
+"""
+回合階段管線的測試
+"""
+import asyncio
+import time
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.application.services.game_service import GameService
+from src.domain.logic.turn_pipeline import TurnPipeline
+from src.infrastructure.database.action_record_repo import ActionRecordRepository
+from src.infrastructure.database.game_round_repo import GameRoundRepository
+from src.infrastructure.database.game_setup_repo import GameSetupRepository
+from src.infrastructure.database.models.base import Base
+from src.infrastructure.database.models.news import News
+from src.infrastructure.database.models.tools import Tool
+from src.infrastructure.database.news_repo import NewsRepository
+from src.infrastructure.database.platform_state_repo import PlatformStateRepository
+from src.infrastructure.database.session import UnitOfWork
+from src.infrastructure.database.tool_repo import ToolRepository
+from src.infrastructure.database.tool_usage_repo import ToolUsageRepository
+
+
+class TestTurnPipeline:
+    """測試階段相依與並行"""
+
+    def test_independent_stages_overlap_and_receive_dependencies(self):
+        pipeline = TurnPipeline()
+        pipeline.stage("a", lambda: time.sleep(0.05) or 1)
+        pipeline.stage("b", lambda: time.sleep(0.05) or 2)
+        pipeline.stage("total", lambda a, b: a + b, depends_on=("a", "b"), blocking=False)
+
+        started = time.perf_counter()
+        result = asyncio.run(pipeline.run())
+
+        assert result["total"] == 3
+        assert time.perf_counter() - started < 0.09
+        assert result.timings["total"][0] >= max(result.timings["a"][1], result.timings["b"][1])
+
+    def test_shared_session_stages_are_serialized(self):
+        active = []
+        peak = 0
+
+        def use_session():
+            nonlocal peak
+            active.append(1)
+            peak = max(peak, len(active))
+            time.sleep(0.02)
+            active.pop()
+
+        pipeline = TurnPipeline()
+        for name in ("x", "y", "z"):
+            pipeline.stage(name, use_session, shared_session=True)
+        asyncio.run(pipeline.run())
+
+        assert peak == 1
+
+    def test_session_is_released_after_each_shared_stage(self):
+        events = []
+
+        async def agent_call(tools):
+            events.append("agent")
+
+        pipeline = TurnPipeline(release_session=lambda: events.append("release"))
+        pipeline.stage("game", lambda: events.append("game"), shared_session=True)
+        pipeline.stage("tools", lambda: events.append("tools"), shared_session=True)
+        pipeline.stage("agent", agent_call, depends_on=("tools",))
+        asyncio.run(pipeline.run())
+
+        assert events[-1] == "agent"
+        assert sorted(events[:-1]) == ["game", "release", "release", "tools"]
+        assert events[1] == events[3] == "release"
+
+    def test_coroutine_stage_overlaps_with_sync_stage(self):
+        async def agent_call():
+            await asyncio.sleep(0.05)
+            return "article"
+
+        pipeline = TurnPipeline()
+        pipeline.stage("agent", agent_call)
+        pipeline.stage("context", lambda: time.sleep(0.05) or "summary")
+        result = asyncio.run(pipeline.run())
+
+        assert result["context"] == "summary"
+        assert result.timings["context"][0] < result.timings["agent"][1]
+
+    def test_failure_propagates(self):
+        def boom():
+            raise RuntimeError("boom")
+
+        pipeline = TurnPipeline()
+        pipeline.stage("fail", boom)
+        pipeline.stage("after", lambda fail: fail, depends_on=("fail",), blocking=False)
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(pipeline.run())
+
+    def test_rejects_undeclared_dependency(self):
+        pipeline = TurnPipeline()
+        with pytest.raises(ValueError):
+            pipeline.stage("gm", lambda turn_result: None, depends_on=("turn_result",))
+
+
+class TestAiTurnPipeline:
+    """測試 AI 回合以獨立 Session 讀取參考資料"""
+
+    def test_ai_turn_reads_reference_data_on_separate_sessions(self, tmp_path, fake_agent_factory):
+        engine = create_engine(f"sqlite:///{tmp_path / 'game.db'}")
+        Base.metadata.create_all(engine, tables=[t for n, t in Base.metadata.tables.items() if n != "agents"])
+        factory = sessionmaker(bind=engine, autocommit=False, autoflush=False, expire_on_commit=False)
+        with UnitOfWork(factory) as uow:
+            uow.session.add(News(
+                title="太陽能板污染？", content="部分研究指出太陽能板製程有污染",
+                veracity="partial", category="energy", source="綠色論壇", is_active=True
+            ))
+            uow.session.add(Tool(
+                tool_name="事實查核", description="查核內容", trust_effect=1.2,
+                spread_effect=0.9, applicable_to="ai", available_from_round=1
+            ))
+
+        async def play():
+            with UnitOfWork(factory) as uow:
+                db = uow.session
+                service = GameService(
+                    setup_repo=GameSetupRepository(db=db),
+                    state_repo=PlatformStateRepository(db=db),
+                    news_repo=NewsRepository(db=db),
+                    action_repo=ActionRecordRepository(db=db),
+                    round_repo=GameRoundRepository(db=db),
+                    tool_repo=ToolRepository(db=db),
+                    tool_usage_repo=ToolUsageRepository(db=db),
+                    agent_factory=fake_agent_factory,
+                    read_session_factory=factory
+                )
+                return await service.astart_game()
+
+        response = asyncio.run(play())
+        engine.dispose()
+
+        assert response.actor == "ai"
+        assert response.article.source == "綠色論壇"
+        assert fake_agent_factory.calls == ["fake_news_agent", "game_master_agent"]
@@ -0,0 +1,103 @@
+"""
+行動記錄與工具使用寫入的資料庫往返次數測試
+"""
+import pytest
+
+from src.application.dto.game_dto import (
+    ArticleMeta, GameMasterAgentPlatformStatus, GameMasterAgentResponse
+)
+from src.domain.logic.game_state_manager import GameStateManager, GameTurnResult
+from src.domain.logic.turn_execution import TurnExecutionResult
+from src.domain.models.tool import AppliedToolEffectDetail
+from src.infrastructure.database.action_record_repo import ActionRecordRepository
+from src.infrastructure.database.game_setup_repo import GameSetupRepository
+from src.infrastructure.database.models.tools import Tool
+from src.infrastructure.database.platform_state_repo import PlatformStateRepository
+from src.infrastructure.database.session import UnitOfWork
+from src.infrastructure.database.session_stats import track_session_stats
+from src.infrastructure.database.tool_usage_repo import ToolUsageRepository
+
+TOOL_NAMES = ["事實查核", "專家背書", "媒體澄清", "社群闢謠"]
+
+
+def make_turn_result(tool_count: int) -> GameTurnResult:
+    turn = TurnExecutionResult(
+        actor="player",
+        session_id="game_rt",
+        round_number=1,
+        article=ArticleMeta(
+            title="澄清", content="太陽能板污染極低", author="player",
+            published_date="2025-05-21T14:45:00", target_platform="Facebook"
+        ),
+        target_platform="Facebook",
+        tools_used=[]
+    )
+    gm = GameMasterAgentResponse(
+        trust_change=5, spread_change=3, reach_count=100,
+        platform_status=[
+            GameMasterAgentPlatformStatus(platform_name="Facebook", player_trust=55, ai_trust=45, spread_rate=52)
+        ],
+        effectiveness="high",
+        simulated_comments=["原來如此"]
+    )
+    effects = [
+        AppliedToolEffectDetail(tool_name=name, applied_trust_effect_value=2, applied_spread_effect_value=-1)
+        for name in TOOL_NAMES[:tool_count]
+    ]
+    return GameTurnResult(turn, gm, effects)
+
+
+class TestPersistTurnResult:
+    """測試回合寫入的語句數不隨工具數增加"""
+
+    @pytest.fixture(autouse=True)
+    def seed(self, session_factory):
+        with UnitOfWork(session_factory) as uow:
+            for name in TOOL_NAMES:
+                uow.session.add(Tool(
+                    tool_name=name, description=name, trust_effect=1.2,
+                    spread_effect=0.9, applicable_to="player", available_from_round=1
+                ))
+            GameSetupRepository(db=uow.session).create_game_setup(
+                session_id="game_rt", platforms=[{"name": "Facebook", "audience": "學生"}]
+            )
+            PlatformStateRepository(db=uow.session).create_all_platforms_states(
+                session_id="game_rt", round_number=1, platforms=[{"name": "Facebook"}]
+            )
+
+    def persist(self, session_factory, tool_count: int):
+        with track_session_stats() as stats:
+            with UnitOfWork(session_factory) as uow:
+                manager = GameStateManager(
+                    GameSetupRepository(db=uow.session), PlatformStateRepository(db=uow.session),
+                    ActionRecordRepository(db=uow.session), ToolUsageRepository(db=uow.session),
+                    None, None, None, None
+                )
+                action_id = manager.persist_turn_result(make_turn_result(tool_count))
+        return action_id, stats
+
+    def test_statement_count_is_constant_in_tool_count(self, session_factory):
+        _, one_tool = self.persist(session_factory, 1)
+        action_id, four_tools = self.persist(session_factory, 4)
+
+        assert one_tool.statements == four_tools.statements
+        assert four_tools.commits == 1
+
+        with UnitOfWork(session_factory) as uow:
+            action = ActionRecordRepository(db=uow.session).get_by_pk(action_id)
+            usages = ToolUsageRepository(db=uow.session).get_by_action_id(action_id)
+            assert (action.effectiveness, action.reach_count, action.trust_change) == ("high", 100, 5)
+            assert action.simulated_comments == ["原來如此"]
+            assert sorted(u.tool_name for u in usages) == sorted(TOOL_NAMES)
+
+    def test_create_action_record_returns_server_defaults(self, session_factory):
+        with UnitOfWork(session_factory) as uow:
+            with track_session_stats() as stats:
+                action = ActionRecordRepository(db=uow.session).create_action_record(
+                    session_id="game_rt", round_number=1, actor="ai",
+                    platform="Facebook", content="假新聞", effectiveness="low"
+                )
+
+        assert action.id is not None
+        assert action.created_at is not None
+        assert stats.statements == 1
@@ -0,0 +1,72 @@
+"""
+Agent 設定版本快取的測試
+"""
+from datetime import datetime
+
+from src.domain.models.agent import AgentDefinition
+from src.infrastructure.database.agent_definition_cache import AgentDefinitionCache
+
+
+def make_definition(updated_at: datetime, instruction: str = "說明 {topic}") -> AgentDefinition:
+    return AgentDefinition(
+        agent_name="fake_news_agent", provider="openai", model_name="gpt-4.1",
+        description="描述", instruction=instruction, tools=None,
+        num_history_responses=10, markdown=True, debug=False, temperature=None,
+        updated_at=updated_at
+    )
+
+
+class FakeAgentStore:
+    """記錄查詢次數的 Agent 資料來源"""
+
+    def __init__(self, definition):
+        self.definition = definition
+        self.version_queries = 0
+        self.definition_loads = 0
+
+    def load_version(self):
+        self.version_queries += 1
+        return self.definition.updated_at if self.definition else None
+
+    def load_definition(self):
+        self.definition_loads += 1
+        return self.definition
+
+
+class TestAgentDefinitionCache:
+    """測試快取命中、版本驗證與失效"""
+
+    def _get(self, cache, store):
+        return cache.get("fake_news_agent", store.load_version, store.load_definition)
+
+    def test_hit_within_interval_skips_database(self):
+        cache = AgentDefinitionCache(revalidate_interval=60)
+        store = FakeAgentStore(make_definition(datetime(2025, 1, 1)))
+
+        first = self._get(cache, store)
+        assert self._get(cache, store) is first
+        assert (store.version_queries, store.definition_loads) == (0, 1)
+
+    def test_revalidation_reloads_only_on_new_version(self):
+        cache = AgentDefinitionCache(revalidate_interval=0)
+        store = FakeAgentStore(make_definition(datetime(2025, 1, 1)))
+
+        first = self._get(cache, store)
+        assert self._get(cache, store) is first
+        assert (store.version_queries, store.definition_loads) == (1, 1)
+
+        store.definition = make_definition(datetime(2025, 1, 2), instruction="新指令")
+        assert self._get(cache, store).instruction == "新指令"
+        assert store.definition_loads == 2
+
+        store.definition = None
+        assert self._get(cache, store) is None
+
+    def test_invalidate_forces_reload(self):
+        cache = AgentDefinitionCache(revalidate_interval=60)
+        store = FakeAgentStore(make_definition(datetime(2025, 1, 1)))
+
+        self._get(cache, store)
+        cache.invalidate("fake_news_agent")
+        self._get(cache, store)
+        assert store.definition_loads == 2
@@ -0,0 +1,96 @@
+"""
+非同步資料層（AsyncSession、AsyncBaseRepository、async 路由）的測試
+"""
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.routes import news as news_routes
+from src.infrastructure.database.async_base_repo import AsyncBaseRepository
+from src.infrastructure.database.models.game_setup import GameSetup
+from src.infrastructure.database.models.news import News
+from src.infrastructure.database.news_repo import AsyncNewsRepository
+from src.infrastructure.database.session import AsyncUnitOfWork, UnitOfWork, get_async_db, resolve_async_database_url
+from src.utils.exceptions import ResourceNotFoundError
+
+
+class AsyncGameSetupRepository(AsyncBaseRepository[GameSetup]):
+    model = GameSetup
+
+
+@pytest.fixture
+def factories(async_session_factory):
+    async_factory, sync_factory = async_session_factory
+    with UnitOfWork(sync_factory) as uow:
+        uow.session.add_all([
+            News(title="太陽能板污染？", content="部分研究指出太陽能板製程有污染", veracity="partial", category="energy", source="論壇"),
+            News(title="風機害死鳥？", content="網路流傳風力發電機大量害死候鳥", veracity="false", category="energy", source="網友", is_active=False),
+        ])
+    return async_factory, sync_factory
+
+
+def test_resolve_async_database_url():
+    assert resolve_async_database_url("", "sqlite:////tmp/a.db") == "sqlite+aiosqlite:////tmp/a.db"
+    assert resolve_async_database_url("", "postgresql+psycopg2://u:p@db/app") == "postgresql+asyncpg://u:p@db/app"
+    assert resolve_async_database_url("postgresql+asyncpg://x/y", "sqlite://") == "postgresql+asyncpg://x/y"
+
+
+def test_unit_of_work_commits_and_rolls_back(factories):
+    async_factory, _ = factories
+
+    async def scenario():
+        async with AsyncUnitOfWork(async_factory) as uow:
+            await AsyncGameSetupRepository(db=uow.session).create({"session_id": "game_ok", "platforms": []})
+
+        with pytest.raises(RuntimeError):
+            async with AsyncUnitOfWork(async_factory) as uow:
+                await AsyncGameSetupRepository(db=uow.session).create({"session_id": "game_fail", "platforms": []})
+                raise RuntimeError("boom")
+
+        async with AsyncUnitOfWork(async_factory) as uow:
+            repo = AsyncGameSetupRepository(db=uow.session)
+            assert (await repo.get_by_pk("game_ok")).session_id == "game_ok"
+            with pytest.raises(ResourceNotFoundError):
+                await repo.get_by_pk("game_fail")
+            return await repo.count()
+
+    assert asyncio.run(scenario()) == 1
+
+
+def test_random_news_skips_inactive(factories):
+    async_factory, _ = factories
+
+    async def scenario():
+        async with AsyncUnitOfWork(async_factory) as uow:
+            repo = AsyncNewsRepository(db=uow.session)
+            batch = await repo.get_random_active_news_batch(5)
+            with pytest.raises(ResourceNotFoundError):
+                await repo.get_random_active_news_batch(1, veracity="false")
+            return batch, await repo.get_random_news(veracity="false")
+
+    batch, inactive = asyncio.run(scenario())
+    assert [news.title for news in batch] == ["太陽能板污染？"]
+    assert inactive.title == "風機害死鳥？"
+
+
+def test_random_news_route_runs_on_async_session(factories):
+    async_factory, _ = factories
+
+    async def override_async_db():
+        async with AsyncUnitOfWork(async_factory) as uow:
+            yield uow.session
+
+    app = FastAPI()
+    app.include_router(news_routes.router, prefix="/api")
+    app.dependency_overrides[get_async_db] = override_async_db
+
+    assert asyncio.iscoroutinefunction(news_routes.get_random_news)
+    with TestClient(app) as client:
+        response = client.get("/api/news/random")
+        missing = client.get("/api/news/random", params={"category": "energy", "veracity": "true"})
+
+    assert response.status_code == 200
+    assert response.json()["title"] == "太陽能板污染？"
+    assert missing.status_code == 404
@@ -0,0 +1,141 @@
+"""
+面板讀取模型（DashboardRepository）的測試
+"""
+import asyncio
+
+import pytest
+
+from src.domain.models.tool import AppliedToolEffectDetail
+from src.infrastructure.database.action_record_repo import ActionRecordRepository
+from src.infrastructure.database.dashboard_repo import AsyncDashboardRepository, DashboardRepository
+from src.infrastructure.database.game_round_repo import GameRoundRepository
+from src.infrastructure.database.game_setup_repo import GameSetupRepository
+from src.infrastructure.database.models.tools import Tool
+from src.infrastructure.database.platform_state_repo import PlatformStateRepository
+from src.infrastructure.database.session import AsyncUnitOfWork, UnitOfWork
+from src.infrastructure.database.session_stats import track_session_stats
+from src.infrastructure.database.tool_usage_repo import ToolUsageRepository
+
+PLATFORMS = [
+    {"name": "Facebook", "audience": "學生"},
+    {"name": "Instagram", "audience": "上班族"},
+    {"name": "Thread", "audience": "退休族"},
+]
+
+
+def add_round(db, round_number: int, states):
+    GameRoundRepository(db=db).create_game_round(session_id="game_dash", round_number=round_number)
+    repo = PlatformStateRepository(db=db)
+    repo.create_all_platforms_states(session_id="game_dash", round_number=round_number, platforms=PLATFORMS)
+    repo.update_all_platforms_states("game_dash", round_number, [
+        {"platform_name": name, "player_trust": player, "ai_trust": 50, "spread_rate": 50}
+        for name, player in states.items()
+    ])
+
+
+def seed_game(session_factory):
+    with UnitOfWork(session_factory) as uow:
+        db = uow.session
+        for tool_name in ("事實查核", "引用權威"):
+            db.add(Tool(
+                tool_name=tool_name, description="工具", trust_effect=1.2,
+                spread_effect=0.9, applicable_to="player", available_from_round=1
+            ))
+        GameSetupRepository(db=db).create_game_setup(session_id="game_dash", platforms=PLATFORMS)
+        add_round(db, 1, {"Facebook": 50, "Instagram": 50, "Thread": 50})
+        add_round(db, 2, {"Facebook": 60, "Instagram": 40, "Thread": 50})
+
+
+@pytest.fixture(autouse=True)
+def seed(session_factory):
+    seed_game(session_factory)
+
+
+def add_player_action(session_factory, round_number: int, tools):
+    with UnitOfWork(session_factory) as uow:
+        actions = ActionRecordRepository(db=uow.session)
+        actions.create_action_record(
+            session_id="game_dash", round_number=round_number, actor="ai", platform="Facebook", content="假新聞"
+        )
+        action = actions.create_action_record(
+            session_id="game_dash", round_number=round_number, actor="player", platform="Facebook", content="澄清"
+        )
+        ToolUsageRepository(db=uow.session).create_tool_usage_records(action.id, [
+            AppliedToolEffectDetail(tool_name=tool, applied_trust_effect_value=2, applied_spread_effect_value=-1)
+            for tool in tools
+        ])
+        return action.id
+
+
+class TestDashboardRepository:
+    """測試平台趨勢、工具預先載入、查詢次數與版本"""
+
+    def test_snapshot_uses_latest_round_with_trends(self, session_factory):
+        player_action_id = add_player_action(session_factory, 2, ["事實查核", "引用權威"])
+
+        with track_session_stats() as stats:
+            with UnitOfWork(session_factory) as uow:
+                snapshot = DashboardRepository(db=uow.session).get_snapshot("game_dash")
+
+        assert snapshot.round_number == 2
+        assert [(p.platform_name, p.player_trust, p.trust_trend) for p in snapshot.platforms] == [
+            ("Facebook", 60, "↗"), ("Instagram", 40, "↘"), ("Thread", 50, "→"),
+        ]
+        assert [action.actor for action in snapshot.actions] == ["ai", "player"]
+        assert snapshot.tools_by_action[player_action_id] == ["事實查核", "引用權威"]
+        # 平台狀態、行動、工具使用、每場摘要各一個查詢
+        assert stats.statements == 4
+
+    def test_first_round_has_flat_trend(self, session_factory):
+        with UnitOfWork(session_factory) as uow:
+            db = uow.session
+            GameSetupRepository(db=db).create_game_setup(session_id="game_new", platforms=PLATFORMS)
+            PlatformStateRepository(db=db).create_all_platforms_states(
+                session_id="game_new", round_number=1, platforms=PLATFORMS
+            )
+
+        with UnitOfWork(session_factory) as uow:
+            snapshot = DashboardRepository(db=uow.session).get_snapshot("game_new")
+
+        assert snapshot.round_number == 1
+        assert {p.trust_trend for p in snapshot.platforms} == {"→"}
+        assert snapshot.actions == [] and snapshot.tools_by_action == {}
+
+    def test_version_changes_with_actions_and_rounds(self, session_factory):
+        def version(session_id="game_dash"):
+            with UnitOfWork(session_factory) as uow:
+                return DashboardRepository(db=uow.session).get_version(session_id)
+
+        initial = version()
+        assert initial == "2.0"
+        assert version() == initial
+
+        add_player_action(session_factory, 2, [])
+        after_action = version()
+        assert after_action != initial
+
+        with UnitOfWork(session_factory) as uow:
+            add_round(uow.session, 3, {"Facebook": 60, "Instagram": 40, "Thread": 50})
+        assert version() not in (initial, after_action)
+        assert version("game_missing") is None
+
+    def test_async_repository_matches_sync(self, async_session_factory):
+        async_factory, sync_factory = async_session_factory
+        seed_game(sync_factory)
+        player_action_id = add_player_action(sync_factory, 2, ["事實查核"])
+
+        async def read():
+            async with AsyncUnitOfWork(async_factory) as uow:
+                repo = AsyncDashboardRepository(db=uow.session)
+                return await repo.get_version("game_dash"), await repo.get_snapshot("game_dash")
+
+        version, snapshot = asyncio.run(read())
+        with UnitOfWork(sync_factory) as uow:
+            repo = DashboardRepository(db=uow.session)
+            expected_version, expected = repo.get_version("game_dash"), repo.get_snapshot("game_dash")
+
+        assert version == expected_version
+        assert snapshot.round_number == expected.round_number == 2
+        assert snapshot.platforms == expected.platforms
+        assert [action.id for action in snapshot.actions] == [action.id for action in expected.actions]
+        assert snapshot.tools_by_action[player_action_id] == ["事實查核"]
@@ -0,0 +1,162 @@
+"""
+遊戲狀態熱資料存放的測試
+"""
+import time
+
+import pytest
+from sqlalchemy import event
+
+from src.application.dto.game_dto import ArticleMeta, PlayerTurnRequest, StartNextRoundRequest
+from src.domain.models.game import Game, Platform, SessionId, SpreadRate, TrustScore
+from src.infrastructure.database.game_state_store import GameStateStore, game_state_store
+from src.infrastructure.database.models.news import News
+from src.infrastructure.database.platform_state_repo import PlatformStateRepository
+from src.infrastructure.database.session import UnitOfWork
+
+
+def make_game(session_id: str, round_number: int = 1, trust: int = 50) -> Game:
+    return Game(
+        session_id=SessionId(session_id),
+        current_round=round_number,
+        platforms=[
+            Platform(name, "學生", TrustScore(trust), TrustScore(trust), SpreadRate(trust))
+            for name in ("Facebook", "Instagram")
+        ]
+    )
+
+
+class TestGameStateStore:
+    """測試存放的寫入、複本與淘汰"""
+
+    def test_returns_copies_and_applies_updates(self):
+        store = GameStateStore()
+        store.put(make_game("game_a"), [{"name": "Facebook", "audience": "學生"}])
+
+        game = store.get_game("game_a", 1)
+        game.get_platform("Facebook").player_trust = TrustScore(99)
+        store.apply_platform_states("game_a", 1, [
+            {"platform_name": "Facebook", "player_trust": 60, "ai_trust": 40, "spread_rate": 55}
+        ])
+
+        fresh = store.get_game("game_a", 1)
+        assert fresh.get_platform("Facebook").player_trust.value == 60
+        assert store.get_game("game_a", 2) is None
+
+        store.advance_round("game_a", 2)
+        assert store.get_game("game_a", 2).get_platform("Facebook").player_trust.value == 60
+        assert store.get_platform_states("game_a", 1)["Facebook"]["ai_trust"] == 40
+
+    def test_evicts_least_recently_used_and_idle_sessions(self):
+        store = GameStateStore(max_sessions=2, idle_ttl=0.05)
+        store.put(make_game("game_a"), [])
+        store.put(make_game("game_b"), [])
+        store.get_game("game_a", 1)
+        store.put(make_game("game_c"), [])
+
+        assert store.get_game("game_b", 1) is None
+        assert store.get_game("game_a", 1) is not None
+
+        time.sleep(0.06)
+        assert store.get_game("game_c", 1) is None
+
+    def test_evicts_by_approximate_bytes(self):
+        probe = GameStateStore()
+        probe.put(make_game("game_a"), [{"name": "Facebook", "audience": "學生"}])
+        entry_bytes = probe.memory_usage()
+        assert entry_bytes > 0
+
+        store = GameStateStore(max_bytes=entry_bytes * 2 + entry_bytes // 2)
+        for session_id in ("game_a", "game_b", "game_c"):
+            store.put(make_game(session_id), [{"name": "Facebook", "audience": "學生"}])
+
+        assert store.size() == 2
+        assert store.get_game("game_a", 1) is None
+        assert store.memory_usage() <= store.max_bytes
+
+        store.invalidate("game_b")
+        store.invalidate("game_c")
+        assert store.memory_usage() == 0
+
+    def test_writes_are_published_on_commit(self, session_factory):
+        store = GameStateStore()
+        store.put(make_game("game_a"), [])
+        update = [{"platform_name": "Facebook", "player_trust": 90, "ai_trust": 10, "spread_rate": 50}]
+
+        with UnitOfWork(session_factory) as uow:
+            store.apply_platform_states("game_a", 1, update, db=uow.session)
+            # 其他請求讀不到未提交的狀態，同一交易可以讀到
+            assert store.get_game("game_a", 1).get_platform("Facebook").player_trust.value == 50
+            assert store.get_game("game_a", 1, db=uow.session).get_platform("Facebook").player_trust.value == 90
+
+        assert store.get_game("game_a", 1).get_platform("Facebook").player_trust.value == 90
+
+    def test_rollback_drops_staged_writes(self, session_factory):
+        store = GameStateStore()
+        store.put(make_game("game_a"), [])
+
+        with pytest.raises(RuntimeError):
+            with UnitOfWork(session_factory) as uow:
+                store.apply_platform_states("game_a", 1, [
+                    {"platform_name": "Facebook", "player_trust": 90, "ai_trust": 10, "spread_rate": 50}
+                ], db=uow.session)
+                store.advance_round("game_a", 2, db=uow.session)
+                raise RuntimeError("boom")
+
+        assert store.get_game("game_a", 1).get_platform("Facebook").player_trust.value == 50
+
+    def test_conflicting_commits_invalidate(self, session_factory):
+        game_state_store.put(make_game("game_a"), [])
+        update = [{"platform_name": "Facebook", "player_trust": 90, "ai_trust": 10, "spread_rate": 50}]
+
+        with UnitOfWork(session_factory) as first, UnitOfWork(session_factory) as second:
+            game_state_store.apply_platform_states("game_a", 1, update, db=first.session)
+            game_state_store.advance_round("game_a", 2, db=second.session)
+            first.session.commit()
+
+        # 第二個交易以提交前的狀態為基礎，無法與第一個交易的結果合併
+        assert game_state_store.get_game("game_a", 1) is None
+        assert game_state_store.get_game("game_a", 2) is None
+
+
+class TestHotTurns:
+    """測試回合不再查詢遊戲設定與平台狀態"""
+
+    @pytest.fixture(autouse=True)
+    def seed(self, session_factory):
+        with UnitOfWork(session_factory) as uow:
+            uow.session.add(News(
+                title="太陽能板污染？", content="部分研究指出太陽能板製程有污染",
+                veracity="partial", category="energy", source="綠色論壇", is_active=True
+            ))
+
+    def test_turns_skip_setup_and_state_reads(self, db_engine, session_factory, build_game_service):
+        with UnitOfWork(session_factory) as uow:
+            session_id = build_game_service(uow.session).start_game().session_id
+
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(db_engine, "before_cursor_execute", record)
+        try:
+            with UnitOfWork(session_factory) as uow:
+                service = build_game_service(uow.session)
+                service.player_turn(PlayerTurnRequest(
+                    session_id=session_id,
+                    round_number=1,
+                    article=ArticleMeta(
+                        title="澄清", content="太陽能板污染極低", author="player",
+                        published_date="2025-05-21T14:45:00", target_platform="Facebook"
+                    )
+                ))
+                service.start_next_round(StartNextRoundRequest(session_id=session_id))
+        finally:
+            event.remove(db_engine, "before_cursor_execute", record)
+
+        reads = [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+        assert not [s for s in reads if "game_setups" in s or "platform_states" in s]
+
+        with UnitOfWork(session_factory) as uow:
+            states = PlatformStateRepository(db=uow.session).get_by_session_and_round(session_id, 2)
+            assert {s.player_trust for s in states} == {55}
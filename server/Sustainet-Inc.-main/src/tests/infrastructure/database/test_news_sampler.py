@@ -0,0 +1,111 @@
+"""
+新聞抽樣索引與 NewsRepository 隨機抽樣的測試
+"""
+import pytest
+
+from src.infrastructure.database.models.news import News
+from src.infrastructure.database.news_repo import NewsRepository
+from src.infrastructure.database.news_sampler import NewsSampler, news_sampler
+from src.infrastructure.database.session import UnitOfWork
+from src.infrastructure.database.session_stats import track_session_stats
+from src.utils.exceptions import ResourceNotFoundError
+
+
+class TestNewsSampler:
+    """測試記憶體內的分桶索引"""
+
+    def test_sample_ids_are_distinct_and_filtered(self):
+        sampler = NewsSampler()
+        sampler.load([(1, "true", "energy"), (2, "false", "energy"), (3, "false", "policy"), (4, "partial", "policy")])
+
+        ids = sampler.sample_ids(4)
+        assert sorted(ids) == [1, 2, 3, 4]
+        assert sorted(sampler.sample_ids(5, veracity="false")) == [2, 3]
+        assert sampler.sample_ids(2, veracity="false", category="policy") == [3]
+        assert sampler.sample_ids(1, category="economy") == []
+
+    def test_add_discard_and_move_between_buckets(self):
+        sampler = NewsSampler()
+        sampler.load([(1, "true", "energy"), (2, "true", "energy"), (3, "true", "energy")])
+
+        sampler.discard(1)
+        sampler.discard(99)
+        assert sorted(sampler.sample_ids(5)) == [2, 3]
+
+        sampler.add(3, "false", "policy")
+        assert sampler.sample_ids(5, veracity="true") == [2]
+        assert sampler.sample_ids(5, veracity="false") == [3]
+        assert sampler.size == 2
+
+
+class TestNewsRepositorySampling:
+    """測試 NewsRepository 透過索引抽樣"""
+
+    @pytest.fixture
+    def uow(self, session_factory):
+        with UnitOfWork(session_factory) as uow:
+            for i in range(20):
+                uow.session.add(News(
+                    title=f"新聞{i}", content="內容", veracity="true" if i % 2 else "false",
+                    category="energy", source="來源", is_active=i < 10
+                ))
+            uow.session.flush()
+            yield uow
+
+    def test_batch_is_one_primary_key_query(self, uow):
+        repo = NewsRepository(db=uow.session)
+        repo.get_random_active_news()  # 載入索引
+
+        with track_session_stats() as stats:
+            news_1, news_2 = repo.get_random_active_news_batch(2)
+
+        assert stats.statements == 1
+        assert news_1.news_id != news_2.news_id
+        assert news_1.is_active and news_2.is_active
+
+    def test_index_follows_create_update_and_delete(self, uow):
+        repo = NewsRepository(db=uow.session)
+        repo.get_random_active_news()  # 載入索引
+        created = repo.create_news(
+            title="新", content="內容", veracity="partial", category="policy", source="來源"
+        )
+        # 提交前索引不變，其他請求不會抽到尚未提交的新聞
+        assert news_sampler.sample_ids(5, veracity="partial") == []
+        uow.session.commit()
+        assert repo.get_random_active_news_batch(5, veracity="partial") == [created]
+
+        repo.update_by_pk(created.news_id, {"is_active": False})
+        uow.session.commit()
+        with pytest.raises(ResourceNotFoundError):
+            repo.get_random_active_news_batch(1, veracity="partial")
+
+        repo.update_by_pk(created.news_id, {"is_active": True})
+        repo.delete_by_pk(created.news_id)
+        uow.session.commit()
+        with pytest.raises(ResourceNotFoundError):
+            repo.get_random_active_news_batch(1, category="policy")
+
+    def test_rollback_leaves_index_untouched(self, uow):
+        repo = NewsRepository(db=uow.session)
+        repo.get_random_active_news()  # 載入索引
+        active_id = repo.get_by(is_active=True)[0].news_id
+
+        repo.create_news(title="新", content="內容", veracity="partial", category="policy", source="來源")
+        repo.update_by_pk(active_id, {"is_active": False})
+        uow.session.rollback()
+
+        assert news_sampler.size == 10
+        assert news_sampler.sample_ids(5, veracity="partial") == []
+
+    def test_stale_entries_are_dropped(self, uow):
+        repo = NewsRepository(db=uow.session)
+        repo.get_random_active_news()
+        # 模擬其他行程停用了所有 veracity=false 的新聞
+        for news in repo.get_by(veracity="false"):
+            news.is_active = False
+        uow.session.flush()
+
+        drawn = repo.get_random_active_news_batch(10)
+        assert {news.veracity for news in drawn} == {"true"}
+        assert len(drawn) == 5
+        assert news_sampler.size == 5
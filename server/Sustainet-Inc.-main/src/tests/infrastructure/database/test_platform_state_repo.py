@@ -0,0 +1,66 @@
+"""
+PlatformStateRepository 批次寫入的測試
+"""
+import pytest
+
+from src.infrastructure.database.game_setup_repo import GameSetupRepository
+from src.infrastructure.database.platform_state_repo import PlatformStateRepository
+from src.infrastructure.database.session import UnitOfWork
+from src.infrastructure.database.session_stats import track_session_stats
+from src.utils.exceptions import ResourceNotFoundError
+
+
+def make_platforms(count: int):
+    return [{"name": f"Platform{i}", "audience": "學生"} for i in range(count)]
+
+
+class TestPlatformStateBulkWrites:
+    """測試平台狀態的批次建立與更新"""
+
+    @pytest.fixture
+    def uow(self, session_factory):
+        with UnitOfWork(session_factory) as uow:
+            yield uow
+
+    def _setup(self, uow, platforms):
+        GameSetupRepository(db=uow.session).create_game_setup(session_id="game_bulk", platforms=platforms)
+        repo = PlatformStateRepository(db=uow.session)
+        repo.create_all_platforms_states("game_bulk", 1, platforms, player_trust=50, ai_trust=50, spread_rate=50)
+        return repo
+
+    @pytest.mark.parametrize("platform_count", [3, 12])
+    def test_round_creation_is_one_statement(self, uow, platform_count):
+        platforms = make_platforms(platform_count)
+        repo = self._setup(uow, platforms)
+
+        # 第二回合：一次查詢上一回合 + 一次多列 INSERT
+        with track_session_stats() as stats:
+            repo.create_all_platforms_states("game_bulk", 2, platforms)
+
+        assert stats.statements == 2
+        assert len(repo.get_by_session_and_round("game_bulk", 2)) == platform_count
+
+    @pytest.mark.parametrize("platform_count", [3, 12])
+    def test_state_update_is_one_statement(self, uow, platform_count):
+        platforms = make_platforms(platform_count)
+        repo = self._setup(uow, platforms)
+        loaded = repo.get_by_session_and_round("game_bulk", 1)
+
+        with track_session_stats() as stats:
+            repo.update_all_platforms_states("game_bulk", 1, [
+                {"platform_name": p["name"], "player_trust": 60 + i, "ai_trust": 40, "spread_rate": 70}
+                for i, p in enumerate(platforms)
+            ])
+
+        assert stats.statements == 1
+        # Session 中已載入的物件同步為新值
+        assert sorted(s.player_trust for s in loaded) == [60 + i for i in range(platform_count)]
+        assert {s.spread_rate for s in repo.get_by_session_and_round("game_bulk", 1)} == {70}
+
+    def test_update_missing_platform_raises(self, uow):
+        repo = self._setup(uow, make_platforms(3))
+
+        with pytest.raises(ResourceNotFoundError):
+            repo.update_all_platforms_states("game_bulk", 1, [
+                {"platform_name": "Unknown", "player_trust": 60, "ai_trust": 40, "spread_rate": 70}
+            ])
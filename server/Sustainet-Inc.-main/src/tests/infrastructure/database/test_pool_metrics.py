@@ -0,0 +1,65 @@
+"""
+連線池設定、量測與健康探測的測試
+"""
+import pytest
+from sqlalchemy import create_engine, exc
+from sqlalchemy.engine import make_url
+
+from src.infrastructure.database.health import DatabaseHealthProbe
+from src.infrastructure.database.pool_metrics import MeasuredQueuePool, instrument_engine, pool_metrics
+from src.infrastructure.database.session import engine_options
+
+
+@pytest.fixture
+def small_pool_engine(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=MeasuredQueuePool, pool_size=1, max_overflow=1, pool_timeout=0.05
+    )
+    yield engine
+    engine.dispose()
+    pool_metrics.pop("test_pool", None)
+
+
+def test_engine_options_follow_settings():
+    options = engine_options(make_url("postgresql+psycopg2://u:p@db/app"))
+    assert options["poolclass"] is MeasuredQueuePool
+    assert options["pool_pre_ping"] is False
+    assert options["connect_args"] == {"connect_timeout": 10}
+    assert engine_options(make_url("postgresql+asyncpg://u:p@db/app"), is_async=True)["connect_args"] == {"timeout": 10}
+    assert engine_options(make_url("sqlite://")) == {}
+
+
+def test_records_overflow_timeouts_and_connection_age(small_pool_engine):
+    metrics = instrument_engine(small_pool_engine, "test_pool")
+
+    first = small_pool_engine.connect()
+    second = small_pool_engine.connect()
+    with pytest.raises(exc.TimeoutError):
+        small_pool_engine.connect()
+
+    snapshot = metrics.snapshot()
+    assert (snapshot["checked_out"], snapshot["overflow"]) == (2, 1)
+    assert (snapshot["checkouts"], snapshot["overflow_checkouts"], snapshot["timeouts"]) == (2, 1, 1)
+    assert snapshot["checkout_wait_ms"]["samples"] == 2
+    assert snapshot["connection_age_s"]["open"] == 2
+
+    first.close()
+    second.close()
+    # 溢位連線歸還時關閉，只留下 pool_size 條
+    assert metrics.snapshot()["connection_age_s"]["open"] == 1
+
+    small_pool_engine.dispose()
+    small_pool_engine.connect().close()
+    assert metrics.snapshot()["checkouts"] == 3
+    assert metrics.snapshot()["checkout_wait_ms"]["samples"] == 3
+
+
+def test_health_probe_reuses_result_within_ttl(small_pool_engine):
+    metrics = instrument_engine(small_pool_engine, "test_pool")
+    probe = DatabaseHealthProbe(small_pool_engine, cache_ttl=60)
+
+    first, second = probe.check(), probe.check()
+    assert (first["status"], first["cached"]) == ("connected", False)
+    assert (second["status"], second["cached"]) == ("connected", True)
+    assert metrics.checkouts == 1
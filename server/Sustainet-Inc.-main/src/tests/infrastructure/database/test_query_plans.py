@@ -0,0 +1,118 @@
+"""
+熱路徑查詢的執行計畫測試：確認各 Repository 查詢都命中索引
+"""
+import pytest
+from datetime import datetime
+
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+
+from src.domain.models.tool import AppliedToolEffectDetail
+from src.infrastructure.database.action_record_repo import ActionRecordRepository
+from src.infrastructure.database.dashboard_repo import DashboardRepository
+from src.infrastructure.database.game_round_repo import GameRoundRepository
+from src.infrastructure.database.game_setup_repo import GameSetupRepository
+from src.infrastructure.database.models.news import News
+from src.infrastructure.database.models.tools import Tool
+from src.infrastructure.database.news_repo import NewsRepository
+from src.infrastructure.database.platform_state_repo import PlatformStateRepository
+from src.infrastructure.database.query_plan import capture_query_plans
+from src.infrastructure.database.session import UnitOfWork
+from src.infrastructure.database.session_summary_repo import SessionSummaryRepository
+from src.infrastructure.database.tool_usage_repo import ToolUsageRepository
+
+HOT_TABLES = {"platform_states", "action_records", "game_rounds", "game_setups", "tool_usages", "news"}
+PLATFORMS = [{"name": "Facebook", "audience": "學生"}, {"name": "Instagram", "audience": "上班族"}]
+
+
+@pytest.fixture(autouse=True)
+def seed(session_factory):
+    with UnitOfWork(session_factory) as uow:
+        db = uow.session
+        db.add(News(title="太陽能板污染？", content="內容", veracity="partial", category="energy", source="論壇"))
+        db.add(Tool(
+            tool_name="事實查核", description="查核", trust_effect=1.2,
+            spread_effect=0.9, applicable_to="player", available_from_round=1
+        ))
+        GameSetupRepository(db=db).create_game_setup(session_id="game_qp", platforms=PLATFORMS)
+        for round_number in (1, 2):
+            GameRoundRepository(db=db).create_game_round(session_id="game_qp", round_number=round_number)
+            PlatformStateRepository(db=db).create_all_platforms_states(
+                session_id="game_qp", round_number=round_number, platforms=PLATFORMS
+            )
+        action = ActionRecordRepository(db=db).create_action_record(
+            session_id="game_qp", round_number=1, actor="player", platform="Facebook", content="澄清"
+        )
+        ToolUsageRepository(db=db).create_tool_usage_records(action.id, [
+            AppliedToolEffectDetail(tool_name="事實查核", applied_trust_effect_value=2, applied_spread_effect_value=-1)
+        ])
+
+
+def run_hot_path(db, action_id: int) -> None:
+    GameSetupRepository(db=db).get_by_session_id("game_qp")
+    rounds = GameRoundRepository(db=db)
+    rounds.get_latest_round_by_session("game_qp")
+    rounds.get_by_session_and_round("game_qp", 1)
+    rounds.get_all_rounds_by_session("game_qp")
+    states = PlatformStateRepository(db=db)
+    states.get_by_session_and_round("game_qp", 1)
+    states.get_states_by_session("game_qp")
+    states.get_state_by_session_round_and_platform_name("game_qp", 1, "Facebook")
+    states.update_all_platforms_states("game_qp", 2, [
+        {"platform_name": "Facebook", "player_trust": 60, "ai_trust": 40, "spread_rate": 55}
+    ])
+    actions = ActionRecordRepository(db=db)
+    actions.get_actions_by_session_and_round("game_qp", 1)
+    actions.get_by_session_and_round("game_qp", 1)
+    ToolUsageRepository(db=db).get_by_action_id(action_id)
+    NewsRepository(db=db).get_random_active_news()
+    dashboard = DashboardRepository(db=db)
+    dashboard.get_version("game_qp")
+    dashboard.get_snapshot("game_qp")
+
+
+def test_hot_path_queries_use_indexes(db_engine, session_factory):
+    with UnitOfWork(session_factory) as uow:
+        action_id = ActionRecordRepository(db=uow.session).get_actions_by_session_and_round("game_qp", 1)[0].id
+
+    with capture_query_plans(db_engine) as recorder:
+        with UnitOfWork(session_factory) as uow:
+            run_hot_path(uow.session, action_id)
+
+    assert len(recorder.plans) >= 13
+    regressions = {query.statement: query.plan for query in recorder.full_scans(HOT_TABLES)}
+    assert not regressions
+
+
+def test_listing_pages_use_indexes(db_engine, session_factory):
+    # 第一頁沿索引順序讀取前 limit 筆；之後的頁以 keyset 條件直接定位，不可退化為全表掃描
+    after = (datetime(2026, 10, 1), "game_qp")
+    with capture_query_plans(db_engine) as recorder:
+        with UnitOfWork(session_factory) as uow:
+            summaries = SessionSummaryRepository(db=uow.session)
+            summaries.list_recent(20, after=after)
+            summaries.list_recent(20, after=after, is_ended=True)
+            summaries.list_recent(20, after=after, winner="player")
+            summaries.list_leaderboard(20, after=(150, "game_qp"))
+
+    assert len(recorder.plans) == 4
+    assert not recorder.full_scans({"session_summaries"})
+
+
+def test_missing_index_is_reported(db_engine, session_factory):
+    with db_engine.begin() as conn:
+        conn.execute(text("DROP INDEX ix_tool_usages_action_id"))
+
+    with capture_query_plans(db_engine) as recorder:
+        with UnitOfWork(session_factory) as uow:
+            ToolUsageRepository(db=uow.session).get_by_action_id(1)
+
+    assert [query.full_scans() for query in recorder.full_scans(HOT_TABLES)] == [{"tool_usages"}]
+
+
+def test_platform_state_is_unique_per_round(session_factory):
+    with pytest.raises(IntegrityError):
+        with UnitOfWork(session_factory) as uow:
+            PlatformStateRepository(db=uow.session).create_all_platforms_states(
+                session_id="game_qp", round_number=1, platforms=PLATFORMS
+            )
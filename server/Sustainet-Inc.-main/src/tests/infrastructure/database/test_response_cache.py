@@ -0,0 +1,112 @@
+"""
+潤稿回應快取的測試
+"""
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+
+from src.application.dto.game_dto import NewsPolishRequest
+from src.application.services.game_service import GameService
+from src.infrastructure.database.response_cache import (
+    MemoryCacheBackend, ResponseCache, SqliteCacheBackend, make_cache_key
+)
+
+
+def build_service(agent_factory, cache: ResponseCache) -> GameService:
+    return GameService(
+        setup_repo=Mock(), state_repo=Mock(), news_repo=Mock(), action_repo=Mock(),
+        round_repo=Mock(), tool_repo=Mock(), tool_usage_repo=Mock(),
+        agent_factory=agent_factory, polish_cache=cache
+    )
+
+
+class TestCacheBackends:
+    """測試容量與 TTL 淘汰"""
+
+    def test_memory_backend_evicts_least_recently_used(self):
+        backend = MemoryCacheBackend(max_entries=2, ttl=60)
+        backend.set("a", 1)
+        backend.set("b", 2)
+        backend.get("a")
+        backend.set("c", 3)
+
+        assert backend.get("a") == 1
+        assert backend.get("b") is None
+        assert backend.size() == 2
+
+    def test_memory_backend_expires_entries(self):
+        backend = MemoryCacheBackend(max_entries=10, ttl=0.01)
+        backend.set("a", 1)
+        time.sleep(0.02)
+        assert backend.get("a") is None
+
+    def test_sqlite_backend_persists_and_evicts(self, tmp_path):
+        path = str(tmp_path / "cache" / "polish.sqlite3")
+        backend = SqliteCacheBackend(path, max_entries=2, ttl=60)
+        backend.set("a", {"polished_content": "一"})
+        backend.set("b", {"polished_content": "二"})
+        backend.set("c", {"polished_content": "三"})
+
+        reopened = SqliteCacheBackend(path, max_entries=2, ttl=60)
+        assert reopened.get("a") is None
+        assert reopened.get("c") == {"polished_content": "三"}
+        assert reopened.size() == 2
+
+    def test_cache_key_is_content_addressed(self):
+        assert make_cache_key("agent", "v1", "草稿") == make_cache_key("agent", "v1", "草稿")
+        assert make_cache_key("agent", "v1", "草稿") != make_cache_key("agent", "v2", "草稿")
+
+
+class TestPolishNewsCache:
+    """測試 GameService.polish_news 使用快取"""
+
+    def test_identical_requests_call_agent_once(self, fake_agent_factory):
+        cache = ResponseCache(MemoryCacheBackend(max_entries=10, ttl=60))
+        service = build_service(fake_agent_factory, cache)
+        request = NewsPolishRequest(session_id="s1", content="台南今天舉辦淨灘活動", platform="Facebook")
+
+        first = service.polish_news(request)
+        second = asyncio.run(service.apolish_news(request.model_copy(update={"session_id": "s2"})))
+
+        assert first == second
+        assert fake_agent_factory.calls == ["news_polish_agent"]
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_different_content_or_bypass_calls_agent(self, fake_agent_factory):
+        cache = ResponseCache(MemoryCacheBackend(max_entries=10, ttl=60))
+        service = build_service(fake_agent_factory, cache)
+        request = NewsPolishRequest(session_id="s1", content="台南今天舉辦淨灘活動")
+
+        service.polish_news(request)
+        service.polish_news(request.model_copy(update={"content": "高雄今天舉辦淨灘活動"}))
+        service.polish_news(request.model_copy(update={"bypass_cache": True}))
+
+        assert len(fake_agent_factory.calls) == 3
+        assert cache.stats()["bypasses"] == 1
+        assert cache.stats()["size"] == 2
+
+    def test_async_polish_reads_and_writes_cache_off_the_event_loop(self, fake_agent_factory):
+        backend = MemoryCacheBackend(max_entries=10, ttl=60)
+        threads = []
+        for name in ("get", "set"):
+            method = getattr(backend, name)
+
+            def record(*args, _method=method, _name=name):
+                threads.append((_name, threading.get_ident()))
+                return _method(*args)
+            setattr(backend, name, record)
+        service = build_service(fake_agent_factory, ResponseCache(backend))
+        request = NewsPolishRequest(session_id="s1", content="台南今天舉辦淨灘活動")
+
+        async def polish_twice():
+            loop_thread = threading.get_ident()
+            await service.apolish_news(request)
+            await service.apolish_news(request)
+            return loop_thread
+
+        loop_thread = asyncio.run(polish_twice())
+
+        assert [name for name, _ in threads] == ["get", "set", "get"]
+        assert all(thread != loop_thread for _, thread in threads)
@@ -0,0 +1,120 @@
+"""
+每場摘要（session_summaries）增量維護的測試
+"""
+import pytest
+from sqlalchemy import event, func
+
+from src.application.dto.game_dto import AiTurnRequest, ArticleMeta, PlayerTurnRequest, StartNextRoundRequest
+from src.infrastructure.database.game_setup_repo import GameSetupRepository
+from src.infrastructure.database.models.action_record import ActionRecord
+from src.infrastructure.database.models.news import News
+from src.infrastructure.database.platform_state_repo import PlatformStateRepository
+from src.infrastructure.database.session import UnitOfWork
+from src.infrastructure.database.session_summary_repo import SessionSummaryRepository
+from src.utils.exceptions import BusinessLogicError
+
+
+def player_turn_request(session_id: str, round_number: int) -> PlayerTurnRequest:
+    return PlayerTurnRequest(
+        session_id=session_id,
+        round_number=round_number,
+        article=ArticleMeta(
+            title="澄清", content="太陽能板污染極低", author="player",
+            published_date="2025-05-21T14:45:00", target_platform="Facebook"
+        )
+    )
+
+
+def get_summary(session_factory, session_id):
+    with UnitOfWork(session_factory) as uow:
+        return SessionSummaryRepository(db=uow.session).get_by_session_id(session_id)
+
+
+@pytest.fixture(autouse=True)
+def seed_news(session_factory):
+    with UnitOfWork(session_factory) as uow:
+        uow.session.add(News(
+            title="太陽能板污染？", content="部分研究指出太陽能板製程有污染",
+            veracity="partial", category="energy", source="綠色論壇", is_active=True
+        ))
+
+
+class TestSessionSummary:
+    """測試摘要隨遊戲流程更新，且與重新掃描歷史資料的結果一致"""
+
+    def test_summary_tracks_a_full_game(self, session_factory, build_game_service):
+        with UnitOfWork(session_factory) as uow:
+            session_id = build_game_service(uow.session)._create_game().session_id
+        created = get_summary(session_factory, session_id)
+        assert (created.latest_round, created.action_count, created.leader) == (1, 0, "draw")
+        assert created.player_total_trust == created.ai_total_trust == 150
+
+        with UnitOfWork(session_factory) as uow:
+            build_game_service(uow.session).player_turn(player_turn_request(session_id, 1))
+        after_player = get_summary(session_factory, session_id)
+        assert after_player.is_ended is False
+        assert after_player.leader == "player"
+
+        with UnitOfWork(session_factory) as uow:
+            service = build_game_service(uow.session)
+            service.start_next_round(StartNextRoundRequest(session_id=session_id))
+            service.player_turn(player_turn_request(session_id, 2))
+
+        summary = get_summary(session_factory, session_id)
+        with UnitOfWork(session_factory) as uow:
+            actions = uow.session.query(ActionRecord).filter_by(session_id=session_id)
+            player_actions = actions.filter_by(actor="player")
+            assert summary.action_count == actions.count() == 3
+            assert summary.player_action_count == player_actions.count() == 2
+            assert summary.player_reach_total == player_actions.with_entities(
+                func.sum(ActionRecord.reach_count)
+            ).scalar()
+            states = PlatformStateRepository(db=uow.session).get_by_session_and_round(session_id, 2)
+        assert summary.latest_round == 2
+        assert summary.player_total_trust == sum(s.player_trust for s in states)
+        assert summary.ai_total_trust == sum(s.ai_trust for s in states)
+        assert (summary.is_ended, summary.winner, summary.end_reason) == (True, "player", "max_rounds_reached")
+
+    def test_ai_turn_keeps_end_state_and_next_round_reads_summary(
+        self, db_engine, session_factory, build_game_service
+    ):
+        with UnitOfWork(session_factory) as uow:
+            service = build_game_service(uow.session)
+            session_id = service.start_game().session_id
+            service.player_turn(player_turn_request(session_id, 1))
+            service.start_next_round(StartNextRoundRequest(session_id=session_id))
+            service.player_turn(player_turn_request(session_id, 2))
+            # 已完成的回合再次執行 AI 行動，不覆寫結束狀態
+            service.ai_turn(AiTurnRequest(session_id=session_id, round_number=2))
+        assert get_summary(session_factory, session_id).is_ended is True
+
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(db_engine, "before_cursor_execute", record)
+        try:
+            with pytest.raises(BusinessLogicError, match="玩家勝利"):
+                with UnitOfWork(session_factory) as uow:
+                    build_game_service(uow.session).start_next_round(
+                        StartNextRoundRequest(session_id=session_id)
+                    )
+        finally:
+            event.remove(db_engine, "before_cursor_execute", record)
+        assert not [s for s in statements if "platform_states" in s]
+
+    def test_apply_turn_creates_missing_summary(self, session_factory):
+        with UnitOfWork(session_factory) as uow:
+            GameSetupRepository(db=uow.session).create_game_setup(
+                session_id="game_legacy", platforms=[{"name": "Facebook", "audience": "學生"}]
+            )
+            SessionSummaryRepository(db=uow.session).apply_turn(
+                session_id="game_legacy", round_number=3, actor="ai", reach_count=80, trust_change=-4,
+                standing={"player_total_trust": 40, "ai_total_trust": 60, "leader": "ai"}
+            )
+
+        summary = get_summary(session_factory, "game_legacy")
+        assert (summary.latest_round, summary.action_count, summary.ai_action_count) == (3, 1, 1)
+        assert (summary.ai_reach_total, summary.ai_trust_change_total, summary.player_reach_total) == (80, -4, 0)
+        assert (summary.leader, summary.is_ended, summary.winner) == ("ai", False, None)
@@ -0,0 +1,63 @@
+"""
+行程共用工具目錄的測試
+"""
+import pytest
+
+from src.infrastructure.database.models.tools import Tool
+from src.infrastructure.database.session import UnitOfWork
+from src.infrastructure.database.session_stats import track_session_stats
+from src.infrastructure.database.tool_catalog import tool_catalog
+from src.infrastructure.database.tool_repo import ToolRepository
+
+
+def make_tool(name: str, applicable_to: str, available_from_round: int) -> Tool:
+    return Tool(
+        tool_name=name, description=f"{name} 說明", trust_effect=1.1,
+        spread_effect=1.0, applicable_to=applicable_to, available_from_round=available_from_round
+    )
+
+
+class TestToolCatalog:
+    """測試工具目錄的索引、共用與失效"""
+
+    @pytest.fixture(autouse=True)
+    def seed(self, session_factory):
+        with UnitOfWork(session_factory) as uow:
+            uow.session.add_all([
+                make_tool("事實查核", "player", 1),
+                make_tool("情緒刺激", "both", 1),
+                make_tool("影片製作", "both", 3),
+                make_tool("殭屍帳號", "ai", 2),
+            ])
+
+    def test_lookups_share_one_load_across_repositories(self, session_factory):
+        with track_session_stats() as stats:
+            with UnitOfWork(session_factory) as uow:
+                repo = ToolRepository(db=uow.session)
+                assert repo.get_tool_by_name("事實查核").applicable_to == "player"
+            # 新請求建立新的 Repository，仍沿用同一份目錄
+            with UnitOfWork(session_factory) as uow:
+                repo = ToolRepository(db=uow.session)
+                assert repo.get_tool_by_name("不存在") is None
+                assert {t.tool_name for t in repo.list_tools_for_actor("ai")} == {"情緒刺激", "影片製作", "殭屍帳號"}
+
+        assert stats.statements == 1
+
+    def test_round_index(self, session_factory):
+        with UnitOfWork(session_factory) as uow:
+            repo = ToolRepository(db=uow.session)
+            assert [t.tool_name for t in repo.list_tools_for_round("player", 1)] == ["事實查核", "情緒刺激"]
+            assert [t.tool_name for t in repo.list_tools_for_round("ai", 2)] == ["情緒刺激", "殭屍帳號"]
+            assert len(repo.list_tools_for_round("player", 10)) == 3
+
+    def test_tool_writes_invalidate_catalog(self, session_factory):
+        with UnitOfWork(session_factory) as uow:
+            ToolRepository(db=uow.session).list_all_tools()
+        assert tool_catalog.loaded
+
+        with UnitOfWork(session_factory) as uow:
+            uow.session.add(make_tool("Podcast", "player", 4))
+        assert not tool_catalog.loaded
+
+        with UnitOfWork(session_factory) as uow:
+            assert ToolRepository(db=uow.session).get_tool_by_name("podcast").available_from_round == 4
@@ -0,0 +1,108 @@
+"""
+工作單元（UnitOfWork）與請求範圍 Session 的測試
+"""
+import asyncio
+
+import pytest
+
+from src.application.dto.game_dto import ArticleMeta, PlayerTurnRequest, ToolUsed
+from src.infrastructure.database.action_record_repo import ActionRecordRepository
+from src.infrastructure.database.game_round_repo import GameRoundRepository
+from src.infrastructure.database.game_setup_repo import GameSetupRepository
+from src.infrastructure.database.models.news import News
+from src.infrastructure.database.models.tools import Tool
+from src.infrastructure.database.session import UnitOfWork
+from src.infrastructure.database.session_stats import track_session_stats
+
+
+class TestUnitOfWork:
+    """測試工作單元模式"""
+
+    @pytest.fixture(autouse=True)
+    def seed(self, session_factory):
+        with UnitOfWork(session_factory) as uow:
+            uow.session.add(News(
+                title="太陽能板污染？", content="部分研究指出太陽能板製程有污染",
+                veracity="partial", category="energy", source="綠色論壇", is_active=True
+            ))
+            uow.session.add(Tool(
+                tool_name="事實查核", description="查核內容", trust_effect=1.2,
+                spread_effect=0.9, applicable_to="player", available_from_round=1
+            ))
+
+    def test_commits_on_success_and_rolls_back_on_error(self, session_factory):
+        with UnitOfWork(session_factory) as uow:
+            GameSetupRepository(db=uow.session).create_game_setup(
+                session_id="game_ok", platforms=[{"name": "Facebook", "audience": "學生"}]
+            )
+
+        with pytest.raises(RuntimeError):
+            with UnitOfWork(session_factory) as uow:
+                GameSetupRepository(db=uow.session).create_game_setup(
+                    session_id="game_fail", platforms=[{"name": "Facebook", "audience": "學生"}]
+                )
+                raise RuntimeError("boom")
+
+        with UnitOfWork(session_factory) as uow:
+            repo = GameSetupRepository(db=uow.session)
+            assert repo.get_by_session_id("game_ok").session_id == "game_ok"
+            assert repo.get_by(session_id="game_fail") == []
+
+    def test_start_game_costs_one_transaction(self, session_factory, build_game_service):
+        with track_session_stats() as stats:
+            with UnitOfWork(session_factory) as uow:
+                response = build_game_service(uow.session).start_game()
+
+        assert response.actor == "ai"
+        assert stats.connections == 1
+        assert stats.commits == 1
+
+    def test_player_turn_costs_one_transaction(self, session_factory, build_game_service):
+        with UnitOfWork(session_factory) as uow:
+            session_id = build_game_service(uow.session).start_game().session_id
+
+        request = PlayerTurnRequest(
+            session_id=session_id,
+            round_number=1,
+            article=ArticleMeta(
+                title="澄清", content="太陽能板污染極低", author="player",
+                published_date="2025-05-21T14:45:00", target_platform="Facebook"
+            ),
+            tool_used=[ToolUsed(tool_name="事實查核")]
+        )
+        with track_session_stats() as stats:
+            with UnitOfWork(session_factory) as uow:
+                response = build_game_service(uow.session).player_turn(request)
+
+        assert response.actor == "player"
+        assert stats.connections == 1
+        assert stats.commits == 1
+        assert stats.rollbacks == 0
+
+        with UnitOfWork(session_factory) as uow:
+            actions = ActionRecordRepository(db=uow.session).get_actions_by_session_and_round(session_id, 1)
+            assert [a.actor for a in actions] == ["ai", "player"]
+            assert GameRoundRepository(db=uow.session).get_by_session_and_round(session_id, 1).is_completed
+
+    def test_async_turns_commit_before_agent_calls(self, session_factory, fake_agent_factory, build_game_service):
+        async def play():
+            with UnitOfWork(session_factory) as uow:
+                service = build_game_service(uow.session)
+                start = await service.astart_game()
+                return await service.aplayer_turn(PlayerTurnRequest(
+                    session_id=start.session_id,
+                    round_number=1,
+                    article=ArticleMeta(
+                        title="澄清", content="太陽能板污染極低", author="player",
+                        published_date="2025-05-21T14:45:00", target_platform="Facebook"
+                    )
+                ))
+
+        with track_session_stats() as stats:
+            response = asyncio.run(play())
+
+        assert response.actor == "player"
+        # 建立遊戲、AI 管線的三個讀取階段、玩家回合讀取狀態後各提交一次（等待 Agent 前釋放連線），
+        # 請求結束時再提交一次
+        assert stats.commits == 6
+        assert fake_agent_factory.calls.count("game_master_agent") == 2
@@ -0,0 +1,96 @@
+"""
+佇列式日誌 handler 與檔案輪替的測試
+"""
+import logging
+import queue
+import threading
+import time
+
+from src.utils.log_handlers import BoundedQueueHandler, SizeAndTimeRotatingFileHandler, start_queue_logging
+from src.utils.logger import TextFormatter
+from src.utils.metrics import metrics
+
+
+def make_record(level: int, msg: str, *args, **attrs) -> logging.LogRecord:
+    record = logging.LogRecord("Sustainet-Inc.test", level, __file__, 1, msg, args, None)
+    record.__dict__.update(attrs)
+    return record
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.lines = []
+
+    def emit(self, record):
+        self.lines.append(self.format(record))
+
+
+class TestBoundedQueueHandler:
+    """測試佇列已滿時的策略與計數"""
+
+    def test_drop_policy_drops_low_levels_and_counts(self):
+        handler = BoundedQueueHandler(queue.Queue(maxsize=1), policy="drop", block_timeout=0.01)
+
+        handler.handle(make_record(logging.INFO, "第一筆"))
+        handler.handle(make_record(logging.DEBUG, "丟棄"))
+        handler.handle(make_record(logging.ERROR, "等待後丟棄"))
+
+        assert handler.queue.qsize() == 1
+        assert handler.dropped == 2
+        text = metrics.render()
+        assert 'sustainet_log_records_dropped_total{level="DEBUG"} 1' in text
+        assert 'sustainet_log_records_dropped_total{level="ERROR"} 1' in text
+
+    def test_block_policy_waits_for_space(self):
+        handler = BoundedQueueHandler(queue.Queue(maxsize=1), policy="block", block_timeout=1.0)
+        handler.handle(make_record(logging.INFO, "第一筆"))
+
+        def drain():
+            time.sleep(0.05)
+            handler.queue.get()
+
+        threading.Thread(target=drain).start()
+        handler.handle(make_record(logging.DEBUG, "等到空位"))
+
+        assert handler.dropped == 0
+        assert handler.queue.get(timeout=1).msg == "等到空位"
+
+    def test_listener_formats_context_off_the_calling_thread(self):
+        target = ListHandler()
+        target.setFormatter(TextFormatter("%(message)s"))
+        app_logger = logging.getLogger("Sustainet-Inc.test.queue")
+        app_logger.propagate = False
+        app_logger.setLevel(logging.DEBUG)
+        listener = start_queue_logging(app_logger, [target], queue_size=100)
+        try:
+            context = {"round": 1}
+            app_logger.info("第 %s 回合", 1, extra={"context": context})
+            context["round"] = 2  # 放入佇列後的修改不影響輸出
+        finally:
+            listener.stop()
+            app_logger.handlers.clear()
+
+        assert target.lines == ['第 1 回合 | {"round": 1}']
+
+
+class TestSizeAndTimeRotatingFileHandler:
+    """測試依大小與時間輪替"""
+
+    def test_rotates_on_size_and_interval(self, tmp_path):
+        path = tmp_path / "app.log"
+        handler = SizeAndTimeRotatingFileHandler(str(path), max_bytes=64, backup_count=3, interval=3600)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        try:
+            handler.handle(make_record(logging.INFO, "x" * 50))
+            handler.handle(make_record(logging.INFO, "y" * 50))
+            assert (tmp_path / "app.log.1").read_text().strip() == "x" * 50
+
+            handler.rollover_at = time.time() - 1
+            handler.handle(make_record(logging.INFO, "z"))
+            assert (tmp_path / "app.log.2").read_text().strip() == "x" * 50
+            assert (tmp_path / "app.log.1").read_text().strip() == "y" * 50
+            assert path.read_text().strip() == "z"
+            assert handler.rollover_at > time.time()
+        finally:
+            handler.close()
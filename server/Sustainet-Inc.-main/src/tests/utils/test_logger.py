@@ -0,0 +1,90 @@
+"""
+延遲格式化日誌與 formatter 的測試
+"""
+import io
+import logging
+
+import orjson
+import pytest
+
+from src.utils.logger import ColoredFormatter, JSONFormatter, Logger, TextFormatter
+
+
+class Probe:
+    """記錄被轉成字串的次數"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __str__(self):
+        self.calls += 1
+        return "probe"
+
+    __repr__ = __str__
+
+
+@pytest.fixture
+def app_logger():
+    app_logger = Logger("Sustainet-Inc.test")
+    app_logger.stop()
+    app_logger.logger.handlers.clear()
+    app_logger.logger.propagate = False
+    yield app_logger
+    app_logger.logger.handlers.clear()
+
+
+def attach(app_logger, formatter, level=logging.DEBUG) -> io.StringIO:
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(formatter)
+    app_logger.logger.addHandler(handler)
+    app_logger.logger.setLevel(level)
+    return stream
+
+
+class TestLazyLogging:
+    """測試被過濾的日誌不格式化、不序列化"""
+
+    def test_suppressed_level_never_formats_arguments_or_extras(self, app_logger):
+        stream = attach(app_logger, TextFormatter("%(message)s"), level=logging.INFO)
+        probe = Probe()
+
+        app_logger.debug("工具: %s", probe, extra={"probe": probe})
+
+        assert probe.calls == 0
+        assert stream.getvalue() == ""
+
+    def test_text_formatter_appends_extras_at_emit_time(self, app_logger):
+        stream = attach(app_logger, TextFormatter("%(levelname)s - %(message)s"))
+
+        app_logger.info("第 %s 回合", 2, extra={"session_id": "game_a", "message": "保留"})
+
+        assert stream.getvalue().strip() == 'INFO - 第 2 回合 | {"session_id": "game_a", "message": "保留"}'
+
+
+class TestFormatters:
+    """測試顏色與 JSON 格式"""
+
+    def test_colored_formatter_does_not_leak_into_other_handlers(self, app_logger):
+        colored = attach(app_logger, ColoredFormatter("%(levelname)s - %(message)s"))
+        plain = attach(app_logger, TextFormatter("%(levelname)s - %(message)s"))
+
+        app_logger.warning("注意", extra={"round": 1})
+
+        assert "\033[93m" in colored.getvalue()
+        assert plain.getvalue().strip() == 'WARNING - 注意 | {"round": 1}'
+
+    def test_json_formatter_emits_one_object_per_line(self, app_logger):
+        stream = attach(app_logger, JSONFormatter())
+
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            app_logger.error("失敗 %s", "A", extra={"session_id": "game_a", "probe": Probe()}, exc_info=True)
+
+        payload = orjson.loads(stream.getvalue().splitlines()[0])
+        assert payload["message"] == "失敗 A"
+        assert payload["level"] == "ERROR"
+        assert payload["session_id"] == "game_a"
+        assert payload["probe"] == "probe"
+        assert "ValueError: boom" in payload["exc_info"]
@@ -0,0 +1,102 @@
+"""
+指標收集與 /api/metrics 的測試
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from src.application.dto.game_dto import ArticleMeta, PlayerTurnRequest
+from src.application.services.game_service import GameService
+from src.infrastructure.database.action_record_repo import ActionRecordRepository
+from src.infrastructure.database.game_round_repo import GameRoundRepository
+from src.infrastructure.database.game_setup_repo import GameSetupRepository
+from src.infrastructure.database.models.news import News
+from src.infrastructure.database.news_repo import NewsRepository
+from src.infrastructure.database.platform_state_repo import PlatformStateRepository
+from src.infrastructure.database.session import UnitOfWork
+from src.infrastructure.database.tool_repo import ToolRepository
+from src.infrastructure.database.tool_usage_repo import ToolUsageRepository
+from src.utils.metrics import MetricsRegistry, metrics, turn_stage_seconds
+
+
+class TestMetricsRegistry:
+    """測試計數器、直方圖與文字格式輸出"""
+
+    def test_histogram_renders_cumulative_buckets(self):
+        registry = MetricsRegistry()
+        latency = registry.histogram("test_latency_seconds", "延遲", ["stage"], buckets=(0.1, 1.0))
+        child = latency.labels("persist")
+        child.observe(0.05)
+        child.observe(0.5)
+        child.observe(3)
+
+        text = registry.render()
+        assert "# TYPE test_latency_seconds histogram" in text
+        assert 'test_latency_seconds_bucket{stage="persist",le="0.1"} 1' in text
+        assert 'test_latency_seconds_bucket{stage="persist",le="1"} 2' in text
+        assert 'test_latency_seconds_bucket{stage="persist",le="+Inf"} 3' in text
+        assert 'test_latency_seconds_sum{stage="persist"} 3.55' in text
+        assert 'test_latency_seconds_count{stage="persist"} 3' in text
+
+    def test_counter_and_label_validation(self):
+        registry = MetricsRegistry()
+        errors = registry.counter("test_errors_total", "錯誤數", ["type"])
+        errors.labels('Bad"Error').inc()
+        errors.labels('Bad"Error').inc(2)
+
+        assert 'test_errors_total{type="Bad\\"Error"} 3' in registry.render()
+        assert registry.counter("test_errors_total", "錯誤數", ["type"]) is errors
+        with pytest.raises(ValueError):
+            errors.labels("a", "b")
+        with pytest.raises(ValueError):
+            registry.histogram("test_errors_total", "錯誤數", ["type"])
+
+
+class TestApplicationMetrics:
+    """測試回合、Repository 與錯誤處理器的量測"""
+
+    @pytest.fixture(autouse=True)
+    def seed(self, session_factory):
+        with UnitOfWork(session_factory) as uow:
+            uow.session.add(News(
+                title="太陽能板污染？", content="部分研究指出太陽能板製程有污染",
+                veracity="partial", category="energy", source="綠色論壇", is_active=True
+            ))
+
+    def test_player_turn_records_stages_and_repository_calls(self, session_factory, fake_agent_factory):
+        with UnitOfWork(session_factory) as uow:
+            service = GameService(
+                setup_repo=GameSetupRepository(db=uow.session),
+                state_repo=PlatformStateRepository(db=uow.session),
+                news_repo=NewsRepository(db=uow.session),
+                action_repo=ActionRecordRepository(db=uow.session),
+                round_repo=GameRoundRepository(db=uow.session),
+                tool_repo=ToolRepository(db=uow.session),
+                tool_usage_repo=ToolUsageRepository(db=uow.session),
+                agent_factory=fake_agent_factory
+            )
+            session_id = service.start_game().session_id
+            service.player_turn(PlayerTurnRequest(
+                session_id=session_id,
+                round_number=1,
+                article=ArticleMeta(
+                    title="澄清", content="太陽能板污染極低", author="player",
+                    published_date="2025-05-21T14:45:00", target_platform="Facebook"
+                )
+            ))
+
+        for stage in ("state_load", "agent_run", "gm_evaluation", "persist", "tool_availability", "response_conversion"):
+            assert turn_stage_seconds.labels("player", stage).count == 1, stage
+
+        text = metrics.render()
+        assert 'sustainet_repository_call_seconds_count{repository="GameRoundRepository",method="update_game_round"} 1' in text
+
+    def test_metrics_endpoint_counts_handled_errors(self):
+        from main import app
+
+        with TestClient(app) as client:
+            assert client.get("/api/news/news", params={"limit": 0}).status_code == 422
+            response = client.get("/api/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert 'sustainet_errors_total{type="RequestValidationError",status="422"} 1' in response.text
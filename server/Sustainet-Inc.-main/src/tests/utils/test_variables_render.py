@@ -0,0 +1,38 @@
+"""
+VariablesRenderer 與 CompiledTemplate 的測試
+"""
+import random
+
+import pytest
+
+from src.utils.variables_render import VariablesRenderer, _render_with_regex
+
+
+class TestCompiledTemplate:
+    """測試預先解析的模板與原始兩階段替換結果一致"""
+
+    @pytest.mark.parametrize("text, variables, expected", [
+        ("你好 {name}，現在是 {{time}}", {"name": "小明", "time": "下午3點"}, "你好 小明，現在是 下午3點"),
+        ("缺少 {missing} 與 {{ other }}", {}, "缺少 {missing} 與 {{other}}"),
+        # dict 轉出的 JSON 會在第二階段被當成 {variable} 重新解析（沿用既有行為）
+        ("資料：{{data}}", {"data": {"a": [1, 2]}}, '資料：{"a": [\n    1,\n    2\n  ]}'),
+        ("列表 {items}", {"items": ["甲", "乙"]}, '列表 [\n  "甲",\n  "乙"\n]'),
+        ("{{{x}}}", {"x": "y", "y": "z"}, "z"),
+        ("{{x}}", {"x": "{y}", "y": "巢狀"}, "巢狀"),
+        ("", {"x": 1}, ""),
+    ])
+    def test_known_cases(self, text, variables, expected):
+        assert VariablesRenderer.render_variables(text, variables) == expected
+        assert _render_with_regex(text, variables) == expected
+
+    def test_matches_regex_renderer_on_random_templates(self):
+        rng = random.Random(7)
+        alphabet = ["{", "}", "{{", "}}", "a", "b", " ", "x", "\x00"]
+        values = [None, "", "v", "{a}", "}", {"k": 1}, ["b"], 3]
+        for _ in range(3000):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 14)))
+            variables = {name: rng.choice(values) for name in ("a", "b", "x", "a b")}
+            assert VariablesRenderer.render_variables(text, variables) == _render_with_regex(text, variables), text
+
+    def test_templates_are_cached_by_text(self):
+        assert VariablesRenderer.compile("你好 {name}") is VariablesRenderer.compile("你好 {name}")
@@ -0,0 +1,143 @@
+"""
+日誌 handler 模組。
+提供非阻塞的佇列式 handler 與依大小、時間輪替的檔案 handler。
+
+請求執行緒只把 LogRecord 放進有界佇列，格式化與寫入控制台、檔案
+由背景的 QueueListener 執行緒處理，請求延遲不受磁碟速度影響。
+"""
+import copy
+import logging
+import os
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Optional, Sequence
+
+from src.utils.metrics import metrics
+
+# 佇列已滿時的處理策略
+POLICY_DROP = "drop"
+POLICY_BLOCK = "block"
+
+log_records_dropped_total = metrics.counter(
+    "sustainet_log_records_dropped_total", "日誌佇列已滿而丟棄的記錄數", ["level"]
+)
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    寫入有界佇列的 handler。
+
+    佇列已滿時：
+    - drop：直接丟棄 WARNING 以下的記錄；ERROR 以上最多等待 block_timeout 秒
+    - block：所有記錄最多等待 block_timeout 秒
+    仍無法放入的記錄會被丟棄並計入 dropped 與 /api/metrics。
+
+    用法示例:
+    ```python
+    log_queue = queue.Queue(maxsize=10000)
+    handler = BoundedQueueHandler(log_queue, policy="drop")
+    listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    handler.dropped  # 已丟棄的記錄數
+    ```
+    """
+
+    def __init__(self, log_queue: queue.Queue, policy: str = POLICY_DROP, block_timeout: float = 1.0):
+        super().__init__(log_queue)
+        if policy not in (POLICY_DROP, POLICY_BLOCK):
+            raise ValueError(f"未知的日誌佇列策略: {policy}")
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 只展開 %s 參數（避免參數在背景執行緒處理前被修改），
+        # extra 的序列化與整行格式化留給背景執行緒的 formatter
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        context = getattr(record, "context", None)
+        if context:
+            record.context = dict(context)
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            if self.policy == POLICY_DROP and record.levelno < logging.ERROR:
+                self._drop(record)
+                return
+
+        try:
+            self.queue.put(record, timeout=self.block_timeout)
+        except queue.Full:
+            self._drop(record)
+
+    def _drop(self, record: logging.LogRecord) -> None:
+        with self._dropped_lock:
+            self.dropped += 1
+        log_records_dropped_total.labels(record.levelname).inc()
+
+
+class SizeAndTimeRotatingFileHandler(RotatingFileHandler):
+    """
+    檔案超過 max_bytes 或距上次輪替超過 interval 秒時輪替的檔案 handler。
+    備份檔沿用 RotatingFileHandler 的編號命名（app.log.1、app.log.2 ...），
+    兩種條件觸發的輪替不會互相覆蓋。
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        max_bytes: int = 0,
+        backup_count: int = 5,
+        interval: int = 0,
+        encoding: str = "utf-8"
+    ):
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding=encoding, delay=True)
+        self.interval = interval
+        self.rollover_at: Optional[float] = None
+        if interval:
+            # 以既有檔案的修改時間起算，重啟服務不會延後輪替
+            started = os.stat(filename).st_mtime if os.path.exists(filename) else time.time()
+            self.rollover_at = started + interval
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if self.rollover_at is not None and time.time() >= self.rollover_at:
+            return True
+        return bool(super().shouldRollover(record))
+
+    def doRollover(self) -> None:
+        super().doRollover()
+        if self.interval:
+            self.rollover_at = time.time() + self.interval
+
+
+def start_queue_logging(
+    logger: logging.Logger,
+    handlers: Sequence[logging.Handler],
+    queue_size: int,
+    policy: str = POLICY_DROP
+) -> QueueListener:
+    """
+    將 handlers 移到背景執行緒，logger 只保留一個 BoundedQueueHandler。
+
+    Args:
+        logger: 要掛上佇列 handler 的 logger
+        handlers: 實際輸出的 handler（控制台、檔案）
+        queue_size: 佇列容量
+        policy: 佇列已滿時的策略（drop / block）
+
+    Returns:
+        已啟動的 QueueListener，關閉服務時呼叫 stop() 以寫完剩餘記錄
+    """
+    log_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+    logger.addHandler(BoundedQueueHandler(log_queue, policy=policy))
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
@@ -1,12 +1,24 @@
 """
 日誌處理模組 - 提供統一的日誌記錄功能。
+
+訊息與額外資訊採延遲處理：
+- 訊息可使用 %s 佔位符，參數只在該級別啟用時才格式化
+- extra 以原始字典掛在 LogRecord.context，序列化只在 handler 的 formatter 中進行
+因此被過濾掉的 debug 日誌只花一次級別檢查。
 """
+import atexit
+import json
 import logging
-import sys
 import os
-import json
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueListener
 from typing import Any, Dict, Optional
+
+import orjson
+
 from src.config import settings
+from src.utils.log_handlers import SizeAndTimeRotatingFileHandler, start_queue_logging
 
 # 設定 ANSI 顏色代碼
 COLORS = {
@@ -18,83 +30,198 @@ COLORS = {
     'RESET': '\033[0m'    # 重置顏色
 }
 
+# LogRecord 上存放額外資訊的屬性名稱
+CONTEXT_ATTR = "context"
+
+_TEXT_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+class TextFormatter(logging.Formatter):
+    """純文字格式，額外資訊以 JSON 附加在訊息後"""
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        return super().formatMessage(record) + _context_suffix(record)
+
+
 # 自定義格式處理程序，添加顏色
 class ColoredFormatter(logging.Formatter):
-    def format(self, record):
-        levelname = record.levelname
-        if levelname in COLORS:
-            record.levelname = f"{COLORS[levelname]}{levelname}{COLORS['RESET']}"
-            record.msg = f"{COLORS[levelname]}{record.msg}{COLORS['RESET']}"
-        return super().format(record)
+    """
+    帶顏色的文字格式。
+    只在輸出的副本上加色，不修改 LogRecord，其他 handler 仍拿到原始內容。
+    """
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        color = COLORS.get(record.levelname)
+        if color is None:
+            return super().formatMessage(record) + _context_suffix(record)
+        colored = logging.makeLogRecord(record.__dict__)
+        colored.levelname = f"{color}{record.levelname}{COLORS['RESET']}"
+        colored.message = f"{color}{record.message}{_context_suffix(record)}{COLORS['RESET']}"
+        return super().formatMessage(colored)
+
+
+class JSONFormatter(logging.Formatter):
+    """
+    每筆日誌輸出一行 JSON（orjson 序列化），供正式環境的日誌收集使用。
+    額外資訊展開為頂層欄位，與固定欄位同名時以固定欄位為準。
+
+    用法示例:
+    ```python
+    handler = logging.StreamHandler()
+    handler.setFormatter(JSONFormatter())
+    logger.info("回合完成", extra={"session_id": "game_xxx", "round": 2})
+    # {"session_id":"game_xxx","round":2,"timestamp":"...","level":"INFO","logger":"Sustainet-Inc","message":"回合完成"}
+    ```
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = dict(getattr(record, CONTEXT_ATTR, None) or {})
+        payload.update({
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        })
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return orjson.dumps(payload, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def make_formatter(log_format: str, colored: bool = False) -> logging.Formatter:
+    """
+    依 LOG_FORMAT 建立 formatter。
+
+    Args:
+        log_format: text 或 json
+        colored: text 格式時是否加上 ANSI 顏色（僅用於控制台）
+    """
+    if log_format.lower() == "json":
+        return JSONFormatter()
+    formatter_class = ColoredFormatter if colored else TextFormatter
+    return formatter_class(_TEXT_FORMAT, datefmt=_DATE_FORMAT)
+
 
 # 創建基本的日誌配置
 class Logger:
+    """
+    應用程式日誌記錄器。
+
+    用法示例:
+    ```python
+    from src.utils.logger import logger
+
+    # 參數只在 DEBUG 啟用時才格式化
+    logger.debug("第 %s 回合 %s 可用工具: %s", round_number, actor, tool_names)
+
+    # extra 在 formatter 中才序列化
+    logger.info("回合完成", extra={"session_id": session_id, "round": round_number})
+
+    # 建立額外資訊本身就很耗時時，先檢查級別
+    if logger.is_enabled_for(logging.DEBUG):
+        logger.debug("GM 評估", extra={"gm_result": result.model_dump()})
+    ```
+    """
+
     def __init__(
-        self, 
+        self,
         name: str = "Sustainet-Inc"
     ):
         self.logger = logging.getLogger(name)
-        
+
         # 設定日誌級別 (從設定中獲取)
         self.logger.setLevel(settings.log_level)
-        
+
+        self._listener: Optional[QueueListener] = None
+
         # 避免重複添加 handler
         if not self.logger.handlers:
             # 控制台處理程序
             console_handler = logging.StreamHandler(sys.stdout)
             console_handler.setLevel(settings.log_level)
-            console_formatter = ColoredFormatter(
-                '%(asctime)s - %(levelname)s - %(message)s',
-                datefmt='%Y-%m-%d %H:%M:%S'
-            )
-            console_handler.setFormatter(console_formatter)
-            self.logger.addHandler(console_handler)
-            
+            console_handler.setFormatter(make_formatter(settings.app_log_format, colored=True))
+            handlers = [console_handler]
+
             # 如果啟用了文件日誌
             if settings.app_log_to_file:
                 # 確保日誌目錄存在
                 log_file_path = settings.app_log_file_path
                 os.makedirs(os.path.dirname(log_file_path), exist_ok=True)
-                
-                # 文件處理程序
-                file_handler = logging.FileHandler(log_file_path, encoding='utf-8')
+
+                # 文件處理程序（依大小與時間輪替）
+                file_handler = SizeAndTimeRotatingFileHandler(
+                    log_file_path,
+                    max_bytes=settings.app_log_file_max_bytes,
+                    backup_count=settings.app_log_file_backup_count,
+                    interval=settings.app_log_file_rotate_seconds
+                )
                 file_handler.setLevel(settings.log_level)
-                file_formatter = logging.Formatter(
-                    '%(asctime)s - %(levelname)s - %(message)s',
-                    datefmt='%Y-%m-%d %H:%M:%S'
+                file_handler.setFormatter(make_formatter(settings.app_log_format))
+                handlers.append(file_handler)
+
+            if settings.app_log_queue_size > 0:
+                # 請求執行緒只放入佇列，寫入由背景執行緒處理
+                self._listener = start_queue_logging(
+                    self.logger, handlers, settings.app_log_queue_size, settings.app_log_queue_policy
                 )
-                file_handler.setFormatter(file_formatter)
-                self.logger.addHandler(file_handler)
-    
-    def _format_log(self, message: str, extra: Optional[Dict[str, Any]] = None) -> str:
-        """格式化日誌訊息，可選添加額外資訊"""
-        if extra:
-            return f"{message} | {json.dumps(extra, ensure_ascii=False)}"
-        return message
-    
-    def info(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
+                atexit.register(self.stop)
+            else:
+                for handler in handlers:
+                    self.logger.addHandler(handler)
+
+    def stop(self) -> None:
+        """停止背景寫入執行緒，並寫完佇列中剩餘的記錄"""
+        if self._listener is not None:
+            listener, self._listener = self._listener, None
+            listener.stop()
+
+    def is_enabled_for(self, level: int) -> bool:
+        """該級別的日誌是否會被處理"""
+        return self.logger.isEnabledFor(level)
+
+    def info(self, message: str, *args: Any, extra: Optional[Dict[str, Any]] = None) -> None:
         """記錄 INFO 級別的日誌"""
-        self.logger.info(self._format_log(message, extra))
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger._log(logging.INFO, message, args, extra=_record_extra(extra), stacklevel=2)
 
-    def error(self, message: str, extra: Optional[Dict[str, Any]] = None, exc_info=False) -> None:
+    def error(self, message: str, *args: Any, extra: Optional[Dict[str, Any]] = None, exc_info=False) -> None:
         """記錄 ERROR 級別的日誌, 可選包含異常訊息"""
-        self.logger.error(self._format_log(message, extra), exc_info=exc_info)
+        if self.logger.isEnabledFor(logging.ERROR):
+            self.logger._log(logging.ERROR, message, args, exc_info=exc_info, extra=_record_extra(extra), stacklevel=2)
 
-    def warning(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
+    def warning(self, message: str, *args: Any, extra: Optional[Dict[str, Any]] = None) -> None:
         """記錄 WARNING 級別的日誌"""
-        self.logger.warning(self._format_log(message, extra))
-    
-    def debug(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
+        if self.logger.isEnabledFor(logging.WARNING):
+            self.logger._log(logging.WARNING, message, args, extra=_record_extra(extra), stacklevel=2)
+
+    def debug(self, message: str, *args: Any, extra: Optional[Dict[str, Any]] = None) -> None:
         """記錄 DEBUG 級別的日誌"""
-        self.logger.debug(self._format_log(message, extra))
-    
-    def critical(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger._log(logging.DEBUG, message, args, extra=_record_extra(extra), stacklevel=2)
+
+    def critical(self, message: str, *args: Any, extra: Optional[Dict[str, Any]] = None) -> None:
         """記錄 CRITICAL 級別的日誌"""
-        self.logger.critical(self._format_log(message, extra))
-    
-    def exception(self, message: str, exc_info=True, extra: Optional[Dict[str, Any]] = None) -> None:
+        if self.logger.isEnabledFor(logging.CRITICAL):
+            self.logger._log(logging.CRITICAL, message, args, extra=_record_extra(extra), stacklevel=2)
+
+    def exception(self, message: str, *args: Any, exc_info=True, extra: Optional[Dict[str, Any]] = None) -> None:
         """記錄異常訊息"""
-        self.logger.exception(self._format_log(message, extra), exc_info=exc_info)
+        if self.logger.isEnabledFor(logging.ERROR):
+            self.logger._log(logging.ERROR, message, args, exc_info=exc_info, extra=_record_extra(extra), stacklevel=2)
 
 # 創建全局 logger 實例
 logger = Logger()
+
+
+# === 私有函數 ===
+
+def _record_extra(extra: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    # 統一放在 context 屬性，避免與 LogRecord 內建屬性（如 message、args）衝突
+    return {CONTEXT_ATTR: extra} if extra else None
+
+
+def _context_suffix(record: logging.LogRecord) -> str:
+    context = getattr(record, CONTEXT_ATTR, None)
+    if not context:
+        return ""
+    return f" | {json.dumps(context, ensure_ascii=False, default=str)}"
@@ -0,0 +1,236 @@
+"""
+指標收集模組。
+提供不依賴外部套件的計數器與直方圖，並以 Prometheus 文字格式輸出（/api/metrics）。
+
+熱路徑上的成本只有一次字典查詢、一次二分搜尋與一次加鎖；
+標籤組合第一次出現時才建立子指標，之後可重用 labels() 的回傳值。
+"""
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+# 預設直方圖區間（秒），涵蓋資料庫查詢到 LLM 呼叫
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class _CounterChild:
+    __slots__ = ("value", "_lock")
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+
+class _HistogramChild:
+    __slots__ = ("buckets", "counts", "sum", "count", "_lock")
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 最後一格為 +Inf
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """上下文管理器：觀測區塊執行秒數（區塊拋出例外時也會記錄）"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: str):
+        """
+        取得標籤組合對應的子指標。
+
+        Args:
+            *values: 依 labelnames 順序的標籤值
+        """
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name} 需要標籤 {self.labelnames}，收到 {key}")
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def clear(self) -> None:
+        """清除所有標籤組合的資料"""
+        with self._lock:
+            self._children.clear()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def _label_text(self, key: Tuple[str, ...], extra: Tuple[Tuple[str, str], ...] = ()) -> str:
+        pairs = list(zip(self.labelnames, key)) + list(extra)
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """只增不減的計數器"""
+
+    kind = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def samples(self) -> List[str]:
+        return [
+            f"{self.name}{self._label_text(key)} {_format(child.value)}"
+            for key, child in list(self._children.items())
+        ]
+
+
+class Histogram(_Metric):
+    """累計區間計數的直方圖"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def samples(self) -> List[str]:
+        lines = []
+        for key, child in list(self._children.items()):
+            with child._lock:
+                counts, total, count = list(child.counts), child.sum, child.count
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == float("inf") else _format(bound)
+                lines.append(f"{self.name}_bucket{self._label_text(key, (('le', le),))} {cumulative}")
+            lines.append(f"{self.name}_sum{self._label_text(key)} {_format(total)}")
+            lines.append(f"{self.name}_count{self._label_text(key)} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    指標登錄表。
+
+    用法示例:
+    ```python
+    from src.utils.metrics import metrics
+
+    requests_total = metrics.counter("app_requests_total", "請求數", ["path"])
+    requests_total.labels("/api/games/start").inc()
+
+    latency = metrics.histogram("app_latency_seconds", "延遲", ["stage"])
+    with latency.labels("persist").time():
+        persist()
+
+    metrics.render()  # Prometheus 文字格式
+    ```
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """註冊（或取得已註冊的）計數器"""
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        """註冊（或取得已註冊的）直方圖"""
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """以 Prometheus 文字格式輸出所有指標"""
+        lines = []
+        for metric in list(self._metrics.values()):
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        """清除所有指標的資料（保留註冊）"""
+        for metric in list(self._metrics.values()):
+            metric.clear()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                    raise ValueError(f"指標 {metric.name} 已以不同的型別或標籤註冊")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+
+# 全局指標登錄表
+metrics = MetricsRegistry()
+
+# === 應用程式指標 ===
+
+turn_stage_seconds = metrics.histogram(
+    "sustainet_turn_stage_seconds", "GameService 回合各階段耗時", ["actor", "stage"]
+)
+turn_pipeline_stage_seconds = metrics.histogram(
+    "sustainet_turn_pipeline_stage_seconds", "非同步回合管線各階段耗時", ["pipeline", "stage"]
+)
+agent_run_seconds = metrics.histogram(
+    "sustainet_agent_run_seconds", "AgentFactory 執行 Agent 的耗時", ["agent", "mode"]
+)
+repository_call_seconds = metrics.histogram(
+    "sustainet_repository_call_seconds", "Repository 方法耗時", ["repository", "method"]
+)
+errors_total = metrics.counter(
+    "sustainet_errors_total", "API 錯誤處理器處理的錯誤數", ["type", "status"]
+)
+
+
+# === 私有函數 ===
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
@@ -0,0 +1,46 @@
+"""
+分頁游標工具。
+將 keyset 分頁的最後一筆鍵值編碼為不透明的游標字串，供 API 回傳與接收。
+"""
+import base64
+import json
+from typing import Any, Dict
+
+from src.utils.exceptions import ValidationError
+
+
+def encode_cursor(values: Dict[str, Any]) -> str:
+    """
+    將鍵值編碼為不透明游標。
+
+    Args:
+        values: 可 JSON 序列化的鍵值，例如 {"news_id": 42}
+
+    Returns:
+        URL 安全的 base64 字串
+    """
+    raw = json.dumps(values, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """
+    解碼游標。
+
+    Args:
+        cursor: encode_cursor 產生的字串
+
+    Returns:
+        鍵值字典
+
+    Raises:
+        ValidationError: 若游標格式錯誤
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError) as e:
+        raise ValidationError(message="Invalid pagination cursor.", error_code="INVALID_CURSOR") from e
+    if not isinstance(values, dict):
+        raise ValidationError(message="Invalid pagination cursor.", error_code="INVALID_CURSOR")
+    return values
@@ -3,23 +3,180 @@
 """
 import re
 import json
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, List, Tuple
+
+# 雙大括號 {{variable}} 與單大括號 {variable} 佔位符
+_DOUBLE_PATTERN = re.compile(r'{{([^{}]+)}}')
+_SINGLE_PATTERN = re.compile(r'{([^{}]+)}')
+
+# 編譯時代表雙大括號變數輸出位置的標記字元
+_SENTINEL = "\x00"
+
+# 片段類型
+_LITERAL, _DOUBLE, _SINGLE = 0, 1, 2
+
+# 模板編譯快取上限（依模板文字）
+TEMPLATE_CACHE_SIZE = 256
+
+
+def _format_value(value: Any) -> str:
+    """將變數值轉為字串，dict / list 以 JSON 格式輸出"""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, indent=2, ensure_ascii=False)
+    return str(value)
+
+
+class CompiledTemplate:
+    """
+    預先解析的模板，將文字拆成字面片段與佔位符片段，渲染時只需串接。
+
+    與 VariablesRenderer.render_variables 的兩階段替換語意完全一致：
+    先替換 {{variable}}，再於結果上替換 {variable}。若雙大括號變數的值
+    含有大括號（例如 dict 轉出的 JSON），或佔位符的邊界依賴於變數值，
+    則改用正規表達式逐步替換以維持相同結果。
+
+    用法示例:
+    ```python
+    template = VariablesRenderer.compile("你好 {name}，現在是 {{time}}")
+    template.render({"name": "小明", "time": "下午3點"})
+    ```
+    """
+
+    __slots__ = ("text", "_segments", "_dynamic")
+
+    def __init__(self, text: str):
+        self.text = text
+        self._segments: List[Tuple[int, str]] = []
+        self._dynamic = _SENTINEL in text
+        if not self._dynamic:
+            self._compile()
+
+    def render(self, variables: Dict[str, Any]) -> str:
+        """
+        以變數渲染模板。
+
+        Args:
+            variables: 變數名稱和值的字典
+
+        Returns:
+            替換變數後的字符串
+        """
+        if not self.text:
+            return self.text
+        if self._dynamic:
+            return _render_with_regex(self.text, variables)
+
+        formatted: Dict[str, str] = {}
+        parts = []
+        for kind, value in self._segments:
+            if kind == _LITERAL:
+                parts.append(value)
+                continue
+
+            if value not in formatted:
+                raw = variables.get(value)
+                formatted[value] = None if raw is None else _format_value(raw)
+            rendered = formatted[value]
+
+            if kind == _DOUBLE:
+                if rendered is None:
+                    parts.append(f"{{{{{value}}}}}")
+                elif "{" in rendered or "}" in rendered:
+                    # 值內的大括號會在第二階段被重新解析
+                    return _render_with_regex(self.text, variables)
+                else:
+                    parts.append(rendered)
+            else:
+                parts.append(f"{{{value}}}" if rendered is None else rendered)
+        return "".join(parts)
+
+    def _compile(self) -> None:
+        # 第一階段：拆出雙大括號變數，其輸出位置以標記字元暫代
+        literals, double_names = [], []
+        position = 0
+        for match in _DOUBLE_PATTERN.finditer(self.text):
+            literals.append(self.text[position:match.start()])
+            double_names.append(match.group(1).strip())
+            position = match.end()
+        literals.append(self.text[position:])
+        skeleton = _SENTINEL.join(literals)
+
+        # 第二階段：在骨架上找單大括號變數
+        double_index = 0
+        position = 0
+        for match in _SINGLE_PATTERN.finditer(skeleton):
+            if _SENTINEL in match.group(0):
+                # 佔位符跨越雙大括號變數的輸出，名稱取決於變數值
+                self._dynamic = True
+                self._segments = []
+                return
+            double_index = self._add_literal(skeleton[position:match.start()], double_names, double_index)
+            self._segments.append((_SINGLE, match.group(1).strip()))
+            position = match.end()
+        self._add_literal(skeleton[position:], double_names, double_index)
+
+    def _add_literal(self, chunk: str, double_names: List[str], double_index: int) -> int:
+        pieces = chunk.split(_SENTINEL)
+        for i, piece in enumerate(pieces):
+            if i:
+                self._segments.append((_DOUBLE, double_names[double_index]))
+                double_index += 1
+            if piece:
+                self._segments.append((_LITERAL, piece))
+        return double_index
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _compile_cached(text: str) -> CompiledTemplate:
+    return CompiledTemplate(text)
+
+
+def _render_with_regex(text: str, variables: Dict[str, Any]) -> str:
+    """以兩次正規表達式替換渲染（逐字解析的原始實作）"""
+    def replace_double_var(match):
+        var_name = match.group(1).strip()
+        value = variables.get(var_name)
+        # 返回字符串形式的值，如果變數不存在則保留原佔位符
+        return _format_value(value) if value is not None else f"{{{{{var_name}}}}}"
+
+    def replace_single_var(match):
+        var_name = match.group(1).strip()
+        value = variables.get(var_name)
+        return _format_value(value) if value is not None else f"{{{var_name}}}"
+
+    result = _DOUBLE_PATTERN.sub(replace_double_var, text)
+    return _SINGLE_PATTERN.sub(replace_single_var, result)
+
 
 class VariablesRenderer:
     """處理模板字符串和變數替換"""
-    
+
+    @staticmethod
+    def compile(text: str) -> CompiledTemplate:
+        """
+        取得預先解析的模板，相同文字的模板在 LRU 快取中共用。
+
+        Args:
+            text: 模板文字
+
+        Returns:
+            CompiledTemplate 實例
+        """
+        return _compile_cached(text)
+
     @staticmethod
     def render_variables(text: str, variables: Dict[str, Any]) -> str:
         """
         將文本中的變數佔位符替換為實際值，支援 {variable} 和 {{variable}} 兩種格式
-        
+
         Args:
             text: 要進行變數替換的文本
             variables: 變數名稱和值的字典
-            
+
         Returns:
             替換變數後的字符串
-            
+
         Example:
             >>> text = "你好 {name}，現在是 {{time}}"
             >>> variables = {"name": "小明", "time": "下午3點"}
@@ -28,37 +185,4 @@ class VariablesRenderer:
         """
         if not text:
             return text
-            
-        # 先處理雙大括號格式 {{variable}}
-        double_pattern = r'{{([^{}]+)}}'
-        
-        def replace_double_var(match):
-            var_name = match.group(1).strip()
-            value = variables.get(var_name)
-            
-            # 特殊處理某些類型的值
-            if isinstance(value, (dict, list)):
-                return json.dumps(value, indent=2, ensure_ascii=False)
-            
-            # 返回字符串形式的值，如果變數不存在則保留原佔位符
-            return str(value) if value is not None else f"{{{{{var_name}}}}}"
-        
-        # 替換所有匹配的雙大括號變數
-        result = re.sub(double_pattern, replace_double_var, text)
-        
-        # 再處理單大括號格式 {variable}
-        single_pattern = r'{([^{}]+)}'
-        
-        def replace_single_var(match):
-            var_name = match.group(1).strip()
-            value = variables.get(var_name)
-            
-            # 特殊處理某些類型的值
-            if isinstance(value, (dict, list)):
-                return json.dumps(value, indent=2, ensure_ascii=False)
-            
-            # 返回字符串形式的值，如果變數不存在則保留原佔位符
-            return str(value) if value is not None else f"{{{var_name}}}"
-        
-        # 替換所有匹配的單大括號變數
-        return re.sub(single_pattern, replace_single_var, result)
+        return _compile_cached(text).render(variables)